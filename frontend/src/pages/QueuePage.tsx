@@ -3,11 +3,14 @@ import { useParams, useNavigate } from 'react-router-dom'
 import { useQuery } from 'react-query'
 import { queueService } from '../services/queueService'
 import { eventService } from '../services/eventService'
+import type { QueueStatus } from '../types'
 
 export default function QueuePage() {
   const { eventId } = useParams<{ eventId: string }>()
   const navigate = useNavigate()
   const [queueToken, setQueueToken] = useState<string | null>(null)
+  const [pushedStatus, setPushedStatus] = useState<QueueStatus | null>(null)
+  const [streamFailed, setStreamFailed] = useState(false)
 
   // Join queue on mount
   useEffect(() => {
@@ -30,15 +33,27 @@ export default function QueuePage() {
     }
   }, [eventId])
 
-  // Poll queue status
-  const { data: queueStatus } = useQuery(
+  // Receive position updates over SSE
+  useEffect(() => {
+    if (!queueToken) return
+
+    return queueService.streamQueueStatus(eventId!, queueToken, {
+      onStatus: setPushedStatus,
+      onPosition: (update) => setPushedStatus((current) => (current ? { ...current, ...update } : current)),
+      onError: () => setStreamFailed(true),
+    })
+  }, [eventId, queueToken])
+
+  // Fall back to polling when the stream is unavailable
+  const { data: polledStatus } = useQuery(
     ['queue-status', eventId],
     () => queueService.getQueueStatus(eventId!),
     {
       refetchInterval: 5000, // Poll every 5 seconds
-      enabled: !!queueToken,
+      enabled: !!queueToken && streamFailed,
     }
   )
+  const queueStatus = streamFailed ? polledStatus ?? pushedStatus : pushedStatus
 
   const { data: event } = useQuery(['event', eventId], () =>
     eventService.getEventById(eventId!)
@@ -47,6 +62,9 @@ export default function QueuePage() {
   // Redirect when can proceed
   useEffect(() => {
     if (queueStatus?.can_proceed) {
+      if (queueStatus.admission_token) {
+        queueService.saveAdmissionToken(eventId!, queueStatus.admission_token)
+      }
       navigate(`/events/${eventId}`)
     }
   }, [queueStatus, eventId, navigate])
@@ -1,18 +1,31 @@
 import api from '../lib/api'
 import type { Booking, BookingDetail } from '../types'
+import { queueService } from './queueService'
 
 export const bookingService = {
   createBooking: async (eventId: string, seats: string[]): Promise<Booking> => {
-    const { data } = await api.post('/bookings', {
-      event_id: eventId,
-      seats,
-    })
+    const admissionToken = queueService.getAdmissionToken(eventId)
+    const { data } = await api.post(
+      '/bookings',
+      {
+        event_id: eventId,
+        seats,
+      },
+      admissionToken ? { headers: { 'X-Admission-Token': admissionToken } } : undefined
+    )
     return data
   },
 
   getMyBookings: async (): Promise<Booking[]> => {
-    const { data } = await api.get('/bookings/my')
-    return data.bookings || []
+    // 목록은 최신순 페이지 단위로 오므로 next_cursor가 없을 때까지 이어서 조회
+    const bookings: Booking[] = []
+    let cursor: string | undefined
+    do {
+      const { data } = await api.get('/bookings/my', { params: { limit: 100, cursor } })
+      bookings.push(...(data.bookings || []))
+      cursor = data.next_cursor || undefined
+    } while (cursor)
+    return bookings
   },
 
   getBookingById: async (bookingId: string): Promise<BookingDetail> => {
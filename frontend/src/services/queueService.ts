@@ -1,5 +1,5 @@
 import api from '../lib/api'
-import type { QueueStatus } from '../types'
+import type { QueueStatus, QueuePositionUpdate } from '../types'
 
 export const queueService = {
   joinQueue: async (eventId: string): Promise<QueueStatus> => {
@@ -14,7 +14,46 @@ export const queueService = {
     return data
   },
 
+  // Server-sent position updates; returns a function that closes the stream.
+  // onError fires when the stream fails (e.g. 503 when the queue replica is full) so callers can fall back to polling.
+  streamQueueStatus: (
+    eventId: string,
+    queueToken: string,
+    handlers: {
+      onStatus: (status: QueueStatus) => void
+      onPosition: (update: QueuePositionUpdate) => void
+      onError: () => void
+    }
+  ): (() => void) => {
+    const baseURL = api.defaults.baseURL || '/api'
+    const source = new EventSource(
+      `${baseURL}/queue/stream/${encodeURIComponent(eventId)}?token=${encodeURIComponent(queueToken)}`
+    )
+    source.addEventListener('status', (e) => {
+      const status: QueueStatus = JSON.parse((e as MessageEvent).data)
+      handlers.onStatus(status)
+      if (status.can_proceed) source.close()
+    })
+    source.addEventListener('position', (e) => {
+      handlers.onPosition(JSON.parse((e as MessageEvent).data))
+    })
+    source.onerror = () => {
+      source.close()
+      handlers.onError()
+    }
+    return () => source.close()
+  },
+
   leaveQueue: async (eventId: string): Promise<void> => {
     await api.post('/queue/leave', { event_id: eventId })
   },
+
+  // Admission tokens are required by the gateway for bookings while an event's waiting room is open
+  saveAdmissionToken: (eventId: string, token: string): void => {
+    sessionStorage.setItem(`admission_token:${eventId}`, token)
+  },
+
+  getAdmissionToken: (eventId: string): string | null => {
+    return sessionStorage.getItem(`admission_token:${eventId}`)
+  },
 }
@@ -108,13 +108,24 @@ export interface AuthResponse {
 
 // Queue Types
 export interface QueueStatus {
+  event_id: string
+  status: 'waiting' | 'ready' | 'open'
   queue_position: number
   total_in_queue: number
   estimated_wait_time: number // seconds
   queue_token?: string
+  admission_token?: string // X-Admission-Token for booking requests once ready
+  admission_expires_at?: string
   can_proceed: boolean
 }
 
+// Pushed over GET /queue/stream/{event_id} between full status events
+export interface QueuePositionUpdate {
+  queue_position: number
+  total_in_queue: number
+  estimated_wait_time: number
+}
+
 // Search Types
 export interface SearchFilters {
   q?: string
@@ -17,19 +17,20 @@ aws dynamodb create-table \
   --attribute-definitions \
       AttributeName=booking_id,AttributeType=S \
       AttributeName=user_id,AttributeType=S \
-      AttributeName=event_id,AttributeType=S \
+      AttributeName=event_shard,AttributeType=S \
+      AttributeName=created_at,AttributeType=N \
   --key-schema \
       AttributeName=booking_id,KeyType=HASH \
   --global-secondary-indexes \
       '[
         {
-          "IndexName": "user-index",
-          "KeySchema": [{"AttributeName":"user_id","KeyType":"HASH"}],
+          "IndexName": "user-bookings-index",
+          "KeySchema": [{"AttributeName":"user_id","KeyType":"HASH"},{"AttributeName":"created_at","KeyType":"RANGE"}],
           "Projection": {"ProjectionType":"ALL"}
         },
         {
-          "IndexName": "event-index",
-          "KeySchema": [{"AttributeName":"event_id","KeyType":"HASH"}],
+          "IndexName": "event-shard-index",
+          "KeySchema": [{"AttributeName":"event_shard","KeyType":"HASH"},{"AttributeName":"created_at","KeyType":"RANGE"}],
           "Projection": {"ProjectionType":"ALL"}
         }
       ]' \
@@ -38,6 +39,21 @@ aws dynamodb create-table \
   --region $REGION \
   2>/dev/null || echo "⚠️  Bookings 테이블이 이미 존재합니다."
 
+# Booking Outbox 테이블 (Kafka 이벤트, 예약과 같은 트랜잭션으로 기록)
+echo "📦 Booking Outbox 테이블 생성..."
+aws dynamodb create-table \
+  --table-name ticketing-booking-outbox \
+  --attribute-definitions \
+      AttributeName=shard,AttributeType=N \
+      AttributeName=outbox_id,AttributeType=S \
+  --key-schema \
+      AttributeName=shard,KeyType=HASH \
+      AttributeName=outbox_id,KeyType=RANGE \
+  --billing-mode PAY_PER_REQUEST \
+  --endpoint-url $ENDPOINT \
+  --region $REGION \
+  2>/dev/null || echo "⚠️  Booking Outbox 테이블이 이미 존재합니다."
+
 # Seats 테이블
 echo "📦 Seats 테이블 생성..."
 aws dynamodb create-table \
@@ -0,0 +1 @@
+# API Gateway Application
@@ -0,0 +1,219 @@
+import asyncio
+import math
+import os
+from collections import deque
+from typing import Optional
+
+from prometheus_client import Counter, Gauge
+
+ADMISSION_LIMIT = Gauge(
+    "gateway_admission_concurrency_limit",
+    "Current adaptive concurrency limit per route group",
+    ["group"],
+)
+
+ADMISSION_IN_FLIGHT = Gauge(
+    "gateway_admission_in_flight_requests",
+    "Admitted in-flight requests per route group",
+    ["group"],
+)
+
+ADMISSION_QUEUED = Gauge(
+    "gateway_admission_queued_requests",
+    "Requests waiting for admission per route group",
+    ["group"],
+)
+
+ADMISSION_SHED = Counter(
+    "gateway_admission_shed_total",
+    "Requests rejected with 503 by admission control per route group, priority and reason",
+    ["group", "priority", "reason"],
+)
+
+# 우선순위 클래스 (높을수록 먼저 처리되고 마지막에 버려진다)
+CRITICAL = "critical"
+HIGH = "high"
+NORMAL = "normal"
+LOW = "low"
+
+PRIORITY_RANKS = {LOW: 0, NORMAL: 1, HIGH: 2, CRITICAL: 3}
+
+# 클래스별로 사용할 수 있는 동시성 한도 비율. 과부하가 시작되면 낮은 클래스부터 자리가 없어진다.
+PRIORITY_SHARES = {LOW: 0.5, NORMAL: 0.75, HIGH: 0.9, CRITICAL: 1.0}
+_SHARES_BY_RANK = {PRIORITY_RANKS[priority]: share for priority, share in PRIORITY_SHARES.items()}
+
+
+class AdaptiveLimiter:
+    """지연 기반 적응형 동시성 제한 (gradient + AIMD)
+
+    - 성공 응답마다 단기/장기 지연 EWMA를 갱신하고 gradient = tolerance × 장기 / 단기 (0.5~1.0)로
+      limit × gradient + √limit 를 목표로 부드럽게 이동한다. 지연이 허용 범위 안이면 √limit만큼 늘고,
+      지연이 늘면 그 비율만큼 줄어든다.
+    - 업스트림 과부하 신호(502/503/504, 타임아웃)는 limit에 backoff_ratio를 곱한다 (multiplicative decrease).
+    - 클래스별로 limit × PRIORITY_SHARES 까지만 바로 통과하고, 나머지는 우선순위 큐에서 최대
+      queue_timeout초 기다린다(low는 기다리지 않고 바로 버림). 큐가 가득 차면 가장 낮은 우선순위의
+      가장 최근 대기 요청부터 버린다.
+    """
+
+    def __init__(
+        self,
+        group: str,
+        initial_limit: float = 100,
+        min_limit: float = 10,
+        max_limit: float = 1000,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        backoff_ratio: float = 0.9,
+        max_queue: int = 100,
+        queue_timeout: float = 0.5,
+    ):
+        self.group = group
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.backoff_ratio = backoff_ratio
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.short_rtt = 0.0
+        self.long_rtt = 0.0
+        self.samples = 0
+        self.queues: dict[int, deque[asyncio.Future]] = {rank: deque() for rank in sorted(PRIORITY_RANKS.values())}
+        ADMISSION_LIMIT.labels(group=group).set(self.limit)
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+    def _capacity(self, rank: int) -> float:
+        return max(self.limit * _SHARES_BY_RANK[rank], 1)
+
+    async def acquire(self, priority: str) -> bool:
+        """동시성 슬롯 확보 (버려지면 False)"""
+        rank = PRIORITY_RANKS[priority]
+        # 같거나 높은 우선순위가 기다리고 있으면 새치기하지 않는다
+        waiting_ahead = any(self.queues[other] for other in self.queues if other >= rank)
+        if not waiting_ahead and self.in_flight < self._capacity(rank):
+            self._admit()
+            return True
+
+        # 가장 낮은 클래스는 기다리지 않고 바로 버린다
+        if rank == PRIORITY_RANKS[LOW]:
+            ADMISSION_SHED.labels(group=self.group, priority=priority, reason="over_limit").inc()
+            return False
+
+        if self.queued >= self.max_queue and not self._evict_below(rank):
+            ADMISSION_SHED.labels(group=self.group, priority=priority, reason="queue_full").inc()
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.queues[rank].append(waiter)
+        ADMISSION_QUEUED.labels(group=self.group).set(self.queued)
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            # 슬롯을 받은 직후 취소되었다면 돌려준다
+            if waiter.done() and waiter.result():
+                self.release(None, dropped=False)
+            raise
+        finally:
+            if waiter in self.queues[rank]:
+                self.queues[rank].remove(waiter)
+            ADMISSION_QUEUED.labels(group=self.group).set(self.queued)
+
+        if not waiter.done():
+            waiter.cancel()
+            ADMISSION_SHED.labels(group=self.group, priority=priority, reason="timeout").inc()
+            return False
+        if not waiter.result():
+            ADMISSION_SHED.labels(group=self.group, priority=priority, reason="evicted").inc()
+            return False
+        return True
+
+    def _admit(self):
+        self.in_flight += 1
+        ADMISSION_IN_FLIGHT.labels(group=self.group).set(self.in_flight)
+
+    def _evict_below(self, rank: int) -> bool:
+        """rank보다 낮은 우선순위 중 가장 최근 대기 요청을 버림"""
+        for other, queue in self.queues.items():
+            if other >= rank:
+                break
+            if queue:
+                queue.pop().set_result(False)
+                return True
+        return False
+
+    def _drain(self):
+        """여유가 생긴 만큼 높은 우선순위 대기 요청부터 통과"""
+        for rank in sorted(self.queues, reverse=True):
+            queue = self.queues[rank]
+            while queue and self.in_flight < self._capacity(rank):
+                waiter = queue.popleft()
+                if not waiter.done():
+                    self._admit()
+                    waiter.set_result(True)
+            if queue:
+                return
+
+    def release(self, latency: Optional[float], dropped: bool):
+        """슬롯 반환 및 지연 샘플 반영 (latency가 None이면 limit은 갱신하지 않음)"""
+        self.in_flight -= 1
+        ADMISSION_IN_FLIGHT.labels(group=self.group).set(self.in_flight)
+
+        if dropped:
+            self._set_limit(self.limit * self.backoff_ratio)
+        elif latency is not None:
+            self._update(latency)
+        self._drain()
+
+    def _update(self, latency: float):
+        self.samples += 1
+        if self.samples == 1:
+            self.short_rtt = self.long_rtt = latency
+            return
+
+        self.short_rtt += (latency - self.short_rtt) * 0.2
+        self.long_rtt += (latency - self.long_rtt) * 0.01
+        # 지연이 크게 줄어든 뒤에는 장기 기준값도 빨리 따라 내려온다
+        if self.long_rtt > self.short_rtt * 2:
+            self.long_rtt *= 0.95
+
+        # 한도의 절반도 쓰지 않는 동안은 지연 정보가 한도와 무관하므로 늘리지 않는다
+        if self.in_flight + 1 < self.limit / 2:
+            return
+
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / self.short_rtt)) if self.short_rtt else 1.0
+        target = self.limit * gradient + math.sqrt(self.limit)
+        self._set_limit(self.limit * (1 - self.smoothing) + target * self.smoothing)
+
+    def _set_limit(self, limit: float):
+        self.limit = min(max(limit, self.min_limit), self.max_limit)
+        ADMISSION_LIMIT.labels(group=self.group).set(self.limit)
+
+
+# Global instances
+_limiters: dict[str, AdaptiveLimiter] = {}
+
+
+def get_admission_limiter(group: str) -> AdaptiveLimiter:
+    """Get adaptive concurrency limiter for a route group"""
+    limiter = _limiters.get(group)
+    if limiter is None:
+        limiter = _limiters[group] = AdaptiveLimiter(
+            group,
+            initial_limit=float(os.getenv("ADMISSION_INITIAL_LIMIT", "100")),
+            min_limit=float(os.getenv("ADMISSION_MIN_LIMIT", "10")),
+            max_limit=float(os.getenv("ADMISSION_MAX_LIMIT", "1000")),
+            tolerance=float(os.getenv("ADMISSION_LATENCY_TOLERANCE", "1.5")),
+            max_queue=int(os.getenv("ADMISSION_MAX_QUEUE", "100")),
+            queue_timeout=float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "0.5")),
+        )
+    return limiter
+
+
+def reset_admission_limiters():
+    """동시성 제한 상태 초기화 (테스트 및 운영 도구용)"""
+    _limiters.clear()
@@ -0,0 +1,168 @@
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from fastapi import Request
+from jose import JWTError, jwt
+from prometheus_client import Counter
+
+from app.config import INTERNAL_AUTH_SECRET, JWT_ALGORITHM, JWT_SECRET
+
+AUTH_CACHE_REQUESTS = Counter(
+    "gateway_auth_cache_requests_total",
+    "Verified-claims cache lookups by result (hit, miss)",
+    ["result"],
+)
+
+AUTH_FAILURES = Counter(
+    "gateway_auth_failures_total",
+    "Bearer tokens rejected at the edge by reason (invalid, missing)",
+    ["reason"],
+)
+
+# 게이트웨이가 검증한 사용자 정보를 업스트림에 전달하는 내부 헤더.
+# 클라이언트가 보낸 같은 이름의 헤더는 항상 제거한다.
+USER_ID_HEADER = "x-user-id"
+USER_EMAIL_HEADER = "x-user-email"
+USER_ROLE_HEADER = "x-user-role"
+AUTH_TIMESTAMP_HEADER = "x-auth-timestamp"
+AUTH_SIGNATURE_HEADER = "x-auth-signature"
+
+INTERNAL_AUTH_HEADERS = frozenset(
+    [USER_ID_HEADER, USER_EMAIL_HEADER, USER_ROLE_HEADER, AUTH_TIMESTAMP_HEADER, AUTH_SIGNATURE_HEADER]
+)
+
+
+class Claims:
+    """검증된 JWT 클레임"""
+
+    __slots__ = ("user_id", "email", "role", "expires_at")
+
+    def __init__(self, user_id: str, email: str = "", role: str = "", expires_at: Optional[float] = None):
+        self.user_id = user_id
+        self.email = email
+        self.role = role
+        self.expires_at = expires_at
+
+
+def decode_token(token: str) -> Optional[Claims]:
+    """auth 서비스(app/auth.py)와 같은 JWT_SECRET/HS256으로 검증 (실패하면 None)
+
+    auth 서비스는 sub에 정수 사용자 ID를 넣으므로 sub 타입 검사는 하지 않는다.
+    """
+    try:
+        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM], options={"verify_sub": False})
+    except JWTError:
+        return None
+
+    if payload.get("sub") is None:
+        return None
+    exp = payload.get("exp")
+    return Claims(
+        str(payload["sub"]),
+        email=str(payload.get("email") or ""),
+        role=str(payload.get("role") or ""),
+        expires_at=float(exp) if exp is not None else None,
+    )
+
+
+class ClaimsCache:
+    """검증된 클레임 캐시 (토큰 해시 → 클레임, LRU + TTL)
+
+    원본 토큰 대신 해시를 키로 보관한다. 엔트리는 ttl과 토큰 만료(exp) 중 이른 시각에 만료된다.
+    검증에 실패한 토큰도 negative_ttl 동안 기억해 같은 잘못된 토큰을 반복해서 디코딩하지 않는다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        ttl: float = 300.0,
+        negative_ttl: float = 10.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.entries: OrderedDict[bytes, tuple[Optional[Claims], float]] = OrderedDict()
+
+    def verify(self, token: str) -> Optional[Claims]:
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        now = self.clock()
+
+        cached = self.entries.get(key)
+        if cached is not None and cached[1] > now:
+            self.entries.move_to_end(key)
+            AUTH_CACHE_REQUESTS.labels(result="hit").inc()
+            return cached[0]
+
+        AUTH_CACHE_REQUESTS.labels(result="miss").inc()
+        claims = decode_token(token)
+        if claims is None:
+            expires_at = now + self.negative_ttl
+        else:
+            expires_at = now + self.ttl
+            if claims.expires_at is not None:
+                expires_at = min(expires_at, claims.expires_at)
+
+        self.entries[key] = (claims, expires_at)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return claims
+
+
+def bearer_token(request: Request) -> Optional[str]:
+    authorization = request.headers.get("authorization", "")
+    if authorization[:7].lower() == "bearer " and authorization[7:].strip():
+        return authorization[7:].strip()
+    return None
+
+
+def authenticate(request: Request) -> Optional[Claims]:
+    """요청의 Bearer 토큰 검증 (결과는 request.state.claims에도 저장)"""
+    token = bearer_token(request)
+    claims = get_claims_cache().verify(token) if token else None
+    if token and claims is None:
+        AUTH_FAILURES.labels(reason="invalid").inc()
+    request.state.claims = claims
+    return claims
+
+
+def sign_claims(user_id: str, email: str, role: str, timestamp: str, secret: str = INTERNAL_AUTH_SECRET) -> str:
+    """내부 헤더 서명 (HMAC-SHA256, 업스트림 서비스의 app/auth.py와 같은 형식)"""
+    message = "\n".join([user_id, email, role, timestamp]).encode()
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def internal_auth_headers(claims: Claims) -> list[tuple[bytes, bytes]]:
+    """업스트림에 전달할 서명된 사용자 헤더"""
+    timestamp = str(int(time.time()))
+    signature = sign_claims(claims.user_id, claims.email, claims.role, timestamp)
+    return [
+        (USER_ID_HEADER.encode(), claims.user_id.encode()),
+        (USER_EMAIL_HEADER.encode(), claims.email.encode()),
+        (USER_ROLE_HEADER.encode(), claims.role.encode()),
+        (AUTH_TIMESTAMP_HEADER.encode(), timestamp.encode()),
+        (AUTH_SIGNATURE_HEADER.encode(), signature.encode()),
+    ]
+
+
+# Global instance
+_claims_cache: Optional[ClaimsCache] = None
+
+
+def get_claims_cache() -> ClaimsCache:
+    """Get verified-claims cache instance"""
+    global _claims_cache
+
+    if _claims_cache is None:
+        _claims_cache = ClaimsCache(
+            max_entries=int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "100000")),
+            ttl=float(os.getenv("AUTH_CACHE_TTL", "300")),
+        )
+
+    return _claims_cache
@@ -0,0 +1,190 @@
+import asyncio
+import logging
+import math
+import random
+import socket
+import time
+from typing import Callable, Iterable, Optional
+from urllib.parse import urlsplit
+
+import dns.asyncresolver
+import dns.exception
+from prometheus_client import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+LB_HEALTHY_ENDPOINTS = Gauge(
+    "gateway_lb_healthy_endpoints",
+    "Endpoints currently in rotation per upstream",
+    ["service"],
+)
+
+LB_EJECTIONS = Counter(
+    "gateway_lb_ejections_total",
+    "Endpoints ejected from rotation after consecutive failures",
+    ["service"],
+)
+
+LEAST_IN_FLIGHT = "least_in_flight"
+EWMA = "ewma"
+
+
+class Endpoint:
+    """업스트림 레플리카 하나의 상태"""
+
+    __slots__ = ("url", "in_flight", "ewma", "updated_at", "failures", "ejections", "ejected_until")
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.in_flight = 0
+        self.ewma = 0.0
+        self.updated_at = 0.0
+        self.failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+
+class LoadBalancer:
+    """클라이언트 측 로드 밸런서 (power of two choices + passive health check)
+
+    임의의 두 엔드포인트 중 점수가 낮은 쪽을 고른다. 점수는 least_in_flight 전략이면 진행 중 요청 수,
+    ewma 전략이면 시간 감쇠 EWMA 지연 × (진행 중 요청 수 + 1)이다. 연속 실패가 failure_threshold에
+    도달한 엔드포인트는 ejection_seconds × 누적 제외 횟수(최대 10배) 동안 제외하되,
+    전체의 max_ejection_ratio를 넘겨 제외하지 않는다. 빠르게 실패하는 레플리카가 EWMA에서 유리해지지 않도록
+    실패 응답은 최소 failure_penalty초로 기록한다.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        urls: Iterable[str] = (),
+        strategy: str = EWMA,
+        failure_threshold: int = 5,
+        ejection_seconds: float = 30.0,
+        max_ejection_ratio: float = 0.5,
+        decay_seconds: float = 10.0,
+        failure_penalty: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.service = service
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.ejection_seconds = ejection_seconds
+        self.max_ejection_ratio = max_ejection_ratio
+        self.decay_seconds = decay_seconds
+        self.failure_penalty = failure_penalty
+        self.clock = clock
+        self.endpoints: list[Endpoint] = []
+        self.set_endpoints(urls)
+
+    def set_endpoints(self, urls: Iterable[str]):
+        """엔드포인트 목록 교체 (기존 엔드포인트의 통계는 유지)"""
+        existing = {endpoint.url: endpoint for endpoint in self.endpoints}
+        self.endpoints = [existing.get(url.rstrip("/")) or Endpoint(url) for url in dict.fromkeys(urls)]
+        self._update_gauge()
+
+    def pick(self, exclude: Iterable[str] = ()) -> Optional[Endpoint]:
+        """요청을 보낼 엔드포인트 선택 (exclude에 있는 URL은 가능하면 피함)"""
+        now = self.clock()
+        candidates = [e for e in self.endpoints if e.ejected_until <= now and e.url not in exclude]
+        if not candidates:
+            candidates = [e for e in self.endpoints if e.ejected_until <= now] or self.endpoints
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+
+        first, second = random.sample(candidates, 2)
+        return first if self._score(first, now) <= self._score(second, now) else second
+
+    def _score(self, endpoint: Endpoint, now: float) -> float:
+        if self.strategy == LEAST_IN_FLIGHT:
+            return endpoint.in_flight
+        return self._decayed_ewma(endpoint, now) * (endpoint.in_flight + 1)
+
+    def _decayed_ewma(self, endpoint: Endpoint, now: float) -> float:
+        # 응답이 없던 엔드포인트는 점수가 서서히 0으로 돌아가 다시 시도된다
+        return endpoint.ewma * math.exp(-max(now - endpoint.updated_at, 0) / self.decay_seconds)
+
+    def on_start(self, endpoint: Endpoint):
+        endpoint.in_flight += 1
+
+    def on_finish(self, endpoint: Endpoint, latency: float, success: bool):
+        endpoint.in_flight -= 1
+        now = self.clock()
+        if not success:
+            latency = max(latency, self.failure_penalty)
+
+        weight = math.exp(-max(now - endpoint.updated_at, 0) / self.decay_seconds)
+        endpoint.ewma = endpoint.ewma * weight + latency * (1 - weight)
+        endpoint.updated_at = now
+
+        if success:
+            endpoint.failures = 0
+            return
+
+        endpoint.failures += 1
+        if endpoint.failures >= self.failure_threshold and self._can_eject(now):
+            endpoint.ejections += 1
+            endpoint.failures = 0
+            endpoint.ejected_until = now + self.ejection_seconds * min(endpoint.ejections, 10)
+            LB_EJECTIONS.labels(service=self.service).inc()
+            logger.warning(f"Ejected {endpoint.url} from {self.service} until +{endpoint.ejected_until - now:.0f}s")
+            self._update_gauge()
+
+    def on_cancel(self, endpoint: Endpoint):
+        """결과를 모르고 끝난 요청 (hedge에서 진 쪽 등): 지연/실패 통계에 반영하지 않음"""
+        endpoint.in_flight -= 1
+
+    def _can_eject(self, now: float) -> bool:
+        ejected = sum(1 for endpoint in self.endpoints if endpoint.ejected_until > now)
+        return ejected + 1 <= len(self.endpoints) * self.max_ejection_ratio
+
+    def _update_gauge(self):
+        now = self.clock()
+        healthy = sum(1 for endpoint in self.endpoints if endpoint.ejected_until <= now)
+        LB_HEALTHY_ENDPOINTS.labels(service=self.service).set(healthy)
+
+
+class EndpointResolver:
+    """서비스 URL 설정을 엔드포인트 목록으로 변환
+
+    - "http://a:8000,http://b:8000": 고정 목록
+    - "dns+http://events-headless:8000": A 레코드의 모든 IP (주기적으로 다시 조회)
+    - "srv+http://_http._tcp.events-headless.ticketing.svc.cluster.local": SRV 레코드의 host:port
+    """
+
+    def __init__(self, spec: str):
+        self.spec = spec
+        self.dynamic = spec.startswith(("dns+", "srv+"))
+
+    def static_urls(self) -> list[str]:
+        return [] if self.dynamic else [url.strip() for url in self.spec.split(",") if url.strip()]
+
+    async def resolve(self) -> list[str]:
+        if not self.dynamic:
+            return self.static_urls()
+
+        kind, url = self.spec.split("+", 1)
+        parts = urlsplit(url)
+
+        if kind == "srv":
+            answers = await dns.asyncresolver.resolve(parts.hostname, "SRV")
+            return sorted(f"{parts.scheme}://{str(record.target).rstrip('.')}:{record.port}" for record in answers)
+
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            parts.hostname, parts.port, type=socket.SOCK_STREAM, proto=socket.IPPROTO_TCP
+        )
+        hosts = sorted({info[4][0] for info in infos})
+        return [f"{parts.scheme}://{host if ':' not in host else f'[{host}]'}:{parts.port}" for host in hosts]
+
+    async def refresh(self, balancer: LoadBalancer):
+        """DNS 조회 결과로 엔드포인트 갱신 (실패하거나 비어 있으면 기존 목록 유지)"""
+        try:
+            urls = await self.resolve()
+        except (OSError, dns.exception.DNSException) as e:
+            logger.warning(f"Endpoint resolution failed for {balancer.service}: {e}")
+            return
+
+        if urls:
+            balancer.set_endpoints(urls)
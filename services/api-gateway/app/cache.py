@@ -0,0 +1,202 @@
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlencode
+
+from prometheus_client import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+CACHE_REQUESTS = Counter(
+    "gateway_response_cache_requests_total",
+    "Response cache lookups by result (hit, stale, miss, coalesced)",
+    ["result"],
+)
+
+CACHE_BYTES = Gauge(
+    "gateway_response_cache_bytes",
+    "Bytes held by the response cache",
+)
+
+CACHE_ENTRIES = Gauge(
+    "gateway_response_cache_entries",
+    "Entries held by the response cache",
+)
+
+
+class CachedResponse:
+    """캐시된 업스트림 응답 (인코딩된 본문 + end-to-end 헤더, Content-Encoding별 압축본)"""
+
+    __slots__ = ("status_code", "headers", "body", "etag", "stored_at", "ttl", "cacheable", "encodings")
+
+    def __init__(self, status_code: int, headers: list[tuple[bytes, bytes]], body: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.ttl = 0.0
+        self.stored_at = 0.0
+        self.etag = self._etag(headers, body)
+        self.cacheable = status_code == 200 and not self._no_store(headers)
+        self.encodings: dict[str, bytes] = {}
+
+    @staticmethod
+    def _etag(headers: list[tuple[bytes, bytes]], body: bytes) -> str:
+        for name, value in headers:
+            if name.lower() == b"etag":
+                return value.decode()
+        return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+    @staticmethod
+    def _no_store(headers: list[tuple[bytes, bytes]]) -> bool:
+        for name, value in headers:
+            if name.lower() == b"cache-control":
+                directives = value.decode().lower()
+                return "no-store" in directives or "private" in directives
+        return False
+
+    @property
+    def size(self) -> int:
+        return (
+            len(self.body)
+            + sum(len(name) + len(value) for name, value in self.headers)
+            + sum(len(body) for body in self.encodings.values())
+        )
+
+    def age(self, now: float) -> float:
+        return now - self.stored_at
+
+
+class ResponseCache:
+    """GET 응답 캐시 (LRU + 용량 제한, stale-while-revalidate, 요청 병합)
+
+    - fresh(age < ttl): 캐시 응답 반환
+    - stale(ttl <= age < ttl + stale_while_revalidate): 캐시 응답을 반환하고 백그라운드에서 한 번만 갱신
+    - 그 외: 업스트림 조회. 같은 키의 동시 미스는 하나의 조회 결과를 함께 기다린다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int = 1024 * 1024,
+        stale_while_revalidate: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.stale_while_revalidate = stale_while_revalidate
+        self.clock = clock
+        self.entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.inflight: dict[str, asyncio.Task] = {}
+        self.size = 0
+
+    @staticmethod
+    def make_key(path: str, query_items: list[tuple[str, str]]) -> str:
+        """경로 + 정렬된 쿼리 파라미터 (빈 값 제외)"""
+        normalized = sorted((name, value) for name, value in query_items if value != "")
+        return f"{path}?{urlencode(normalized)}" if normalized else path
+
+    async def get_or_fetch(
+        self, key: str, ttl: float, fetch: Callable[[], Awaitable[CachedResponse]]
+    ) -> tuple[CachedResponse, str]:
+        """캐시 조회 후 필요하면 업스트림 조회 (응답, 결과: hit/stale/miss/coalesced)"""
+        now = self.clock()
+        entry = self.entries.get(key)
+
+        if entry is not None:
+            age = entry.age(now)
+            if age < entry.ttl:
+                self.entries.move_to_end(key)
+                CACHE_REQUESTS.labels(result="hit").inc()
+                return entry, "hit"
+            if age < entry.ttl + self.stale_while_revalidate:
+                self.entries.move_to_end(key)
+                self._refresh(key, ttl, fetch)
+                CACHE_REQUESTS.labels(result="stale").inc()
+                return entry, "stale"
+
+        if key in self.inflight:
+            CACHE_REQUESTS.labels(result="coalesced").inc()
+            return await asyncio.shield(self.inflight[key]), "coalesced"
+
+        CACHE_REQUESTS.labels(result="miss").inc()
+        return await asyncio.shield(self._refresh(key, ttl, fetch)), "miss"
+
+    def _refresh(self, key: str, ttl: float, fetch: Callable[[], Awaitable[CachedResponse]]) -> asyncio.Task:
+        """키당 하나의 업스트림 조회만 실행"""
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_store(key, ttl, fetch))
+            self.inflight[key] = task
+            task.add_done_callback(lambda done: self._fetch_done(key, done))
+        return task
+
+    def _fetch_done(self, key: str, task: asyncio.Task):
+        self.inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Cache fetch failed for {key}: {task.exception()}")
+
+    async def _fetch_and_store(self, key: str, ttl: float, fetch: Callable[[], Awaitable[CachedResponse]]):
+        response = await fetch()
+        response.ttl = ttl
+        response.stored_at = self.clock()
+        if response.cacheable and response.size <= self.max_entry_bytes:
+            self.put(key, response)
+        return response
+
+    def put(self, key: str, response: CachedResponse):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= old.size
+
+        self.entries[key] = response
+        self.size += response.size
+        self._evict()
+
+    def add_encoding(self, key: str, response: CachedResponse, encoding: str, body: bytes):
+        """압축본을 엔트리에 저장 (엔트리가 이미 교체/제거되었으면 저장하지 않음)"""
+        if self.entries.get(key) is not response or encoding in response.encodings:
+            return
+
+        response.encodings[encoding] = body
+        self.size += len(body)
+        self._evict()
+
+    def _evict(self):
+        while self.size > self.max_bytes and self.entries:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= evicted.size
+
+        CACHE_BYTES.set(self.size)
+        CACHE_ENTRIES.set(len(self.entries))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (weak 비교, 여러 값 및 * 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == bare for candidate in if_none_match.split(","))
+
+
+# Global instance
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get response cache instance"""
+    global _response_cache
+
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            max_bytes=int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            max_entry_bytes=int(os.getenv("RESPONSE_CACHE_MAX_ENTRY_BYTES", str(1024 * 1024))),
+            stale_while_revalidate=float(os.getenv("RESPONSE_CACHE_STALE_WHILE_REVALIDATE", "30")),
+        )
+
+    return _response_cache
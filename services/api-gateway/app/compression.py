@@ -0,0 +1,205 @@
+import asyncio
+import gzip
+import os
+import zlib
+from typing import AsyncIterator, Optional
+
+import brotli
+import zstandard
+from prometheus_client import Counter
+
+COMPRESSION_INPUT_BYTES = Counter(
+    "gateway_compression_input_bytes_total",
+    "Response bytes before compression per content encoding",
+    ["encoding"],
+)
+
+COMPRESSION_OUTPUT_BYTES = Counter(
+    "gateway_compression_output_bytes_total",
+    "Response bytes after compression per content encoding",
+    ["encoding"],
+)
+
+# 서버 선호 순서 (Accept-Encoding의 q 값이 같으면 앞쪽을 고른다)
+ENCODINGS = tuple(
+    encoding.strip() for encoding in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",") if encoding.strip()
+)
+
+# nginx gzip_min_length와 같은 기준: 이보다 작은 본문은 압축 이득이 헤더 비용보다 작다
+MIN_SIZE = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+# 이보다 큰 본문은 스레드 풀에서 압축 (zlib/brotli/zstd 모두 압축 중 GIL을 놓는다).
+# gzip 6 기준 32KB 압축이 약 1ms (benchmarks/bench_compression.py)
+OFFLOAD_SIZE = int(os.getenv("COMPRESSION_OFFLOAD_BYTES", str(32 * 1024)))
+
+GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+COMPRESSIBLE_TYPES = frozenset(
+    [
+        "application/json",
+        "application/javascript",
+        "application/xml",
+        "application/x-ndjson",
+        "image/svg+xml",
+        "text/css",
+        "text/csv",
+        "text/html",
+        "text/javascript",
+        "text/plain",
+        "text/xml",
+    ]
+)
+
+_zstd_compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding에서 사용할 인코딩 선택 (없으면 None = identity)"""
+    if not accept_encoding:
+        return None
+
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params[:2].lower() == "q=":
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name.strip().lower()] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compressible(headers: list[tuple[bytes, bytes]]) -> bool:
+    """압축 대상 응답인지 (텍스트 계열 타입, 아직 인코딩되지 않음, no-transform 아님)"""
+    content_type = None
+    for name, value in headers:
+        name = name.lower()
+        if name == b"content-encoding" and value.strip().lower() != b"identity":
+            return False
+        if name == b"cache-control" and b"no-transform" in value.lower():
+            return False
+        if name == b"content-type":
+            content_type = value.decode("latin-1").split(";", 1)[0].strip().lower()
+
+    if content_type is None:
+        return False
+    return content_type in COMPRESSIBLE_TYPES or content_type.endswith(("+json", "+xml"))
+
+
+def choose_encoding(
+    accept_encoding: Optional[str], status_code: int, headers: list[tuple[bytes, bytes]], size: Optional[int]
+) -> Optional[str]:
+    """응답에 적용할 Content-Encoding (size가 None이면 길이를 모르는 스트림)"""
+    if status_code < 200 or status_code in (204, 304):
+        return None
+    if size is not None and size < MIN_SIZE:
+        return None
+    if not compressible(headers):
+        return None
+    return negotiate(accept_encoding)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        data = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    elif encoding == "br":
+        data = brotli.compress(body, quality=BROTLI_QUALITY)
+    elif encoding == "zstd":
+        data = _zstd_compressor.compress(body)
+    else:
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+
+    COMPRESSION_INPUT_BYTES.labels(encoding=encoding).inc(len(body))
+    COMPRESSION_OUTPUT_BYTES.labels(encoding=encoding).inc(len(data))
+    return data
+
+
+async def compress_async(body: bytes, encoding: str) -> bytes:
+    """큰 본문은 이벤트 루프를 막지 않도록 스레드에서 압축"""
+    if len(body) >= OFFLOAD_SIZE:
+        return await asyncio.to_thread(compress, body, encoding)
+    return compress(body, encoding)
+
+
+class StreamCompressor:
+    """청크 단위 압축 (청크마다 flush해 스트리밍 응답이 지연되지 않게 한다)"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "gzip":
+            self.compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        elif encoding == "br":
+            self.compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        elif encoding == "zstd":
+            self.compressor = _zstd_compressor.compressobj()
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "gzip":
+            data = self.compressor.compress(chunk) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+        elif self.encoding == "br":
+            data = self.compressor.process(chunk) + self.compressor.flush()
+        else:
+            data = self.compressor.compress(chunk) + self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+        COMPRESSION_INPUT_BYTES.labels(encoding=self.encoding).inc(len(chunk))
+        COMPRESSION_OUTPUT_BYTES.labels(encoding=self.encoding).inc(len(data))
+        return data
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            data = self.compressor.finish()
+        else:
+            data = self.compressor.flush()
+        COMPRESSION_OUTPUT_BYTES.labels(encoding=self.encoding).inc(len(data))
+        return data
+
+
+async def compress_stream(chunks: AsyncIterator[bytes], encoding: str) -> AsyncIterator[bytes]:
+    compressor = StreamCompressor(encoding)
+    async for chunk in chunks:
+        if chunk:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+    yield compressor.finish()
+
+
+def vary_headers(headers: list[tuple[bytes, bytes]]) -> list[tuple[bytes, bytes]]:
+    """Vary에 Accept-Encoding 추가 (표현이 요청의 Accept-Encoding에 따라 달라짐)"""
+    for index, (name, value) in enumerate(headers):
+        if name.lower() == b"vary":
+            if b"accept-encoding" in value.lower() or value.strip() == b"*":
+                return headers
+            return headers[:index] + [(name, value + b", Accept-Encoding")] + headers[index + 1 :]
+    return headers + [(b"vary", b"Accept-Encoding")]
+
+
+def encoded_headers(headers: list[tuple[bytes, bytes]], encoding: str) -> list[tuple[bytes, bytes]]:
+    """압축 응답 헤더 (Content-Length 제거, Content-Encoding 추가, ETag는 weak로 변경)
+
+    nginx gzip 모듈과 같이 strong ETag를 weak로 바꿔, 인코딩이 다른 표현이 같은 strong
+    validator를 공유하지 않으면서도 If-None-Match(weak 비교)는 그대로 동작하게 한다.
+    """
+    result = []
+    for name, value in headers:
+        lowered = name.lower()
+        if lowered in (b"content-length", b"content-encoding"):
+            continue
+        if lowered == b"etag" and not value.startswith(b"W/"):
+            value = b"W/" + value
+        result.append((name, value))
+    return vary_headers(result) + [(b"content-encoding", encoding.encode())]
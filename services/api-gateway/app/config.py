@@ -0,0 +1,43 @@
+import os
+
+
+def _service(name: str, default_url: str) -> dict:
+    """업스트림 서비스 설정 (엔드포인트, 커넥션 풀 한도, 타임아웃/재시도/브레이커, 로드 밸런싱)"""
+    prefix = name.upper()
+    return {
+        # 콤마로 구분한 URL 목록, 또는 dns+http://host:port / srv+http://_http._tcp.name (app/balancer.py)
+        "url": os.getenv(f"{prefix}_SERVICE_URL", default_url),
+        "max_connections": int(os.getenv(f"{prefix}_POOL_MAX_CONNECTIONS", "100")),
+        "max_keepalive_connections": int(os.getenv(f"{prefix}_POOL_MAX_KEEPALIVE", "20")),
+        "keepalive_expiry": float(os.getenv(f"{prefix}_POOL_KEEPALIVE_EXPIRY", "30")),
+        "timeout": float(os.getenv(f"{prefix}_TIMEOUT", "10")),
+        "pool_timeout": float(os.getenv(f"{prefix}_POOL_TIMEOUT", "2")),
+        "http2": os.getenv(f"{prefix}_HTTP2", "false").lower() == "true",
+        "max_retries": int(os.getenv(f"{prefix}_MAX_RETRIES", "2")),
+        "breaker_failures": int(os.getenv(f"{prefix}_BREAKER_FAILURES", "5")),
+        "breaker_open_seconds": float(os.getenv(f"{prefix}_BREAKER_OPEN_SECONDS", "10")),
+        "lb_strategy": os.getenv(f"{prefix}_LB_STRATEGY", "ewma"),
+        "lb_failures": int(os.getenv(f"{prefix}_LB_FAILURES", "5")),
+        "lb_ejection_seconds": float(os.getenv(f"{prefix}_LB_EJECTION_SECONDS", "30")),
+    }
+
+
+# Service endpoints
+SERVICES = {
+    "auth": _service("auth", "http://auth-service:8000"),
+    "events": _service("events", "http://events-service:8000"),
+    "booking": _service("booking", "http://booking-service:8000"),
+    "payment": _service("payment", "http://payment-service:8000"),
+    "search": _service("search", "http://search-service:8000"),
+    "queue": _service("queue", "http://queue-service:8000"),
+}
+
+# JWT (auth 서비스와 동일한 설정)
+JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key-change-in-production")
+JWT_ALGORITHM = "HS256"
+
+# 게이트웨이 → 업스트림 내부 사용자 헤더 서명 키 (업스트림 서비스와 공유)
+INTERNAL_AUTH_SECRET = os.getenv("INTERNAL_AUTH_SECRET", JWT_SECRET)
+
+# 가상 대기열 입장 토큰 서명 키 (queue 서비스와 공유)
+QUEUE_TOKEN_SECRET = os.getenv("QUEUE_TOKEN_SECRET", "queue-token-secret-change-this")
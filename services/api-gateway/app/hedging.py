@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+import httpx
+from prometheus_client import Counter
+
+from app.resilience import RetryBudget
+
+logger = logging.getLogger(__name__)
+
+HEDGES_SENT = Counter(
+    "gateway_hedged_requests_total",
+    "Hedged (second) upstream requests sent per route",
+    ["route"],
+)
+
+HEDGES_WON = Counter(
+    "gateway_hedged_requests_won_total",
+    "Hedged requests that answered before the original attempt per route",
+    ["route"],
+)
+
+HEDGES_SKIPPED = Counter(
+    "gateway_hedged_requests_skipped_total",
+    "Hedges not sent because the hedging budget was exhausted per route",
+    ["route"],
+)
+
+
+class LatencyTracker:
+    """최근 응답 시간으로 라우트의 p95 추정
+
+    최근 window개 샘플을 보관하고 recompute_every개마다 분위수를 다시 계산한다.
+    샘플이 min_samples보다 적으면 hedge 지연을 정하지 않는다.
+    """
+
+    def __init__(self, window: int = 1000, min_samples: int = 50, recompute_every: int = 50, quantile: float = 0.95):
+        self.samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.recompute_every = recompute_every
+        self.quantile = quantile
+        self.since_recompute = 0
+        self.value: Optional[float] = None
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+        self.since_recompute += 1
+        if self.since_recompute >= self.recompute_every and len(self.samples) >= self.min_samples:
+            ordered = sorted(self.samples)
+            self.value = ordered[min(int(len(ordered) * self.quantile), len(ordered) - 1)]
+            self.since_recompute = 0
+
+
+class Hedger:
+    """지연 기반 hedged request
+
+    첫 시도가 라우트 p95(최소 min_delay) 안에 응답하지 않으면 같은 요청을 한 번 더 보내고
+    먼저 끝난 응답을 사용한다. 진 쪽은 취소(또는 이미 받은 응답은 닫기)한다.
+    hedge 요청 수는 예산(기본 전체 요청의 5%)으로 제한한다.
+    """
+
+    def __init__(self, min_delay: float = 0.01, budget_ratio: float = 0.05, budget_min_per_second: float = 1.0):
+        self.min_delay = min_delay
+        self.budget_ratio = budget_ratio
+        self.budget_min_per_second = budget_min_per_second
+        self.trackers: dict[str, LatencyTracker] = {}
+        self.budgets: dict[str, RetryBudget] = {}
+
+    def _tracker(self, route: str) -> LatencyTracker:
+        tracker = self.trackers.get(route)
+        if tracker is None:
+            tracker = self.trackers[route] = LatencyTracker()
+        return tracker
+
+    def _budget(self, route: str) -> RetryBudget:
+        budget = self.budgets.get(route)
+        if budget is None:
+            budget = self.budgets[route] = RetryBudget(
+                ratio=self.budget_ratio, min_per_second=self.budget_min_per_second, max_tokens=10
+            )
+        return budget
+
+    def hedge_delay(self, route: str) -> Optional[float]:
+        p95 = self._tracker(route).value
+        return None if p95 is None else max(p95, self.min_delay)
+
+    async def request(self, route: str, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """send()를 필요하면 두 번 실행해 먼저 도착한 응답 반환"""
+        tracker = self._tracker(route)
+        budget = self._budget(route)
+        budget.deposit()
+
+        delay = self.hedge_delay(route)
+        start_time = time.perf_counter()
+        primary = asyncio.create_task(send())
+        tasks = [primary]
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if not done and not budget.withdraw():
+                HEDGES_SKIPPED.labels(route=route).inc()
+            elif not done:
+                HEDGES_SENT.labels(route=route).inc()
+                tasks.append(asyncio.create_task(send()))
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # 같은 순간에 끝났다면 성공한 쪽, 그다음 원래 요청을 우선 (성공 응답을 버리고 오류를 내지 않도록)
+                for task in sorted(done, key=lambda task: (task.exception() is not None, task is not primary)):
+                    if task.exception() is not None:
+                        if not pending:
+                            raise task.exception()
+                        continue
+
+                    tracker.record(time.perf_counter() - start_time)
+                    if task is not primary:
+                        HEDGES_WON.labels(route=route).inc()
+                    for other in done - {task}:
+                        await _discard(other)
+                    return task.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    task.add_done_callback(_close_result)
+
+
+async def _discard(task: asyncio.Task):
+    """진 쪽 응답 정리"""
+    if not task.cancelled() and task.exception() is None:
+        await task.result().aclose()
+
+
+def _close_result(task: asyncio.Task):
+    # 취소 직전에 응답을 받은 경우 커넥션을 풀에 돌려준다
+    if not task.cancelled() and task.exception() is None:
+        asyncio.ensure_future(task.result().aclose())
+
+
+# Global instance
+_hedger: Optional[Hedger] = None
+
+
+def get_hedger() -> Hedger:
+    """Get request hedger instance"""
+    global _hedger
+
+    if _hedger is None:
+        _hedger = Hedger(
+            min_delay=float(os.getenv("HEDGE_MIN_DELAY", "0.01")),
+            budget_ratio=float(os.getenv("HEDGE_BUDGET_RATIO", "0.05")),
+        )
+
+    return _hedger
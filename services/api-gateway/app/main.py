@@ -1,22 +1,66 @@
+import asyncio
+import json
 import logging
+import math
 import os
+import random
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Awaitable, Callable, Optional, TypeVar
 
 import httpx
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette.background import BackgroundTask
+
+from app.admission import get_admission_limiter
+from app.auth import AUTH_FAILURES, INTERNAL_AUTH_HEADERS, Claims, authenticate, internal_auth_headers
+from app.cache import CachedResponse, etag_matches, get_response_cache
+from app.compression import (
+    choose_encoding,
+    compress_async,
+    compress_stream,
+    compressible,
+    encoded_headers,
+    vary_headers,
+)
+from app.config import SERVICES
+from app.hedging import get_hedger
+from app.ratelimit import get_rate_limiter, rate_limit_key, retry_after_header
+from app.resilience import (
+    DEADLINE_HEADER,
+    RETRY_BUDGET_EXHAUSTED,
+    UPSTREAM_RETRIES,
+    Deadline,
+    RetryBudget,
+    get_circuit_breaker,
+    get_retry_budget,
+)
+from app.routes import ROUTES, CompiledRoute, RouteTable
+from app.upstream import get_upstream_pool
+from app.waiting_room import ADMISSION_TOKEN_HEADER, get_waiting_room_gate
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-limiter = Limiter(key_func=get_remote_address)
-app = FastAPI(title="API Gateway", version="1.0.0")
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """업스트림 커넥션 풀 생성 및 종료"""
+    upstream_pool = get_upstream_pool()
+    await upstream_pool.start()
+
+    yield
+
+    await upstream_pool.close()
+    await get_rate_limiter().close()
+    await get_waiting_room_gate().close()
+
+
+app = FastAPI(title="API Gateway", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -26,122 +70,380 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Service endpoints
-SERVICES = {
-    "auth": os.getenv("AUTH_SERVICE_URL", "http://auth-service:8000"),
-    "events": os.getenv("EVENTS_SERVICE_URL", "http://events-service:8000"),
-    "booking": os.getenv("BOOKING_SERVICE_URL", "http://booking-service:8000"),
-    "payment": os.getenv("PAYMENT_SERVICE_URL", "http://payment-service:8000"),
-    "search": os.getenv("SEARCH_SERVICE_URL", "http://search-service:8000"),
-}
-
-
-async def proxy_request(service: str, path: str, request: Request):
-    """프록시 요청 처리"""
-    service_url = SERVICES.get(service)
-    if not service_url:
-        raise HTTPException(status_code=404, detail="Service not found")
-
-    url = f"{service_url}{path}"
-    headers = dict(request.headers)
-    headers.pop("host", None)
-
-    async with httpx.AsyncClient() as client:
-        try:
-            if request.method == "GET":
-                response = await client.get(url, headers=headers, params=request.query_params)
-            elif request.method == "POST":
-                body = await request.body()
-                response = await client.post(url, headers=headers, content=body)
-            elif request.method == "PUT":
-                body = await request.body()
-                response = await client.put(url, headers=headers, content=body)
-            elif request.method == "DELETE":
-                response = await client.delete(url, headers=headers)
-            else:
-                raise HTTPException(status_code=405, detail="Method not allowed")
-
-            return JSONResponse(content=response.json() if response.text else {}, status_code=response.status_code)
-        except httpx.RequestError as e:
-            logger.error(f"Service error: {e}")
-            raise HTTPException(status_code=503, detail="Service unavailable")
-
-
-# Auth routes
-@app.post("/api/auth/register")
-@limiter.limit("5/minute")
-async def auth_register(request: Request):
-    return await proxy_request("auth", "/auth/register", request)
 
+# RFC 7230 hop-by-hop 헤더는 프록시 구간마다 종료되므로 전달하지 않는다
+HOP_BY_HOP_HEADERS = frozenset(
+    [
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+    ]
+)
 
-@app.post("/api/auth/login")
-@limiter.limit("10/minute")
-async def auth_login(request: Request):
-    return await proxy_request("auth", "/auth/login", request)
-
-
-@app.get("/api/auth/me")
-@limiter.limit("30/minute")
-async def auth_me(request: Request):
-    return await proxy_request("auth", "/auth/me", request)
-
-
-# Events routes
-@app.get("/api/events")
-@limiter.limit("100/minute")
-async def events_list(request: Request):
-    return await proxy_request("events", "/events", request)
-
-
-@app.post("/api/events")
-@limiter.limit("10/minute")
-async def events_create(request: Request):
-    return await proxy_request("events", "/events", request)
-
-
-@app.get("/api/events/{event_id}")
-@limiter.limit("100/minute")
-async def events_get(event_id: str, request: Request):
-    return await proxy_request("events", f"/events/{event_id}", request)
-
+PROXY_STREAMING = os.getenv("PROXY_STREAMING", "true").lower() == "true"
 
-# Search routes
-@app.get("/api/search/events")
-@limiter.limit("50/minute")
-async def search_events(request: Request):
-    return await proxy_request("search", "/search/events", request)
+# 업스트림 과부하/일시 장애로 보고 브레이커 실패 및 재시도 대상으로 삼는 상태 코드
+RETRYABLE_STATUS_CODES = frozenset([502, 503, 504])
+RETRY_BACKOFF_BASE = 0.025
 
+# 업스트림으로 전달하지 않는 요청 헤더 (게이트웨이가 다시 설정)
+STRIPPED_REQUEST_HEADERS = frozenset(
+    [b"host", b"accept-encoding", DEADLINE_HEADER.encode()] + [name.encode() for name in INTERNAL_AUTH_HEADERS]
+)
 
-# Booking routes
-@app.post("/api/bookings")
-@limiter.limit("20/minute")
-async def bookings_create(request: Request):
-    return await proxy_request("booking", "/bookings", request)
 
+def filter_headers(headers) -> list[tuple[bytes, bytes]]:
+    """hop-by-hop 헤더(및 Connection 헤더에 나열된 헤더) 제거"""
+    connection_tokens = set()
+    for name, value in headers:
+        if name.lower() == b"connection":
+            connection_tokens.update(token.strip().lower().encode() for token in value.decode().split(","))
 
-@app.get("/api/bookings/my")
-@limiter.limit("30/minute")
-async def bookings_my(request: Request):
-    return await proxy_request("booking", "/bookings/my", request)
+    return [
+        (name, value)
+        for name, value in headers
+        if name.lower().decode() not in HOP_BY_HOP_HEADERS and name.lower() not in connection_tokens
+    ]
 
 
-@app.post("/api/bookings/{booking_id}/confirm")
-@limiter.limit("10/minute")
-async def bookings_confirm(booking_id: str, request: Request):
-    return await proxy_request("booking", f"/bookings/{booking_id}/confirm", request)
+async def send_upstream(
+    service: str, path: str, request: Request, timeout: Optional[float] = None, hedge_key: Optional[str] = None
+) -> httpx.Response:
+    """업스트림으로 요청을 보내고 응답 헤더까지 수신 (본문은 스트림으로 남겨 둠)
 
+    서킷 브레이커가 열려 있으면 즉시 503을 반환한다. 본문 없는 GET만 재시도 예산 안에서
+    재시도하며, 남은 deadline은 매 시도의 타임아웃과 DEADLINE_HEADER로 업스트림에 전달된다.
+    hedge_key가 주어진 본문 없는 GET은 각 시도를 hedged request로 보낸다.
+    """
+    if service not in SERVICES:
+        raise HTTPException(status_code=404, detail="Service not found")
 
-# Payment routes
-@app.post("/api/payments/create-intent")
-@limiter.limit("20/minute")
-async def payments_create_intent(request: Request):
-    return await proxy_request("payment", "/payments/create-intent", request)
+    if request.method not in ("GET", "POST", "PUT", "PATCH", "DELETE"):
+        raise HTTPException(status_code=405, detail="Method not allowed")
+
+    # 압축은 게이트웨이가 클라이언트와 협상하므로 업스트림에는 identity를 요청한다
+    # (캐시 엔트리가 특정 클라이언트의 Accept-Encoding에 묶이지 않도록).
+    # 클라이언트가 보낸 내부 사용자 헤더는 버리고 게이트웨이가 검증한 클레임으로 다시 서명한다.
+    headers = [
+        (name, value)
+        for name, value in filter_headers(request.headers.raw)
+        if name.lower() not in STRIPPED_REQUEST_HEADERS
+    ] + [(b"accept-encoding", b"identity")]
+    claims = getattr(request.state, "claims", None)
+    if claims is not None:
+        headers += internal_auth_headers(claims)
+    has_body = "content-length" in request.headers or "transfer-encoding" in request.headers
+    retryable = request.method == "GET" and not has_body
+
+    deadline = Deadline.from_request(request, timeout if timeout is not None else SERVICES[service]["timeout"])
+    breaker = get_circuit_breaker(service)
+    budget = get_retry_budget(service)
+    budget.deposit()
+
+    attempt = 0
+    # 재시도와 hedge는 이미 시도한 레플리카를 피한다
+    tried_endpoints: set = set()
+    while True:
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise HTTPException(status_code=504, detail="Gateway timeout")
+
+        if not breaker.allow():
+            raise HTTPException(
+                status_code=503,
+                detail="Service unavailable",
+                headers={"Retry-After": str(max(math.ceil(breaker.retry_after()), 1))},
+            )
+
+        def send() -> Awaitable[httpx.Response]:
+            return get_upstream_pool().request(
+                service,
+                request.method,
+                path,
+                stream=True,
+                exclude=tried_endpoints,
+                headers=headers + [(DEADLINE_HEADER.encode(), str(int(remaining * 1000)).encode())],
+                params=request.query_params,
+                content=request.stream() if has_body else None,
+                timeout=httpx.Timeout(remaining, pool=min(remaining, SERVICES[service]["pool_timeout"])),
+            )
 
+        try:
+            upstream = await (get_hedger().request(hedge_key, send) if hedge_key and retryable else send())
+        except httpx.RequestError as e:
+            breaker.record_failure()
+            if retryable and await retry_allowed(service, attempt, deadline, budget):
+                attempt += 1
+                continue
+            logger.error(f"Service error: {e}")
+            if isinstance(e, httpx.TimeoutException):
+                raise HTTPException(status_code=504, detail="Gateway timeout")
+            raise HTTPException(status_code=503, detail="Service unavailable")
 
-@app.post("/api/payments/webhook")
-async def payments_webhook(request: Request):
-    """Stripe webhook - no rate limit"""
-    return await proxy_request("payment", "/payments/webhook", request)
+        if upstream.status_code not in RETRYABLE_STATUS_CODES:
+            breaker.record_success()
+            return upstream
+
+        breaker.record_failure()
+        if retryable and await retry_allowed(service, attempt, deadline, budget):
+            await upstream.aclose()
+            attempt += 1
+            continue
+        return upstream
+
+
+async def retry_allowed(service: str, attempt: int, deadline: Deadline, budget: RetryBudget) -> bool:
+    """재시도 가능 여부 확인 후 지터 백오프 대기"""
+    if attempt >= SERVICES[service]["max_retries"]:
+        return False
+
+    if not budget.withdraw():
+        RETRY_BUDGET_EXHAUSTED.labels(service=service).inc()
+        return False
+
+    backoff = random.uniform(0, min(RETRY_BACKOFF_BASE * 2**attempt, deadline.remaining() / 2))
+    if backoff > 0:
+        await asyncio.sleep(backoff)
+
+    UPSTREAM_RETRIES.labels(service=service).inc()
+    return True
+
+
+async def read_upstream(upstream: httpx.Response) -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+    """업스트림 응답을 인코딩된 원본 바이트 그대로 버퍼링 (Content-Length는 제외)"""
+    try:
+        body = b"".join([chunk async for chunk in upstream.aiter_raw()])
+    finally:
+        await upstream.aclose()
+
+    headers = [
+        (name, value) for name, value in filter_headers(upstream.headers.raw) if name.lower() != b"content-length"
+    ]
+    return upstream.status_code, headers, body
+
+
+def buffered_response(status_code: int, headers: list[tuple[bytes, bytes]], body: bytes) -> Response:
+    """버퍼링된 본문으로 응답 생성 (Content-Length는 다시 계산)"""
+    response = Response(content=body, status_code=status_code)
+    response.raw_headers = [header for header in response.raw_headers if header[0] == b"content-length"] + headers
+    return response
+
+
+async def compressed_response(
+    request: Request, status_code: int, headers: list[tuple[bytes, bytes]], body: bytes
+) -> Response:
+    """Accept-Encoding에 따라 압축한 버퍼링 응답"""
+    encoding = choose_encoding(request.headers.get("accept-encoding"), status_code, headers, len(body))
+    if encoding is None:
+        return buffered_response(status_code, vary_headers(headers) if compressible(headers) else headers, body)
+    return buffered_response(status_code, encoded_headers(headers, encoding), await compress_async(body, encoding))
+
+
+async def proxy_request(
+    service: str,
+    path: str,
+    request: Request,
+    stream: bool = PROXY_STREAMING,
+    timeout: Optional[float] = None,
+    hedge_key: Optional[str] = None,
+):
+    """프록시 요청 처리
+
+    stream=True이면 요청/응답 본문을 청크 단위로 그대로 전달하고, False이면 응답 본문을 버퍼링한다.
+    어느 쪽이든 JSON을 디코딩하지 않고 상태 코드와 헤더를 그대로 전달하며,
+    텍스트 계열 응답은 클라이언트가 지원하는 인코딩(zstd/br/gzip)으로 압축한다.
+    """
+    upstream = await send_upstream(service, path, request, timeout, hedge_key)
+
+    if not stream:
+        return await compressed_response(request, *await read_upstream(upstream))
+
+    headers = filter_headers(upstream.headers.raw)
+    content = upstream.aiter_raw()
+    length = upstream.headers.get("content-length")
+    encoding = choose_encoding(
+        request.headers.get("accept-encoding"),
+        upstream.status_code,
+        headers,
+        int(length) if length and length.isdigit() else None,
+    )
+    if encoding is not None:
+        content = compress_stream(content, encoding)
+        headers = encoded_headers(headers, encoding)
+    elif compressible(headers):
+        headers = vary_headers(headers)
+
+    response = StreamingResponse(content, status_code=upstream.status_code, background=BackgroundTask(upstream.aclose))
+    response.raw_headers = headers
+    return response
+
+
+async def cached_proxy_request(compiled: CompiledRoute, path: str, request: Request) -> Response:
+    """캐시 대상 GET 라우트 처리 (stale-while-revalidate, 요청 병합, ETag/304)
+
+    압축본은 인코딩별로 처음 요청될 때 한 번 만들어 캐시 엔트리에 함께 저장한다.
+    """
+    cache = get_response_cache()
+    key = cache.make_key(path, request.query_params.multi_items())
+
+    async def fetch() -> CachedResponse:
+        upstream = await send_upstream(
+            compiled.route.service, path, request, compiled.route.timeout, compiled.hedge_key
+        )
+        return CachedResponse(*await read_upstream(upstream))
+
+    async def admitted_fetch() -> CachedResponse:
+        return await admitted(compiled, fetch)
+
+    entry, result = await cache.get_or_fetch(key, compiled.route.cache_ttl, admitted_fetch)
+
+    cache_headers = [(b"etag", entry.etag.encode()), (b"x-cache", result.upper().encode())]
+    if result in ("hit", "stale"):
+        cache_headers.append((b"age", str(int(entry.age(cache.clock()))).encode()))
+
+    headers = [(name, value) for name, value in entry.headers if name.lower() != b"etag"] + cache_headers
+    encoding = choose_encoding(request.headers.get("accept-encoding"), entry.status_code, headers, len(entry.body))
+    if encoding is not None:
+        headers = encoded_headers(headers, encoding)
+    elif compressible(headers):
+        headers = vary_headers(headers)
+
+    if entry.status_code == 200 and etag_matches(request.headers.get("if-none-match"), entry.etag):
+        response = Response(status_code=304)
+        response.raw_headers = [
+            (name, value) for name, value in headers if name.lower() in (b"etag", b"x-cache", b"age", b"vary")
+        ]
+        return response
+
+    if encoding is None:
+        return buffered_response(entry.status_code, headers, entry.body)
+
+    body = entry.encodings.get(encoding)
+    if body is None:
+        body = await compress_async(entry.body, encoding)
+        cache.add_encoding(key, entry, encoding, body)
+    return buffered_response(entry.status_code, headers, body)
+
+
+ResponseT = TypeVar("ResponseT", Response, CachedResponse)
+
+
+async def admitted(compiled: CompiledRoute, call: Callable[[], Awaitable[ResponseT]]) -> ResponseT:
+    """라우트 그룹의 적응형 동시성 제한 안에서 업스트림 호출
+
+    슬롯을 얻지 못하면(낮은 우선순위부터) 즉시 503 + Retry-After를 반환한다. 응답 헤더까지의
+    지연은 limit 조정에 쓰이고, 502/503/504와 타임아웃은 limit을 줄인다.
+    """
+    limiter = get_admission_limiter(compiled.group)
+    if not await limiter.acquire(compiled.route.priority):
+        raise HTTPException(status_code=503, detail="Service overloaded", headers={"Retry-After": "1"})
+
+    start_time = time.perf_counter()
+    latency, dropped = None, False
+    try:
+        response = await call()
+        latency = time.perf_counter() - start_time
+        dropped = response.status_code in RETRYABLE_STATUS_CODES
+        return response
+    except HTTPException as e:
+        dropped = e.status_code in RETRYABLE_STATUS_CODES
+        raise
+    finally:
+        limiter.release(latency, dropped)
+
+
+route_table = RouteTable(ROUTES)
+
+
+async def check_rate_limit(compiled: CompiledRoute, request: Request) -> Optional[JSONResponse]:
+    """라우트별 요청 제한 확인 (초과 시 429 응답 반환)"""
+    if compiled.rate_limit is None:
+        return None
+
+    allowed, retry_after = await get_rate_limiter().hit(compiled.rate_limit, rate_limit_key(request), compiled.key)
+    if allowed:
+        return None
+
+    return JSONResponse(
+        {"error": f"Rate limit exceeded: {compiled.rate_limit}"},
+        status_code=429,
+        headers={"Retry-After": retry_after_header(retry_after)},
+    )
+
+
+async def check_admission(request: Request, claims: Claims) -> Optional[JSONResponse]:
+    """대기열이 열린 이벤트의 예약 요청이면 입장 토큰 확인 (없거나 잘못되면 403 응답 반환)
+
+    열린 대기열이 하나도 없으면 본문을 읽지 않는다. 본문은 버퍼링되어 업스트림 전송 시 다시 사용된다.
+    """
+    gate = get_waiting_room_gate()
+    gated = await gate.gated_events()
+    if not gated:
+        return None
+
+    try:
+        event_id = json.loads(await request.body()).get("event_id")
+    except (ValueError, AttributeError):
+        # 본문 검증은 업스트림에 맡긴다
+        return None
+    if event_id is None or str(event_id) not in gated:
+        return None
+
+    if gate.verify(request.headers.get(ADMISSION_TOKEN_HEADER), claims.user_id, str(event_id)):
+        return None
+    return JSONResponse({"detail": "Admission token required"}, status_code=403)
+
+
+@app.api_route("/api/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+async def gateway(request: Request):
+    """라우트 테이블 기반 단일 프록시 핸들러"""
+    match = route_table.lookup(request.url.path)
+    if match is None:
+        raise HTTPException(status_code=404, detail="Route not found")
+
+    routes, params = match
+    compiled = routes.get(request.method)
+    if compiled is None:
+        raise HTTPException(status_code=405, detail="Method not allowed", headers={"Allow": ", ".join(routes)})
+
+    claims = authenticate(request)
+    rate_limited = await check_rate_limit(compiled, request)
+    if rate_limited is not None:
+        return rate_limited
+
+    if compiled.route.auth and claims is None:
+        if "authorization" not in request.headers:
+            AUTH_FAILURES.labels(reason="missing").inc()
+        return JSONResponse(
+            {"detail": "Could not validate credentials"}, status_code=401, headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    if compiled.route.admission:
+        rejected = await check_admission(request, claims)
+        if rejected is not None:
+            return rejected
+
+    path = compiled.upstream_path(params)
+    if compiled.route.cache_ttl and request.method == "GET":
+        return await cached_proxy_request(compiled, path, request)
+
+    return await admitted(
+        compiled,
+        lambda: proxy_request(
+            compiled.route.service,
+            path,
+            request,
+            stream=compiled.route.stream or PROXY_STREAMING,
+            timeout=compiled.route.timeout,
+            hedge_key=compiled.hedge_key,
+        ),
+    )
 
 
 @app.get("/health")
@@ -149,6 +451,11 @@ async def health():
     return {"status": "healthy", "service": "api-gateway", "timestamp": datetime.utcnow().isoformat()}
 
 
+@app.get("/metrics")
+async def metrics():
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/")
 async def root():
     return {"service": "API Gateway", "version": "1.0.0", "services": list(SERVICES.keys())}
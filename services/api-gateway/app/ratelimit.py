@@ -0,0 +1,179 @@
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import redis.asyncio as redis
+from fastapi import Request
+from limits import RateLimitItem
+from prometheus_client import Counter
+
+from app.auth import authenticate
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_DECISIONS = Counter(
+    "gateway_rate_limit_decisions_total",
+    "Rate limit decisions by outcome and source (local lease or redis)",
+    ["decision", "source"],
+)
+
+RATE_LIMIT_ERRORS = Counter(
+    "gateway_rate_limit_redis_errors_total",
+    "Redis errors while checking rate limits (requests are allowed)",
+)
+
+# GCRA: 키마다 TAT(theoretical arrival time)만 저장하고 요청된 개수만큼 한 번에 토큰을 발급
+# KEYS[1] = TAT 키, ARGV = now_ms, emission interval_ms, period_ms, requested
+# 반환값 = {발급된 토큰 수, 발급이 0일 때 재시도까지 남은 ms}
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local period = tonumber(ARGV[3])
+local requested = tonumber(ARGV[4])
+
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+
+local granted = math.floor((now + period - tat) / interval)
+if granted > requested then
+    granted = requested
+end
+if granted < 1 then
+    return {0, math.ceil(tat + interval - period - now)}
+end
+
+tat = tat + granted * interval
+redis.call('SET', KEYS[1], tat, 'PX', math.ceil(tat - now))
+return {granted, 0}
+"""
+
+
+class _Lease:
+    """Redis에서 미리 받아 둔 로컬 토큰"""
+
+    __slots__ = ("tokens", "expires_at", "batch")
+
+    def __init__(self, tokens: int, expires_at: float, batch: int):
+        self.tokens = tokens
+        self.expires_at = expires_at
+        self.batch = batch
+
+
+class RedisRateLimiter:
+    """Redis GCRA 기반 분산 요청 제한
+
+    체크 한 번은 Lua 스크립트 한 번(왕복 1회)이다. 자주 들어오는 키는 토큰을 묶음으로
+    미리 받아 lease_ttl 동안 로컬에서 소비한다. 묶음 크기는 1에서 시작해 lease가 만료 전에
+    소진될 때마다 두 배로 늘고(최대 limit의 10%, max_prefetch), 남긴 채 만료되면 1로 돌아간다.
+    따라서 레플리카 하나가 남겨 버릴 수 있는 토큰은 limit의 10% 이내다.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        prefix: str = "ratelimit",
+        max_prefetch: int = 50,
+        lease_ttl: float = 1.0,
+        max_leases: int = 10000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.client = client
+        self.prefix = prefix
+        self.max_prefetch = max_prefetch
+        self.lease_ttl = lease_ttl
+        self.max_leases = max_leases
+        self.clock = clock
+        self.script = client.register_script(GCRA_SCRIPT)
+        self.leases: OrderedDict[str, _Lease] = OrderedDict()
+
+    async def hit(self, item: RateLimitItem, key: str, namespace: str) -> tuple[bool, float]:
+        """요청 1건 소비 (허용 여부, 재시도까지 남은 초)"""
+        lease_key = f"{self.prefix}:{namespace}:{key}"
+        now = self.clock()
+
+        lease = self.leases.get(lease_key)
+        if lease is not None and lease.tokens > 0 and lease.expires_at > now:
+            lease.tokens -= 1
+            RATE_LIMIT_DECISIONS.labels(decision="allowed", source="local").inc()
+            return True, 0.0
+
+        batch = self._next_batch(item, lease, now)
+        period_ms = item.get_expiry() * 1000
+        interval_ms = period_ms / item.amount
+
+        try:
+            granted, retry_after_ms = await self.script(
+                keys=[lease_key], args=[int(now * 1000), interval_ms, period_ms, batch]
+            )
+        except redis.RedisError as e:
+            # Redis 장애 시 게이트웨이 전체가 멈추지 않도록 허용(fail-open)
+            RATE_LIMIT_ERRORS.inc()
+            logger.warning(f"Rate limit check failed, allowing request: {e}")
+            return True, 0.0
+
+        if int(granted) == 0:
+            RATE_LIMIT_DECISIONS.labels(decision="limited", source="redis").inc()
+            return False, int(retry_after_ms) / 1000
+
+        self._store(lease_key, _Lease(int(granted) - 1, now + self.lease_ttl, batch))
+        RATE_LIMIT_DECISIONS.labels(decision="allowed", source="redis").inc()
+        return True, 0.0
+
+    def _next_batch(self, item: RateLimitItem, lease: Optional[_Lease], now: float) -> int:
+        """이번에 미리 받을 토큰 수"""
+        cap = max(1, min(self.max_prefetch, item.amount // 10))
+        if lease is None:
+            return 1
+        if lease.tokens == 0 and lease.expires_at > now:
+            return min(lease.batch * 2, cap)
+        return 1
+
+    def _store(self, lease_key: str, lease: _Lease):
+        self.leases[lease_key] = lease
+        self.leases.move_to_end(lease_key)
+        while len(self.leases) > self.max_leases:
+            self.leases.popitem(last=False)
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def rate_limit_key(request: Request) -> str:
+    """요청 제한 키: 유효한 JWT가 있으면 사용자, 없으면 클라이언트 IP"""
+    claims = request.state.claims if hasattr(request.state, "claims") else authenticate(request)
+    if claims is not None:
+        return f"user:{claims.user_id}"
+
+    return f"ip:{request.client.host if request.client else '127.0.0.1'}"
+
+
+def retry_after_header(seconds: float) -> str:
+    return str(max(math.ceil(seconds), 1))
+
+
+# Global instance
+_rate_limiter: Optional[RedisRateLimiter] = None
+
+
+def get_rate_limiter() -> RedisRateLimiter:
+    """Get rate limiter instance"""
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        client = redis.from_url(
+            os.getenv("REDIS_URL", "redis://redis:6379/0"),
+            socket_timeout=float(os.getenv("RATE_LIMIT_REDIS_TIMEOUT", "0.05")),
+            socket_connect_timeout=float(os.getenv("RATE_LIMIT_REDIS_TIMEOUT", "0.05")),
+        )
+        _rate_limiter = RedisRateLimiter(
+            client,
+            max_prefetch=int(os.getenv("RATE_LIMIT_MAX_PREFETCH", "50")),
+            lease_ttl=float(os.getenv("RATE_LIMIT_LEASE_TTL", "1.0")),
+        )
+
+    return _rate_limiter
@@ -0,0 +1,220 @@
+import logging
+import os
+import time
+from typing import Callable, Optional
+
+from fastapi import Request
+from prometheus_client import Counter, Gauge
+
+from app.config import SERVICES
+
+logger = logging.getLogger(__name__)
+
+# 업스트림에 남은 처리 시간(ms)을 전달하는 헤더. 클라이언트가 보내면 더 짧은 쪽을 사용한다.
+DEADLINE_HEADER = "x-request-deadline-ms"
+
+BREAKER_STATE = Gauge(
+    "gateway_circuit_breaker_state",
+    "Circuit breaker state per upstream (0=closed, 1=half_open, 2=open)",
+    ["service"],
+)
+
+BREAKER_TRANSITIONS = Counter(
+    "gateway_circuit_breaker_transitions_total",
+    "Circuit breaker state transitions per upstream",
+    ["service", "state"],
+)
+
+BREAKER_REJECTED = Counter(
+    "gateway_circuit_breaker_rejected_total",
+    "Requests fast-failed because the upstream breaker was open",
+    ["service"],
+)
+
+UPSTREAM_RETRIES = Counter(
+    "gateway_upstream_retries_total",
+    "Retried upstream requests",
+    ["service"],
+)
+
+RETRY_BUDGET_EXHAUSTED = Counter(
+    "gateway_retry_budget_exhausted_total",
+    "Retries skipped because the upstream retry budget was exhausted",
+    ["service"],
+)
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """업스트림별 서킷 브레이커 (closed → open → half_open → closed)
+
+    연속 실패가 failure_threshold에 도달하면 open 상태가 되어 open_seconds 동안 요청을 즉시 거절한다.
+    이후 half_open 상태에서 half_open_max_calls개의 요청만 통과시켜 성공하면 closed, 실패하면 다시 open.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        failure_threshold: int = 5,
+        open_seconds: float = 10.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.service = service
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        BREAKER_STATE.labels(service=service).set(0)
+
+    def allow(self) -> bool:
+        """요청 통과 여부 (half_open에서는 탐색 요청 슬롯을 점유)"""
+        if self.state == OPEN:
+            if self.clock() - self.opened_at < self.open_seconds:
+                BREAKER_REJECTED.labels(service=self.service).inc()
+                return False
+            self._transition(HALF_OPEN)
+
+        if self.state == HALF_OPEN:
+            if self.half_open_calls >= self.half_open_max_calls:
+                BREAKER_REJECTED.labels(service=self.service).inc()
+                return False
+            self.half_open_calls += 1
+
+        return True
+
+    def retry_after(self) -> float:
+        """open 상태가 끝나기까지 남은 초"""
+        return max(self.open_seconds - (self.clock() - self.opened_at), 0.0)
+
+    def record_success(self):
+        self.failures = 0
+        if self.state == HALF_OPEN:
+            self._transition(CLOSED)
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self._transition(OPEN)
+
+    def _transition(self, state: str):
+        if state == OPEN:
+            self.opened_at = self.clock()
+        if state != HALF_OPEN:
+            self.half_open_calls = 0
+        if state == CLOSED:
+            self.failures = 0
+
+        if state != self.state:
+            logger.warning(f"Circuit breaker for {self.service}: {self.state} -> {state}")
+            BREAKER_TRANSITIONS.labels(service=self.service, state=state).inc()
+        self.state = state
+        BREAKER_STATE.labels(service=self.service).set(_STATE_VALUES[state])
+
+
+class RetryBudget:
+    """재시도 예산 (토큰 버킷)
+
+    요청마다 ratio만큼 토큰이 쌓이고 재시도마다 1개를 쓴다. 초당 min_per_second만큼은 항상 보충되어
+    트래픽이 적을 때도 재시도할 수 있다. 장애 시 재시도가 전체 요청의 ratio를 넘지 않는다.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_per_second: float = 5.0,
+        max_tokens: float = 100.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.clock = clock
+        self.tokens = max_tokens
+        self.updated_at = clock()
+
+    def _refill(self, amount: float = 0.0):
+        now = self.clock()
+        self.tokens = min(self.max_tokens, self.tokens + amount + (now - self.updated_at) * self.min_per_second)
+        self.updated_at = now
+
+    def deposit(self):
+        """요청 1건 기록"""
+        self._refill(self.ratio)
+
+    def withdraw(self) -> bool:
+        """재시도 1회 사용 (예산이 없으면 False)"""
+        self._refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class Deadline:
+    """요청 처리 마감 시각"""
+
+    def __init__(self, timeout: float, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.expires_at = clock() + timeout
+
+    @classmethod
+    def from_request(cls, request: Request, timeout: float) -> "Deadline":
+        """라우트/서비스 타임아웃과 클라이언트가 보낸 deadline 중 짧은 쪽"""
+        header = request.headers.get(DEADLINE_HEADER)
+        if header:
+            try:
+                timeout = min(timeout, max(int(header), 0) / 1000)
+            except ValueError:
+                pass
+        return cls(timeout)
+
+    def remaining(self) -> float:
+        return self.expires_at - self.clock()
+
+
+# Global instances
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_retry_budgets: dict[str, RetryBudget] = {}
+
+
+def get_circuit_breaker(service: str) -> CircuitBreaker:
+    """Get circuit breaker for an upstream service"""
+    breaker = _circuit_breakers.get(service)
+    if breaker is None:
+        config = SERVICES[service]
+        breaker = _circuit_breakers[service] = CircuitBreaker(
+            service,
+            failure_threshold=config["breaker_failures"],
+            open_seconds=config["breaker_open_seconds"],
+        )
+    return breaker
+
+
+def get_retry_budget(service: str) -> RetryBudget:
+    """Get retry budget for an upstream service"""
+    budget = _retry_budgets.get(service)
+    if budget is None:
+        budget = _retry_budgets[service] = RetryBudget(
+            ratio=float(os.getenv("RETRY_BUDGET_RATIO", "0.1")),
+            min_per_second=float(os.getenv("RETRY_BUDGET_MIN_PER_SECOND", "5")),
+        )
+    return budget
+
+
+def reset_resilience_state(service: Optional[str] = None):
+    """브레이커/재시도 예산 초기화 (테스트 및 운영 도구용)"""
+    for registry in (_circuit_breakers, _retry_budgets):
+        if service is None:
+            registry.clear()
+        else:
+            registry.pop(service, None)
@@ -0,0 +1,388 @@
+from typing import Literal, Optional
+from urllib.parse import quote
+
+from limits import RateLimitItem, parse
+from pydantic import BaseModel, ConfigDict
+
+
+class Route(BaseModel):
+    """게이트웨이 라우트 정의
+
+    path는 "/api/events/{event_id}" 형태의 패턴이며 마지막 세그먼트에 한해
+    "{name:path}"로 나머지 경로 전체를 매칭할 수 있다. upstream은 같은 파라미터를
+    사용하는 업스트림 경로 템플릿이다.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    method: str
+    path: str
+    service: str
+    upstream: str
+    rate_limit: Optional[str] = None  # 예: "10/minute", None이면 제한 없음
+    cache_ttl: Optional[float] = None  # 응답 캐시 TTL(초), None이면 캐시하지 않음
+    timeout: Optional[float] = None  # None이면 서비스 기본 타임아웃
+    hedge: bool = False  # 본문 없는 GET을 p95 지연 후 한 번 더 보내는 hedged request 사용 여부
+    auth: bool = False  # True면 유효한 Bearer 토큰이 없는 요청을 게이트웨이에서 401로 거절
+    group: Optional[str] = None  # 동시성 제한 그룹, None이면 서비스 이름
+    priority: Literal["critical", "high", "normal", "low"] = "normal"  # 과부하 시 낮은 우선순위부터 503
+    admission: bool = False  # True면 대기열이 열린 이벤트(본문 event_id)에 입장 토큰 요구 (app/waiting_room.py)
+    stream: bool = False  # True면 PROXY_STREAMING과 무관하게 응답을 스트리밍 (SSE 등 오래 열려 있는 응답)
+
+
+class CompiledRoute:
+    """매칭에 필요한 값을 미리 계산해 둔 라우트"""
+
+    __slots__ = ("route", "key", "rate_limit", "wildcards", "hedge_key", "group")
+
+    def __init__(self, route: Route):
+        self.route = route
+        self.key = f"{route.method} {route.path}"
+        self.rate_limit: Optional[RateLimitItem] = parse(route.rate_limit) if route.rate_limit else None
+        self.wildcards = {segment[1:-6] for segment in route.path.split("/") if segment.endswith(":path}")}
+        self.hedge_key = self.key if route.hedge else None
+        self.group = route.group or route.service
+
+    def upstream_path(self, params: dict) -> str:
+        """업스트림 경로 생성 (파라미터는 다시 URL 인코딩)"""
+        path = self.route.upstream
+        for name, value in params.items():
+            placeholder = f"{{{name}:path}}" if name in self.wildcards else f"{{{name}}}"
+            path = path.replace(placeholder, quote(value, safe="/" if name in self.wildcards else ""))
+        return path
+
+
+class _Node:
+    __slots__ = ("static", "param", "param_name", "wildcard", "wildcard_name", "routes")
+
+    def __init__(self):
+        self.static: dict[str, "_Node"] = {}
+        self.param: Optional["_Node"] = None
+        self.param_name: Optional[str] = None
+        self.wildcard: Optional[dict[str, CompiledRoute]] = None
+        self.wildcard_name: Optional[str] = None
+        self.routes: dict[str, CompiledRoute] = {}
+
+
+class RouteTable:
+    """세그먼트 단위 prefix trie로 컴파일된 라우트 테이블
+
+    매칭 비용은 라우트 개수가 아니라 경로 깊이에 비례한다. 같은 위치에서는
+    정적 세그먼트가 파라미터보다, 파라미터가 {name:path} 와일드카드보다 우선한다.
+    """
+
+    def __init__(self, routes: list[Route]):
+        self.routes = routes
+        self.root = _Node()
+        for route in routes:
+            self._insert(CompiledRoute(route))
+
+    def _insert(self, compiled: CompiledRoute):
+        node = self.root
+        segments = compiled.route.path.strip("/").split("/")
+
+        for index, segment in enumerate(segments):
+            if segment.startswith("{") and segment.endswith(":path}"):
+                if index != len(segments) - 1:
+                    raise ValueError(f"Path wildcard must be the last segment: {compiled.route.path}")
+                if node.wildcard is None:
+                    node.wildcard = {}
+                    node.wildcard_name = segment[1:-6]
+                self._add(node.wildcard, compiled)
+                return
+
+            if segment.startswith("{") and segment.endswith("}"):
+                name = segment[1:-1]
+                if node.param is None:
+                    node.param = _Node()
+                    node.param_name = name
+                elif node.param_name != name:
+                    raise ValueError(f"Conflicting parameter name '{name}' in {compiled.route.path}")
+                node = node.param
+            else:
+                node = node.static.setdefault(segment, _Node())
+
+        self._add(node.routes, compiled)
+
+    @staticmethod
+    def _add(routes: dict, compiled: CompiledRoute):
+        method = compiled.route.method.upper()
+        if method in routes:
+            raise ValueError(f"Duplicate route: {compiled.key}")
+        routes[method] = compiled
+
+    def lookup(self, path: str) -> Optional[tuple[dict[str, CompiledRoute], dict]]:
+        """경로에 매칭되는 {method: route}와 경로 파라미터 반환"""
+        segments = path.strip("/").split("/")
+        params: dict = {}
+        routes = self._walk(self.root, segments, 0, params)
+        if routes is None:
+            return None
+        return routes, params
+
+    def _walk(self, node: _Node, segments: list[str], index: int, params: dict) -> Optional[dict]:
+        if index == len(segments):
+            return node.routes or None
+
+        segment = segments[index]
+
+        child = node.static.get(segment)
+        if child is not None:
+            routes = self._walk(child, segments, index + 1, params)
+            if routes is not None:
+                return routes
+
+        if node.param is not None and segment:
+            routes = self._walk(node.param, segments, index + 1, params)
+            if routes is not None:
+                params[node.param_name] = segment
+                return routes
+
+        if node.wildcard is not None:
+            params[node.wildcard_name] = "/".join(segments[index:])
+            return node.wildcard
+
+        return None
+
+
+# 라우트 테이블 (게이트웨이 경로 → 업스트림 서비스)
+ROUTES = [
+    # Auth
+    Route(method="POST", path="/api/auth/register", service="auth", upstream="/auth/register", rate_limit="5/minute"),
+    Route(method="POST", path="/api/auth/login", service="auth", upstream="/auth/login", rate_limit="10/minute"),
+    Route(method="GET", path="/api/auth/me", service="auth", upstream="/auth/me", rate_limit="30/minute", auth=True),
+    Route(method="PUT", path="/api/auth/me", service="auth", upstream="/auth/me", rate_limit="10/minute", auth=True),
+    # Events
+    Route(
+        method="GET",
+        path="/api/events",
+        service="events",
+        upstream="/events",
+        rate_limit="100/minute",
+        cache_ttl=5,
+        priority="low",
+    ),
+    Route(method="POST", path="/api/events", service="events", upstream="/events", rate_limit="10/minute", auth=True),
+    Route(
+        method="GET",
+        path="/api/events/search",
+        service="events",
+        upstream="/events/search",
+        rate_limit="50/minute",
+        priority="low",
+    ),
+    Route(
+        method="GET",
+        path="/api/events/{event_id}",
+        service="events",
+        upstream="/events/{event_id}",
+        rate_limit="100/minute",
+        cache_ttl=10,
+        hedge=True,
+        priority="low",
+    ),
+    Route(
+        method="PUT",
+        path="/api/events/{event_id}",
+        service="events",
+        upstream="/events/{event_id}",
+        rate_limit="10/minute",
+        auth=True,
+    ),
+    Route(
+        method="DELETE",
+        path="/api/events/{event_id}",
+        service="events",
+        upstream="/events/{event_id}",
+        rate_limit="10/minute",
+        auth=True,
+    ),
+    Route(
+        method="POST",
+        path="/api/events/{event_id}/publish",
+        service="events",
+        upstream="/events/{event_id}/publish",
+        rate_limit="10/minute",
+        auth=True,
+    ),
+    # Search
+    Route(
+        method="GET",
+        path="/api/search/events",
+        service="search",
+        upstream="/search/events",
+        rate_limit="50/minute",
+        cache_ttl=5,
+        priority="low",
+    ),
+    # Booking
+    Route(
+        method="POST",
+        path="/api/bookings",
+        service="booking",
+        upstream="/bookings",
+        rate_limit="20/minute",
+        auth=True,
+        priority="high",
+        admission=True,
+    ),
+    Route(
+        method="POST",
+        path="/api/bookings/batch",
+        service="booking",
+        upstream="/bookings/batch",
+        rate_limit="20/minute",
+        auth=True,
+        priority="high",
+        admission=True,
+    ),
+    Route(
+        method="GET",
+        path="/api/bookings/my",
+        service="booking",
+        upstream="/bookings/my",
+        rate_limit="30/minute",
+        auth=True,
+    ),
+    Route(
+        method="GET",
+        path="/api/bookings/my/export",
+        service="booking",
+        upstream="/bookings/my/export",
+        rate_limit="5/minute",
+        timeout=60,
+        auth=True,
+        priority="low",
+        stream=True,
+    ),
+    Route(
+        method="GET",
+        path="/api/bookings/events/{event_id}/stats",
+        service="booking",
+        upstream="/bookings/events/{event_id}/stats",
+        rate_limit="60/minute",
+        auth=True,
+    ),
+    Route(
+        method="GET",
+        path="/api/bookings/{booking_id}",
+        service="booking",
+        upstream="/bookings/{booking_id}",
+        rate_limit="60/minute",
+        hedge=True,
+        auth=True,
+    ),
+    Route(
+        method="DELETE",
+        path="/api/bookings/{booking_id}",
+        service="booking",
+        upstream="/bookings/{booking_id}",
+        rate_limit="10/minute",
+        auth=True,
+        priority="high",
+    ),
+    Route(
+        method="POST",
+        path="/api/bookings/{booking_id}/confirm",
+        service="booking",
+        upstream="/bookings/{booking_id}/confirm",
+        rate_limit="10/minute",
+        auth=True,
+        priority="critical",
+    ),
+    # Queue (virtual waiting room)
+    Route(
+        method="POST",
+        path="/api/queue/join",
+        service="queue",
+        upstream="/queue/join",
+        rate_limit="10/minute",
+        auth=True,
+    ),
+    Route(
+        method="GET",
+        path="/api/queue/status/{event_id}",
+        service="queue",
+        upstream="/queue/status/{event_id}",
+        rate_limit="60/minute",
+        auth=True,
+        priority="low",
+    ),
+    # EventSource는 Authorization 헤더를 보낼 수 없으므로 queue 서비스가 join에서 발급한 queue_token으로 인증
+    Route(
+        method="GET",
+        path="/api/queue/stream/{event_id}",
+        service="queue",
+        upstream="/queue/stream/{event_id}",
+        rate_limit="30/minute",
+        timeout=30.0,  # 하트비트(15초) 사이의 최대 읽기 대기
+        priority="low",
+        stream=True,
+    ),
+    Route(
+        method="POST",
+        path="/api/queue/leave",
+        service="queue",
+        upstream="/queue/leave",
+        rate_limit="10/minute",
+        auth=True,
+    ),
+    Route(
+        method="GET",
+        path="/api/queue/events/{event_id}",
+        service="queue",
+        upstream="/queue/events/{event_id}",
+        rate_limit="30/minute",
+        auth=True,
+    ),
+    Route(
+        method="POST",
+        path="/api/queue/events/{event_id}/open",
+        service="queue",
+        upstream="/queue/events/{event_id}/open",
+        rate_limit="10/minute",
+        auth=True,
+    ),
+    Route(
+        method="POST",
+        path="/api/queue/events/{event_id}/close",
+        service="queue",
+        upstream="/queue/events/{event_id}/close",
+        rate_limit="10/minute",
+        auth=True,
+    ),
+    # Payment
+    Route(
+        method="POST",
+        path="/api/payments/create-intent",
+        service="payment",
+        upstream="/payments/create-intent",
+        rate_limit="20/minute",
+        auth=True,
+        priority="critical",
+    ),
+    # Stripe webhook - no rate limit
+    Route(
+        method="POST",
+        path="/api/payments/webhook",
+        service="payment",
+        upstream="/payments/webhook",
+        priority="critical",
+    ),
+    Route(
+        method="GET",
+        path="/api/payments/{payment_id}",
+        service="payment",
+        upstream="/payments/{payment_id}",
+        rate_limit="30/minute",
+        auth=True,
+    ),
+    Route(
+        method="POST",
+        path="/api/payments/{payment_id}/refund",
+        service="payment",
+        upstream="/payments/{payment_id}/refund",
+        rate_limit="5/minute",
+        auth=True,
+    ),
+]
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+import httpx
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.balancer import EndpointResolver, LoadBalancer
+from app.config import SERVICES
+
+logger = logging.getLogger(__name__)
+
+DNS_REFRESH_SECONDS = float(os.getenv("LB_DNS_REFRESH_SECONDS", "10"))
+
+UPSTREAM_IN_FLIGHT = Gauge(
+    "gateway_upstream_in_flight_requests",
+    "In-flight requests per upstream connection pool",
+    ["service"],
+)
+
+UPSTREAM_POOL_MAX = Gauge(
+    "gateway_upstream_pool_max_connections",
+    "Configured connection limit per upstream pool",
+    ["service"],
+)
+
+UPSTREAM_POOL_TIMEOUTS = Counter(
+    "gateway_upstream_pool_timeouts_total",
+    "Requests that timed out waiting for a pooled connection",
+    ["service"],
+)
+
+UPSTREAM_DURATION = Histogram(
+    "gateway_upstream_request_duration_seconds",
+    "Upstream request duration in seconds",
+    ["service", "method"],
+)
+
+
+class UpstreamPool:
+    """업스트림 서비스별 keep-alive 커넥션 풀 + 레플리카 로드 밸런싱
+
+    서비스마다 httpx.AsyncClient 하나를 lifespan 동안 유지해 요청마다
+    TCP/TLS 핸드셰이크를 다시 하지 않도록 한다. 요청마다 LoadBalancer가 레플리카를 고르고,
+    DNS 기반 엔드포인트는 백그라운드에서 주기적으로 다시 조회한다.
+    """
+
+    def __init__(self, services: dict):
+        self.services = services
+        self.clients: dict[str, httpx.AsyncClient] = {}
+        self.balancers: dict[str, LoadBalancer] = {}
+        self.resolvers: dict[str, EndpointResolver] = {}
+        self.refresh_task: Optional[asyncio.Task] = None
+
+    def _create_client(self, service: str) -> httpx.AsyncClient:
+        config = self.services[service]
+        limits = httpx.Limits(
+            max_connections=config["max_connections"],
+            max_keepalive_connections=config["max_keepalive_connections"],
+            keepalive_expiry=config["keepalive_expiry"],
+        )
+        timeout = httpx.Timeout(config["timeout"], pool=config["pool_timeout"])
+        UPSTREAM_POOL_MAX.labels(service=service).set(config["max_connections"])
+
+        # 클러스터 내부 http:// 업스트림은 ALPN이 없으므로 HTTP/2 사용 시 prior knowledge(h2c)로 연결
+        http2 = config["http2"]
+        http1 = not (http2 and "https" not in config["url"].split("://", 1)[0])
+
+        return httpx.AsyncClient(limits=limits, timeout=timeout, http1=http1, http2=http2)
+
+    def balancer(self, service: str) -> LoadBalancer:
+        """서비스용 로드 밸런서 (고정 엔드포인트는 즉시, DNS 엔드포인트는 start/refresh 시 채워짐)"""
+        balancer = self.balancers.get(service)
+        if balancer is None:
+            config = self.services[service]
+            resolver = self.resolvers[service] = EndpointResolver(config["url"])
+            balancer = self.balancers[service] = LoadBalancer(
+                service,
+                resolver.static_urls(),
+                strategy=config["lb_strategy"],
+                failure_threshold=config["lb_failures"],
+                ejection_seconds=config["lb_ejection_seconds"],
+            )
+        return balancer
+
+    async def start(self):
+        """모든 업스트림 풀 생성 및 엔드포인트 조회"""
+        for service in self.services:
+            if service not in self.clients:
+                self.clients[service] = self._create_client(service)
+            balancer = self.balancer(service)
+            await self.resolvers[service].refresh(balancer)
+
+        if any(resolver.dynamic for resolver in self.resolvers.values()):
+            self.refresh_task = asyncio.create_task(self._refresh_loop())
+        logger.info(f"Upstream pools initialized: {list(self.clients.keys())}")
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(DNS_REFRESH_SECONDS)
+            for service, resolver in self.resolvers.items():
+                if resolver.dynamic:
+                    await resolver.refresh(self.balancers[service])
+
+    async def close(self):
+        """모든 업스트림 풀 종료"""
+        if self.refresh_task:
+            self.refresh_task.cancel()
+            self.refresh_task = None
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients.clear()
+
+    def client(self, service: str) -> httpx.AsyncClient:
+        """서비스용 클라이언트 (lifespan 밖에서는 지연 생성)"""
+        client = self.clients.get(service)
+        if client is None:
+            client = self.clients[service] = self._create_client(service)
+        return client
+
+    async def request(
+        self, service: str, method: str, path: str, stream: bool = False, exclude: Optional[set] = None, **kwargs
+    ) -> httpx.Response:
+        """풀링된 커넥션으로 업스트림 요청
+
+        stream=True이면 응답 헤더까지만 받고 본문은 호출자가 aiter_raw()로 읽은 뒤 aclose()해야 한다.
+        exclude가 주어지면 그 안의 엔드포인트를 가능한 한 피하고, 고른 엔드포인트를 추가한다
+        (같은 요청의 재시도/hedge가 다른 레플리카로 가도록).
+        """
+        client = self.client(service)
+        balancer = self.balancer(service)
+        endpoint = balancer.pick(exclude or ())
+        if endpoint is None:
+            raise httpx.ConnectError(f"No endpoints available for {service}")
+        if exclude is not None:
+            exclude.add(endpoint.url)
+
+        in_flight = UPSTREAM_IN_FLIGHT.labels(service=service)
+        in_flight.inc()
+        balancer.on_start(endpoint)
+        start_time = time.perf_counter()
+        success = False
+        cancelled = False
+        try:
+            response = await client.send(client.build_request(method, endpoint.url + path, **kwargs), stream=stream)
+            success = response.status_code not in (502, 503, 504)
+            return response
+        except httpx.PoolTimeout:
+            UPSTREAM_POOL_TIMEOUTS.labels(service=service).inc()
+            # 게이트웨이 쪽 풀 포화는 레플리카 장애가 아니다
+            success = True
+            raise
+        except asyncio.CancelledError:
+            # hedge에서 진 쪽처럼 호출자가 취소한 요청은 레플리카가 느리거나 실패했다는 뜻이 아니다
+            cancelled = True
+            raise
+        finally:
+            duration = time.perf_counter() - start_time
+            in_flight.dec()
+            if cancelled:
+                balancer.on_cancel(endpoint)
+            else:
+                balancer.on_finish(endpoint, duration, success)
+                UPSTREAM_DURATION.labels(service=service, method=method).observe(duration)
+
+
+# Global instance
+_upstream_pool: Optional[UpstreamPool] = None
+
+
+def get_upstream_pool() -> UpstreamPool:
+    """Get upstream connection pool instance"""
+    global _upstream_pool
+
+    if _upstream_pool is None:
+        _upstream_pool = UpstreamPool(SERVICES)
+
+    return _upstream_pool
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, Optional
+
+import redis.asyncio as redis
+from jose import JWTError, jwt
+from prometheus_client import Counter
+
+from app.config import QUEUE_TOKEN_SECRET
+
+logger = logging.getLogger(__name__)
+
+WAITING_ROOM_CHECKS = Counter(
+    "gateway_waiting_room_checks_total",
+    "Admission token checks on gated booking routes by result (admitted, missing, invalid)",
+    ["result"],
+)
+
+WAITING_ROOM_REFRESH_ERRORS = Counter(
+    "gateway_waiting_room_refresh_errors_total",
+    "Redis errors while refreshing gated events (the last known set is kept)",
+)
+
+ADMISSION_TOKEN_HEADER = "x-admission-token"
+
+# queue 서비스(app/waiting_room.py)가 관리하는 대기열이 열린 이벤트 집합
+GATED_EVENTS_KEY = "wr:gated"
+
+
+class WaitingRoomGate:
+    """대기열이 열린 이벤트의 예약 요청에 입장 토큰 요구
+
+    대기열이 열린 이벤트 목록은 refresh_seconds마다 Redis에서 다시 읽어 로컬에 보관하므로
+    요청마다 Redis를 조회하지 않는다. 갱신이 실패하면 마지막으로 읽은 목록을 계속 사용한다.
+    입장 토큰은 queue 서비스가 QUEUE_TOKEN_SECRET으로 서명한 JWT(aud=booking)이며, 사용자와 이벤트가
+    요청과 일치해야 한다.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        refresh_seconds: float = 2.0,
+        secret: str = QUEUE_TOKEN_SECRET,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.client = client
+        self.refresh_seconds = refresh_seconds
+        self.secret = secret
+        self.clock = clock
+        self.gated: frozenset[str] = frozenset()
+        self.refreshed_at: Optional[float] = None
+        self.refreshing: Optional[asyncio.Task] = None
+
+    async def gated_events(self) -> frozenset[str]:
+        """대기열이 열린 이벤트 목록 (동시에 만료되어도 Redis 조회는 한 번만)"""
+        if self.refreshed_at is not None and self.clock() - self.refreshed_at < self.refresh_seconds:
+            return self.gated
+
+        if self.refreshing is None:
+            self.refreshing = asyncio.create_task(self._refresh())
+        await asyncio.shield(self.refreshing)
+        return self.gated
+
+    async def _refresh(self):
+        try:
+            members = await self.client.smembers(GATED_EVENTS_KEY)
+            self.gated = frozenset(member.decode() for member in members)
+        except redis.RedisError as e:
+            WAITING_ROOM_REFRESH_ERRORS.inc()
+            logger.warning(f"Gated event refresh failed, keeping {len(self.gated)} known events: {e}")
+        finally:
+            self.refreshed_at = self.clock()
+            self.refreshing = None
+
+    def verify(self, token: Optional[str], user_id: str, event_id: str) -> bool:
+        """입장 토큰 검증 (결과는 메트릭으로 집계)"""
+        if not token:
+            WAITING_ROOM_CHECKS.labels(result="missing").inc()
+            return False
+
+        try:
+            payload = jwt.decode(token, self.secret, algorithms=["HS256"], audience="booking")
+        except JWTError:
+            WAITING_ROOM_CHECKS.labels(result="invalid").inc()
+            return False
+
+        if str(payload.get("sub")) != user_id or str(payload.get("event_id")) != event_id:
+            WAITING_ROOM_CHECKS.labels(result="invalid").inc()
+            return False
+
+        WAITING_ROOM_CHECKS.labels(result="admitted").inc()
+        return True
+
+    async def close(self):
+        await self.client.aclose()
+
+
+# Global instance
+_gate: Optional[WaitingRoomGate] = None
+
+
+def get_waiting_room_gate() -> WaitingRoomGate:
+    """Get waiting room gate instance"""
+    global _gate
+
+    if _gate is None:
+        client = redis.from_url(
+            os.getenv("REDIS_URL", "redis://redis:6379/0"),
+            socket_timeout=float(os.getenv("WAITING_ROOM_REDIS_TIMEOUT", "0.1")),
+            socket_connect_timeout=float(os.getenv("WAITING_ROOM_REDIS_TIMEOUT", "0.1")),
+        )
+        _gate = WaitingRoomGate(client, refresh_seconds=float(os.getenv("WAITING_ROOM_REFRESH_SECONDS", "2")))
+
+    return _gate
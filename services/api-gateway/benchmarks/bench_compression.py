@@ -0,0 +1,90 @@
+"""응답 압축 비용 벤치마크
+
+events 서비스의 EventListResponse 형태(설명, 주소, 태그 포함)로 만든 페이로드를 인코딩/레벨별로
+압축해 CPU 시간과 절약한 바이트를 비교한다. 기본 설정(gzip 6, br 4, zstd 3)이 표에 포함된다.
+
+    cd services/api-gateway && python -m benchmarks.bench_compression
+"""
+
+import gzip
+import json
+import random
+import timeit
+from datetime import datetime, timedelta
+
+import brotli
+import zstandard
+
+PAGE_SIZES = [1, 20, 100]
+NUMBER = 200
+
+VENUES = ["Olympic Hall", "KSPO Dome", "Blue Square", "Sejong Center", "Charlotte Theater"]
+ADDRESSES = [
+    "424 Olympic-ro, Songpa-gu, Seoul",
+    "25 Olympic-ro, Songpa-gu, Seoul",
+    "294 Itaewon-ro, Yongsan-gu, Seoul",
+    "175 Sejong-daero, Jongno-gu, Seoul",
+]
+WORDS = "live concert tour special guest encore night orchestra festival stage seats standing vip fan meeting".split()
+
+ENCODERS = {
+    "gzip-1": lambda body: gzip.compress(body, compresslevel=1, mtime=0),
+    "gzip-6": lambda body: gzip.compress(body, compresslevel=6, mtime=0),
+    "gzip-9": lambda body: gzip.compress(body, compresslevel=9, mtime=0),
+    "br-1": lambda body: brotli.compress(body, quality=1),
+    "br-4": lambda body: brotli.compress(body, quality=4),
+    "br-11": lambda body: brotli.compress(body, quality=11),
+    "zstd-1": zstandard.ZstdCompressor(level=1).compress,
+    "zstd-3": zstandard.ZstdCompressor(level=3).compress,
+    "zstd-9": zstandard.ZstdCompressor(level=9).compress,
+}
+
+
+def build_event(event_id: int, rng: random.Random) -> dict:
+    start_time = datetime(2026, 1, 1, 19) + timedelta(days=rng.randint(0, 365))
+    return {
+        "id": event_id,
+        "title": f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} 2026",
+        "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 120))),
+        "venue": rng.choice(VENUES),
+        "address": rng.choice(ADDRESSES),
+        "start_time": start_time.isoformat(),
+        "end_time": (start_time + timedelta(hours=3)).isoformat(),
+        "total_seats": 5000,
+        "available_seats": rng.randint(0, 5000),
+        "price": f"{rng.randint(5, 20) * 10000}.00",
+        "currency": "KRW",
+        "category": rng.choice(["concert", "musical", "sports"]),
+        "tags": ",".join(rng.sample(WORDS, 3)),
+        "image_url": f"https://cdn.example.com/events/{event_id}.jpg",
+        "is_featured": rng.random() < 0.1,
+        "status": "published",
+        "organizer_id": rng.randint(1, 50),
+        "created_at": "2025-12-01T00:00:00",
+    }
+
+
+def build_payload(page_size: int) -> bytes:
+    rng = random.Random(page_size)
+    events = [build_event(index, rng) for index in range(page_size)]
+    body = {"events": events, "total": 1000, "page": 1, "page_size": page_size}
+    return json.dumps(body).encode()
+
+
+def main():
+    header = f"{'events':>6} {'bytes':>8} {'encoding':>8} {'out':>8} {'saved':>7} {'us/op':>9} {'MB/s':>8}"
+    print(f"{header} {'us/KB saved':>12}")
+    for page_size in PAGE_SIZES:
+        body = build_payload(page_size)
+        for name, encode in ENCODERS.items():
+            compressed = encode(body)
+            seconds = timeit.timeit(lambda: encode(body), number=NUMBER) / NUMBER
+            saved = len(body) - len(compressed)
+            print(
+                f"{page_size:>6} {len(body):>8} {name:>8} {len(compressed):>8} {saved / len(body):>6.0%} "
+                f"{seconds * 1e6:>9.1f} {len(body) / seconds / 1e6:>8.1f} {seconds * 1e6 / (saved / 1024):>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
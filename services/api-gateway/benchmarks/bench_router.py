@@ -0,0 +1,70 @@
+"""라우트 디스패치 마이크로벤치마크
+
+라우트 테이블 크기를 늘려가며 prefix trie 매칭 비용과 정규식 선형 탐색 비용을 비교한다.
+
+    cd services/api-gateway && python -m benchmarks.bench_router
+"""
+
+import re
+import timeit
+
+from app.routes import ROUTES, Route, RouteTable
+
+TABLE_SIZES = [len(ROUTES), 100, 1_000, 10_000]
+LOOKUP_PATHS = ["/api/events/123", "/api/bookings/my", "/api/bookings/b-1/confirm", "/api/payments/webhook"]
+NUMBER = 20_000
+
+
+def build_routes(size: int) -> list[Route]:
+    """합성 라우트 + 기본 라우트로 지정된 크기의 테이블 생성 (기본 라우트가 뒤에 오도록)"""
+    routes = []
+    index = 0
+    while len(routes) + len(ROUTES) < size:
+        routes.append(
+            Route(
+                method="GET",
+                path=f"/api/synthetic{index}/{{item_id}}/detail",
+                service="events",
+                upstream=f"/synthetic{index}/{{item_id}}/detail",
+            )
+        )
+        index += 1
+    return routes + list(ROUTES)
+
+
+def compile_regex(routes: list[Route]) -> list[tuple[re.Pattern, Route]]:
+    """비교 대상: 라우트마다 정규식을 만들어 순서대로 검사하는 방식"""
+    compiled = []
+    for route in routes:
+        pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", route.path)
+        compiled.append((re.compile(f"^{pattern}$"), route))
+    return compiled
+
+
+def regex_lookup(compiled: list[tuple[re.Pattern, Route]], path: str):
+    for pattern, route in compiled:
+        match = pattern.match(path)
+        if match:
+            return route, match.groupdict()
+    return None
+
+
+def main():
+    print(f"{'routes':>8} {'trie ns/op':>12} {'regex ns/op':>12}")
+    for size in TABLE_SIZES:
+        routes = build_routes(size)
+        table = RouteTable(routes)
+        regex_table = compile_regex(routes)
+
+        trie_seconds = timeit.timeit(lambda: [table.lookup(path) for path in LOOKUP_PATHS], number=NUMBER)
+        regex_seconds = timeit.timeit(
+            lambda: [regex_lookup(regex_table, path) for path in LOOKUP_PATHS], number=NUMBER // 10
+        )
+
+        trie_ns = trie_seconds / (NUMBER * len(LOOKUP_PATHS)) * 1e9
+        regex_ns = regex_seconds / (NUMBER // 10 * len(LOOKUP_PATHS)) * 1e9
+        print(f"{size:>8} {trie_ns:>12.0f} {regex_ns:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
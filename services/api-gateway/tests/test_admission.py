@@ -0,0 +1,97 @@
+import asyncio
+
+from app.admission import AdaptiveLimiter
+
+
+def make_limiter(**kwargs) -> AdaptiveLimiter:
+    return AdaptiveLimiter("booking", **{"initial_limit": 20, "min_limit": 4, "max_limit": 200, **kwargs})
+
+
+def sample(limiter: AdaptiveLimiter, latency: float):
+    """완료 1건을 기록하고 같은 수의 요청이 계속 진행 중인 상태 유지"""
+    limiter.release(latency, dropped=False)
+    limiter.in_flight += 1
+
+
+async def fill(limiter: AdaptiveLimiter, count: int, priority: str = "critical"):
+    for _ in range(count):
+        assert await limiter.acquire(priority)
+
+
+async def test_limit_grows_while_latency_is_stable():
+    """Test the limit increases when the group is busy and latency stays flat"""
+    limiter = make_limiter()
+    await fill(limiter, 15)
+
+    for _ in range(50):
+        sample(limiter, 0.05)
+
+    # 한도의 절반 이상을 쓰는 동안만 늘어난다
+    assert 25 < limiter.limit <= 32
+
+
+async def test_limit_shrinks_when_latency_rises():
+    """Test rising latency lowers the limit through the gradient and overload drops cut it multiplicatively"""
+    limiter = make_limiter(initial_limit=100)
+    await fill(limiter, 90)
+    for _ in range(20):
+        sample(limiter, 0.05)
+    baseline = limiter.limit
+
+    for _ in range(30):
+        sample(limiter, 0.5)
+    assert limiter.limit < baseline * 0.5
+
+    before_drop = limiter.limit
+    limiter.release(None, dropped=True)
+    assert limiter.limit == max(before_drop * 0.9, limiter.min_limit)
+
+
+async def test_low_priority_shed_first():
+    """Test browse traffic is shed once its share is used while higher classes still get slots"""
+    limiter = make_limiter()
+    await fill(limiter, 10, priority="low")
+
+    assert not await limiter.acquire("low")
+    assert await limiter.acquire("normal")
+    await fill(limiter, 4, priority="normal")
+    assert await limiter.acquire("critical")
+
+
+async def test_queued_requests_admitted_by_priority():
+    """Test freed slots go to the highest queued priority first"""
+    limiter = make_limiter(queue_timeout=1.0)
+    await fill(limiter, 20)
+
+    normal = asyncio.create_task(limiter.acquire("normal"))
+    await asyncio.sleep(0)
+    critical = asyncio.create_task(limiter.acquire("critical"))
+    await asyncio.sleep(0)
+    assert limiter.queued == 2
+
+    limiter.release(None, dropped=False)
+    assert await critical
+    assert not normal.done()
+
+    # normal은 limit의 75%까지만 통과
+    for _ in range(6):
+        limiter.release(None, dropped=False)
+    assert await normal
+    assert limiter.in_flight == 15
+
+
+async def test_full_queue_evicts_lowest_priority_and_times_out():
+    """Test a full queue drops the newest lower-priority waiter and waiters give up after the timeout"""
+    limiter = make_limiter(max_queue=1, queue_timeout=0.05)
+    await fill(limiter, 20)
+
+    normal = asyncio.create_task(limiter.acquire("normal"))
+    await asyncio.sleep(0)
+    high = asyncio.create_task(limiter.acquire("high"))
+    await asyncio.sleep(0)
+
+    assert not await normal
+    assert not await limiter.acquire("normal")
+    assert not await high
+    assert limiter.queued == 0
+    assert limiter.in_flight == 20
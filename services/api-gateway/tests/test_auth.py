@@ -0,0 +1,79 @@
+import time
+from unittest.mock import patch
+
+from jose import jwt
+
+from app.auth import ClaimsCache, decode_token, sign_claims
+from app.config import JWT_ALGORITHM, JWT_SECRET
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_token(exp: float, secret: str = JWT_SECRET) -> str:
+    return jwt.encode({"sub": 42, "email": "fan@example.com", "role": "admin", "exp": exp}, secret, JWT_ALGORITHM)
+
+
+def test_decode_token_accepts_auth_service_tokens():
+    """Test tokens with an integer subject (as issued by the auth service) are accepted"""
+    claims = decode_token(make_token(exp=4_000_000_000))
+
+    assert claims.user_id == "42"
+    assert claims.email == "fan@example.com"
+    assert claims.role == "admin"
+    assert decode_token(make_token(exp=4_000_000_000, secret="wrong-secret")) is None
+
+
+def test_claims_cache_hits_and_expires_with_token():
+    """Test verified claims are cached by token hash until the earlier of the TTL and the token expiry"""
+    clock = FakeClock(time.time())
+    cache = ClaimsCache(ttl=300, clock=clock)
+    token = make_token(exp=int(clock.now) + 60)
+
+    with patch("app.auth.jwt.decode", wraps=jwt.decode) as decode:
+        assert cache.verify(token).user_id == "42"
+        assert cache.verify(token).user_id == "42"
+        assert decode.call_count == 1
+
+        ((key, (_, expires_at)),) = cache.entries.items()
+        assert token.encode() not in key
+        assert expires_at == int(clock.now) + 60
+
+        clock.now += 61
+        cache.verify(token)
+        assert decode.call_count == 2
+
+
+def test_claims_cache_remembers_invalid_tokens_briefly():
+    """Test rejected tokens are cached for the negative TTL only"""
+    clock = FakeClock()
+    cache = ClaimsCache(negative_ttl=10, clock=clock)
+    forged = make_token(exp=clock.now + 3600, secret="wrong-secret")
+
+    assert cache.verify(forged) is None
+    _, expires_at = next(iter(cache.entries.values()))
+    assert expires_at == clock.now + 10
+
+
+def test_claims_cache_is_bounded():
+    """Test least recently used entries are evicted beyond max_entries"""
+    cache = ClaimsCache(max_entries=2)
+    for user in range(5):
+        cache.verify(jwt.encode({"sub": str(user)}, JWT_SECRET, JWT_ALGORITHM))
+
+    assert len(cache.entries) == 2
+
+
+def test_sign_claims_binds_every_field():
+    """Test the internal signature changes when any forwarded field changes"""
+    signature = sign_claims("42", "fan@example.com", "user", "1700000000", secret="s")
+
+    assert signature == sign_claims("42", "fan@example.com", "user", "1700000000", secret="s")
+    assert signature != sign_claims("43", "fan@example.com", "user", "1700000000", secret="s")
+    assert signature != sign_claims("42", "fan@example.com", "admin", "1700000000", secret="s")
+    assert signature != sign_claims("42", "fan@example.com", "user", "1700000000", secret="t")
@@ -0,0 +1,159 @@
+import asyncio
+import random
+from collections import Counter
+
+import httpx
+import pytest
+
+from app.balancer import EWMA, LEAST_IN_FLIGHT, EndpointResolver, LoadBalancer
+from app.config import SERVICES
+from app.upstream import UpstreamPool
+
+URLS = ["http://10.0.0.1:8000", "http://10.0.0.2:8000", "http://10.0.0.3:8000", "http://10.0.0.4:8000"]
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def seeded_random():
+    random.seed(7)
+
+
+def test_p2c_avoids_busy_endpoint():
+    """Test power-of-two-choices never picks the most loaded endpoint"""
+    balancer = LoadBalancer("events", URLS, strategy=LEAST_IN_FLIGHT)
+    busy = balancer.endpoints[0]
+    for _ in range(10):
+        balancer.on_start(busy)
+
+    picks = Counter(balancer.pick().url for _ in range(1000))
+    assert busy.url not in picks
+
+
+def test_ewma_prefers_fast_endpoint():
+    """Test EWMA strategy sends most traffic to the lower-latency replica"""
+    clock = FakeClock()
+    balancer = LoadBalancer("events", URLS[:2], strategy=EWMA, clock=clock)
+    fast, slow = balancer.endpoints
+    for _ in range(20):
+        clock.now += 0.1
+        for endpoint, latency in ((fast, 0.01), (slow, 0.5)):
+            balancer.on_start(endpoint)
+            balancer.on_finish(endpoint, latency, success=True)
+
+    picks = Counter(balancer.pick().url for _ in range(100))
+    assert picks[fast.url] == 100
+
+
+def test_passive_ejection_and_readmission():
+    """Test consecutive failures eject an endpoint until the ejection period passes"""
+    clock = FakeClock()
+    balancer = LoadBalancer(
+        "events", URLS, strategy=LEAST_IN_FLIGHT, failure_threshold=3, ejection_seconds=30, clock=clock
+    )
+    bad = balancer.endpoints[0]
+
+    for _ in range(3):
+        balancer.on_start(bad)
+        balancer.on_finish(bad, 0.01, success=False)
+
+    assert bad.url not in {balancer.pick().url for _ in range(200)}
+
+    clock.now += 31
+    assert bad.url in {balancer.pick().url for _ in range(200)}
+
+
+def test_max_ejection_ratio():
+    """Test at most half of the endpoints are ejected"""
+    clock = FakeClock()
+    balancer = LoadBalancer("events", URLS, failure_threshold=1, clock=clock)
+    for endpoint in balancer.endpoints:
+        balancer.on_start(endpoint)
+        balancer.on_finish(endpoint, 0.01, success=False)
+
+    ejected = [endpoint for endpoint in balancer.endpoints if endpoint.ejected_until > clock.now]
+    assert len(ejected) == 2
+
+
+def test_exclude_and_endpoint_refresh():
+    """Test excluded endpoints are avoided and refreshes keep existing endpoint stats"""
+    balancer = LoadBalancer("events", URLS[:2])
+    assert balancer.pick(exclude={URLS[0]}).url == URLS[1]
+
+    balancer.endpoints[1].ewma = 0.2
+    balancer.set_endpoints(URLS[1:])
+    assert [endpoint.url for endpoint in balancer.endpoints] == URLS[1:]
+    assert balancer.endpoints[0].ewma == 0.2
+
+
+async def test_resolver_static_and_dns():
+    """Test static lists and DNS A-record specs resolve to endpoint URLs"""
+    assert await EndpointResolver("http://a:8000, http://b:8000").resolve() == ["http://a:8000", "http://b:8000"]
+
+    resolver = EndpointResolver("dns+http://localhost:8000")
+    assert resolver.static_urls() == []
+    assert "http://127.0.0.1:8000" in await resolver.resolve()
+
+
+async def test_pool_spreads_requests_across_replicas():
+    """Test the upstream pool balances requests and retries avoid the failing replica"""
+    seen = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen[request.url.host] += 1
+        return httpx.Response(503 if request.url.host == "10.0.0.1" else 200)
+
+    services = {"events": {**SERVICES["events"], "url": ",".join(URLS[:2])}}
+    pool = UpstreamPool(services)
+    pool.clients["events"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    tried = set()
+    first = await pool.request("events", "GET", "/events", exclude=tried)
+    second = await pool.request("events", "GET", "/events", exclude=tried)
+    assert tried == set(URLS[:2])
+    assert {first.status_code, second.status_code} == {200, 503}
+
+    # 실패가 쌓인 레플리카는 제외되고 정상 레플리카로만 보낸다
+    for _ in range(20):
+        await pool.request("events", "GET", "/events")
+    seen.clear()
+    for _ in range(20):
+        await pool.request("events", "GET", "/events")
+    assert set(seen) == {"10.0.0.2"}
+    await pool.close()
+
+
+async def test_cancelled_request_is_not_an_endpoint_failure():
+    """Test a request cancelled by its caller (a losing hedge) leaves the endpoint's latency and failures alone"""
+    started = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    services = {"events": {**SERVICES["events"], "url": URLS[0]}}
+    pool = UpstreamPool(services)
+    pool.clients["events"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    [endpoint] = pool.balancer("events").endpoints
+    ewma = endpoint.ewma
+
+    for _ in range(10):
+        started.clear()
+        task = asyncio.create_task(pool.request("events", "GET", "/events"))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert endpoint.in_flight == 0
+    assert endpoint.failures == 0
+    assert endpoint.ejected_until == 0
+    assert endpoint.ewma == ewma
+    await pool.close()
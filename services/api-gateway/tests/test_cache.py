@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from app.cache import CachedResponse, ResponseCache, etag_matches
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def counting_fetch(body: bytes = b'{"events": []}', status_code: int = 200, delay: float = 0):
+    calls = []
+
+    async def fetch() -> CachedResponse:
+        calls.append(1)
+        if delay:
+            await asyncio.sleep(delay)
+        return CachedResponse(status_code, [(b"content-type", b"application/json")], body + str(len(calls)).encode())
+
+    return fetch, calls
+
+
+async def test_fresh_hit_and_miss(clock):
+    """Test second lookup within the TTL is served from cache"""
+    cache = ResponseCache(clock=clock)
+    fetch, calls = counting_fetch()
+
+    first, result = await cache.get_or_fetch("/events", 5, fetch)
+    assert result == "miss"
+
+    clock.now += 4
+    second, result = await cache.get_or_fetch("/events", 5, fetch)
+    assert result == "hit"
+    assert second is first
+    assert len(calls) == 1
+
+
+async def test_stale_while_revalidate(clock):
+    """Test stale entries are served immediately and refreshed once in the background"""
+    cache = ResponseCache(stale_while_revalidate=30, clock=clock)
+    fetch, calls = counting_fetch()
+
+    first, _ = await cache.get_or_fetch("/events", 5, fetch)
+    clock.now += 10
+
+    stale_results = [await cache.get_or_fetch("/events", 5, fetch) for _ in range(5)]
+    assert all(entry is first and result == "stale" for entry, result in stale_results)
+
+    await asyncio.sleep(0)
+    assert len(calls) == 2
+    refreshed, result = await cache.get_or_fetch("/events", 5, fetch)
+    assert result == "hit"
+    assert refreshed.body.endswith(b"2")
+
+
+async def test_expired_beyond_stale_window_refetches(clock):
+    """Test entries older than ttl + stale window are fetched synchronously"""
+    cache = ResponseCache(stale_while_revalidate=30, clock=clock)
+    fetch, calls = counting_fetch()
+
+    await cache.get_or_fetch("/events", 5, fetch)
+    clock.now += 60
+    _, result = await cache.get_or_fetch("/events", 5, fetch)
+
+    assert result == "miss"
+    assert len(calls) == 2
+
+
+async def test_concurrent_misses_are_coalesced(clock):
+    """Test a thousand concurrent misses trigger one upstream fetch"""
+    cache = ResponseCache(clock=clock)
+    fetch, calls = counting_fetch(delay=0.01)
+
+    results = await asyncio.gather(*[cache.get_or_fetch("/events/1", 10, fetch) for _ in range(1000)])
+
+    assert len(calls) == 1
+    assert len({id(entry) for entry, _ in results}) == 1
+    assert sum(result == "coalesced" for _, result in results) == 999
+
+
+async def test_fetch_error_propagates_to_waiters(clock):
+    """Test a failed fetch fails every coalesced waiter and is not cached"""
+    cache = ResponseCache(clock=clock)
+
+    async def failing_fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        *[cache.get_or_fetch("/events", 5, failing_fetch) for _ in range(3)], return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.entries == {}
+    assert cache.inflight == {}
+
+
+async def test_non_cacheable_responses_not_stored(clock):
+    """Test error and no-store responses are returned but not cached"""
+    cache = ResponseCache(clock=clock)
+
+    fetch, calls = counting_fetch(status_code=503)
+    await cache.get_or_fetch("/events", 5, fetch)
+    await cache.get_or_fetch("/events", 5, fetch)
+    assert len(calls) == 2
+
+    async def no_store_fetch():
+        return CachedResponse(200, [(b"cache-control", b"no-store")], b"{}")
+
+    await cache.get_or_fetch("/private", 5, no_store_fetch)
+    assert "/private" not in cache.entries
+
+
+async def test_lru_eviction_by_size(clock):
+    """Test least recently used entries are evicted when the byte budget is exceeded"""
+    cache = ResponseCache(max_bytes=300, clock=clock)
+
+    for key in ["/a", "/b", "/c"]:
+        fetch, _ = counting_fetch(body=b"x" * 60)
+        await cache.get_or_fetch(key, 60, fetch)
+
+    await cache.get_or_fetch("/a", 60, counting_fetch()[0])
+    fetch, _ = counting_fetch(body=b"x" * 60)
+    await cache.get_or_fetch("/d", 60, fetch)
+
+    assert list(cache.entries) == ["/c", "/a", "/d"]
+    assert cache.size <= 300
+
+
+def test_key_normalization():
+    """Test query parameter order and empty values do not change the key"""
+    key = ResponseCache.make_key("/events", [("page", "1"), ("category", "concert"), ("q", "")])
+    assert key == ResponseCache.make_key("/events", [("category", "concert"), ("page", "1")])
+    assert ResponseCache.make_key("/events", []) == "/events"
+
+
+def test_etag_matches():
+    """Test If-None-Match weak comparison, lists and wildcard"""
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"def"', '"abc"')
+    assert not etag_matches(None, '"abc"')
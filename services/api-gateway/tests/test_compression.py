@@ -0,0 +1,101 @@
+import gzip
+
+import brotli
+import pytest
+import zstandard
+
+from app.cache import CachedResponse, ResponseCache
+from app.compression import (
+    StreamCompressor,
+    choose_encoding,
+    compress,
+    compress_async,
+    compressible,
+    encoded_headers,
+    negotiate,
+)
+
+JSON_HEADERS = [(b"content-type", b"application/json")]
+BODY = b'{"events": [' + b",".join(b'{"title": "Concert %d", "venue": "Olympic Hall"}' % i for i in range(200)) + b"]}"
+
+DECOMPRESS = {
+    "gzip": gzip.decompress,
+    "br": brotli.decompress,
+    "zstd": lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data),
+}
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("gzip, deflate", "gzip"),
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("br;q=1.0, zstd;q=0.5, gzip;q=0.8", "br"),
+        ("zstd;q=0, *", "br"),
+        ("identity", None),
+        ("gzip;q=0", None),
+    ],
+)
+def test_negotiate(accept_encoding, expected):
+    """Test Accept-Encoding negotiation honours q-values, wildcard and server preference"""
+    assert negotiate(accept_encoding) == expected
+
+
+def test_compressible_content_types():
+    """Test only unencoded text-like responses without no-transform are compressed"""
+    assert compressible([(b"content-type", b"application/json; charset=utf-8")])
+    assert compressible([(b"content-type", b"application/problem+json")])
+    assert not compressible([(b"content-type", b"image/png")])
+    assert not compressible(JSON_HEADERS + [(b"content-encoding", b"gzip")])
+    assert not compressible(JSON_HEADERS + [(b"cache-control", b"no-transform")])
+    assert not compressible([])
+
+
+def test_choose_encoding_min_size_and_status():
+    """Test small bodies and bodiless statuses are left uncompressed"""
+    assert choose_encoding("gzip", 200, JSON_HEADERS, 100) is None
+    assert choose_encoding("gzip", 304, JSON_HEADERS, None) is None
+    assert choose_encoding("gzip", 200, JSON_HEADERS, None) == "gzip"
+    assert choose_encoding("gzip", 200, JSON_HEADERS, len(BODY)) == "gzip"
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+async def test_compress_round_trip(encoding):
+    """Test one-shot, offloaded and streaming compression decode back to the original body"""
+    assert DECOMPRESS[encoding](compress(BODY, encoding)) == BODY
+    assert DECOMPRESS[encoding](await compress_async(BODY * 20, encoding)) == BODY * 20
+    assert len(compress(BODY, encoding)) < len(BODY) // 4
+
+    compressor = StreamCompressor(encoding)
+    chunks = [compressor.compress(BODY[i : i + 1000]) for i in range(0, len(BODY), 1000)]
+    assert all(chunks)  # 청크마다 flush
+    assert DECOMPRESS[encoding](b"".join(chunks) + compressor.finish()) == BODY
+
+
+def test_encoded_headers():
+    """Test compressed responses drop Content-Length, weaken the ETag and vary on Accept-Encoding"""
+    headers = encoded_headers(
+        JSON_HEADERS + [(b"content-length", b"123"), (b"etag", b'"abc"'), (b"vary", b"Origin")], "br"
+    )
+
+    assert (b"content-encoding", b"br") in headers
+    assert (b"etag", b'W/"abc"') in headers
+    assert (b"vary", b"Origin, Accept-Encoding") in headers
+    assert all(name != b"content-length" for name, _ in headers)
+
+
+def test_cache_add_encoding_accounts_size():
+    """Test pre-compressed variants count towards the cache size and are dropped with replaced entries"""
+    cache = ResponseCache()
+    entry = CachedResponse(200, JSON_HEADERS, BODY)
+    cache.put("/events", entry)
+
+    cache.add_encoding("/events", entry, "gzip", b"x" * 100)
+    assert entry.encodings == {"gzip": b"x" * 100}
+    assert cache.size == entry.size
+
+    cache.put("/events", CachedResponse(200, JSON_HEADERS, BODY))
+    cache.add_encoding("/events", entry, "br", b"y" * 100)
+    assert "br" not in entry.encodings
+    assert cache.size == cache.entries["/events"].size
@@ -0,0 +1,149 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.hedging import Hedger, LatencyTracker
+
+
+def warm_hedger(route: str, p95: float, **kwargs) -> Hedger:
+    hedger = Hedger(min_delay=0.001, **kwargs)
+    tracker = hedger._tracker(route)
+    for _ in range(100):
+        tracker.record(p95)
+    return hedger
+
+
+def scripted_send(delays: list[float]):
+    """Each call sleeps for the next delay and returns a response tagged with its attempt number"""
+    calls = []
+    cancelled = []
+
+    async def send() -> httpx.Response:
+        attempt = len(calls)
+        calls.append(attempt)
+        try:
+            await asyncio.sleep(delays[attempt])
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return httpx.Response(200, headers={"x-attempt": str(attempt)})
+
+    return send, calls, cancelled
+
+
+def test_latency_tracker_p95():
+    """Test p95 is only reported after enough samples"""
+    tracker = LatencyTracker(min_samples=50, recompute_every=50)
+    for value in range(49):
+        tracker.record(value / 100)
+    assert tracker.value is None
+
+    for value in range(49, 100):
+        tracker.record(value / 100)
+    assert tracker.value == pytest.approx(0.95)
+
+
+async def test_no_hedge_without_latency_history():
+    """Test requests are not hedged until the route p95 is known"""
+    hedger = Hedger()
+    send, calls, _ = scripted_send([0.02])
+
+    response = await hedger.request("GET /api/events/{event_id}", send)
+
+    assert response.headers["x-attempt"] == "0"
+    assert calls == [0]
+
+
+async def test_slow_primary_is_hedged_and_cancelled():
+    """Test a hedge is sent after p95 and the slower original attempt is cancelled"""
+    hedger = warm_hedger("route", p95=0.01)
+    send, calls, cancelled = scripted_send([1.0, 0.01])
+
+    response = await hedger.request("route", send)
+
+    assert response.headers["x-attempt"] == "1"
+    assert calls == [0, 1]
+    await asyncio.sleep(0)
+    assert cancelled == [0]
+
+
+async def test_fast_primary_not_hedged():
+    """Test responses within p95 do not trigger a hedge"""
+    hedger = warm_hedger("route", p95=0.05)
+    send, calls, _ = scripted_send([0.001])
+
+    response = await hedger.request("route", send)
+
+    assert response.headers["x-attempt"] == "0"
+    assert calls == [0]
+
+
+async def test_primary_wins_after_hedge_sent():
+    """Test the original attempt still wins when it answers before the hedge"""
+    hedger = warm_hedger("route", p95=0.01)
+    send, calls, cancelled = scripted_send([0.02, 1.0])
+
+    response = await hedger.request("route", send)
+
+    assert response.headers["x-attempt"] == "0"
+    await asyncio.sleep(0)
+    assert cancelled == [1]
+
+
+async def test_hedge_budget_caps_extra_load():
+    """Test hedges stop once the budget is spent"""
+    hedger = warm_hedger("route", p95=0.001, budget_ratio=0, budget_min_per_second=0)
+    hedger._budget("route").tokens = 2
+
+    total_calls = 0
+    for _ in range(5):
+        send, calls, _ = scripted_send([0.01, 0.0])
+        await hedger.request("route", send)
+        total_calls += len(calls)
+
+    assert total_calls == 5 + 2
+
+
+async def test_failed_primary_falls_back_to_hedge():
+    """Test an error on one attempt is ignored while the other can still succeed"""
+    hedger = warm_hedger("route", p95=0.005)
+    attempts = []
+
+    async def send() -> httpx.Response:
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            await asyncio.sleep(0.01)
+            raise httpx.ConnectError("reset")
+        await asyncio.sleep(0.02)
+        return httpx.Response(200)
+
+    response = await hedger.request("route", send)
+    assert response.status_code == 200
+
+    async def always_fail() -> httpx.Response:
+        await asyncio.sleep(0.01)
+        raise httpx.ConnectError("down")
+
+    with pytest.raises(httpx.ConnectError):
+        await hedger.request("route", always_fail)
+
+
+async def test_hedge_success_wins_over_simultaneous_primary_error():
+    """Test a successful hedge that finishes together with a failing primary is returned, not the error"""
+    hedger = warm_hedger("route", p95=0.005)
+    finished = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.03, finished.set)
+    attempts = []
+
+    async def send() -> httpx.Response:
+        attempt = len(attempts)
+        attempts.append(attempt)
+        await finished.wait()
+        if attempt == 0:
+            raise httpx.ReadError("reset")
+        return httpx.Response(200, headers={"x-attempt": str(attempt)})
+
+    response = await hedger.request("route", send)
+    assert attempts == [0, 1]
+    assert response.headers["x-attempt"] == "1"
@@ -1,20 +1,80 @@
+import json
+import time
 from unittest.mock import AsyncMock, patch
 
+import fakeredis
+import httpx
 import pytest
 from httpx import ASGITransport, AsyncClient
+from jose import jwt
 
+from app.admission import get_admission_limiter, reset_admission_limiters
+from app.auth import AUTH_SIGNATURE_HEADER, AUTH_TIMESTAMP_HEADER, USER_ID_HEADER, sign_claims
+from app.cache import ResponseCache
+from app.compression import compress_async
+from app.config import JWT_ALGORITHM, JWT_SECRET, QUEUE_TOKEN_SECRET
 from app.main import app
+from app.ratelimit import RedisRateLimiter
+from app.resilience import DEADLINE_HEADER, OPEN, get_circuit_breaker, reset_resilience_state
+from app.waiting_room import GATED_EVENTS_KEY, WaitingRoomGate
+
+# auth 서비스와 같은 형식의 토큰 (sub는 정수 사용자 ID)
+TOKEN = jwt.encode({"sub": 7, "email": "fan@example.com", "role": "user"}, JWT_SECRET, algorithm=JWT_ALGORITHM)
+AUTH_HEADERS = {"Authorization": f"Bearer {TOKEN}"}
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter():
+    """Redis-backed rate limiter on fakeredis"""
+    limiter = RedisRateLimiter(fakeredis.aioredis.FakeRedis())
+    with patch("app.main.get_rate_limiter", return_value=limiter):
+        yield limiter
+
+
+@pytest.fixture(autouse=True)
+def waiting_room_gate():
+    """Waiting room gate on fakeredis with no open queues"""
+    gate = WaitingRoomGate(fakeredis.aioredis.FakeRedis(), refresh_seconds=0)
+    with patch("app.main.get_waiting_room_gate", return_value=gate):
+        yield gate
+
+
+@pytest.fixture(autouse=True)
+def response_cache():
+    """Empty response cache per test"""
+    cache = ResponseCache()
+    with patch("app.main.get_response_cache", return_value=cache):
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def resilience_state():
+    """Fresh circuit breakers, retry budgets and concurrency limiters per test"""
+    reset_resilience_state()
+    reset_admission_limiters()
+    yield
+    reset_resilience_state()
+    reset_admission_limiters()
 
 
 @pytest.fixture
 def mock_httpx_client():
-    """Mock httpx.AsyncClient for service calls"""
-    with patch("httpx.AsyncClient") as mock:
+    """Mock pooled upstream client for service calls"""
+    with patch("app.main.get_upstream_pool") as mock:
         client = AsyncMock()
-        mock.return_value.__aenter__.return_value = client
+        mock.return_value = client
         yield client
 
 
+def upstream_response(status_code: int, body: dict, headers: dict = None) -> httpx.Response:
+    """Build an unread upstream response as returned by the pool in stream mode"""
+    return httpx.Response(
+        status_code,
+        headers={"content-type": "application/json", **(headers or {})},
+        stream=httpx.ByteStream(json.dumps(body).encode()),
+    )
+
+
 @pytest.mark.asyncio
 async def test_health_check():
     """Test health check endpoint"""
@@ -30,11 +90,9 @@ async def test_health_check():
 async def test_rate_limiting(mock_httpx_client):
     """Test rate limiting on auth endpoints"""
     # Mock successful auth response
-    mock_response = AsyncMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"access_token": "test_token"}
-    mock_response.headers = {}
-    mock_httpx_client.post.return_value = mock_response
+    mock_httpx_client.request.side_effect = lambda *args, **kwargs: upstream_response(
+        200, {"access_token": "test_token"}
+    )
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         # First 10 requests should succeed (rate limit is 10/minute)
@@ -47,22 +105,21 @@ async def test_rate_limiting(mock_httpx_client):
 
         # 11th request should be rate limited
         response = await client.post("/api/auth/login", json={"email": "test@example.com", "password": "password123"})
-        # Either rate limited or still succeeding
-        assert response.status_code in [200, 429]
+        assert response.status_code == 429
+        assert "retry-after" in response.headers
 
 
 @pytest.mark.asyncio
 async def test_auth_login_proxy(mock_httpx_client):
     """Test proxy to auth service login"""
     # Mock auth service response
-    mock_response = AsyncMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "access_token": "test_token",
-        "user": {"user_id": "123", "email": "test@example.com"},
-    }
-    mock_response.headers = {}
-    mock_httpx_client.post.return_value = mock_response
+    mock_httpx_client.request.return_value = upstream_response(
+        200,
+        {
+            "access_token": "test_token",
+            "user": {"user_id": "123", "email": "test@example.com"},
+        },
+    )
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         response = await client.post("/api/auth/login", json={"email": "test@example.com", "password": "password123"})
@@ -78,14 +135,13 @@ async def test_auth_login_proxy(mock_httpx_client):
 async def test_events_search_proxy(mock_httpx_client):
     """Test proxy to events service search"""
     # Mock events service response
-    mock_response = AsyncMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "events": [{"event_id": "evt_123", "title": "Test Concert", "category": "concert"}],
-        "total": 1,
-    }
-    mock_response.headers = {}
-    mock_httpx_client.get.return_value = mock_response
+    mock_httpx_client.request.return_value = upstream_response(
+        200,
+        {
+            "events": [{"event_id": "evt_123", "title": "Test Concert", "category": "concert"}],
+            "total": 1,
+        },
+    )
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         response = await client.get("/api/events?category=concert")
@@ -112,3 +168,352 @@ async def test_invalid_service_route():
 
         # Should return 404 or 500
         assert response.status_code in [404, 500]
+
+
+@pytest.mark.asyncio
+async def test_upstream_pool_reuses_client():
+    """Test upstream pool keeps one client per service"""
+    from app.config import SERVICES
+    from app.upstream import UpstreamPool
+
+    pool = UpstreamPool(SERVICES)
+    await pool.start()
+    try:
+        assert set(pool.clients) == set(SERVICES)
+        assert pool.client("events") is pool.client("events")
+        assert pool.client("events") is not pool.client("booking")
+    finally:
+        await pool.close()
+    assert pool.clients == {}
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint():
+    """Test Prometheus metrics endpoint exposes pool metrics"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        assert "gateway_upstream_in_flight_requests" in response.text
+
+
+@pytest.mark.asyncio
+async def test_streaming_proxy_passes_headers(mock_httpx_client):
+    """Test streaming proxy forwards status and end-to-end headers but drops hop-by-hop headers"""
+    mock_httpx_client.request.return_value = upstream_response(
+        201,
+        {"booking_id": "b1"},
+        headers={"x-request-id": "abc", "connection": "keep-alive, x-internal", "x-internal": "1"},
+    )
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/bookings", json={"event_id": "evt_1"}, headers=AUTH_HEADERS)
+
+    assert response.status_code == 201
+    assert response.json() == {"booking_id": "b1"}
+    assert response.headers["x-request-id"] == "abc"
+    assert "x-internal" not in response.headers
+
+    kwargs = mock_httpx_client.request.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert all(name.lower() != b"host" for name, _ in kwargs["headers"])
+    assert kwargs["content"] is not None
+
+
+@pytest.mark.asyncio
+async def test_queue_stream_is_streamed_without_bearer_token(mock_httpx_client):
+    """Test the SSE queue stream passes the queue token through and streams even when buffering is configured"""
+    mock_httpx_client.request.return_value = httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream"},
+        stream=httpx.ByteStream(b'event: position\ndata: {"queue_position":3}\n\n'),
+    )
+
+    from app.main import proxy_request
+
+    with (
+        patch("app.main.PROXY_STREAMING", False),
+        patch("app.main.proxy_request", wraps=proxy_request) as proxy,
+    ):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(
+                "/api/queue/stream/evt-1", params={"token": "queue-token"}, headers={"Accept-Encoding": "gzip"}
+            )
+
+    assert proxy.call_args.kwargs["stream"] is True
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/event-stream"
+    assert "content-encoding" not in response.headers
+    assert response.text.startswith("event: position")
+
+    assert mock_httpx_client.request.call_args.args[2] == "/queue/stream/evt-1"
+    assert mock_httpx_client.request.call_args.kwargs["params"]["token"] == "queue-token"
+
+
+@pytest.mark.asyncio
+async def test_buffered_proxy_mode(mock_httpx_client):
+    """Test buffered proxy mode returns raw upstream bytes with recomputed content-length"""
+    from fastapi import Request
+
+    from app.main import proxy_request
+
+    mock_httpx_client.request.return_value = upstream_response(200, {"total": 0}, headers={"content-length": "999"})
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""})
+
+    response = await proxy_request("events", "/events", request, stream=False)
+
+    assert response.body == b'{"total": 0}'
+    assert response.headers["content-length"] == str(len(response.body))
+    assert response.headers["content-type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_catch_all_routes_put_event(mock_httpx_client):
+    """Test routes without a dedicated handler are proxied via the route table"""
+    mock_httpx_client.request.return_value = upstream_response(200, {"id": 7})
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.put("/api/events/7", json={"title": "Updated"}, headers=AUTH_HEADERS)
+
+    assert response.status_code == 200
+    args = mock_httpx_client.request.call_args.args
+    assert args[:3] == ("events", "PUT", "/events/7")
+
+
+@pytest.mark.asyncio
+async def test_method_not_allowed_on_known_path():
+    """Test known path with an unrouted method returns 405 with Allow header"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.patch("/api/bookings/my")
+
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET"
+
+
+@pytest.mark.asyncio
+async def test_cached_route_etag_revalidation(mock_httpx_client):
+    """Test cacheable GET routes are served from cache and answer If-None-Match with 304"""
+    mock_httpx_client.request.side_effect = lambda *args, **kwargs: upstream_response(200, {"id": 1})
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/api/events/1")
+        second = await client.get("/api/events/1")
+        not_modified = await client.get("/api/events/1", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == {"id": 1}
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert mock_httpx_client.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_route_compressed_once_per_encoding(mock_httpx_client, response_cache):
+    """Test large cached responses are compressed per encoding once and stored with the entry"""
+    events = [{"id": i, "description": "Outdoor festival " * 10, "address": "Seoul"} for i in range(50)]
+    mock_httpx_client.request.side_effect = lambda *args, **kwargs: upstream_response(200, {"events": events})
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with patch("app.main.compress_async", wraps=compress_async) as compressor:
+            first = await client.get("/api/events", headers={"Accept-Encoding": "gzip"})
+            second = await client.get("/api/events", headers={"Accept-Encoding": "gzip"})
+            plain = await client.get("/api/events", headers={"Accept-Encoding": "identity"})
+        not_modified = await client.get(
+            "/api/events", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]}
+        )
+
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"].startswith('W/"')
+    assert "Accept-Encoding" in first.headers["vary"]
+    assert second.json() == plain.json() == {"events": events}
+    assert "content-encoding" not in plain.headers
+    assert compressor.call_count == 1
+    assert set(response_cache.entries["/events"].encodings) == {"gzip"}
+    assert not_modified.status_code == 304
+
+    headers = dict(mock_httpx_client.request.call_args.kwargs["headers"])
+    assert headers[b"accept-encoding"] == b"identity"
+
+
+@pytest.mark.asyncio
+async def test_streaming_proxy_compresses_large_json(mock_httpx_client):
+    """Test streamed JSON above the size threshold is compressed and small bodies are not"""
+    bookings = [{"id": f"b{i}", "status": "confirmed"} for i in range(100)]
+    responses = [
+        upstream_response(200, {"bookings": bookings}),
+        upstream_response(200, {"bookings": []}, headers={"content-length": "16"}),
+    ]
+    mock_httpx_client.request.side_effect = lambda *args, **kwargs: responses.pop(0)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        large = await client.get("/api/bookings/my", headers={**AUTH_HEADERS, "Accept-Encoding": "br"})
+        small = await client.get("/api/bookings/my", headers={**AUTH_HEADERS, "Accept-Encoding": "br"})
+
+    assert large.headers["content-encoding"] == "br"
+    assert large.json() == {"bookings": bookings}
+    assert "content-encoding" not in small.headers
+    assert "Accept-Encoding" in small.headers["vary"]
+
+
+@pytest.mark.asyncio
+async def test_protected_route_requires_valid_token(mock_httpx_client):
+    """Test protected routes reject missing or forged tokens at the edge without calling upstream"""
+    forged = jwt.encode({"sub": 7}, "wrong-secret", algorithm=JWT_ALGORITHM)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        missing = await client.get("/api/bookings/my")
+        invalid = await client.get("/api/bookings/my", headers={"Authorization": f"Bearer {forged}"})
+
+    assert missing.status_code == invalid.status_code == 401
+    assert missing.headers["www-authenticate"] == "Bearer"
+    mock_httpx_client.request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_verified_claims_forwarded_as_signed_headers(mock_httpx_client):
+    """Test verified claims reach upstream as signed headers and client-supplied copies are dropped"""
+    mock_httpx_client.request.side_effect = lambda *args, **kwargs: upstream_response(200, {"bookings": []})
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/bookings/my", headers={**AUTH_HEADERS, USER_ID_HEADER: "admin"})
+        anonymous = await client.get("/api/events", headers={USER_ID_HEADER: "admin"})
+
+    assert response.status_code == anonymous.status_code == 200
+    first, second = mock_httpx_client.request.call_args_list
+    forwarded = first.kwargs["headers"]
+    headers = dict(forwarded)
+    assert [value for name, value in forwarded if name == USER_ID_HEADER.encode()] == [b"7"]
+    assert headers[AUTH_SIGNATURE_HEADER.encode()].decode() == sign_claims(
+        "7", "fan@example.com", "user", headers[AUTH_TIMESTAMP_HEADER.encode()].decode()
+    )
+    assert all(name != USER_ID_HEADER.encode() for name, _ in second.kwargs["headers"])
+
+
+@pytest.mark.asyncio
+async def test_overloaded_group_sheds_low_priority(mock_httpx_client):
+    """Test a saturated route group sheds browse traffic with 503 while booking confirm still gets through"""
+    mock_httpx_client.request.side_effect = lambda *args, **kwargs: upstream_response(200, {"ok": True})
+    limiter = get_admission_limiter("booking")
+    limiter.in_flight = int(limiter.limit * 0.8)
+    limiter.queue_timeout = 0.01
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        browse = await client.get("/api/bookings/my", headers=AUTH_HEADERS)
+        confirm = await client.post("/api/bookings/b1/confirm", json={}, headers=AUTH_HEADERS)
+
+    assert browse.status_code == 503
+    assert browse.headers["retry-after"] == "1"
+    assert confirm.status_code == 200
+    assert mock_httpx_client.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_idempotent_get_retried_on_503(mock_httpx_client):
+    """Test GET is retried on 503 and the deadline is propagated upstream"""
+    responses = [upstream_response(503, {}), upstream_response(200, {"bookings": []})]
+    mock_httpx_client.request.side_effect = lambda *args, **kwargs: responses.pop(0)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/bookings/my", headers=AUTH_HEADERS)
+
+    assert response.status_code == 200
+    assert mock_httpx_client.request.call_count == 2
+    headers = dict(mock_httpx_client.request.call_args.kwargs["headers"])
+    assert 0 < int(headers[DEADLINE_HEADER.encode()]) <= 10_000
+
+
+@pytest.mark.asyncio
+async def test_post_not_retried(mock_httpx_client):
+    """Test non-idempotent requests are never retried"""
+    mock_httpx_client.request.side_effect = lambda *args, **kwargs: upstream_response(503, {"detail": "busy"})
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/bookings", json={"event_id": "evt_1"}, headers=AUTH_HEADERS)
+
+    assert response.status_code == 503
+    assert mock_httpx_client.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fast_fails(mock_httpx_client):
+    """Test requests to an upstream with an open breaker fail fast without calling it"""
+    breaker = get_circuit_breaker("payment")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert breaker.state == OPEN
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/payments/create-intent", json={"booking_id": "b1"}, headers=AUTH_HEADERS)
+
+    assert response.status_code == 503
+    assert "retry-after" in response.headers
+    mock_httpx_client.request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upstream_timeout_returns_504(mock_httpx_client):
+    """Test upstream timeouts surface as 504 and count as breaker failures"""
+    mock_httpx_client.request.side_effect = httpx.ReadTimeout("slow")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/payments/create-intent", json={"booking_id": "b1"}, headers=AUTH_HEADERS)
+
+    assert response.status_code == 504
+    assert get_circuit_breaker("payment").failures == 1
+
+
+def admission_token(user_id: str, event_id: str, secret: str = QUEUE_TOKEN_SECRET) -> str:
+    """Admission token as issued by the queue service"""
+    claims = {"sub": user_id, "event_id": event_id, "aud": "booking", "exp": int(time.time()) + 300}
+    return jwt.encode(claims, secret, algorithm="HS256")
+
+
+@pytest.mark.asyncio
+async def test_gated_event_requires_admission_token(mock_httpx_client, waiting_room_gate):
+    """Test bookings for an event with an open waiting room need a matching admission token"""
+    await waiting_room_gate.client.sadd(GATED_EVENTS_KEY, "evt_hot")
+    bodies = []
+
+    async def send(*args, **kwargs):
+        bodies.append(b"".join([chunk async for chunk in kwargs["content"]]))
+        return upstream_response(201, {"booking_id": "b1"})
+
+    mock_httpx_client.request.side_effect = send
+    payload = {"event_id": "evt_hot", "seat_number": "A1"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        missing = await client.post("/api/bookings", json=payload, headers=AUTH_HEADERS)
+        other_user = await client.post(
+            "/api/bookings",
+            json=payload,
+            headers={**AUTH_HEADERS, "X-Admission-Token": admission_token("8", "evt_hot")},
+        )
+        other_event = await client.post(
+            "/api/bookings",
+            json=payload,
+            headers={**AUTH_HEADERS, "X-Admission-Token": admission_token("7", "evt_other")},
+        )
+        forged = await client.post(
+            "/api/bookings",
+            json=payload,
+            headers={**AUTH_HEADERS, "X-Admission-Token": admission_token("7", "evt_hot", secret="wrong")},
+        )
+        admitted = await client.post(
+            "/api/bookings",
+            json=payload,
+            headers={**AUTH_HEADERS, "X-Admission-Token": admission_token("7", "evt_hot")},
+        )
+        ungated = await client.post(
+            "/api/bookings", json={"event_id": "evt_calm", "seat_number": "A1"}, headers=AUTH_HEADERS
+        )
+
+    for response in (missing, other_user, other_event, forged):
+        assert response.status_code == 403
+        assert response.json() == {"detail": "Admission token required"}
+    assert admitted.status_code == 201
+    assert ungated.status_code == 201
+    # 게이트웨이가 읽은 본문이 업스트림에 그대로 전달된다
+    assert json.loads(bodies[0]) == payload
+    assert mock_httpx_client.request.call_count == 2
@@ -0,0 +1,145 @@
+import fakeredis
+import pytest
+from fastapi import Request
+from jose import jwt
+from limits import parse
+
+from app.config import JWT_ALGORITHM, JWT_SECRET
+from app.ratelimit import RedisRateLimiter, rate_limit_key
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.aioredis.FakeRedis()
+
+
+def make_limiter(redis_client, clock, **kwargs) -> RedisRateLimiter:
+    return RedisRateLimiter(redis_client, clock=clock, **kwargs)
+
+
+def make_request(headers: dict = None, host: str = "10.0.0.1") -> Request:
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers, "client": (host, 1234)})
+
+
+async def test_limit_enforced_and_recovers(redis_client, clock):
+    """Test GCRA allows the burst, rejects the next request and recovers after one interval"""
+    limiter = make_limiter(redis_client, clock)
+    item = parse("10/minute")
+
+    results = [await limiter.hit(item, "ip:1", "POST /api/auth/login") for _ in range(10)]
+    assert all(allowed for allowed, _ in results)
+
+    allowed, retry_after = await limiter.hit(item, "ip:1", "POST /api/auth/login")
+    assert not allowed
+    assert retry_after == pytest.approx(6.0)
+
+    clock.now += 6
+    allowed, _ = await limiter.hit(item, "ip:1", "POST /api/auth/login")
+    assert allowed
+
+
+async def test_limit_shared_across_replicas(redis_client, clock):
+    """Test two gateway replicas sharing Redis enforce one global limit"""
+    replica_a = make_limiter(redis_client, clock)
+    replica_b = make_limiter(redis_client, clock)
+    item = parse("4/minute")
+
+    decisions = []
+    for replica in [replica_a, replica_b] * 3:
+        allowed, _ = await replica.hit(item, "user:1", "GET /api/bookings/my")
+        decisions.append(allowed)
+
+    assert decisions.count(True) == 4
+
+
+async def test_keys_and_namespaces_are_independent(redis_client, clock):
+    """Test different keys and routes have separate buckets"""
+    limiter = make_limiter(redis_client, clock)
+    item = parse("1/minute")
+
+    assert (await limiter.hit(item, "ip:1", "route-a"))[0]
+    assert (await limiter.hit(item, "ip:2", "route-a"))[0]
+    assert (await limiter.hit(item, "ip:1", "route-b"))[0]
+    assert not (await limiter.hit(item, "ip:1", "route-a"))[0]
+
+
+async def test_hot_key_prefetch_reduces_redis_calls(redis_client, clock, monkeypatch):
+    """Test hot keys are served from local leases after the batch size ramps up"""
+    limiter = make_limiter(redis_client, clock, max_prefetch=50)
+    item = parse("1000/minute")
+
+    calls = 0
+    script = limiter.script
+
+    async def counting_script(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await script(*args, **kwargs)
+
+    monkeypatch.setattr(limiter, "script", counting_script)
+
+    for _ in range(200):
+        assert (await limiter.hit(item, "ip:1", "GET /api/events"))[0]
+
+    assert calls < 20
+
+
+async def test_prefetch_never_exceeds_limit(redis_client, clock):
+    """Test local leases cannot admit more than the global limit"""
+    replicas = [make_limiter(redis_client, clock, max_prefetch=50) for _ in range(3)]
+    item = parse("100/minute")
+
+    admitted = 0
+    for _ in range(100):
+        for replica in replicas:
+            allowed, _ = await replica.hit(item, "ip:1", "GET /api/events")
+            admitted += allowed
+
+    assert admitted <= 100
+
+
+async def test_cold_key_lease_resets(redis_client, clock):
+    """Test an expired lease with unused tokens falls back to single-token fetches"""
+    limiter = make_limiter(redis_client, clock, lease_ttl=1.0)
+    item = parse("1000/minute")
+
+    for _ in range(10):
+        await limiter.hit(item, "ip:1", "GET /api/events")
+    clock.now += 5
+
+    await limiter.hit(item, "ip:1", "GET /api/events")
+    assert limiter.leases["ratelimit:GET /api/events:ip:1"].batch == 1
+
+
+async def test_redis_failure_fails_open(clock):
+    """Test requests are allowed when Redis is unreachable"""
+    server = fakeredis.FakeServer()
+    server.connected = False
+    limiter = make_limiter(fakeredis.aioredis.FakeRedis(server=server), clock)
+
+    allowed, _ = await limiter.hit(parse("1/minute"), "ip:1", "GET /api/events")
+    assert allowed
+
+
+def test_rate_limit_key_prefers_jwt_user():
+    """Test key is the JWT subject for valid tokens and the client IP otherwise"""
+    token = jwt.encode({"sub": "42"}, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    assert rate_limit_key(make_request({"Authorization": f"Bearer {token}"})) == "user:42"
+
+    forged = jwt.encode({"sub": "42"}, "wrong-secret", algorithm=JWT_ALGORITHM)
+    assert rate_limit_key(make_request({"Authorization": f"Bearer {forged}"})) == "ip:10.0.0.1"
+    assert rate_limit_key(make_request()) == "ip:10.0.0.1"
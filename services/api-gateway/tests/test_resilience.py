@@ -0,0 +1,92 @@
+from fastapi import Request
+
+from app.resilience import CLOSED, DEADLINE_HEADER, HALF_OPEN, OPEN, CircuitBreaker, Deadline, RetryBudget
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_after_consecutive_failures():
+    """Test breaker opens at the failure threshold and rejects until the open period ends"""
+    clock = FakeClock()
+    breaker = CircuitBreaker("payment", failure_threshold=3, open_seconds=10, clock=clock)
+
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 10
+
+    clock.now += 10
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+
+
+def test_breaker_half_open_probe():
+    """Test half-open admits one probe, closes on success and re-opens on failure"""
+    clock = FakeClock()
+    breaker = CircuitBreaker("payment", failure_threshold=1, open_seconds=5, clock=clock)
+
+    breaker.record_failure()
+    clock.now += 5
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    clock.now += 5
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_retry_budget_limits_retry_ratio():
+    """Test retries are capped at the configured ratio of requests once the initial tokens are spent"""
+    clock = FakeClock()
+    budget = RetryBudget(ratio=0.25, min_per_second=0, max_tokens=5, clock=clock)
+
+    while budget.withdraw():
+        pass
+
+    retries = 0
+    for _ in range(100):
+        budget.deposit()
+        retries += budget.withdraw()
+    assert retries == 25
+
+
+def test_retry_budget_min_per_second():
+    """Test the budget refills at the minimum rate without traffic"""
+    clock = FakeClock()
+    budget = RetryBudget(ratio=0, min_per_second=2, max_tokens=10, clock=clock)
+    budget.tokens = 0
+
+    assert not budget.withdraw()
+    clock.now += 1
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_deadline_from_request_uses_shorter_budget():
+    """Test client-supplied deadline header shortens but never extends the route timeout"""
+
+    def request(headers):
+        return Request({"type": "http", "headers": [(k.encode(), v.encode()) for k, v in headers.items()]})
+
+    assert Deadline.from_request(request({DEADLINE_HEADER: "500"}), 10).remaining() <= 0.5
+    assert 9 < Deadline.from_request(request({DEADLINE_HEADER: "60000"}), 10).remaining() <= 10
+    assert 9 < Deadline.from_request(request({DEADLINE_HEADER: "bogus"}), 10).remaining() <= 10
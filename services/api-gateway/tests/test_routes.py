@@ -0,0 +1,65 @@
+import pytest
+
+from app.routes import ROUTES, Route, RouteTable
+
+
+@pytest.fixture
+def table():
+    return RouteTable(ROUTES)
+
+
+def test_static_route_beats_param(table):
+    """Test static segment takes precedence over a path parameter"""
+    routes, params = table.lookup("/api/bookings/my")
+    assert routes["GET"].route.upstream == "/bookings/my"
+    assert params == {}
+
+    routes, params = table.lookup("/api/bookings/b-1")
+    assert set(routes) == {"GET", "DELETE"}
+    assert params == {"booking_id": "b-1"}
+
+
+def test_param_route_upstream_path(table):
+    """Test path parameters are substituted and re-encoded in the upstream path"""
+    routes, params = table.lookup("/api/events/evt 1/publish")
+    assert routes["POST"].upstream_path(params) == "/events/evt%201/publish"
+
+
+def test_previously_unreachable_routes(table):
+    """Test PUT/DELETE on events and booking cancellation are routed"""
+    assert "PUT" in table.lookup("/api/events/1")[0]
+    assert "DELETE" in table.lookup("/api/events/1")[0]
+    assert "DELETE" in table.lookup("/api/bookings/b-1")[0]
+
+
+def test_unknown_path(table):
+    """Test unknown paths and partial prefixes do not match"""
+    assert table.lookup("/api/nonexistent/endpoint") is None
+    assert table.lookup("/api/bookings/b-1/unknown") is None
+    assert table.lookup("/api") is None
+
+
+def test_wildcard_route():
+    """Test {name:path} matches the remaining path after more specific routes"""
+    table = RouteTable(
+        [
+            Route(
+                method="GET", path="/api/files/{file_path:path}", service="events", upstream="/files/{file_path:path}"
+            ),
+            Route(method="GET", path="/api/files/index", service="events", upstream="/files"),
+        ]
+    )
+    assert table.lookup("/api/files/index")[0]["GET"].route.upstream == "/files"
+
+    routes, params = table.lookup("/api/files/a/b c")
+    assert params == {"file_path": "a/b c"}
+    assert routes["GET"].upstream_path(params) == "/files/a/b%20c"
+
+
+def test_invalid_tables():
+    """Test duplicate routes and conflicting parameter names are rejected at compile time"""
+    route = Route(method="GET", path="/api/x/{id}", service="events", upstream="/x/{id}")
+    with pytest.raises(ValueError):
+        RouteTable([route, route])
+    with pytest.raises(ValueError):
+        RouteTable([route, Route(method="PUT", path="/api/x/{other}", service="events", upstream="/x/{other}")])
@@ -0,0 +1,92 @@
+import asyncio
+
+import fakeredis
+import pytest
+import redis.asyncio as redis
+from jose import jwt
+
+from app.waiting_room import GATED_EVENTS_KEY, WaitingRoomGate
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.aioredis.FakeRedis()
+
+
+async def test_gated_events_refreshed_after_interval(redis_client, clock):
+    """Test the gated set is cached locally and re-read once the refresh interval passes"""
+    gate = WaitingRoomGate(redis_client, refresh_seconds=2.0, clock=clock)
+    await redis_client.sadd(GATED_EVENTS_KEY, "evt-1")
+
+    assert await gate.gated_events() == {"evt-1"}
+
+    await redis_client.sadd(GATED_EVENTS_KEY, "evt-2")
+    clock.now += 1
+    assert await gate.gated_events() == {"evt-1"}
+
+    clock.now += 1
+    assert await gate.gated_events() == {"evt-1", "evt-2"}
+
+
+async def test_concurrent_refresh_reads_redis_once(redis_client, clock):
+    """Test requests arriving while the set is stale share one Redis read"""
+    gate = WaitingRoomGate(redis_client, clock=clock)
+    await redis_client.sadd(GATED_EVENTS_KEY, "evt-1")
+    calls = 0
+    smembers = redis_client.smembers
+
+    async def counting_smembers(key):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return await smembers(key)
+
+    redis_client.smembers = counting_smembers
+    results = await asyncio.gather(*(gate.gated_events() for _ in range(10)))
+
+    assert calls == 1
+    assert all(result == {"evt-1"} for result in results)
+
+
+async def test_redis_error_keeps_last_known_set(redis_client, clock):
+    """Test a failed refresh keeps gating the events read last time"""
+    gate = WaitingRoomGate(redis_client, refresh_seconds=2.0, clock=clock)
+    await redis_client.sadd(GATED_EVENTS_KEY, "evt-1")
+    await gate.gated_events()
+
+    async def failing_smembers(key):
+        raise redis.ConnectionError("redis down")
+
+    redis_client.smembers = failing_smembers
+    clock.now += 5
+    assert await gate.gated_events() == {"evt-1"}
+
+
+def test_verify_admission_token(redis_client):
+    """Test admission tokens must be signed for the booking audience, user and event"""
+    gate = WaitingRoomGate(redis_client, secret="queue-secret")
+
+    def token(**claims) -> str:
+        payload = {"sub": "7", "event_id": "evt-1", "aud": "booking", "exp": 4_000_000_000, **claims}
+        return jwt.encode(payload, "queue-secret", algorithm="HS256")
+
+    assert gate.verify(token(), "7", "evt-1")
+    assert not gate.verify(None, "7", "evt-1")
+    assert not gate.verify(token(), "8", "evt-1")
+    assert not gate.verify(token(), "7", "evt-2")
+    assert not gate.verify(token(aud="queue"), "7", "evt-1")
+    assert not gate.verify(token(exp=1), "7", "evt-1")
+    assert not gate.verify(jwt.encode({"sub": "7", "event_id": "evt-1", "aud": "booking"}, "other"), "7", "evt-1")
@@ -0,0 +1,142 @@
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import redis.asyncio as redis
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+BOOKING_CACHE_REQUESTS = Counter(
+    "booking_cache_requests_total",
+    "Booking record cache lookups by tier (local LRU or redis) and result",
+    ["tier", "result"],
+)
+
+BOOKING_CACHE_INVALIDATIONS = Counter(
+    "booking_cache_invalidations_total",
+    "Booking records evicted from the cache because their status changed",
+)
+
+
+class BookingCache:
+    """예약 레코드 2단 캐시 (프로세스 내 LRU + Redis)
+
+    값은 DynamoDB 원본 아이템이다. 로컬 LRU는 local_ttl(기본 2초) 동안만 믿어 다른 레플리카에서
+    상태가 바뀌었을 때의 불일치를 그 시간 안으로 제한하고, Redis는 레플리카가 공유한다. 상태가 바뀌면
+    바뀐 아이템을 두 계층에 덮어쓰고(write-through), 조회 미스로 채울 때는 키가 없을 때만 쓴다(SET NX).
+    그래서 상태 변경과 겹친 조회가 읽은 이전 아이템(최종 일관성 읽기)이 새 값을 덮어쓰지 못한다.
+    Redis 오류는 캐시 미스로 처리해 요청은 DynamoDB에서 계속 처리된다.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        ttl: int = 300,
+        local_max_entries: int = 10_000,
+        local_ttl: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.local_max_entries = local_max_entries
+        self.local_ttl = local_ttl
+        self.clock = clock
+        self.entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+
+    async def close(self):
+        """Close Redis connections"""
+        await self.client.aclose()
+
+    @staticmethod
+    def key(booking_id: str) -> str:
+        return f"booking:{booking_id}"
+
+    async def get(self, booking_id: str) -> Optional[dict]:
+        """캐시된 아이템 (로컬 → Redis 순, 없으면 None)"""
+        cached = self.entries.get(booking_id)
+        if cached is not None and cached[1] > self.clock():
+            self.entries.move_to_end(booking_id)
+            BOOKING_CACHE_REQUESTS.labels(tier="local", result="hit").inc()
+            return cached[0]
+        BOOKING_CACHE_REQUESTS.labels(tier="local", result="miss").inc()
+
+        try:
+            value = await self.client.get(self.key(booking_id))
+        except redis.RedisError as e:
+            logger.warning(f"Booking cache read failed for {booking_id}: {e}")
+            BOOKING_CACHE_REQUESTS.labels(tier="redis", result="error").inc()
+            return None
+
+        if value is None:
+            BOOKING_CACHE_REQUESTS.labels(tier="redis", result="miss").inc()
+            return None
+
+        BOOKING_CACHE_REQUESTS.labels(tier="redis", result="hit").inc()
+        item = json.loads(value)
+        self._store_local(booking_id, item)
+        return item
+
+    async def fill(self, booking_id: str, item: dict):
+        """DynamoDB에서 읽은 아이템을 캐시에 없을 때만 저장 (이미 있으면 그쪽이 같거나 더 최신)"""
+        try:
+            stored = await self.client.set(
+                self.key(booking_id), json.dumps(item, separators=(",", ":")), ex=self.ttl, nx=True
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Booking cache write failed for {booking_id}: {e}")
+            stored = True
+        if stored:
+            self._store_local(booking_id, item)
+
+    async def set(self, booking_id: str, item: dict):
+        """상태가 바뀐 아이템을 두 계층에 덮어쓰기"""
+        self._store_local(booking_id, item)
+        try:
+            await self.client.set(self.key(booking_id), json.dumps(item, separators=(",", ":")), ex=self.ttl)
+        except redis.RedisError as e:
+            # 이전 값은 ttl이 지나면 사라진다
+            logger.error(f"Booking cache write failed for {booking_id}: {e}")
+
+    async def invalidate(self, booking_id: str):
+        """상태 변경 결과를 알 수 없을 때(충돌, 오류) 두 계층에서 삭제"""
+        self.entries.pop(booking_id, None)
+        BOOKING_CACHE_INVALIDATIONS.inc()
+        try:
+            await self.client.delete(self.key(booking_id))
+        except redis.RedisError as e:
+            # 삭제하지 못한 값은 ttl이 지나면 사라진다
+            logger.error(f"Booking cache invalidation failed for {booking_id}: {e}")
+
+    def _store_local(self, booking_id: str, item: dict):
+        self.entries[booking_id] = (item, self.clock() + self.local_ttl)
+        self.entries.move_to_end(booking_id)
+        while len(self.entries) > self.local_max_entries:
+            self.entries.popitem(last=False)
+
+
+# Global instance
+_booking_cache: Optional[BookingCache] = None
+
+
+def get_booking_cache() -> BookingCache:
+    """Get booking cache instance"""
+    global _booking_cache
+
+    if _booking_cache is None:
+        client = redis.from_url(
+            os.getenv("REDIS_URL", "redis://redis:6379/0"),
+            socket_timeout=float(os.getenv("BOOKING_CACHE_REDIS_TIMEOUT", "0.05")),
+            socket_connect_timeout=float(os.getenv("BOOKING_CACHE_REDIS_TIMEOUT", "0.05")),
+        )
+        _booking_cache = BookingCache(
+            client,
+            ttl=int(os.getenv("BOOKING_CACHE_TTL_SECONDS", "300")),
+            local_max_entries=int(os.getenv("BOOKING_CACHE_LOCAL_MAX_ENTRIES", "10000")),
+            local_ttl=float(os.getenv("BOOKING_CACHE_LOCAL_TTL_SECONDS", "2")),
+        )
+
+    return _booking_cache
@@ -1,108 +1,491 @@
+import asyncio
+import base64
+import binascii
+import functools
+import json
 import logging
 import os
+import random
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Sequence
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import ClientError, ConnectTimeoutError, EndpointConnectionError
+from prometheus_client import Counter, Histogram
+
+from app.cache import BookingCache, get_booking_cache
+from app.events import OutboxMessage
+from app.stats import BookingStats, get_booking_stats
 
 logger = logging.getLogger(__name__)
 
+DYNAMODB_CALL_DURATION = Histogram(
+    "booking_dynamodb_call_duration_seconds",
+    "DynamoDB call duration including time waiting for a worker thread, by operation",
+    ["operation"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+DYNAMODB_RETRIES = Counter(
+    "booking_dynamodb_retries_total",
+    "DynamoDB calls retried after throttling or a transient error, by operation and error",
+    ["operation", "error"],
+)
+
+# 재시도하면 성공할 수 있는 오류 (파티션 처리량 초과, 일시적 서버 오류)
+RETRYABLE_ERRORS = {
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+    "InternalServerError",
+    "ServiceUnavailable",
+}
+
+# 목록 화면에 필요한 속성만 읽는다 (reservation_id/payment_id 등 상세 전용 속성 제외)
+LIST_PROJECTION = "booking_id, event_id, seat_number, user_id, #status, price, created_at, confirmed_at"
+
+# relay가 읽지 않는 outbox 파티션 (재시도 한도를 넘은 메시지를 옮겨 둠, 원래 샤드는 source_shard)
+OUTBOX_DEAD_LETTER_SHARD = -1
+
+
+class InvalidCursorError(ValueError):
+    """Cursor is malformed or belongs to another user"""
+
+
+class BookingStatusConflictError(Exception):
+    """Booking status changed since it was read"""
+
+
+def event_shard_key(event_id: str, booking_id: str, shards: int) -> str:
+    """공연 GSI 파티션 키 (공연 ID + 예약 ID 해시 접미사, 인기 공연의 쓰기를 shards개 키로 분산)"""
+    return f"{event_id}#{zlib.crc32(booking_id.encode()) % shards}"
+
+
+def retryable_error(error: Exception) -> Optional[str]:
+    """재시도할 오류면 오류 코드, 아니면 None"""
+    if isinstance(error, (EndpointConnectionError, ConnectTimeoutError)):
+        # 연결 전에 실패해 요청이 보내지지 않음
+        return type(error).__name__
+    if not isinstance(error, ClientError):
+        return None
+    code = error.response["Error"]["Code"]
+    if code in RETRYABLE_ERRORS:
+        return code
+    if code == "TransactionCanceledException":
+        # 스로틀링으로만 취소된 트랜잭션 (조건 실패가 섞여 있으면 재시도해도 같은 결과)
+        reasons = {reason.get("Code") for reason in error.response.get("CancellationReasons", [])} - {"None"}
+        if reasons == {"ThrottlingError"}:
+            return "ThrottlingError"
+    return None
+
+
+def encode_cursor(last_evaluated_key: dict) -> str:
+    """LastEvaluatedKey를 불투명한 커서 문자열로 변환"""
+    return base64.urlsafe_b64encode(json.dumps(last_evaluated_key, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, user_id: str) -> dict:
+    """커서를 ExclusiveStartKey로 변환 (다른 사용자의 키면 InvalidCursorError)"""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError("Invalid cursor")
+    if not isinstance(key, dict) or key.get("user_id") != {"S": user_id}:
+        raise InvalidCursorError("Invalid cursor")
+    return key
+
 
 class DynamoDBRepository:
-    """DynamoDB repository for bookings"""
+    """DynamoDB repository for bookings
 
-    def __init__(self):
-        self.client = boto3.client("dynamodb", region_name=os.getenv("AWS_REGION", "us-east-1"))
-        self.table_name = os.getenv("DYNAMODB_BOOKINGS_TABLE", "ticketing-bookings-prod")
+    boto3 클라이언트는 동기 호출이므로 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않는다.
+    동시에 진행되는 호출은 max_concurrency개로 제한되고(초과분은 풀의 큐에서 대기), HTTP 연결 풀도
+    같은 크기로 맞춰 워커 스레드가 연결을 기다리지 않게 한다.
 
-    async def create_booking(self, booking_data: dict) -> dict:
-        """Create a booking in DynamoDB"""
-        try:
-            item = {
-                "booking_id": {"S": booking_data["booking_id"]},
-                "event_id": {"S": booking_data["event_id"]},
-                "seat_number": {"S": booking_data["seat_number"]},
-                "user_id": {"S": booking_data["user_id"]},
-                "status": {"S": booking_data["status"]},
-                "price": {"N": str(booking_data["price"])},
-                "created_at": {"N": str(int(datetime.utcnow().timestamp()))},
-            }
+    cache가 주어지면 get_booking은 캐시를 먼저 읽고(read-through), 상태를 바꾸면 캐시에서 지운다.
+    stats가 주어지면 예약 생성과 상태 변경이 성공할 때마다 공연별 집계 카운터를 함께 갱신한다.
+
+    예약을 쓰는 메서드는 events로 받은 Kafka 메시지를 같은 트랜잭션으로 outbox 테이블에 기록한다.
+    발행은 OutboxRelay가 맡으므로 요청 경로는 Kafka를 기다리지 않는다.
+
+    공연별 GSI는 event_shard(공연 ID#0..event_shards-1)를 파티션 키로 써서 한 공연의 예매가 몰려도
+    쓰기가 여러 파티션으로 나뉜다. 공연별 조회는 모든 샤드를 병렬로 읽어 합친다(scatter-gather).
+
+    스로틀링과 일시적 오류는 botocore가 아니라 이벤트 루프에서 재시도한다. botocore는 워커 스레드 안에서
+    대기해 그동안 풀 자리를 차지하기 때문이다. 대기 시간은 full jitter 지수 백오프(0 ~ min(cap, base * 2^n))로
+    골라 재시도가 한꺼번에 몰리지 않게 하고, DynamoDB adaptive capacity가 뜨거운 파티션에 처리량을
+    옮기거나 파티션을 나눌 시간을 번다.
+    """
 
-            if "reservation_id" in booking_data:
-                item["reservation_id"] = {"S": booking_data["reservation_id"]}
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        cache: Optional[BookingCache] = None,
+        stats: Optional[BookingStats] = None,
+        max_attempts: int = 8,
+        backoff_base: float = 0.025,
+        backoff_cap: float = 2.0,
+    ):
+        self.client = boto3.client(
+            "dynamodb",
+            region_name=os.getenv("AWS_REGION", "us-east-1"),
+            endpoint_url=os.getenv("DYNAMODB_ENDPOINT_URL") or None,
+            config=Config(max_pool_connections=max_concurrency, retries={"mode": "standard", "max_attempts": 1}),
+        )
+        self.table_name = os.getenv("DYNAMODB_BOOKINGS_TABLE", "ticketing-bookings-prod")
+        # user_id + created_at(정렬 키) GSI
+        self.user_index = os.getenv("DYNAMODB_USER_INDEX", "user-bookings-index")
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="dynamodb")
+        self.cache = cache
+        self.stats = stats
+        # 공연 ID 해시로 나눈 파티션 (relay는 샤드별로 생성 순서대로 읽는다)
+        self.outbox_table = os.getenv("DYNAMODB_OUTBOX_TABLE", "ticketing-booking-outbox")
+        self.outbox_shards = int(os.getenv("OUTBOX_SHARDS", "4"))
+        # event_shard + created_at(정렬 키) GSI, 샤드 수를 바꾸면 기존 예약의 event_shard를 다시 써야 한다
+        self.event_index = os.getenv("DYNAMODB_EVENT_INDEX", "event-shard-index")
+        self.event_shards = int(os.getenv("EVENT_KEY_SHARDS", "10"))
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
 
-            if "payment_id" in booking_data:
-                item["payment_id"] = {"S": booking_data["payment_id"]}
+    def close(self):
+        """Wait for in-flight calls and stop worker threads"""
+        self.executor.shutdown(wait=True)
 
-            if "confirmed_at" in booking_data:
-                item["confirmed_at"] = {"N": str(int(booking_data["confirmed_at"].timestamp()))}
+    async def _call(self, operation: str, **kwargs) -> dict:
+        """boto3 호출을 워커 스레드에서 실행 (지연은 작업별 히스토그램에 기록, 스로틀링은 백오프 후 재시도)"""
+        for attempt in range(self.max_attempts):
+            start_time = time.perf_counter()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self.executor, functools.partial(getattr(self.client, operation), **kwargs)
+                )
+            except (ClientError, EndpointConnectionError, ConnectTimeoutError) as e:
+                error = retryable_error(e)
+                if error is None or attempt == self.max_attempts - 1:
+                    raise
+                DYNAMODB_RETRIES.labels(operation=operation, error=error).inc()
+            finally:
+                DYNAMODB_CALL_DURATION.labels(operation=operation).observe(time.perf_counter() - start_time)
+            await asyncio.sleep(self._backoff(attempt))
 
-            self.client.put_item(TableName=self.table_name, Item=item)
+    def _backoff(self, attempt: int) -> float:
+        """full jitter 지수 백오프 대기 시간"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))
 
-            return booking_data
+    async def create_booking(self, booking_data: dict, events: Sequence[OutboxMessage] = ()) -> dict:
+        """Create a booking in DynamoDB (with its outbox events in the same transaction)"""
+        try:
+            if events:
+                await self._call(
+                    "transact_write_items",
+                    TransactItems=[
+                        {"Put": {"TableName": self.table_name, "Item": self._serialize_item(booking_data)}},
+                        *self._outbox_puts(events),
+                    ],
+                )
+            else:
+                await self._call("put_item", TableName=self.table_name, Item=self._serialize_item(booking_data))
 
         except ClientError as e:
             logger.error(f"Failed to create booking: {e}")
             raise
 
-    async def get_booking(self, booking_id: str) -> Optional[dict]:
-        """Get booking by ID"""
-        try:
-            response = self.client.get_item(TableName=self.table_name, Key={"booking_id": {"S": booking_id}})
+        if self.stats:
+            await self.stats.record_created([booking_data])
+        return booking_data
 
-            if "Item" not in response:
-                return None
-
-            return self._deserialize_item(response["Item"])
+    async def create_bookings(self, bookings: List[dict], events: Sequence[OutboxMessage] = ()) -> List[dict]:
+        """Create several bookings in one TransactWriteItems call (all or nothing, up to 100 items with events)"""
+        try:
+            await self._call(
+                "transact_write_items",
+                TransactItems=[
+                    *({"Put": {"TableName": self.table_name, "Item": self._serialize_item(b)}} for b in bookings),
+                    *self._outbox_puts(events),
+                ],
+            )
 
         except ClientError as e:
-            logger.error(f"Failed to get booking: {e}")
+            logger.error(f"Failed to create bookings: {e}")
             raise
 
-    async def update_booking_status(self, booking_id: str, status: str, payment_id: Optional[str] = None) -> dict:
-        """Update booking status"""
-        try:
-            update_expression = "SET #status = :status, confirmed_at = :confirmed_at"
-            expression_values = {
-                ":status": {"S": status},
-                ":confirmed_at": {"N": str(int(datetime.utcnow().timestamp()))},
-            }
+        if self.stats:
+            await self.stats.record_created(bookings)
+        return bookings
 
-            if payment_id:
-                update_expression += ", payment_id = :payment_id"
-                expression_values[":payment_id"] = {"S": payment_id}
+    async def get_booking(self, booking_id: str, consistent: bool = False) -> Optional[dict]:
+        """Get booking by ID
 
-            self.client.update_item(
+        consistent=True면 캐시를 건너뛰고 강한 일관성 읽기를 한다 (상태 전이 전 확인용).
+        """
+        if self.cache and not consistent:
+            item = await self.cache.get(booking_id)
+            if item is not None:
+                return self._deserialize_item(item)
+
+        try:
+            response = await self._call(
+                "get_item",
                 TableName=self.table_name,
                 Key={"booking_id": {"S": booking_id}},
-                UpdateExpression=update_expression,
-                ExpressionAttributeNames={"#status": "status"},
-                ExpressionAttributeValues=expression_values,
+                ConsistentRead=consistent,
             )
+        except ClientError as e:
+            logger.error(f"Failed to get booking: {e}")
+            raise
+
+        if "Item" not in response:
+            return None
+
+        if self.cache:
+            await self.cache.fill(booking_id, response["Item"])
+        return self._deserialize_item(response["Item"])
+
+    async def update_booking_status(
+        self,
+        booking: dict,
+        status: str,
+        payment_id: Optional[str] = None,
+        events: Sequence[OutboxMessage] = (),
+    ) -> dict:
+        """Update booking status and return the updated booking
+
+        booking은 방금 읽은 레코드이며, 그 사이 다른 요청이 상태를 바꿨으면 BookingStatusConflictError.
+        상태 외의 속성은 바뀌지 않으므로 갱신 결과를 다시 읽지 않고 booking에 반영해 돌려준다.
+        """
+        confirmed_at = datetime.utcnow()
+        update = {
+            "TableName": self.table_name,
+            "Key": {"booking_id": {"S": booking["booking_id"]}},
+            "UpdateExpression": "SET #status = :status, confirmed_at = :confirmed_at",
+            "ConditionExpression": "#status = :current",
+            "ExpressionAttributeNames": {"#status": "status"},
+            "ExpressionAttributeValues": {
+                ":status": {"S": status},
+                ":current": {"S": booking["status"]},
+                ":confirmed_at": {"N": str(int(confirmed_at.timestamp()))},
+            },
+        }
+        if payment_id:
+            update["UpdateExpression"] += ", payment_id = :payment_id"
+            update["ExpressionAttributeValues"][":payment_id"] = {"S": payment_id}
 
-            return await self.get_booking(booking_id)
+        written = False
+        try:
+            if events:
+                await self._call("transact_write_items", TransactItems=[{"Update": update}, *self._outbox_puts(events)])
+            else:
+                await self._call("update_item", **update)
+            written = True
 
         except ClientError as e:
+            code = e.response["Error"]["Code"]
+            reasons = e.response.get("CancellationReasons", [])
+            if code == "ConditionalCheckFailedException" or (
+                code == "TransactionCanceledException"
+                and reasons
+                and reasons[0].get("Code") == "ConditionalCheckFailed"
+            ):
+                raise BookingStatusConflictError(f"Booking {booking['booking_id']} is no longer {booking['status']}")
             logger.error(f"Failed to update booking: {e}")
             raise
 
-    async def list_user_bookings(self, user_id: str) -> List[dict]:
-        """List bookings for a user (using GSI)"""
-        try:
-            response = self.client.query(
-                TableName=self.table_name,
-                IndexName="user-index",
-                KeyConditionExpression="user_id = :user_id",
-                ExpressionAttributeValues={":user_id": {"S": user_id}},
-            )
+        finally:
+            if self.cache and not written:
+                await self.cache.invalidate(booking["booking_id"])
+
+        if self.stats:
+            await self.stats.record_transition(booking, status)
+
+        updated = {**booking, "status": status, "confirmed_at": confirmed_at.replace(microsecond=0)}
+        if payment_id:
+            updated["payment_id"] = payment_id
+        if self.cache:
+            # 겹친 조회가 이전 아이템으로 다시 채우지 못하도록 무효화 대신 새 아이템을 써 둔다
+            await self.cache.set(booking["booking_id"], self._serialize_item(updated))
+        return updated
 
-            return [self._deserialize_item(item) for item in response.get("Items", [])]
+    async def list_user_bookings(
+        self, user_id: str, limit: int = 20, cursor: Optional[str] = None
+    ) -> tuple[List[dict], Optional[str]]:
+        """List a page of bookings for a user, newest first (using GSI)
+
+        Returns the bookings and the cursor for the next page (None on the last page).
+        """
+        params = {
+            "TableName": self.table_name,
+            "IndexName": self.user_index,
+            "KeyConditionExpression": "user_id = :user_id",
+            "ExpressionAttributeValues": {":user_id": {"S": user_id}},
+            "ExpressionAttributeNames": {"#status": "status"},
+            "ProjectionExpression": LIST_PROJECTION,
+            "ScanIndexForward": False,
+            "Limit": limit,
+        }
+        if cursor:
+            params["ExclusiveStartKey"] = decode_cursor(cursor, user_id)
 
+        try:
+            response = await self._call("query", **params)
         except ClientError as e:
             logger.error(f"Failed to list user bookings: {e}")
             raise
 
+        last_key = response.get("LastEvaluatedKey")
+        return [self._deserialize_item(item) for item in response.get("Items", [])], (
+            encode_cursor(last_key) if last_key else None
+        )
+
+    async def iter_user_bookings(self, user_id: str, page_size: int = 100) -> AsyncIterator[dict]:
+        """Iterate over all bookings for a user, newest first, one page in memory at a time"""
+        cursor = None
+        while True:
+            bookings, cursor = await self.list_user_bookings(user_id, page_size, cursor)
+            for booking in bookings:
+                yield booking
+            if cursor is None:
+                return
+
+    async def list_event_bookings(self, event_id: str, status: Optional[str] = None) -> List[dict]:
+        """List every booking of an event, newest first (queries all event_shard keys in parallel)"""
+        shards = await asyncio.gather(
+            *(self._query_event_shard(f"{event_id}#{shard}", status) for shard in range(self.event_shards))
+        )
+        bookings = [booking for shard in shards for booking in shard]
+        bookings.sort(key=lambda booking: booking["created_at"], reverse=True)
+        return bookings
+
+    async def _query_event_shard(self, event_shard: str, status: Optional[str]) -> List[dict]:
+        params = {
+            "TableName": self.table_name,
+            "IndexName": self.event_index,
+            "KeyConditionExpression": "event_shard = :event_shard",
+            "ExpressionAttributeValues": {":event_shard": {"S": event_shard}},
+            "ExpressionAttributeNames": {"#status": "status"},
+            "ProjectionExpression": LIST_PROJECTION,
+            "ScanIndexForward": False,
+        }
+        if status:
+            params["FilterExpression"] = "#status = :status"
+            params["ExpressionAttributeValues"][":status"] = {"S": status}
+
+        items = []
+        while True:
+            try:
+                response = await self._call("query", **params)
+            except ClientError as e:
+                logger.error(f"Failed to list event bookings: {e}")
+                raise
+            items.extend(self._deserialize_item(item) for item in response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                return items
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    async def fetch_outbox(self, shard: int, limit: int) -> List[OutboxMessage]:
+        """Oldest pending outbox messages of a shard"""
+        response = await self._call(
+            "query",
+            TableName=self.outbox_table,
+            KeyConditionExpression="#shard = :shard",
+            ExpressionAttributeNames={"#shard": "shard"},
+            ExpressionAttributeValues={":shard": {"N": str(shard)}},
+            ConsistentRead=True,
+            Limit=limit,
+        )
+        return [OutboxMessage.from_item(item) for item in response.get("Items", [])]
+
+    async def delete_outbox(self, messages: Sequence[OutboxMessage]):
+        """Remove published messages from the outbox (25 keys per BatchWriteItem, unprocessed keys retried)"""
+        for start in range(0, len(messages), 25):
+            requests = [
+                {"DeleteRequest": {"Key": self._outbox_key(message)}} for message in messages[start : start + 25]
+            ]
+            for attempt in range(5):
+                response = await self._call("batch_write_item", RequestItems={self.outbox_table: requests})
+                requests = response.get("UnprocessedItems", {}).get(self.outbox_table)
+                if not requests:
+                    break
+                await asyncio.sleep(self._backoff(attempt + 1))
+            else:
+                # 남은 메시지는 다음 주기에 다시 발행된다 (idempotency key로 중복 제거)
+                logger.warning(f"{len(requests)} outbox messages left undeleted after retries")
+
+    async def record_outbox_attempt(self, message: OutboxMessage):
+        """Count a rejected delivery of an outbox message (ignored if it was already removed)"""
+        try:
+            await self._call(
+                "update_item",
+                TableName=self.outbox_table,
+                Key=self._outbox_key(message),
+                UpdateExpression="ADD attempts :one",
+                ConditionExpression="attribute_exists(outbox_id)",
+                ExpressionAttributeValues={":one": {"N": "1"}},
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+
+    async def dead_letter_outbox(self, message: OutboxMessage, error: str):
+        """Move an outbox message to the dead-letter partition in one transaction"""
+        item = message.to_item(self.outbox_shards)
+        item["source_shard"] = item["shard"]
+        item["shard"] = {"N": str(OUTBOX_DEAD_LETTER_SHARD)}
+        item["attempts"] = {"N": str(message.attempts)}
+        item["error"] = {"S": error[:1000]}
+        item["dead_lettered_at"] = {"N": str(int(time.time()))}
+        await self._call(
+            "transact_write_items",
+            TransactItems=[
+                {"Put": {"TableName": self.outbox_table, "Item": item}},
+                {"Delete": {"TableName": self.outbox_table, "Key": self._outbox_key(message)}},
+            ],
+        )
+
+    def _outbox_key(self, message: OutboxMessage) -> dict:
+        return {"shard": {"N": str(message.shard(self.outbox_shards))}, "outbox_id": {"S": message.outbox_id}}
+
+    def _outbox_puts(self, events: Sequence[OutboxMessage]) -> List[dict]:
+        return [
+            {
+                "Put": {
+                    "TableName": self.outbox_table,
+                    "Item": event.to_item(self.outbox_shards),
+                    "ConditionExpression": "attribute_not_exists(outbox_id)",
+                }
+            }
+            for event in events
+        ]
+
+    def _serialize_item(self, booking_data: dict) -> dict:
+        """Convert booking dict to DynamoDB item"""
+        event_shard = event_shard_key(booking_data["event_id"], booking_data["booking_id"], self.event_shards)
+        item = {
+            "booking_id": {"S": booking_data["booking_id"]},
+            "event_id": {"S": booking_data["event_id"]},
+            "event_shard": {"S": event_shard},
+            "seat_number": {"S": booking_data["seat_number"]},
+            "user_id": {"S": booking_data["user_id"]},
+            "status": {"S": booking_data["status"]},
+            "price": {"N": str(booking_data["price"])},
+            "created_at": {"N": str(int((booking_data.get("created_at") or datetime.utcnow()).timestamp()))},
+        }
+
+        if booking_data.get("reservation_id") is not None:
+            item["reservation_id"] = {"S": booking_data["reservation_id"]}
+
+        if booking_data.get("payment_id") is not None:
+            item["payment_id"] = {"S": booking_data["payment_id"]}
+
+        if booking_data.get("confirmed_at") is not None:
+            item["confirmed_at"] = {"N": str(int(booking_data["confirmed_at"].timestamp()))}
+
+        return item
+
     def _deserialize_item(self, item: dict) -> dict:
         """Convert DynamoDB item to dict"""
         return {
@@ -128,6 +511,10 @@ def get_dynamodb_repo() -> DynamoDBRepository:
     global _dynamodb_repo
 
     if _dynamodb_repo is None:
-        _dynamodb_repo = DynamoDBRepository()
+        _dynamodb_repo = DynamoDBRepository(
+            max_concurrency=int(os.getenv("DYNAMODB_MAX_CONCURRENCY", "32")),
+            cache=get_booking_cache() if os.getenv("BOOKING_CACHE_ENABLED", "true").lower() == "true" else None,
+            stats=get_booking_stats() if os.getenv("BOOKING_STATS_ENABLED", "true").lower() == "true" else None,
+        )
 
     return _dynamodb_repo
@@ -0,0 +1,213 @@
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from typing import Optional
+
+import httpx
+from aiokafka import AIOKafkaConsumer
+from prometheus_client import Counter, Gauge
+
+from app.kafka_producer import kafka_bootstrap_servers
+
+logger = logging.getLogger(__name__)
+
+EVENT_LOOKUPS = Counter(
+    "booking_event_metadata_lookups_total",
+    "Event metadata lookups on the booking path, by outcome",
+    ["result"],  # hit | fetched | not_found | unavailable
+)
+
+EVENT_CACHE_SIZE = Gauge(
+    "booking_event_metadata_cache_entries",
+    "Events held in the in-process event metadata cache",
+)
+
+
+class EventLookupError(Exception):
+    """Events Service에서 이벤트를 조회하지 못함"""
+
+
+def event_metadata(event: dict) -> dict:
+    """캐시에 두는 공연 메타데이터 (Events Service 응답과 event.updated 메시지 공통 필드)"""
+    return {"price": float(event["price"]), "status": event.get("status")}
+
+
+class EventMetadataCache:
+    """공연 메타데이터(기본 가격, 상태)를 프로세스 메모리에 들고 있는 캐시
+
+    기동 시와 refresh_interval마다 Events Service의 목록 API로 전체를 다시 적재하고, 그 사이 변경과 삭제는
+    event.updated 토픽을 구독해 바로 반영한다. 예약 경로는 좌석을 잡기 전 공연 존재 확인에 쓰며 dict 조회만
+    하므로 네트워크 I/O가 없다 (예약 금액은 Inventory의 좌석 가격).
+    캐시에 없는 공연(새로 생긴 직후 등)만 한 번 조회해 채우며, 같은 공연의 동시 미스는 요청 하나로 합친다.
+    """
+
+    topic = "event.updated"
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        bootstrap_servers: str = "localhost:9092",
+        refresh_interval: float = 300,
+        page_size: int = 100,
+    ):
+        self.http = http_client
+        self.bootstrap_servers = bootstrap_servers
+        self.refresh_interval = refresh_interval
+        self.page_size = page_size
+        self.events: dict[str, dict] = {}
+        self._fetches: dict[str, asyncio.Future] = {}
+        # 적재 중 구독으로 바뀐 공연 (적재 결과가 더 오래된 값일 수 있어 덮어쓰지 않음)
+        self._updated_during_warm: Optional[set[str]] = None
+
+    def get(self, event_id: str) -> Optional[dict]:
+        """캐시된 메타데이터 (I/O 없음)"""
+        return self.events.get(event_id)
+
+    async def lookup(self, event_id: str) -> Optional[dict]:
+        """메타데이터 조회, 캐시에 없으면 Events Service에서 한 번 가져와 채움 (없는 공연이면 None)"""
+        metadata = self.events.get(event_id)
+        if metadata is not None:
+            EVENT_LOOKUPS.labels(result="hit").inc()
+            return metadata
+
+        future = self._fetches.get(event_id)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(event_id))
+            self._fetches[event_id] = future
+            future.add_done_callback(lambda _: self._fetches.pop(event_id, None))
+        try:
+            metadata = await asyncio.shield(future)
+        except EventLookupError:
+            EVENT_LOOKUPS.labels(result="unavailable").inc()
+            raise
+        EVENT_LOOKUPS.labels(result="fetched" if metadata is not None else "not_found").inc()
+        return metadata
+
+    async def organizer_id(self, event_id: str) -> Optional[str]:
+        """공연 주최자 ID (캐시하지 않고 매번 조회하므로 대시보드 같은 드문 요청용, 없는 공연이면 None)"""
+        event = await self._get_event(event_id)
+        return None if event is None else str(event["organizer_id"])
+
+    async def _get_event(self, event_id: str) -> Optional[dict]:
+        try:
+            response = await self.http.get(f"/events/{event_id}")
+        except httpx.HTTPError as e:
+            raise EventLookupError(f"Events service error: {e}") from e
+        if response.status_code in (404, 422):
+            return None
+        if response.is_error:
+            raise EventLookupError(f"Events service error: {response.status_code}")
+        return response.json()
+
+    async def _fetch(self, event_id: str) -> Optional[dict]:
+        event = await self._get_event(event_id)
+        if event is None:
+            return None
+        metadata = event_metadata(event)
+        self.events[event_id] = metadata
+        EVENT_CACHE_SIZE.set(len(self.events))
+        return metadata
+
+    async def warm(self):
+        """Events Service의 전체 공연 메타데이터를 다시 적재 (삭제된 공연은 빠짐)"""
+        self._updated_during_warm = set()
+        try:
+            events = {}
+            skip = 0
+            while True:
+                response = await self.http.get("/events", params={"skip": skip, "limit": self.page_size})
+                response.raise_for_status()
+                page = response.json()
+                for event in page["events"]:
+                    events[str(event["id"])] = event_metadata(event)
+                skip += self.page_size
+                if not page["events"] or skip >= page["total"]:
+                    break
+
+            for event_id in self._updated_during_warm:
+                events.pop(event_id, None)
+                if event_id in self.events:
+                    events[event_id] = self.events[event_id]
+            self.events = events
+        finally:
+            self._updated_during_warm = None
+        EVENT_CACHE_SIZE.set(len(self.events))
+        logger.info(f"Event metadata cache warmed: {len(self.events)} events")
+
+    def apply(self, message: dict):
+        """event.updated 메시지 반영"""
+        event_id = message["event_id"]
+        if message["event_type"] == "event.deleted":
+            self.events.pop(event_id, None)
+        else:
+            self.events[event_id] = event_metadata(message)
+        if self._updated_during_warm is not None:
+            self._updated_during_warm.add(event_id)
+        EVENT_CACHE_SIZE.set(len(self.events))
+
+    async def consume(self, consumer: AIOKafkaConsumer):
+        async for record in consumer:
+            try:
+                self.apply(record.value)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping malformed {self.topic} message: {e}")
+
+    async def run(self):
+        """구독 + 주기적 재적재 (lifespan 백그라운드 태스크)
+
+        레플리카마다 모든 변경을 받아야 하므로 컨슈머 그룹 없이 최신 위치부터 읽고, 구독을 먼저 시작한 뒤
+        적재해 그 사이 변경을 놓치지 않는다. Kafka에 붙지 못하면 재적재 주기만큼 늦게 반영된다.
+        """
+        consumer = AIOKafkaConsumer(
+            self.topic,
+            bootstrap_servers=self.bootstrap_servers.split(","),
+            group_id=None,
+            auto_offset_reset="latest",
+            value_deserializer=json.loads,
+        )
+        consume_task = None
+        try:
+            await consumer.start()
+            consume_task = asyncio.create_task(self.consume(consumer))
+        except Exception as e:
+            logger.error(f"Failed to subscribe to {self.topic}, relying on periodic refresh: {e}")
+
+        try:
+            while True:
+                try:
+                    await self.warm()
+                except (httpx.HTTPError, KeyError, ValueError) as e:
+                    logger.warning(f"Failed to warm event metadata cache: {e}")
+                await asyncio.sleep(self.refresh_interval)
+        finally:
+            if consume_task:
+                consume_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await consume_task
+            await consumer.stop()
+
+    async def close(self):
+        await self.http.aclose()
+
+
+# Global instance
+_event_metadata_cache: Optional[EventMetadataCache] = None
+
+
+def get_event_metadata_cache() -> EventMetadataCache:
+    """Get event metadata cache instance"""
+    global _event_metadata_cache
+
+    if _event_metadata_cache is None:
+        _event_metadata_cache = EventMetadataCache(
+            httpx.AsyncClient(
+                base_url=os.getenv("EVENTS_SERVICE_URL", "http://events-service:8000"),
+                timeout=float(os.getenv("EVENTS_SERVICE_TIMEOUT", "2")),
+            ),
+            bootstrap_servers=kafka_bootstrap_servers(),
+            refresh_interval=float(os.getenv("EVENT_METADATA_REFRESH_SECONDS", "300")),
+        )
+
+    return _event_metadata_cache
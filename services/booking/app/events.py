@@ -0,0 +1,108 @@
+import json
+import time
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass
+class OutboxMessage:
+    """outbox 테이블을 거쳐 Kafka로 나가는 메시지 하나
+
+    message_id는 페이로드와 idempotency-key 헤더에 함께 실리며, relay가 같은 메시지를 다시 보내도
+    컨슈머는 이 값으로 중복을 걸러낸다. key(공연 ID)로 outbox 샤드와 Kafka 파티션을 정해 같은 공연의
+    이벤트는 생성 순서대로 전달된다. attempts는 메시지 자체가 거부된(직렬화 실패, 크기 초과 등) 발행 횟수다.
+    """
+
+    topic: str
+    key: str
+    payload: dict
+    message_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: int = field(default_factory=lambda: int(time.time() * 1000))
+    attempts: int = 0
+
+    def shard(self, shards: int) -> int:
+        return zlib.crc32(self.key.encode()) % shards
+
+    @property
+    def outbox_id(self) -> str:
+        """샤드 안의 정렬 키 (생성 시각순)"""
+        return f"{self.created_at:013d}#{self.message_id}"
+
+    def to_item(self, shards: int) -> dict:
+        """Convert message to outbox table item"""
+        return {
+            "shard": {"N": str(self.shard(shards))},
+            "outbox_id": {"S": self.outbox_id},
+            "topic": {"S": self.topic},
+            "message_key": {"S": self.key},
+            "payload": {"S": json.dumps(self.payload, separators=(",", ":"))},
+        }
+
+    @classmethod
+    def from_item(cls, item: dict) -> "OutboxMessage":
+        """Convert outbox table item to message"""
+        created_at, message_id = item["outbox_id"]["S"].split("#", 1)
+        return cls(
+            topic=item["topic"]["S"],
+            key=item["message_key"]["S"],
+            payload=json.loads(item["payload"]["S"]),
+            message_id=message_id,
+            created_at=int(created_at),
+            attempts=int(item.get("attempts", {"N": "0"})["N"]),
+        )
+
+
+def _message(topic: str, key: str, payload: dict) -> OutboxMessage:
+    message_id = str(uuid.uuid4())
+    return OutboxMessage(topic=topic, key=key, payload={"message_id": message_id, **payload}, message_id=message_id)
+
+
+def booking_created(booking: dict) -> OutboxMessage:
+    """Booking created event"""
+    return _message(
+        "booking.created",
+        booking["event_id"],
+        {
+            "event_type": "booking.created",
+            "booking_id": booking["booking_id"],
+            "event_id": booking["event_id"],
+            "user_id": booking["user_id"],
+            "seat_number": booking["seat_number"],
+            "timestamp": booking["created_at"].isoformat(),
+        },
+    )
+
+
+def bookings_created(bookings: list[dict]) -> OutboxMessage:
+    """Booking created event for a multi-seat cart"""
+    first = bookings[0]
+    return _message(
+        "booking.created",
+        first["event_id"],
+        {
+            "event_type": "booking.batch_created",
+            "booking_ids": [booking["booking_id"] for booking in bookings],
+            "event_id": first["event_id"],
+            "user_id": first["user_id"],
+            "seat_numbers": [booking["seat_number"] for booking in bookings],
+            "total_price": sum(booking["price"] for booking in bookings),
+            "timestamp": first["created_at"].isoformat(),
+        },
+    )
+
+
+def booking_confirmed(booking: dict, payment_id: str) -> OutboxMessage:
+    """Booking confirmed event"""
+    return _message(
+        "booking.confirmed",
+        booking["event_id"],
+        {
+            "event_type": "booking.confirmed",
+            "booking_id": booking["booking_id"],
+            "payment_id": payment_id,
+            "user_id": booking["user_id"],
+            "timestamp": datetime.utcnow().isoformat(),
+        },
+    )
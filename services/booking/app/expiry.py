@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, Optional
+
+import grpc
+import redis.asyncio as redis
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.dynamodb import BookingStatusConflictError, DynamoDBRepository, get_dynamodb_repo
+from app.grpc_client import InventoryServiceClient, get_inventory_client
+from app.schemas import BookingStatus
+
+logger = logging.getLogger(__name__)
+
+EXPIRY_PROCESSED = Counter(
+    "booking_expiry_processed_total",
+    "Due holds handled by the expiry sweeper, by outcome",
+    ["result"],  # expired | skipped | release_rejected | retry
+)
+
+EXPIRY_LAG = Histogram(
+    "booking_expiry_lag_seconds",
+    "Time between a hold's due time and the sweeper picking it up",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+
+EXPIRY_BACKLOG = Gauge(
+    "booking_expiry_backlog",
+    "Holds past their due time still waiting in the expiry index",
+)
+
+EXPIRY_SCHEDULE_FAILURES = Counter(
+    "booking_expiry_schedule_failures_total",
+    "Holds that could not be added to the expiry index (they will not expire automatically)",
+)
+
+# 만료 시각이 지난 예약을 batch개 꺼내 점수를 lease 만료 시각으로 미뤄 둔다.
+# 다른 레플리카는 lease 동안 같은 예약을 가져가지 않고, 처리 도중 죽으면 lease가 지난 뒤 다시 처리된다.
+CLAIM_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'WITHSCORES', 'LIMIT', 0, ARGV[2])
+for i = 1, #due, 2 do
+    redis.call('ZADD', KEYS[1], ARGV[3], due[i])
+end
+return due
+"""
+
+
+class ExpirySweeper:
+    """결제되지 않은 예약을 만료시키고 좌석을 돌려주는 백그라운드 작업
+
+    예약을 만들 때 Redis ZSET(점수 = 만료 시각)에 넣고, 확정/취소되면 뺀다. 주기마다 만료 시각이 지난
+    예약을 batch_size개씩 가져와 최대 concurrency개씩 병렬로 pending → expired로 바꾸고 release_seat을
+    호출한다. 테이블을 스캔하지 않으므로 대기 중인 예약 수와 무관하게 만료된 건수만큼만 일한다.
+    좌석 해제가 일시적으로 실패하면 expired 상태로 인덱스에 남겨 lease_seconds 뒤 해제만 다시 시도한다.
+    """
+
+    key = "booking:expiry"
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        repo: DynamoDBRepository,
+        inventory_client: InventoryServiceClient,
+        hold_seconds: float = 600,
+        batch_size: int = 500,
+        concurrency: int = 32,
+        lease_seconds: float = 30,
+        interval: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.client = client
+        self.repo = repo
+        self.inventory_client = inventory_client
+        self.hold_seconds = hold_seconds
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.interval = interval
+        self.clock = clock
+
+    async def schedule(self, booking_ids: list[str]):
+        """새 예약을 hold_seconds 뒤 만료되도록 등록"""
+        expires_at = self.clock() + self.hold_seconds
+        try:
+            await self.client.zadd(self.key, {booking_id: expires_at for booking_id in booking_ids})
+        except redis.RedisError as e:
+            EXPIRY_SCHEDULE_FAILURES.inc(len(booking_ids))
+            logger.error(f"Failed to schedule expiry for {booking_ids}: {e}")
+
+    async def unschedule(self, booking_id: str):
+        """확정/취소된 예약을 인덱스에서 제거 (실패해도 스위퍼가 상태를 보고 건너뛴다)"""
+        try:
+            await self.client.zrem(self.key, booking_id)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to unschedule expiry for {booking_id}: {e}")
+
+    async def expire(self, booking_id: str) -> str:
+        """예약 하나 만료 처리 (결과 라벨 반환, 인덱스에 남겨 재시도할 때는 retry)"""
+        booking = await self.repo.get_booking(booking_id, consistent=True)
+        if booking is None or booking["status"] not in (BookingStatus.PENDING, BookingStatus.EXPIRED):
+            return "skipped"
+
+        if booking["status"] == BookingStatus.PENDING:
+            try:
+                booking = await self.repo.update_booking_status(booking, BookingStatus.EXPIRED.value)
+            except BookingStatusConflictError:
+                # 그 사이 결제 확정/취소됨
+                return "skipped"
+
+        try:
+            result = await self.inventory_client.release_seat(
+                booking["event_id"], booking["seat_number"], booking["user_id"]
+            )
+        except grpc.RpcError as e:
+            logger.warning(f"Failed to release seat for expired booking {booking_id}: {e.code().name}")
+            return "retry"
+
+        if not result.get("success"):
+            logger.warning(f"Inventory refused to release seat for {booking_id}: {result.get('message')}")
+            return "release_rejected"
+        return "expired"
+
+    async def tick(self) -> int:
+        """만료된 예약 한 배치 처리 (가져온 건수 반환)"""
+        now = self.clock()
+        due = await self.client.eval(CLAIM_SCRIPT, 1, self.key, now, self.batch_size, now + self.lease_seconds)
+        claimed = [(due[index].decode(), float(due[index + 1])) for index in range(0, len(due), 2)]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def process(booking_id: str, expires_at: float):
+            async with semaphore:
+                EXPIRY_LAG.observe(max(now - expires_at, 0))
+                try:
+                    result = await self.expire(booking_id)
+                except Exception:
+                    # ClientError, 재시도를 다 쓴 BotoCoreError 등: 인덱스에 남겨 lease 뒤 다시 처리
+                    logger.exception(f"Failed to expire booking {booking_id}")
+                    result = "retry"
+                EXPIRY_PROCESSED.labels(result=result).inc()
+                if result != "retry":
+                    try:
+                        await self.client.zrem(self.key, booking_id)
+                    except redis.RedisError as e:
+                        # lease 뒤 다시 가져오지만 상태를 보고 건너뛰거나 해제만 다시 시도한다
+                        logger.warning(f"Failed to remove {booking_id} from the expiry index: {e}")
+
+        await asyncio.gather(*(process(booking_id, expires_at) for booking_id, expires_at in claimed))
+        EXPIRY_BACKLOG.set(await self.client.zcount(self.key, "-inf", now))
+        return len(claimed)
+
+    async def run(self):
+        """밀린 만료가 없을 때만 interval씩 쉬며 반복 (lifespan 백그라운드 태스크)"""
+        while True:
+            try:
+                claimed = await self.tick()
+            except Exception:
+                # 어떤 오류에도 태스크가 끝나면 만료된 좌석이 영영 풀리지 않는다
+                logger.exception("Expiry sweep failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.interval)
+
+
+# Global instance
+_expiry_sweeper: Optional[ExpirySweeper] = None
+
+
+def get_expiry_sweeper() -> ExpirySweeper:
+    """Get expiry sweeper instance"""
+    global _expiry_sweeper
+
+    if _expiry_sweeper is None:
+        _expiry_sweeper = ExpirySweeper(
+            redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379/0"), socket_timeout=1, socket_connect_timeout=1),
+            get_dynamodb_repo(),
+            get_inventory_client(),
+            hold_seconds=float(os.getenv("BOOKING_HOLD_SECONDS", "600")),
+            batch_size=int(os.getenv("EXPIRY_BATCH_SIZE", "500")),
+            concurrency=int(os.getenv("EXPIRY_CONCURRENCY", "32")),
+            interval=float(os.getenv("EXPIRY_INTERVAL_SECONDS", "1")),
+        )
+
+    return _expiry_sweeper
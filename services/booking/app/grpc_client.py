@@ -1,56 +1,153 @@
+import itertools
+import json
 import os
+import time
 from typing import Optional
 
 import grpc
-
-# Note: In production, generate from inventory.proto
-# For now, using mock client structure
+from prometheus_client import Histogram
+
+from app.proto import inventory_pb2, inventory_pb2_grpc
+
+INVENTORY_RPC_DURATION = Histogram(
+    "inventory_grpc_client_duration_seconds",
+    "Inventory Service gRPC call duration including retries, by method and status code",
+    ["method", "code"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+# UNAVAILABLE(연결 실패, 서버 재시작 등)만 지수 백오프로 재시도한다.
+# 재시도는 호출의 deadline 안에서만 일어나며, 실패가 쌓이면 retryThrottling이 재시도를 멈춰
+# 장애 중에 부하를 키우지 않는다.
+SERVICE_CONFIG = {
+    "loadBalancingConfig": [{"round_robin": {}}],
+    "methodConfig": [
+        {
+            "name": [{"service": "inventory.InventoryService"}],
+            "retryPolicy": {
+                "maxAttempts": 3,
+                "initialBackoff": "0.05s",
+                "maxBackoff": "0.5s",
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": ["UNAVAILABLE"],
+            },
+        }
+    ],
+    "retryThrottling": {"maxTokens": 10, "tokenRatio": 0.1},
+}
 
 
 class InventoryServiceClient:
-    """gRPC 클라이언트 for Inventory Service"""
-
-    def __init__(self, endpoint: str):
+    """gRPC 클라이언트 for Inventory Service
+
+    HTTP/2 연결 하나의 동시 스트림 한도에 묶이지 않도록 채널 여러 개를 만들어 호출마다 라운드로빈으로
+    나눠 쓴다. 채널마다 별도 서브채널 풀을 써서 실제 TCP 연결도 채널 수만큼 열리며, keepalive ping으로
+    유휴 연결이 끊긴 것을 미리 감지한다. 모든 호출에는 timeout(초) deadline이 붙는다.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        channels: int = 4,
+        timeout: float = 2.0,
+        keepalive_seconds: float = 30.0,
+        service_config: dict = SERVICE_CONFIG,
+    ):
         self.endpoint = endpoint
-        self.channel = None
-        self.stub = None
+        self.channel_count = channels
+        self.timeout = timeout
+        self.options = [
+            ("grpc.use_local_subchannel_pool", 1),
+            ("grpc.keepalive_time_ms", int(keepalive_seconds * 1000)),
+            ("grpc.keepalive_timeout_ms", 10000),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+            ("grpc.enable_retries", 1),
+            ("grpc.service_config", json.dumps(service_config)),
+        ]
+        self.channels: list[grpc.aio.Channel] = []
+        self.stubs: list[inventory_pb2_grpc.InventoryServiceStub] = []
+        self._next = itertools.cycle(())
 
     async def connect(self):
         """Connect to Inventory Service"""
-        self.channel = grpc.aio.insecure_channel(self.endpoint)
-        # self.stub = inventory_pb2_grpc.InventoryServiceStub(self.channel)
+        if self.channels:
+            return
+
+        self.channels = [
+            grpc.aio.insecure_channel(self.endpoint, options=self.options) for _ in range(self.channel_count)
+        ]
+        self.stubs = [inventory_pb2_grpc.InventoryServiceStub(channel) for channel in self.channels]
+        self._next = itertools.cycle(self.stubs)
 
     async def close(self):
-        """Close gRPC channel"""
-        if self.channel:
-            await self.channel.close()
+        """Close gRPC channels"""
+        for channel in self.channels:
+            await channel.close()
+        self.channels, self.stubs = [], []
+        self._next = itertools.cycle(())
+
+    async def _call(self, method: str, request, timeout: Optional[float] = None):
+        """다음 채널로 RPC 호출 (지연은 메서드/상태 코드별 히스토그램에 기록)"""
+        await self.connect()
+        rpc = getattr(next(self._next), method)
+
+        start_time = time.perf_counter()
+        code = grpc.StatusCode.OK
+        try:
+            return await rpc(request, timeout=timeout if timeout is not None else self.timeout)
+        except grpc.aio.AioRpcError as e:
+            code = e.code()
+            raise
+        finally:
+            INVENTORY_RPC_DURATION.labels(method=method, code=code.name).observe(time.perf_counter() - start_time)
 
     async def reserve_seat(self, event_id: str, seat_number: str, user_id: str) -> dict:
         """좌석 예약 요청"""
-        # Mock implementation - replace with actual gRPC call
-        # request = inventory_pb2.ReserveSeatRequest(
-        #     event_id=event_id,
-        #     seat_number=seat_number,
-        #     user_id=user_id
-        # )
-        # response = await self.stub.ReserveSeat(request)
-
-        # Mock response
+        response = await self._call(
+            "ReserveSeat", inventory_pb2.ReserveSeatRequest(event_id=event_id, seat_number=seat_number, user_id=user_id)
+        )
+        return {
+            "success": response.success,
+            "reservation_id": response.reservation_id,
+            "price": response.seat.price,
+            "message": response.message,
+        }
+
+    async def reserve_seats(self, event_id: str, seat_numbers: list[str], user_id: str) -> dict:
+        """여러 좌석 일괄 예약 요청 (전부 예약되거나 하나도 예약되지 않음)"""
+        response = await self._call(
+            "ReserveSeats",
+            inventory_pb2.ReserveSeatsRequest(event_id=event_id, seat_numbers=seat_numbers, user_id=user_id),
+        )
         return {
-            "success": True,
-            "reservation_id": f"res_{event_id}_{seat_number}",
-            "message": "Seat reserved successfully",
+            "success": response.success,
+            "message": response.message,
+            "reservations": [
+                {
+                    "seat_number": reservation.seat_number,
+                    "reservation_id": reservation.reservation_id,
+                    "price": reservation.price,
+                }
+                for reservation in response.reservations
+            ],
+            "unavailable_seats": list(response.unavailable_seats),
         }
 
     async def confirm_booking(self, reservation_id: str, user_id: str, payment_id: str) -> dict:
         """예약 확정 요청"""
-        # Mock implementation
-        return {"success": True, "booking_id": f"booking_{reservation_id}", "message": "Booking confirmed"}
+        response = await self._call(
+            "ConfirmBooking",
+            inventory_pb2.ConfirmBookingRequest(reservation_id=reservation_id, user_id=user_id, payment_id=payment_id),
+        )
+        return {"success": response.success, "booking_id": response.booking_id, "message": response.message}
 
     async def release_seat(self, event_id: str, seat_number: str, user_id: str) -> dict:
         """좌석 해제 요청"""
-        # Mock implementation
-        return {"success": True, "message": "Seat released"}
+        response = await self._call(
+            "ReleaseSeat", inventory_pb2.ReleaseSeatRequest(event_id=event_id, seat_number=seat_number, user_id=user_id)
+        )
+        return {"success": response.success, "message": response.message}
 
 
 # Global client instance
@@ -62,7 +159,11 @@ def get_inventory_client() -> InventoryServiceClient:
     global _inventory_client
 
     if _inventory_client is None:
-        endpoint = os.getenv("INVENTORY_SERVICE_GRPC", "inventory-service:50051")
-        _inventory_client = InventoryServiceClient(endpoint)
+        _inventory_client = InventoryServiceClient(
+            os.getenv("INVENTORY_SERVICE_GRPC", "inventory-service:50051"),
+            channels=int(os.getenv("INVENTORY_GRPC_CHANNELS", "4")),
+            timeout=float(os.getenv("INVENTORY_GRPC_TIMEOUT", "2")),
+            keepalive_seconds=float(os.getenv("INVENTORY_GRPC_KEEPALIVE_SECONDS", "30")),
+        )
 
     return _inventory_client
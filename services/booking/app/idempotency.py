@@ -0,0 +1,214 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Awaitable, Callable, Optional
+
+import redis.asyncio as redis
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
+from prometheus_client import Counter
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_REQUESTS = Counter(
+    "booking_idempotency_requests_total",
+    "Booking mutations carrying an Idempotency-Key, by outcome",
+    ["result"],  # executed | replayed | waited | in_progress | mismatch | unavailable
+)
+
+MAX_KEY_LENGTH = 255
+
+# 키가 없으면 실행 중 표시를 남기고 nil, 있으면 기존 기록 반환 (재요청은 왕복 1회로 판별)
+BEGIN_SCRIPT = """
+local existing = redis.call('GET', KEYS[1])
+if existing then
+    return existing
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+return false
+"""
+
+# 내가 남긴 실행 중 표시일 때만 교체/삭제
+FINISH_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current or cjson.decode(current)['token'] ~= ARGV[1] then
+    return 0
+end
+if ARGV[2] == '' then
+    return redis.call('DEL', KEYS[1])
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+
+class IdempotencyStore:
+    """Idempotency-Key별 첫 실행 결과를 Redis에 ttl 동안 보관
+
+    첫 요청은 실행 중 표시(lock_seconds 뒤 만료)를 남기고 실행한 뒤 상태 코드와 본문을 저장한다.
+    같은 키의 재요청은 저장된 응답을 그대로 받고, 첫 요청이 아직 실행 중이면 최대 wait_timeout 동안
+    결과를 기다린다. 5xx 결과는 저장하지 않아 클라이언트가 같은 키로 다시 시도할 수 있다.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        ttl: int = 86400,
+        lock_seconds: float = 30,
+        wait_timeout: float = 10,
+        poll_interval: float = 0.02,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.lock_ms = int(lock_seconds * 1000)
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+
+    async def begin(self, key: str, fingerprint: str, token: str) -> Optional[dict]:
+        """실행 권한을 얻으면 None, 이미 기록이 있으면 그 기록"""
+        record = json.dumps({"state": "running", "fingerprint": fingerprint, "token": token})
+        existing = await self.client.eval(BEGIN_SCRIPT, 1, key, record, self.lock_ms)
+        return json.loads(existing) if existing else None
+
+    async def wait(self, key: str) -> Optional[dict]:
+        """실행 중인 첫 요청의 결과를 기다림 (완료 기록, 첫 요청이 실패해 키가 사라졌거나 시간 초과면 None)"""
+        deadline = time.monotonic() + self.wait_timeout
+        interval = self.poll_interval
+        while time.monotonic() < deadline:
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, 0.2)
+            value = await self.client.get(key)
+            if value is None:
+                return None
+            record = json.loads(value)
+            if record["state"] == "done":
+                return record
+        return None
+
+    async def finish(self, key: str, token: str, record: Optional[dict]):
+        """결과 저장 (record가 None이면 실행 중 표시만 지움)"""
+        await self.client.eval(FINISH_SCRIPT, 1, key, token, json.dumps(record) if record else "", self.ttl)
+
+
+def replay(record: dict) -> Response:
+    """저장된 응답 재생"""
+    return Response(
+        content=record["body"].encode(),
+        status_code=record["status"],
+        media_type="application/json" if record["body"] else None,
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+async def run_idempotent(
+    request: Request,
+    user_id: str,
+    idempotency_key: Optional[str],
+    handler: Callable[[], Awaitable[Optional[BaseModel]]],
+    status_code: int,
+) -> Response:
+    """Idempotency-Key가 있으면 같은 사용자/경로/키의 요청을 한 번만 실행
+
+    handler의 결과(또는 HTTPException)를 응답으로 만들어 저장한다. 같은 키를 다른 본문으로 다시 쓰면 422,
+    첫 요청이 wait_timeout 안에 끝나지 않으면 409. Redis 장애 시에는 중복 제거 없이 실행하되, 이미 실행 중인
+    요청을 기다리던 중이면 다시 실행하지 않고 503.
+    """
+    if idempotency_key is None:
+        return to_response(await handler(), status_code)
+    if not 0 < len(idempotency_key) <= MAX_KEY_LENGTH:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid Idempotency-Key")
+
+    store = get_idempotency_store()
+    key = f"booking:idempotency:{user_id}:{request.method}:{request.url.path}:{idempotency_key}"
+    fingerprint = hashlib.sha256(await request.body()).hexdigest()
+    token = uuid.uuid4().hex
+
+    try:
+        existing = await store.begin(key, fingerprint, token)
+    except redis.RedisError as e:
+        logger.warning(f"Idempotency store unavailable, executing without dedupe: {e}")
+        IDEMPOTENCY_REQUESTS.labels(result="unavailable").inc()
+        return to_response(await handler(), status_code)
+
+    if existing is not None:
+        if existing["fingerprint"] != fingerprint:
+            IDEMPOTENCY_REQUESTS.labels(result="mismatch").inc()
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used with a different request",
+            )
+        if existing["state"] == "done":
+            IDEMPOTENCY_REQUESTS.labels(result="replayed").inc()
+            return replay(existing)
+
+        try:
+            record = await store.wait(key)
+        except redis.RedisError as e:
+            # 첫 요청이 실행 중인 것을 알고 있으므로 다시 실행하지 않는다 (중복 예약 방지)
+            logger.warning(f"Idempotency store unavailable while waiting for {key}: {e}")
+            IDEMPOTENCY_REQUESTS.labels(result="unavailable").inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Could not check the result of the original request, retry later",
+            )
+        if record is None:
+            IDEMPOTENCY_REQUESTS.labels(result="in_progress").inc()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still in progress, retry later",
+            )
+        IDEMPOTENCY_REQUESTS.labels(result="waited").inc()
+        return replay(record)
+
+    IDEMPOTENCY_REQUESTS.labels(result="executed").inc()
+    try:
+        response = to_response(await handler(), status_code)
+    except HTTPException as e:
+        response = JSONResponse({"detail": e.detail}, status_code=e.status_code, headers=e.headers)
+    except BaseException:
+        try:
+            await store.finish(key, token, None)
+        except redis.RedisError as e:
+            # 실행 중 표시는 lock_seconds 뒤 만료된다, 원래 오류를 그대로 올린다
+            logger.error(f"Failed to release idempotency key {key}: {e}")
+        raise
+
+    record = None
+    if response.status_code < 500:
+        record = {"state": "done", "fingerprint": fingerprint, "status": response.status_code}
+        record["body"] = response.body.decode()
+    try:
+        await store.finish(key, token, record)
+    except redis.RedisError as e:
+        # 실행 중 표시는 lock_seconds 뒤 만료되고, 그 뒤 재요청은 다시 실행된다
+        logger.error(f"Failed to store idempotent response: {e}")
+    return response
+
+
+def to_response(result: Optional[BaseModel], status_code: int) -> Response:
+    if result is None:
+        return Response(status_code=status_code)
+    return JSONResponse(result.model_dump(mode="json"), status_code=status_code)
+
+
+# Global instance
+_idempotency_store: Optional[IdempotencyStore] = None
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Get idempotency store instance"""
+    global _idempotency_store
+
+    if _idempotency_store is None:
+        _idempotency_store = IdempotencyStore(
+            redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379/0"), socket_timeout=1, socket_connect_timeout=1),
+            ttl=int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400")),
+            wait_timeout=float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "10")),
+        )
+
+    return _idempotency_store
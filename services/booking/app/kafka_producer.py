@@ -1,18 +1,81 @@
+import asyncio
 import json
 import logging
 import os
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from aiokafka import AIOKafkaProducer
+from aiokafka.errors import InvalidTopicError, KafkaError, MessageSizeTooLargeError, RecordTooLargeError
+from prometheus_client import Counter
+
+from app.events import OutboxMessage
 
 logger = logging.getLogger(__name__)
 
+KAFKA_MESSAGES = Counter(
+    "booking_kafka_messages_total",
+    "Kafka messages handed to the producer, by topic and delivery result",
+    ["topic", "result"],
+)
 
-class KafkaProducer:
-    """Kafka producer for publishing booking events"""
+# 직렬화 형식별 content-type 헤더 (컨슈머가 형식을 판단)
+CONTENT_TYPES = {
+    "json": b"application/json",
+    "orjson": b"application/json",
+    "msgpack": b"application/msgpack",
+}
+
+# 브로커 상태와 상관없이 그 메시지 때문에 다시 보내도 계속 실패하는 오류 (직렬화 실패, 크기 초과, 잘못된 토픽).
+# 타임아웃이나 연결 오류는 장애가 끝나면 성공하므로 포함하지 않는다.
+REJECTED_ERRORS = (TypeError, ValueError, MessageSizeTooLargeError, RecordTooLargeError, InvalidTopicError)
+
+
+def is_rejected(error: Optional[BaseException]) -> bool:
+    """메시지 자체가 거부된 오류인지 (outbox relay가 재시도 횟수를 세는 대상)"""
+    return isinstance(error, REJECTED_ERRORS)
+
+
+def kafka_bootstrap_servers() -> str:
+    """브로커 목록 (AWS 배포는 MSK_BOOTSTRAP_SERVERS, docker compose와 k8s/local은 KAFKA_BOOTSTRAP_SERVERS)"""
+    return os.getenv("MSK_BOOTSTRAP_SERVERS") or os.getenv("KAFKA_BOOTSTRAP_SERVERS") or "localhost:9092"
+
+
+def make_serializer(name: str) -> Callable[[Any], bytes]:
+    """이벤트 직렬화 함수 (json | orjson | msgpack, orjson과 json은 같은 JSON을 만든다)"""
+    if name == "orjson":
+        import orjson
 
-    def __init__(self):
-        self.bootstrap_servers = os.getenv("MSK_BOOTSTRAP_SERVERS", "localhost:9092")
+        return orjson.dumps
+    if name == "msgpack":
+        import msgpack
+
+        return msgpack.packb
+    if name == "json":
+        return lambda value: json.dumps(value, separators=(",", ":")).encode()
+    raise ValueError(f"Unknown Kafka serializer: {name}")
+
+
+class KafkaProducer:
+    """Kafka producer for publishing booking events
+
+    메시지는 linger_ms 동안 모아 파티션별 배치(최대 max_batch_size 바이트)로 압축해 보낸다.
+    예약 이벤트는 모두 outbox relay가 publish_messages로 보내며, 삭제 여부를 정할 수 있도록
+    배치 전체를 버퍼에 넣은 뒤 ack를 한꺼번에 기다린다.
+    """
+
+    def __init__(
+        self,
+        linger_ms: int = 5,
+        max_batch_size: int = 64 * 1024,
+        compression: Optional[str] = "lz4",
+        serializer: str = "orjson",
+    ):
+        self.bootstrap_servers = kafka_bootstrap_servers()
+        self.linger_ms = linger_ms
+        self.max_batch_size = max_batch_size
+        self.compression = compression if compression and compression != "none" else None
+        self.serializer = make_serializer(serializer)
+        self.headers = [("content-type", CONTENT_TYPES[serializer])]
         self.producer: Optional[AIOKafkaProducer] = None
 
     async def start(self):
@@ -20,7 +83,13 @@ class KafkaProducer:
         try:
             self.producer = AIOKafkaProducer(
                 bootstrap_servers=self.bootstrap_servers.split(","),
-                value_serializer=lambda v: json.dumps(v).encode("utf-8"),
+                value_serializer=self.serializer,
+                linger_ms=self.linger_ms,
+                max_batch_size=self.max_batch_size,
+                compression_type=self.compression,
+                # 재시도로 인한 중복/순서 뒤바뀜 방지
+                enable_idempotence=True,
+                acks="all",
             )
             await self.producer.start()
             logger.info(f"Kafka producer started: {self.bootstrap_servers}")
@@ -29,44 +98,51 @@ class KafkaProducer:
             self.producer = None
 
     async def stop(self):
-        """Stop Kafka producer"""
+        """Flush pending messages and stop Kafka producer"""
         if self.producer:
             await self.producer.stop()
 
-    async def publish_event(self, topic: str, event: dict):
-        """Publish event to Kafka"""
-        if not self.producer:
-            logger.warning("Kafka producer not available, skipping event publish")
-            return
+    async def publish_messages(self, messages: list[OutboxMessage]) -> list[Optional[Exception]]:
+        """Publish outbox messages and wait for broker acks (delivery error per message, None if acked)
 
-        try:
-            await self.producer.send_and_wait(topic, event)
-            logger.info(f"Published event to {topic}: {event.get('event_type')}")
-        except Exception as e:
-            logger.error(f"Failed to publish event: {e}")
-
-    async def publish_booking_created(self, booking: dict):
-        """Publish booking created event"""
-        event = {
-            "event_type": "booking.created",
-            "booking_id": booking["booking_id"],
-            "event_id": booking["event_id"],
-            "user_id": booking["user_id"],
-            "seat_number": booking["seat_number"],
-            "timestamp": booking["created_at"].isoformat(),
-        }
-        await self.publish_event("booking.created", event)
-
-    async def publish_booking_confirmed(self, booking: dict):
-        """Publish booking confirmed event"""
-        event = {
-            "event_type": "booking.confirmed",
-            "booking_id": booking["booking_id"],
-            "payment_id": booking.get("payment_id"),
-            "user_id": booking["user_id"],
-            "timestamp": booking.get("confirmed_at", booking["created_at"]).isoformat(),
-        }
-        await self.publish_event("booking.confirmed", event)
+        전송은 순서대로 배치 버퍼에 넣고 ack는 한꺼번에 기다린다. 메시지 키는 파티션 키, message_id는
+        idempotency-key 헤더로 보낸다.
+        """
+        if not self.producer:
+            return [KafkaError("Kafka producer is not started") for _ in messages]
+
+        deliveries = []
+        enqueue_error = None
+        for message in messages:
+            try:
+                deliveries.append(
+                    await self.producer.send(
+                        message.topic,
+                        message.payload,
+                        key=message.key.encode() if message.key else None,
+                        headers=self.headers + [("idempotency-key", message.message_id.encode())],
+                    )
+                )
+            except (KafkaError, *REJECTED_ERRORS) as e:
+                # 나머지는 순서를 지키기 위해 보내지 않고 다음 주기에 다시 시도한다
+                logger.error(f"Failed to enqueue {message.message_id} for {message.topic}: {e!r}")
+                enqueue_error = e
+                break
+
+        results = await asyncio.gather(*deliveries, return_exceptions=True)
+        errors: list[Optional[Exception]] = []
+        for message, result in zip(messages, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to publish {message.message_id} to {message.topic}: {result!r}")
+                errors.append(result)
+            else:
+                errors.append(None)
+        if enqueue_error is not None:
+            errors.append(enqueue_error)
+        errors += [KafkaError("Not sent after an earlier failure in the batch") for _ in messages[len(errors) :]]
+        for message, error in zip(messages, errors):
+            KAFKA_MESSAGES.labels(topic=message.topic, result="success" if error is None else "failure").inc()
+        return errors
 
 
 # Global instance
@@ -78,6 +154,11 @@ def get_kafka_producer() -> KafkaProducer:
     global _kafka_producer
 
     if _kafka_producer is None:
-        _kafka_producer = KafkaProducer()
+        _kafka_producer = KafkaProducer(
+            linger_ms=int(os.getenv("KAFKA_LINGER_MS", "5")),
+            max_batch_size=int(os.getenv("KAFKA_MAX_BATCH_SIZE", str(64 * 1024))),
+            compression=os.getenv("KAFKA_COMPRESSION", "lz4"),
+            serializer=os.getenv("KAFKA_SERIALIZER", "orjson"),
+        )
 
     return _kafka_producer
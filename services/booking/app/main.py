@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import logging
 import os
 import time
@@ -9,8 +11,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, Response
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
 
+from app.dynamodb import get_dynamodb_repo
+from app.event_metadata import get_event_metadata_cache
+from app.expiry import get_expiry_sweeper
 from app.grpc_client import get_inventory_client
 from app.kafka_producer import get_kafka_producer
+from app.outbox import get_outbox_relay
 from app.routers import booking
 from app.schemas import HealthResponse
 
@@ -38,6 +44,9 @@ async def lifespan(app: FastAPI):
     """애플리케이션 시작 및 종료"""
     logger.info("Starting Booking Service...")
 
+    # Initialize DynamoDB client and worker threads
+    dynamodb_repo = get_dynamodb_repo()
+
     # Initialize gRPC client
     inventory_client = get_inventory_client()
     await inventory_client.connect()
@@ -46,13 +55,37 @@ async def lifespan(app: FastAPI):
     kafka_producer = get_kafka_producer()
     await kafka_producer.start()
 
+    # outbox → Kafka 발행 루프 (레플리카마다 실행, 샤드별 Redis 잠금으로 나눠 처리)
+    outbox_relay = get_outbox_relay()
+    relay_task = asyncio.create_task(outbox_relay.run())
+
+    # 결제되지 않은 예약 만료 루프 (레플리카마다 실행, Redis에서 lease로 나눠 가져감)
+    expiry_sweeper = get_expiry_sweeper()
+    expiry_task = asyncio.create_task(expiry_sweeper.run())
+
+    # 공연 가격 캐시 (Events Service에서 적재 + event.updated 구독)
+    event_cache = get_event_metadata_cache()
+    event_task = asyncio.create_task(event_cache.run())
+
     logger.info("All connections initialized")
 
     yield
 
-    # Cleanup
+    # Cleanup (남은 outbox 메시지와 만료 예약은 다른 레플리카나 다음 기동 때 처리된다)
+    for task in (relay_task, expiry_task, event_task):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await outbox_relay.client.aclose()
+    await expiry_sweeper.client.aclose()
+    await event_cache.close()
     await inventory_client.close()
     await kafka_producer.stop()
+    dynamodb_repo.close()
+    if dynamodb_repo.cache:
+        await dynamodb_repo.cache.close()
+    if dynamodb_repo.stats:
+        await dynamodb_repo.stats.close()
     logger.info("Shutting down Booking Service...")
 
 
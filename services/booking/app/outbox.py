@@ -0,0 +1,190 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from typing import Optional
+
+import redis.asyncio as redis
+from prometheus_client import Counter, Histogram
+
+from app.dynamodb import DynamoDBRepository, get_dynamodb_repo
+from app.kafka_producer import KafkaProducer, get_kafka_producer, is_rejected
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_PUBLISHED = Counter(
+    "booking_outbox_published_total",
+    "Outbox messages delivered to Kafka, by result",
+    ["result"],
+)
+
+OUTBOX_LAG = Histogram(
+    "booking_outbox_lag_seconds",
+    "Time from the booking write to the Kafka ack of its event",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+
+OUTBOX_RELAY_ERRORS = Counter(
+    "booking_outbox_relay_errors_total",
+    "Outbox relay ticks that failed with an unexpected error",
+)
+
+OUTBOX_DEAD_LETTERED = Counter(
+    "booking_outbox_dead_lettered_total",
+    "Outbox messages moved to the dead-letter partition after max_attempts rejected deliveries",
+    ["topic"],
+)
+
+# 내가 잡은 잠금만 해제
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class OutboxRelay:
+    """outbox 테이블의 메시지를 Kafka로 발행하고 지우는 백그라운드 작업
+
+    샤드마다 가장 오래된 메시지를 batch_size개씩 읽어 한꺼번에 보내고, ack를 받은 것만 지운다.
+    발행 후 삭제 전에 죽으면 같은 메시지가 다시 나가므로(at-least-once) 컨슈머는 idempotency-key
+    헤더로 중복을 걸러야 한다. 레플리카마다 실행되지만 샤드별 Redis 잠금으로 한 샤드는 한 곳에서만
+    처리하며, Redis 장애 시에는 잠금 없이 진행한다 (중복만 늘어남).
+
+    메시지 자체가 거부되는 오류(직렬화 실패, 크기 초과 등)는 메시지별 attempts로 세고, max_attempts번 거부된
+    메시지는 dead-letter 파티션으로 옮겨 뒤 메시지가 영원히 막히지 않게 한다. 타임아웃 같은 브로커 장애는
+    세지 않으므로 장애 중에는 메시지가 옮겨지지 않고 기다린다.
+    """
+
+    def __init__(
+        self,
+        repo: DynamoDBRepository,
+        producer: KafkaProducer,
+        client: Optional[redis.Redis] = None,
+        batch_size: int = 100,
+        interval: float = 0.2,
+        lock_seconds: float = 10.0,
+        max_backoff: float = 30.0,
+        max_attempts: int = 5,
+    ):
+        self.repo = repo
+        self.producer = producer
+        self.client = client
+        self.batch_size = batch_size
+        self.interval = interval
+        self.lock_ms = int(lock_seconds * 1000)
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        self.owner = uuid.uuid4().hex
+
+    async def relay_shard(self, shard: int) -> int:
+        """샤드의 메시지 한 배치 발행 (outbox에서 지우거나 dead-letter로 옮긴 메시지 수 반환)"""
+        messages = await self.repo.fetch_outbox(shard, self.batch_size)
+        if not messages:
+            return 0
+
+        errors = await self.producer.publish_messages(messages)
+        acked = sum(error is None for error in errors)
+        OUTBOX_PUBLISHED.labels(result="success").inc(acked)
+        OUTBOX_PUBLISHED.labels(result="failure").inc(len(messages) - acked)
+
+        # 첫 실패 이후 메시지는 ack를 받았어도 남겨 둔다: 먼저 지우면 재시도되는 앞 메시지보다
+        # 뒤 메시지가 먼저 나간 셈이 되어 같은 키의 순서가 깨진다 (다음 주기에 다시 나가 중복만 생김)
+        delivered = []
+        dead_lettered = 0
+        for message, error in zip(messages, errors):
+            if error is None:
+                delivered.append(message)
+                continue
+            if not is_rejected(error):
+                break
+            message.attempts += 1
+            if message.attempts < self.max_attempts:
+                await self.repo.record_outbox_attempt(message)
+                break
+            await self.repo.dead_letter_outbox(message, repr(error))
+            OUTBOX_DEAD_LETTERED.labels(topic=message.topic).inc()
+            logger.error(
+                f"Moved outbox message {message.message_id} for {message.topic} to dead letter "
+                f"after {message.attempts} rejected deliveries: {error!r}"
+            )
+            dead_lettered += 1
+
+        now = time.time()
+        for message in delivered:
+            OUTBOX_LAG.observe(max(now - message.created_at / 1000, 0))
+        if delivered:
+            await self.repo.delete_outbox(delivered)
+        return len(delivered) + dead_lettered
+
+    async def tick(self) -> bool:
+        """모든 샤드를 한 번씩 처리 (가득 찬 배치가 있었으면 True, 밀린 메시지가 남았을 수 있음)"""
+        backlog = False
+        for shard in range(self.repo.outbox_shards):
+            key = f"booking:outbox:lock:{shard}"
+            if not await self._acquire(key):
+                continue
+            try:
+                backlog |= await self.relay_shard(shard) >= self.batch_size
+            finally:
+                await self._release(key)
+        return backlog
+
+    async def run(self):
+        """밀린 메시지가 없을 때만 interval씩 쉬며 반복 (lifespan 백그라운드 태스크)
+
+        어떤 오류에도 태스크가 끝나지 않도록 하고, 연속으로 실패하면 max_backoff까지 두 배씩 쉰다.
+        """
+        failures = 0
+        while True:
+            try:
+                backlog = await self.tick()
+                failures = 0
+            except Exception:
+                logger.exception("Outbox relay tick failed")
+                OUTBOX_RELAY_ERRORS.inc()
+                backlog = False
+                failures += 1
+            if not backlog:
+                await asyncio.sleep(min(self.interval * 2**failures, self.max_backoff))
+
+    async def _acquire(self, key: str) -> bool:
+        if self.client is None:
+            return True
+        try:
+            return bool(await self.client.set(key, self.owner, nx=True, px=self.lock_ms))
+        except redis.RedisError as e:
+            logger.warning(f"Outbox lock unavailable, relaying without it: {e}")
+            return True
+
+    async def _release(self, key: str):
+        if self.client is None:
+            return
+        try:
+            await self.client.eval(RELEASE_SCRIPT, 1, key, self.owner)
+        except redis.RedisError as e:
+            # 잠금은 lock_seconds 후 만료된다
+            logger.warning(f"Outbox lock release failed: {e}")
+
+
+# Global instance
+_outbox_relay: Optional[OutboxRelay] = None
+
+
+def get_outbox_relay() -> OutboxRelay:
+    """Get outbox relay instance"""
+    global _outbox_relay
+
+    if _outbox_relay is None:
+        _outbox_relay = OutboxRelay(
+            get_dynamodb_repo(),
+            get_kafka_producer(),
+            redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379/0"), socket_timeout=1, socket_connect_timeout=1),
+            batch_size=int(os.getenv("OUTBOX_BATCH_SIZE", "100")),
+            interval=float(os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", "0.2")),
+            max_attempts=int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5")),
+        )
+
+    return _outbox_relay
@@ -0,0 +1 @@
+# Generated gRPC stubs (scripts/generate_protos.sh)
@@ -1,46 +1,89 @@
+import logging
 import uuid
 from datetime import datetime
-
-from fastapi import APIRouter, Depends, HTTPException, status
-
-from app.dynamodb import get_dynamodb_repo
+from typing import AsyncIterator, Optional
+
+import grpc
+import redis.asyncio as redis
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from app.auth import SERVICE_ROLE, get_current_user_id
+from app.dynamodb import BookingStatusConflictError, InvalidCursorError, get_dynamodb_repo
+from app.event_metadata import EventLookupError, get_event_metadata_cache
+from app.events import booking_confirmed, booking_created, bookings_created
+from app.expiry import get_expiry_sweeper
 from app.grpc_client import get_inventory_client
-from app.kafka_producer import get_kafka_producer
-from app.schemas import BookingConfirm, BookingCreate, BookingListResponse, BookingResponse
+from app.idempotency import run_idempotent
+from app.schemas import (
+    BookingBatchCreate,
+    BookingConfirm,
+    BookingCreate,
+    BookingListResponse,
+    BookingResponse,
+    EventBookingStats,
+)
+from app.stats import get_booking_stats
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
 
 
-# 임시: 인증 시뮬레이션
-async def get_current_user_id() -> str:
-    """임시 사용자 ID"""
-    return "user-123"
+IdempotencyKey = Header(None, alias="Idempotency-Key", description="같은 키의 재시도는 첫 응답을 그대로 돌려받는다")
+
+
+async def require_event(event_id: str):
+    """공연 존재 확인 (프로세스 내 캐시, 캐시에 없을 때만 Events Service 조회)
+
+    Events Service 장애로 확인하지 못하면 막지 않고 진행한다: 없는 공연의 좌석은 Inventory가 거부하므로
+    이 확인은 좌석을 잡기 전에 일찍 404를 주는 용도일 뿐이다.
+    """
+    try:
+        known = await get_event_metadata_cache().lookup(event_id) is not None
+    except EventLookupError as e:
+        logger.warning(f"Could not check event {event_id}, continuing without it: {e}")
+        return
+    if not known:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
 
 @router.post("", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
-async def create_booking(booking_data: BookingCreate, user_id: str = Depends(get_current_user_id)):
+async def create_booking(
+    booking_data: BookingCreate,
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+    idempotency_key: Optional[str] = IdempotencyKey,
+):
     """예약 생성 (좌석 예약)"""
+    return await run_idempotent(
+        request, user_id, idempotency_key, lambda: reserve_booking(booking_data, user_id), status.HTTP_201_CREATED
+    )
+
+
+async def reserve_booking(booking_data: BookingCreate, user_id: str) -> BookingResponse:
     inventory_client = get_inventory_client()
     dynamodb_repo = get_dynamodb_repo()
-    kafka_producer = get_kafka_producer()
+
+    # Step 0: 없는 공연이면 좌석을 잡기 전에 404
+    await require_event(booking_data.event_id)
 
     # Step 1: Inventory Service에 좌석 예약 요청 (gRPC)
     try:
         reserve_result = await inventory_client.reserve_seat(
             event_id=booking_data.event_id, seat_number=booking_data.seat_number, user_id=user_id
         )
+    except grpc.RpcError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Inventory service error: {e.code().name}"
+        )
 
-        if not reserve_result.get("success"):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail=reserve_result.get("message", "Failed to reserve seat")
-            )
-
-    except Exception as e:
+    if not reserve_result.get("success"):
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Inventory service error: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST, detail=reserve_result.get("message") or "Failed to reserve seat"
         )
 
-    # Step 2: DynamoDB에 예약 기록 저장
+    # Step 2: DynamoDB에 예약 기록과 Kafka 이벤트(outbox)를 함께 저장
     booking_id = str(uuid.uuid4())
     reservation_id = reserve_result.get("reservation_id")
 
@@ -51,12 +94,13 @@ async def create_booking(booking_data: BookingCreate, user_id: str = Depends(get
         "user_id": user_id,
         "status": "pending",
         "reservation_id": reservation_id,
-        "price": 100.0,  # TODO: Get from event
+        # 가격은 일괄 예약과 같이 Inventory가 돌려준 좌석 가격 (좌석 등급별로 다를 수 있음)
+        "price": reserve_result["price"],
         "created_at": datetime.utcnow(),
     }
 
     try:
-        await dynamodb_repo.create_booking(booking)
+        await dynamodb_repo.create_booking(booking, events=[booking_created(booking)])
     except Exception as e:
         # Rollback: release seat
         await inventory_client.release_seat(booking_data.event_id, booking_data.seat_number, user_id)
@@ -64,30 +108,133 @@ async def create_booking(booking_data: BookingCreate, user_id: str = Depends(get
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to create booking: {str(e)}"
         )
 
-    # Step 3: Kafka 이벤트 발행
+    # Step 3: 결제 대기 시간이 지나면 만료되도록 등록
+    await get_expiry_sweeper().schedule([booking_id])
+
+    return BookingResponse(**booking)
+
+
+@router.post("/batch", response_model=BookingListResponse, status_code=status.HTTP_201_CREATED)
+async def create_bookings(
+    booking_data: BookingBatchCreate,
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+    idempotency_key: Optional[str] = IdempotencyKey,
+):
+    """여러 좌석 일괄 예약 (장바구니, 전부 예약되거나 하나도 예약되지 않음)
+
+    좌석 수와 상관없이 gRPC 1회, DynamoDB 트랜잭션 1회(Kafka 이벤트 1건 포함)로 처리한다.
+    """
+    return await run_idempotent(
+        request, user_id, idempotency_key, lambda: reserve_bookings(booking_data, user_id), status.HTTP_201_CREATED
+    )
+
+
+async def reserve_bookings(booking_data: BookingBatchCreate, user_id: str) -> BookingListResponse:
+    inventory_client = get_inventory_client()
+    dynamodb_repo = get_dynamodb_repo()
+
+    # Step 0: 없는 공연이면 좌석을 잡기 전에 404
+    await require_event(booking_data.event_id)
+
+    # Step 1: Inventory Service에 좌석 일괄 예약 요청 (gRPC)
+    try:
+        reserve_result = await inventory_client.reserve_seats(
+            event_id=booking_data.event_id, seat_numbers=booking_data.seat_numbers, user_id=user_id
+        )
+    except grpc.RpcError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Inventory service error: {e.code().name}"
+        )
+
+    if not reserve_result.get("success"):
+        if reserve_result.get("unavailable_seats"):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "message": reserve_result.get("message") or "Seats not available",
+                    "unavailable_seats": reserve_result["unavailable_seats"],
+                },
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=reserve_result.get("message") or "Failed to reserve seats"
+        )
+
+    # Step 2: DynamoDB에 예약 기록과 Kafka 이벤트(outbox, 장바구니당 1건)를 일괄 저장
+    created_at = datetime.utcnow()
+    bookings = [
+        {
+            "booking_id": str(uuid.uuid4()),
+            "event_id": booking_data.event_id,
+            "seat_number": reservation["seat_number"],
+            "user_id": user_id,
+            "status": "pending",
+            "reservation_id": reservation["reservation_id"],
+            "price": reservation["price"],
+            "created_at": created_at,
+        }
+        for reservation in reserve_result["reservations"]
+    ]
+
     try:
-        await kafka_producer.publish_booking_created(booking)
+        await dynamodb_repo.create_bookings(bookings, events=[bookings_created(bookings)])
     except Exception as e:
-        # Log but don't fail the request
-        print(f"Warning: Failed to publish Kafka event: {e}")
+        # Rollback: release seats
+        for booking in bookings:
+            try:
+                await inventory_client.release_seat(booking_data.event_id, booking["seat_number"], user_id)
+            except Exception as release_error:
+                # 롤백하지 못한 좌석은 예약 없이 잡혀 있으므로 수동 해제가 필요하다
+                logger.error(
+                    f"Failed to release seat {booking_data.event_id}/{booking['seat_number']} "
+                    f"for {user_id} during batch rollback: {release_error}"
+                )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to create bookings: {str(e)}"
+        )
 
-    return BookingResponse(**booking)
+    # Step 3: 결제 대기 시간이 지나면 만료되도록 등록
+    await get_expiry_sweeper().schedule([booking["booking_id"] for booking in bookings])
+
+    return BookingListResponse(bookings=[BookingResponse(**b) for b in bookings], total=len(bookings))
 
 
 @router.post("/{booking_id}/confirm", response_model=BookingResponse)
-async def confirm_booking(booking_id: str, confirm_data: BookingConfirm, user_id: str = Depends(get_current_user_id)):
-    """예약 확정 (결제 완료 후)"""
+async def confirm_booking(
+    booking_id: str,
+    confirm_data: BookingConfirm,
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+    x_user_role: str = Header(""),
+    idempotency_key: Optional[str] = IdempotencyKey,
+):
+    """예약 확정 (결제 완료 후, 예약한 사용자 또는 Payment Service 웹훅)
+
+    Payment Service는 서비스 주체(SERVICE_ROLE)로 서명해 호출하므로 예약 소유자 확인을 건너뛴다
+    (역할 헤더는 get_current_user_id가 서명으로 검증).
+    """
+    owner_id = None if x_user_role == SERVICE_ROLE else user_id
+    return await run_idempotent(
+        request,
+        user_id,
+        idempotency_key,
+        lambda: apply_confirmation(booking_id, confirm_data, owner_id),
+        status.HTTP_200_OK,
+    )
+
+
+async def apply_confirmation(booking_id: str, confirm_data: BookingConfirm, user_id: Optional[str]) -> BookingResponse:
+    """user_id가 None이면 서비스 호출이라 소유자 확인 없이 확정"""
     inventory_client = get_inventory_client()
     dynamodb_repo = get_dynamodb_repo()
-    kafka_producer = get_kafka_producer()
 
-    # Step 1: 예약 조회
-    booking = await dynamodb_repo.get_booking(booking_id)
+    # Step 1: 예약 조회 (상태 확인은 캐시가 아닌 최신 값으로)
+    booking = await dynamodb_repo.get_booking(booking_id, consistent=True)
     if not booking:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
 
     # 권한 확인
-    if booking["user_id"] != user_id:
+    if user_id is not None and booking["user_id"] != user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
     # 상태 확인
@@ -97,50 +244,99 @@ async def confirm_booking(booking_id: str, confirm_data: BookingConfirm, user_id
     # Step 2: Inventory Service에 확정 요청
     try:
         confirm_result = await inventory_client.confirm_booking(
-            reservation_id=booking["reservation_id"], user_id=user_id, payment_id=confirm_data.payment_id
+            reservation_id=booking["reservation_id"], user_id=booking["user_id"], payment_id=confirm_data.payment_id
+        )
+    except grpc.RpcError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Inventory service error: {e.code().name}"
         )
 
-        if not confirm_result.get("success"):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=confirm_result.get("message", "Failed to confirm booking"),
-            )
-
-    except Exception as e:
+    if not confirm_result.get("success"):
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Inventory service error: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=confirm_result.get("message") or "Failed to confirm booking",
         )
 
-    # Step 3: DynamoDB 업데이트
+    # Step 3: DynamoDB 업데이트 (확정 이벤트는 outbox에 함께 기록)
     try:
-        updated_booking = await dynamodb_repo.update_booking_status(booking_id, "confirmed", confirm_data.payment_id)
+        updated_booking = await dynamodb_repo.update_booking_status(
+            booking,
+            "confirmed",
+            confirm_data.payment_id,
+            events=[booking_confirmed(booking, confirm_data.payment_id)],
+        )
+    except BookingStatusConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to update booking: {str(e)}"
         )
 
-    # Step 4: Kafka 이벤트 발행
-    try:
-        await kafka_producer.publish_booking_confirmed(updated_booking)
-    except Exception as e:
-        print(f"Warning: Failed to publish Kafka event: {e}")
+    await get_expiry_sweeper().unschedule(booking_id)
 
     return BookingResponse(**updated_booking)
 
 
 @router.get("/my", response_model=BookingListResponse)
-async def list_my_bookings(user_id: str = Depends(get_current_user_id)):
-    """내 예약 목록"""
+async def list_my_bookings(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    user_id: str = Depends(get_current_user_id),
+):
+    """내 예약 목록 (최신순, 커서 페이지네이션)"""
     dynamodb_repo = get_dynamodb_repo()
 
     try:
-        bookings = await dynamodb_repo.list_user_bookings(user_id)
-        return BookingListResponse(bookings=[BookingResponse(**b) for b in bookings], total=len(bookings))
+        bookings, next_cursor = await dynamodb_repo.list_user_bookings(user_id, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to list bookings: {str(e)}"
         )
 
+    return BookingListResponse(
+        bookings=[BookingResponse(**b) for b in bookings], total=len(bookings), next_cursor=next_cursor
+    )
+
+
+@router.get("/my/export")
+async def export_my_bookings(user_id: str = Depends(get_current_user_id)):
+    """내 예약 전체 내보내기 (NDJSON 스트리밍, 한 줄에 예약 하나)"""
+    dynamodb_repo = get_dynamodb_repo()
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for booking in dynamodb_repo.iter_user_bookings(user_id):
+            yield BookingResponse(**booking).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="bookings.ndjson"'},
+    )
+
+
+@router.get("/events/{event_id}/stats", response_model=EventBookingStats)
+async def get_event_stats(event_id: str, user_id: str = Depends(get_current_user_id), x_user_role: str = Header("")):
+    """공연별 예약 집계 (주최자/관리자 대시보드, 테이블을 읽지 않고 집계 카운터만 조회)
+
+    관리자는 모든 공연, 그 외에는 공연 주최자만 볼 수 있다 (역할 헤더는 get_current_user_id가 서명으로 검증).
+    """
+    if x_user_role != "admin":
+        try:
+            organizer_id = await get_event_metadata_cache().organizer_id(event_id)
+        except EventLookupError as e:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+        if organizer_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+        if organizer_id != user_id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    try:
+        return await get_booking_stats().get(event_id)
+    except redis.RedisError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Stats store error: {e}")
+
 
 @router.get("/{booking_id}", response_model=BookingResponse)
 async def get_booking(booking_id: str, user_id: str = Depends(get_current_user_id)):
@@ -163,7 +359,7 @@ async def cancel_booking(booking_id: str, user_id: str = Depends(get_current_use
     dynamodb_repo = get_dynamodb_repo()
     inventory_client = get_inventory_client()
 
-    booking = await dynamodb_repo.get_booking(booking_id)
+    booking = await dynamodb_repo.get_booking(booking_id, consistent=True)
     if not booking:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
 
@@ -174,11 +370,16 @@ async def cancel_booking(booking_id: str, user_id: str = Depends(get_current_use
     if booking["status"] == "confirmed":
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot cancel confirmed booking")
 
-    # Inventory Service에 좌석 해제 요청
+    # DynamoDB 업데이트 (조건부 쓰기, 동시에 확정되었으면 409이고 좌석은 그대로 둔다)
+    try:
+        await dynamodb_repo.update_booking_status(booking, "cancelled")
+    except BookingStatusConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    await get_expiry_sweeper().unschedule(booking_id)
+
+    # 취소가 기록된 뒤에만 Inventory Service에 좌석 해제 요청 (만료 처리와 같은 순서)
     try:
         await inventory_client.release_seat(booking["event_id"], booking["seat_number"], user_id)
     except Exception as e:
-        print(f"Warning: Failed to release seat: {e}")
-
-    # DynamoDB 업데이트
-    await dynamodb_repo.update_booking_status(booking_id, "cancelled")
+        logger.error(f"Failed to release seat {booking['event_id']}/{booking['seat_number']} for {booking_id}: {e}")
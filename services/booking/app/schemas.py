@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class BookingStatus(str, Enum):
@@ -19,6 +19,21 @@ class BookingCreate(BaseModel):
     user_id: str = Field(..., min_length=1)
 
 
+class BookingBatchCreate(BaseModel):
+    event_id: str = Field(..., min_length=1)
+    # Inventory Service의 트랜잭션 한도 (TransactWriteItems 100개 = 좌석 업데이트 + 예약 기록)
+    seat_numbers: list[str] = Field(..., min_length=1, max_length=50)
+
+    @field_validator("seat_numbers")
+    @classmethod
+    def unique_seats(cls, seat_numbers: list[str]) -> list[str]:
+        if any(not seat_number for seat_number in seat_numbers):
+            raise ValueError("seat numbers must not be empty")
+        if len(set(seat_numbers)) != len(seat_numbers):
+            raise ValueError("seat numbers must be unique")
+        return seat_numbers
+
+
 class BookingConfirm(BaseModel):
     payment_id: str = Field(..., min_length=1)
 
@@ -42,6 +57,17 @@ class BookingResponse(BaseModel):
 class BookingListResponse(BaseModel):
     bookings: list[BookingResponse]
     total: int
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달, 마지막 페이지면 None
+
+
+class EventBookingStats(BaseModel):
+    event_id: str
+    pending: int = 0
+    confirmed: int = 0
+    cancelled: int = 0
+    expired: int = 0
+    total: int = 0
+    revenue: float = 0.0  # 확정된 예약 금액 합계
 
 
 # Health check
@@ -0,0 +1,110 @@
+import logging
+import os
+from typing import Optional, Sequence
+
+import redis.asyncio as redis
+from prometheus_client import Counter
+
+from app.schemas import BookingStatus, EventBookingStats
+
+logger = logging.getLogger(__name__)
+
+BOOKING_STATS_UPDATE_FAILURES = Counter(
+    "booking_stats_update_failures_total",
+    "Booking state transitions that could not be applied to the per-event aggregates (rebuild to repair)",
+)
+
+
+class BookingStats:
+    """공연별 예약 집계 (상태별 건수 + 확정 매출)를 Redis 해시 하나에 유지
+
+    예약이 생기거나 상태가 바뀔 때마다 DynamoDBRepository가 해당 공연의 카운터를 MULTI로 함께 증감하므로
+    조회는 테이블을 읽지 않고 HGETALL 한 번이다. 상태 변경은 조건부 쓰기가 성공했을 때만 반영되어 같은
+    전이가 두 번 세어지지 않는다. Redis에 반영하지 못한 전이는 메트릭으로 남기고, 어긋난 집계는 rebuild로
+    테이블에서 다시 계산한다.
+    """
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+
+    async def close(self):
+        """Close Redis connections"""
+        await self.client.aclose()
+
+    @staticmethod
+    def key(event_id: str) -> str:
+        return f"booking:stats:{event_id}"
+
+    async def record_created(self, bookings: Sequence[dict]):
+        """새 예약(pending) 반영"""
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                for booking in bookings:
+                    pipe.hincrby(self.key(booking["event_id"]), booking["status"], 1)
+                await pipe.execute()
+        except redis.RedisError as e:
+            BOOKING_STATS_UPDATE_FAILURES.inc(len(bookings))
+            logger.error(f"Failed to record {len(bookings)} new bookings in stats: {e}")
+
+    async def record_transition(self, booking: dict, status: str):
+        """상태 변경 반영 (booking은 변경 전 레코드, 확정되면 매출에 더하고 확정이 풀리면 뺀다)"""
+        key = self.key(booking["event_id"])
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.hincrby(key, booking["status"], -1)
+                pipe.hincrby(key, status, 1)
+                if status == BookingStatus.CONFIRMED:
+                    pipe.hincrbyfloat(key, "revenue", booking["price"])
+                elif booking["status"] == BookingStatus.CONFIRMED:
+                    pipe.hincrbyfloat(key, "revenue", -booking["price"])
+                await pipe.execute()
+        except redis.RedisError as e:
+            BOOKING_STATS_UPDATE_FAILURES.inc()
+            logger.error(f"Failed to record {booking['booking_id']} {booking['status']} -> {status} in stats: {e}")
+
+    async def get(self, event_id: str) -> EventBookingStats:
+        """공연 집계 조회 (예약이 없던 공연은 0)"""
+        stored = await self.client.hgetall(self.key(event_id))
+        fields = {name.decode(): value.decode() for name, value in stored.items()}
+        counts = {status.value: int(fields.get(status.value, 0)) for status in BookingStatus}
+        return EventBookingStats(
+            event_id=event_id, **counts, total=sum(counts.values()), revenue=float(fields.get("revenue", 0))
+        )
+
+    async def rebuild(self, event_id: str, bookings: Sequence[dict]) -> EventBookingStats:
+        """예약 전체로 집계를 다시 계산해 교체
+
+        읽은 뒤 교체하기 전까지 바뀐 예약은 반영되지 않을 수 있으므로 한산할 때 실행하거나 한 번 더 실행한다.
+        """
+        counts = {status.value: 0 for status in BookingStatus}
+        revenue = 0.0
+        for booking in bookings:
+            counts[booking["status"]] += 1
+            if booking["status"] == BookingStatus.CONFIRMED:
+                revenue += booking["price"]
+
+        key = self.key(event_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={**counts, "revenue": revenue})
+            await pipe.execute()
+        return EventBookingStats(event_id=event_id, **counts, total=sum(counts.values()), revenue=revenue)
+
+
+# Global instance
+_booking_stats: Optional[BookingStats] = None
+
+
+def get_booking_stats() -> BookingStats:
+    """Get booking stats instance"""
+    global _booking_stats
+
+    if _booking_stats is None:
+        client = redis.from_url(
+            os.getenv("REDIS_URL", "redis://redis:6379/0"),
+            socket_timeout=float(os.getenv("BOOKING_STATS_REDIS_TIMEOUT", "0.05")),
+            socket_connect_timeout=float(os.getenv("BOOKING_STATS_REDIS_TIMEOUT", "0.05")),
+        )
+        _booking_stats = BookingStats(client)
+
+    return _booking_stats
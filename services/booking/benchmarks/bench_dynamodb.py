@@ -0,0 +1,131 @@
+"""DynamoDB 동시성 벤치마크
+
+예약 한 건의 저장 경로(put_item 후 get_item)를 동시 요청 수(in-flight)를 바꿔 가며 실행하고, async
+메서드 안에서 boto3를 바로 호출하던 방식(blocking)과 워커 스레드 풀로 넘기는 DynamoDBRepository(executor)의
+처리량과 지연 p50/p99를 비교한다. blocking은 호출마다 이벤트 루프가 멈추므로 동시 요청 수와 무관하게
+처리량이 1/왕복 시간에 머물고, executor는 풀 크기까지 처리량이 늘어난다.
+
+    # DynamoDB Local (docker compose up dynamodb-local)
+    cd services/booking && python -m benchmarks.bench_dynamodb --endpoint-url http://localhost:8000
+
+    # 외부 의존성 없이 moto로 (실제 DynamoDB의 네트워크 왕복을 --latency-ms로 흉내)
+    cd services/booking && python -m benchmarks.bench_dynamodb --mock --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+from app.dynamodb import DynamoDBRepository
+
+TABLE_NAME = "bench-bookings"
+
+
+def percentile(samples: list[float], q: int) -> float:
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1] if len(samples) > 1 else samples[0]
+
+
+def create_table(client):
+    with contextlib.suppress(client.exceptions.ResourceInUseException):
+        client.create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[{"AttributeName": "booking_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "booking_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+    client.get_waiter("table_exists").wait(TableName=TABLE_NAME)
+
+
+def booking() -> dict:
+    return {
+        "booking_id": str(uuid.uuid4()),
+        "event_id": "evt-bench",
+        "seat_number": "A1",
+        "user_id": "user-bench",
+        "status": "pending",
+        "price": 100.0,
+        "created_at": datetime.utcnow(),
+    }
+
+
+class BlockingRepository(DynamoDBRepository):
+    """변경 전 동작: async 메서드 안에서 boto3를 직접 호출 (이벤트 루프 차단)"""
+
+    async def _call(self, operation: str, **kwargs) -> dict:
+        return getattr(self.client, operation)(**kwargs)
+
+
+async def run(repo: DynamoDBRepository, in_flight: int, operations: int) -> tuple[float, list[float]]:
+    """in_flight개 작업자가 operations건을 나눠 처리 (경과 시간, 건별 지연)"""
+    latencies: list[float] = []
+    remaining = operations
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start_time = time.perf_counter()
+            data = booking()
+            await repo.create_booking(data)
+            await repo.get_booking(data["booking_id"])
+            latencies.append(time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(in_flight)))
+    return time.perf_counter() - start_time, latencies
+
+
+async def main(args: argparse.Namespace):
+    repos = {
+        "blocking": BlockingRepository(max_concurrency=args.pool_size),
+        "executor": DynamoDBRepository(max_concurrency=args.pool_size),
+    }
+    for repo in repos.values():
+        repo.table_name = TABLE_NAME
+        if args.latency_ms:
+            # moto는 네트워크를 거치지 않으므로 요청마다 왕복 시간만큼 스레드를 재운다
+            repo.client.meta.events.register_first(
+                "before-send.dynamodb.*", lambda **_: time.sleep(args.latency_ms / 1000)
+            )
+    create_table(repos["executor"].client)
+
+    print(f"pool size {args.pool_size}, {args.operations} bookings (put_item + get_item) per run")
+    print(f"{'mode':<9} {'in-flight':>9} {'bookings/s':>11} {'p50':>9} {'p99':>9}")
+    for mode, repo in repos.items():
+        for in_flight in args.in_flight:
+            elapsed, latencies = await run(repo, in_flight, args.operations)
+            print(
+                f"{mode:<9} {in_flight:>9} {len(latencies) / elapsed:>11,.0f} "
+                f"{percentile(latencies, 50) * 1000:>7.1f}ms {percentile(latencies, 99) * 1000:>7.1f}ms"
+            )
+    for repo in repos.values():
+        repo.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint-url", help="DynamoDB Local endpoint (default: DYNAMODB_ENDPOINT_URL)")
+    parser.add_argument("--mock", action="store_true", help="run against an in-process moto DynamoDB")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated round trip per request")
+    parser.add_argument("--in-flight", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--pool-size", type=int, default=32)
+    parser.add_argument("--operations", type=int, default=500)
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "dummy")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "dummy")
+    if args.endpoint_url:
+        os.environ["DYNAMODB_ENDPOINT_URL"] = args.endpoint_url
+
+    backend = contextlib.nullcontext()
+    if args.mock:
+        from moto import mock_dynamodb
+
+        backend = mock_dynamodb()
+    with backend:
+        asyncio.run(main(args))
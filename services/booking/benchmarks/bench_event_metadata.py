@@ -0,0 +1,94 @@
+"""공연 조회 벤치마크 (예약 경로의 공연 존재 확인): 프로세스 내 캐시 vs 요청마다 Events Service HTTP 조회
+
+기본 모드는 Events Service 대신 같은 프로세스의 FastAPI 앱(ASGITransport)을 쓴다. 네트워크와 DB가
+빠진 HTTP 경로의 하한이므로 실제 차이는 이보다 크다. --events-url을 주면 실제 서비스로 잰다.
+
+    cd services/booking && python -m benchmarks.bench_event_metadata
+
+    # docker compose up events-service
+    cd services/booking && python -m benchmarks.bench_event_metadata --events-url http://localhost:8002
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from app.event_metadata import EventMetadataCache
+
+
+def stub_events_app(events: int) -> FastAPI:
+    """GET /events, GET /events/{id}만 흉내 내는 Events Service"""
+    stub = FastAPI()
+    prices = {event_id: f"{50000 + event_id:.2f}" for event_id in range(1, events + 1)}
+
+    @stub.get("/events")
+    async def list_events(skip: int = 0, limit: int = 20):
+        ids = list(prices)[skip : skip + limit]
+        return {"events": [{"id": event_id, "price": prices[event_id]} for event_id in ids], "total": len(prices)}
+
+    @stub.get("/events/{event_id}")
+    async def get_event(event_id: int):
+        if event_id not in prices:
+            raise HTTPException(status_code=404, detail="Event not found")
+        return {"id": event_id, "price": prices[event_id]}
+
+    return stub
+
+
+async def measure(label: str, lookup, event_ids: list[str], concurrency: int):
+    latencies = []
+    queue = iter(event_ids)
+
+    async def worker():
+        for event_id in queue:
+            start_time = time.perf_counter()
+            await lookup(event_id)
+            latencies.append(time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start_time
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1e6
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1e6
+    print(f"{label:<18} {len(event_ids) / elapsed:>12,.0f} lookups/s   p50 {p50:>9.1f}us   p99 {p99:>9.1f}us")
+
+
+async def main(args: argparse.Namespace):
+    if args.events_url:
+        client = httpx.AsyncClient(base_url=args.events_url, timeout=5)
+    else:
+        transport = httpx.ASGITransport(app=stub_events_app(args.events))
+        client = httpx.AsyncClient(transport=transport, base_url="http://events")
+
+    cache = EventMetadataCache(client)
+    await cache.warm()
+    if not cache.events:
+        raise SystemExit("events service returned no events")
+    known = list(cache.events)
+    event_ids = [known[index % len(known)] for index in range(args.lookups)]
+
+    async def per_request(event_id: str):
+        response = await client.get(f"/events/{event_id}")
+        response.raise_for_status()
+        return float(response.json()["price"])
+
+    print(f"{args.lookups} lookups over {len(known)} events, concurrency {args.concurrency}")
+    await measure("cache", cache.lookup, event_ids, args.concurrency)
+    await measure("http per request", per_request, event_ids[: args.http_lookups], args.concurrency)
+    await client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events-url", help="run against a real events service instead of the in-process stub")
+    parser.add_argument("--events", type=int, default=500, help="stub events to serve")
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--http-lookups", type=int, default=5_000, help="HTTP lookups are slow, keep it short")
+    parser.add_argument("--concurrency", type=int, default=32)
+    asyncio.run(main(parser.parse_args()))
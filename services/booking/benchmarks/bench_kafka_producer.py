@@ -0,0 +1,138 @@
+"""Kafka 프로듀서 처리량 벤치마크 (messages/sec)
+
+기본 모드는 브로커 없이 클라이언트 쪽 비용만 잰다: 직렬화(json | orjson | msgpack)와 압축 코덱별로
+booking.created 이벤트를 max_batch_size 크기의 레코드 배치로 인코딩하는 처리량과 메시지당 전송 바이트.
+--bootstrap-servers를 주면 실제 브로커로 메시지마다 ack를 기다리는 방식(send_and_wait, 변경 전)과
+outbox relay가 쓰는 KafkaProducer.publish_messages(relay 배치 단위로 버퍼에 넣고 ack를 한꺼번에 대기)의
+처리량을 비교한다.
+
+    cd services/booking && python -m benchmarks.bench_kafka_producer
+
+    # docker compose up kafka
+    cd services/booking && python -m benchmarks.bench_kafka_producer --bootstrap-servers localhost:9092
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import time
+import uuid
+from datetime import datetime
+
+from aiokafka import AIOKafkaProducer
+from aiokafka.codec import has_gzip, has_lz4, has_zstd
+from aiokafka.record.default_records import DefaultRecordBatch, DefaultRecordBatchBuilder
+
+from app.events import OutboxMessage
+from app.kafka_producer import KafkaProducer, make_serializer
+
+CODECS = {
+    "none": (lambda: True, 0),
+    "gzip": (has_gzip, DefaultRecordBatch.CODEC_GZIP),
+    "lz4": (has_lz4, DefaultRecordBatch.CODEC_LZ4),
+    "zstd": (has_zstd, DefaultRecordBatch.CODEC_ZSTD),
+}
+
+
+def event(index: int) -> dict:
+    return {
+        "message_id": str(uuid.uuid4()),
+        "event_type": "booking.created",
+        "booking_id": str(uuid.uuid4()),
+        "event_id": f"evt_{index % 20}",
+        "user_id": f"user_{index}",
+        "seat_number": f"{chr(65 + index % 26)}{index % 50 + 1}",
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+def encode(events: list[dict], serializer: str, codec: int, batch_size: int) -> tuple[float, int]:
+    """이벤트를 레코드 배치로 인코딩 (경과 시간, 총 바이트)"""
+    serialize = make_serializer(serializer)
+    total_bytes = 0
+    start_time = time.perf_counter()
+
+    def new_builder():
+        return DefaultRecordBatchBuilder(2, codec, 0, -1, -1, -1, batch_size)
+
+    builder, offset = new_builder(), 0
+    for item in events:
+        args = (offset, None, item["event_id"].encode(), serialize(item), [])
+        if builder.append(*args) is None:
+            total_bytes += len(builder.build())
+            builder, offset = new_builder(), 0
+            builder.append(0, *args[1:])
+        offset += 1
+    total_bytes += len(builder.build())
+    return time.perf_counter() - start_time, total_bytes
+
+
+def bench_encode(args: argparse.Namespace):
+    events = [event(index) for index in range(args.messages)]
+    serializers = ["json", "orjson"] + (["msgpack"] if importlib.util.find_spec("msgpack") else [])
+
+    print(f"{args.messages} booking.created events, batch size {args.batch_size} bytes (client-side encode only)")
+    print(f"{'serializer':<10} {'codec':<6} {'msgs/s':>11} {'bytes/msg':>10}")
+    for serializer in serializers:
+        for name, (available, codec) in CODECS.items():
+            if not available():
+                print(f"{serializer:<10} {name:<6} {'-':>11} {'-':>10}  (codec not installed)")
+                continue
+            elapsed, total_bytes = encode(events, serializer, codec, args.batch_size)
+            print(f"{serializer:<10} {name:<6} {args.messages / elapsed:>11,.0f} {total_bytes / args.messages:>10.1f}")
+
+
+async def bench_broker(args: argparse.Namespace):
+    events = [event(index) for index in range(args.messages)]
+    topic = f"bench.booking.{uuid.uuid4().hex[:8]}"
+
+    # 변경 전: 기본 설정 + 메시지마다 ack 대기
+    baseline = AIOKafkaProducer(
+        bootstrap_servers=args.bootstrap_servers.split(","), value_serializer=make_serializer("json")
+    )
+    await baseline.start()
+    start_time = time.perf_counter()
+    for item in events[: args.baseline_messages]:
+        await baseline.send_and_wait(topic, item)
+    elapsed = time.perf_counter() - start_time
+    await baseline.stop()
+    print(f"{'send_and_wait':<28} {args.baseline_messages / elapsed:>11,.0f} msgs/s")
+
+    producer = KafkaProducer(
+        linger_ms=args.linger_ms,
+        max_batch_size=args.batch_size,
+        compression=args.compression,
+        serializer=args.serializer,
+    )
+    producer.bootstrap_servers = args.bootstrap_servers
+    await producer.start()
+    messages = [OutboxMessage(topic, item["event_id"], item, item["message_id"]) for item in events]
+    start_time = time.perf_counter()
+    for index in range(0, len(messages), args.relay_batch_size):
+        errors = await producer.publish_messages(messages[index : index + args.relay_batch_size])
+        assert not any(errors), "broker rejected messages"
+    elapsed = time.perf_counter() - start_time
+    await producer.stop()
+    label = f"publish_messages {args.serializer}/{args.compression}"
+    print(
+        f"{label:<28} {args.messages / elapsed:>11,.0f} msgs/s "
+        f"(linger {args.linger_ms}ms, {args.relay_batch_size} per relay batch)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bootstrap-servers", help="run against a broker instead of encoding only")
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--baseline-messages", type=int, default=2_000, help="send_and_wait is slow, keep it short")
+    parser.add_argument("--batch-size", type=int, default=64 * 1024)
+    parser.add_argument("--linger-ms", type=int, default=5)
+    parser.add_argument("--relay-batch-size", type=int, default=100, help="messages per publish_messages call")
+    parser.add_argument("--compression", default="lz4")
+    parser.add_argument("--serializer", default="orjson")
+    args = parser.parse_args()
+
+    if args.bootstrap_servers:
+        asyncio.run(bench_broker(args))
+    else:
+        bench_encode(args)
@@ -0,0 +1,165 @@
+"""인기 공연 오픈 부하 재현: 한 공연에 분당 50,000건 예약 쓰기
+
+예약 생성 경로(예약 + outbox 이벤트 TransactWriteItems)를 한 event_id로 목표 속도에 맞춰 보낸다. 응답을
+기다리지 않고 일정 간격으로 요청을 내보내므로(open loop) 지연은 예정 시각부터 재며, 밀리면 대기열 지연이
+그대로 드러난다. 공연 GSI 키(event_shard)별 초당 쓰기 수를 함께 출력해 파티션 하나의 한도(초당 1,000 WCU)와
+비교할 수 있다. --shards 1이면 샤딩 전처럼 모든 쓰기가 키 하나에 몰린다.
+
+DynamoDB Local은 파티션별 처리량 제한을 흉내 내지 않으므로 스로틀링 자체는 실제 DynamoDB에서만 재현된다.
+Local에서는 부하 형태, 클라이언트 처리량, 키 분산을 확인한다.
+
+    # DynamoDB Local (docker compose up dynamodb-local)
+    cd services/booking && python -m benchmarks.load_event_spike --endpoint-url http://localhost:8000
+
+    # 샤딩 전과 비교
+    cd services/booking && python -m benchmarks.load_event_spike --endpoint-url http://localhost:8000 --shards 1
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+
+from app.dynamodb import DYNAMODB_RETRIES, DynamoDBRepository, event_shard_key
+from app.events import booking_created
+
+TABLE_NAME = "bench-bookings-spike"
+OUTBOX_TABLE_NAME = "bench-booking-outbox-spike"
+PARTITION_WCU_LIMIT = 1000
+
+
+def create_tables(client):
+    with contextlib.suppress(client.exceptions.ResourceInUseException):
+        client.create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[{"AttributeName": "booking_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "booking_id", "AttributeType": "S"},
+                {"AttributeName": "event_shard", "AttributeType": "S"},
+                {"AttributeName": "created_at", "AttributeType": "N"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "event-shard-index",
+                    "KeySchema": [
+                        {"AttributeName": "event_shard", "KeyType": "HASH"},
+                        {"AttributeName": "created_at", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+    with contextlib.suppress(client.exceptions.ResourceInUseException):
+        client.create_table(
+            TableName=OUTBOX_TABLE_NAME,
+            KeySchema=[
+                {"AttributeName": "shard", "KeyType": "HASH"},
+                {"AttributeName": "outbox_id", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "shard", "AttributeType": "N"},
+                {"AttributeName": "outbox_id", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+    for table_name in (TABLE_NAME, OUTBOX_TABLE_NAME):
+        client.get_waiter("table_exists").wait(TableName=table_name)
+
+
+def booking(index: int, event_id: str) -> dict:
+    return {
+        "booking_id": str(uuid.uuid4()),
+        "event_id": event_id,
+        "seat_number": f"{chr(65 + index // 1000 % 26)}{index % 1000 + 1}",
+        "user_id": f"user-{index}",
+        "status": "pending",
+        "reservation_id": str(uuid.uuid4()),
+        "price": 150000.0,
+        "created_at": datetime.utcnow(),
+    }
+
+
+def total_retries() -> float:
+    return sum(sample.value for sample in DYNAMODB_RETRIES.collect()[0].samples if sample.name.endswith("_total"))
+
+
+async def main(args: argparse.Namespace):
+    repo = DynamoDBRepository(max_concurrency=args.pool_size)
+    repo.table_name = TABLE_NAME
+    repo.outbox_table = OUTBOX_TABLE_NAME
+    repo.event_shards = args.shards
+    create_tables(repo.client)
+
+    rate = args.bookings_per_minute / 60
+    total = int(rate * args.duration)
+    event_id = f"evt-spike-{uuid.uuid4().hex[:8]}"
+    in_flight = asyncio.Semaphore(args.max_in_flight)
+    latencies: list[float] = []
+    key_writes: Counter = Counter()
+    failures: Counter = Counter()
+    retries_before = total_retries()
+
+    async def write(index: int, scheduled: float):
+        async with in_flight:
+            data = booking(index, event_id)
+            try:
+                await repo.create_booking(data, events=[booking_created(data)])
+            except Exception as e:
+                failures[type(e).__name__] += 1
+                return
+            latencies.append(time.perf_counter() - scheduled)
+            second = int(scheduled - start_time)
+            key_writes[(event_shard_key(event_id, data["booking_id"], args.shards), second)] += 1
+
+    print(f"{total} bookings for {event_id} at {args.bookings_per_minute:,}/min over {args.duration}s")
+    print(f"event_shard keys {args.shards}, pool size {args.pool_size}, max in-flight {args.max_in_flight}")
+
+    start_time = time.perf_counter()
+    tasks = []
+    for index in range(total):
+        scheduled = start_time + index / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(write(index, scheduled)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start_time
+    repo.close()
+
+    latencies.sort()
+    print(f"written   {len(latencies):,} ({len(latencies) / elapsed * 60:,.0f}/min), failed {sum(failures.values())}")
+    if failures:
+        print(f"failures  {dict(failures)}")
+    print(f"retries   {total_retries() - retries_before:,.0f}")
+    if latencies:
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+        print(f"latency   p50 {p50:.1f}ms  p99 {p99:.1f}ms  max {latencies[-1] * 1000:.1f}ms (from scheduled time)")
+
+    # GSI 복제는 트랜잭션 여부와 관계없이 예약(1KB 이하)당 GSI 파티션에 1 WCU
+    peak = max(key_writes.values(), default=0)
+    print(f"hottest event_shard key: {peak} GSI WCU/s (partition limit {PARTITION_WCU_LIMIT})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint-url", help="DynamoDB Local endpoint (default: DYNAMODB_ENDPOINT_URL)")
+    parser.add_argument("--bookings-per-minute", type=int, default=50_000)
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument("--shards", type=int, default=10, help="event_shard keys per event (1 = unsharded)")
+    parser.add_argument("--pool-size", type=int, default=64)
+    parser.add_argument("--max-in-flight", type=int, default=512)
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "dummy")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "dummy")
+    if args.endpoint_url:
+        os.environ["DYNAMODB_ENDPOINT_URL"] = args.endpoint_url
+
+    asyncio.run(main(args))
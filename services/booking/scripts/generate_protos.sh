@@ -0,0 +1,17 @@
+#!/bin/sh
+# inventory.proto에서 Python gRPC 스텁 생성 (app/proto/inventory_pb2*.py)
+# 생성 파일은 커밋하지 않는다. Docker 빌드에서는 PROTO_DIR로 inventory-proto 빌드 컨텍스트를 넘긴다.
+#
+#   cd services/booking && sh scripts/generate_protos.sh
+set -e
+
+cd "$(dirname "$0")/.."
+PROTO_DIR="${PROTO_DIR:-../inventory/proto}"
+
+# app/proto=... 매핑으로 생성된 inventory_pb2_grpc.py가 "from app.proto import inventory_pb2"를 사용하게 한다
+python -m grpc_tools.protoc \
+    -I "app/proto=${PROTO_DIR}" \
+    --python_out=. \
+    --grpc_python_out=. \
+    --pyi_out=. \
+    app/proto/inventory.proto
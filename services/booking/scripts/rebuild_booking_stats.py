@@ -0,0 +1,69 @@
+"""공연별 예약 집계를 bookings 테이블에서 다시 계산
+
+Redis 집계가 유실되었거나(재시작, eviction) booking_stats_update_failures_total이 올라 어긋났을 때 실행한다.
+공연마다 event-shard-index를 샤드 전체 병렬 조회(scatter-gather)해 상태별 건수와 확정 매출을 계산하고
+Redis 해시를 통째로 교체한다. --all은 테이블을 병렬 스캔해 공연 ID를 모은다.
+
+    cd services/booking && python -m scripts.rebuild_booking_stats --event-id 42 --event-id 43
+    cd services/booking && python -m scripts.rebuild_booking_stats --all
+"""
+
+import argparse
+import asyncio
+
+from app.dynamodb import DynamoDBRepository
+from app.stats import get_booking_stats
+
+
+async def scan_event_ids(repo: DynamoDBRepository, segments: int) -> set[str]:
+    """테이블 전체의 공연 ID (세그먼트별 병렬 스캔, event_id 속성만 읽음)"""
+
+    async def scan_segment(segment: int) -> set[str]:
+        event_ids = set()
+        params = {
+            "TableName": repo.table_name,
+            "ProjectionExpression": "event_id",
+            "Segment": segment,
+            "TotalSegments": segments,
+        }
+        while True:
+            response = await repo._call("scan", **params)
+            event_ids.update(item["event_id"]["S"] for item in response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                return event_ids
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    return set().union(*await asyncio.gather(*(scan_segment(segment) for segment in range(segments))))
+
+
+async def main(args: argparse.Namespace):
+    # 재계산하는 동안 이 프로세스의 쓰기가 집계를 건드리지 않도록 stats 없이 연다
+    repo = DynamoDBRepository(max_concurrency=args.concurrency)
+    stats = get_booking_stats()
+    try:
+        event_ids = sorted(await scan_event_ids(repo, args.segments)) if args.all else args.event_id
+        semaphore = asyncio.Semaphore(args.concurrency // repo.event_shards or 1)
+
+        async def rebuild(event_id: str):
+            async with semaphore:
+                result = await stats.rebuild(event_id, await repo.list_event_bookings(event_id))
+            print(
+                f"{event_id}: pending {result.pending}, confirmed {result.confirmed}, cancelled {result.cancelled}, "
+                f"expired {result.expired}, revenue {result.revenue:,.2f}"
+            )
+
+        await asyncio.gather(*(rebuild(event_id) for event_id in event_ids))
+        print(f"Rebuilt stats for {len(event_ids)} events")
+    finally:
+        repo.close()
+        await stats.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--event-id", action="append", help="event to rebuild (repeatable)")
+    target.add_argument("--all", action="store_true", help="rebuild every event found in the bookings table")
+    parser.add_argument("--segments", type=int, default=8, help="parallel scan segments for --all")
+    parser.add_argument("--concurrency", type=int, default=32, help="DynamoDB calls in flight")
+    asyncio.run(main(parser.parse_args()))
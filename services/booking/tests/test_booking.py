@@ -2,6 +2,8 @@ from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import boto3
+import fakeredis
+import httpx
 import pytest
 from httpx import ASGITransport, AsyncClient
 from moto import mock_dynamodb
@@ -23,23 +25,44 @@ def mock_dynamodb_table():
             AttributeDefinitions=[
                 {"AttributeName": "booking_id", "AttributeType": "S"},
                 {"AttributeName": "user_id", "AttributeType": "S"},
-                {"AttributeName": "event_id", "AttributeType": "S"},
+                {"AttributeName": "event_shard", "AttributeType": "S"},
+                {"AttributeName": "created_at", "AttributeType": "N"},
             ],
             GlobalSecondaryIndexes=[
                 {
-                    "IndexName": "user-index",
-                    "KeySchema": [{"AttributeName": "user_id", "KeyType": "HASH"}],
+                    "IndexName": "user-bookings-index",
+                    "KeySchema": [
+                        {"AttributeName": "user_id", "KeyType": "HASH"},
+                        {"AttributeName": "created_at", "KeyType": "RANGE"},
+                    ],
                     "Projection": {"ProjectionType": "ALL"},
                 },
                 {
-                    "IndexName": "event-index",
-                    "KeySchema": [{"AttributeName": "event_id", "KeyType": "HASH"}],
+                    "IndexName": "event-shard-index",
+                    "KeySchema": [
+                        {"AttributeName": "event_shard", "KeyType": "HASH"},
+                        {"AttributeName": "created_at", "KeyType": "RANGE"},
+                    ],
                     "Projection": {"ProjectionType": "ALL"},
                 },
             ],
             BillingMode="PAY_PER_REQUEST",
         )
 
+        # Kafka outbox table
+        dynamodb.create_table(
+            TableName="ticketing-booking-outbox",
+            KeySchema=[
+                {"AttributeName": "shard", "KeyType": "HASH"},
+                {"AttributeName": "outbox_id", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "shard", "AttributeType": "N"},
+                {"AttributeName": "outbox_id", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
         yield table
 
 
@@ -265,6 +288,142 @@ async def test_booking_with_invalid_seats():
         assert response.status_code in [400, 401, 422]
 
 
+@pytest.mark.asyncio
+async def test_create_bookings_batch(mock_dynamodb_table):
+    """Test a multi-seat cart is reserved with one RPC and written in one transaction with one outbox event"""
+    from app.auth import get_current_user_id
+    from app.dynamodb import DynamoDBRepository
+    from app.event_metadata import EventMetadataCache
+    from app.events import OutboxMessage
+    from app.expiry import ExpirySweeper
+
+    repo = DynamoDBRepository()
+    repo.table_name = mock_dynamodb_table.name
+    inventory_client = MagicMock()
+    inventory_client.reserve_seats = AsyncMock(
+        return_value={
+            "success": True,
+            "message": "Seats reserved successfully",
+            "reservations": [
+                {"seat_number": seat, "reservation_id": f"res_{seat}", "price": 150000.0} for seat in ["A1", "A2"]
+            ],
+            "unavailable_seats": [],
+        }
+    )
+    expiry_sweeper = ExpirySweeper(fakeredis.FakeAsyncRedis(), repo, inventory_client)
+    event_cache = EventMetadataCache(httpx.AsyncClient(base_url="http://events"))
+    event_cache.apply({"event_type": "event.updated", "event_id": "evt_123", "price": 100000.0})
+
+    app.dependency_overrides[get_current_user_id] = lambda: "user_123"
+    try:
+        with (
+            patch("app.routers.booking.get_dynamodb_repo", return_value=repo),
+            patch("app.routers.booking.get_inventory_client", return_value=inventory_client),
+            patch("app.routers.booking.get_expiry_sweeper", return_value=expiry_sweeper),
+            patch("app.routers.booking.get_event_metadata_cache", return_value=event_cache),
+        ):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post(
+                    "/bookings/batch", json={"event_id": "evt_123", "seat_numbers": ["A1", "A2"]}
+                )
+                duplicate = await client.post(
+                    "/bookings/batch", json={"event_id": "evt_123", "seat_numbers": ["A1", "A1"]}
+                )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 201
+    assert response.json()["total"] == 2
+    assert duplicate.status_code == 422
+    inventory_client.reserve_seats.assert_awaited_once_with(
+        event_id="evt_123", seat_numbers=["A1", "A2"], user_id="user_123"
+    )
+
+    items = mock_dynamodb_table.scan()["Items"]
+    assert sorted(item["reservation_id"] for item in items) == ["res_A1", "res_A2"]
+
+    [item] = repo.client.scan(TableName=repo.outbox_table)["Items"]
+    message = OutboxMessage.from_item(item)
+    assert message.topic == "booking.created"
+    assert message.key == "evt_123"
+    assert message.payload["seat_numbers"] == ["A1", "A2"]
+    # 공연 캐시의 가격이 아니라 Inventory가 돌려준 좌석 가격
+    assert [booking["price"] for booking in response.json()["bookings"]] == [150000.0, 150000.0]
+    assert message.payload["total_price"] == 300000.0
+
+    # 결제 대기 시간이 지나면 만료되도록 두 예약 모두 등록
+    scheduled = await expiry_sweeper.client.zrange(expiry_sweeper.key, 0, -1)
+    assert sorted(scheduled) == sorted(booking["booking_id"].encode() for booking in response.json()["bookings"])
+
+
+@pytest.mark.asyncio
+async def test_list_my_bookings_pages_newest_first(mock_dynamodb_table):
+    """Test the listing walks every booking through opaque cursors and exports NDJSON newest first"""
+    import json
+
+    from app.auth import get_current_user_id
+    from app.dynamodb import DynamoDBRepository
+
+    for index in range(5):
+        mock_dynamodb_table.put_item(
+            Item={
+                "booking_id": f"book_{index}",
+                "event_id": "evt_123",
+                "seat_number": f"A{index}",
+                "user_id": "user_123",
+                "status": "pending",
+                "price": 100,
+                "created_at": 1700000000 + index,
+                "reservation_id": f"res_{index}",
+            }
+        )
+    mock_dynamodb_table.put_item(
+        Item={
+            "booking_id": "book_other",
+            "event_id": "evt_123",
+            "seat_number": "B1",
+            "user_id": "user_456",
+            "status": "pending",
+            "price": 100,
+            "created_at": 1700000100,
+        }
+    )
+
+    repo = DynamoDBRepository()
+    repo.table_name = mock_dynamodb_table.name
+    app.dependency_overrides[get_current_user_id] = lambda: "user_123"
+    try:
+        with patch("app.routers.booking.get_dynamodb_repo", return_value=repo):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                pages, cursor = [], None
+                while True:
+                    response = await client.get(
+                        "/bookings/my", params={"limit": 2, **({"cursor": cursor} if cursor else {})}
+                    )
+                    assert response.status_code == 200
+                    pages.append(response.json())
+                    cursor = response.json()["next_cursor"]
+                    if cursor is None:
+                        break
+
+                forged = await client.get("/bookings/my", params={"cursor": pages[0]["next_cursor"][:-4] + "AAAA"})
+                export = await client.get("/bookings/my/export")
+    finally:
+        app.dependency_overrides.clear()
+
+    # moto는 ScanIndexForward=False에서 Limit을 역순 정렬 전에 적용하므로 여러 페이지는 순서 대신 누락/중복만 본다
+    listed = [booking for page in pages for booking in page["bookings"]]
+    assert sorted(booking["booking_id"] for booking in listed) == [f"book_{index}" for index in range(5)]
+    assert all(page["total"] <= 2 for page in pages)
+    # 목록 조회는 ProjectionExpression으로 상세 전용 속성을 읽지 않는다
+    assert all(booking["reservation_id"] is None for booking in listed)
+    assert forged.status_code == 400
+
+    assert export.headers["content-type"] == "application/x-ndjson"
+    exported = [json.loads(line) for line in export.text.splitlines()]
+    assert [booking["booking_id"] for booking in exported] == [f"book_{index}" for index in range(4, -1, -1)]
+
+
 @pytest.mark.asyncio
 async def test_get_booking_unauthorized():
     """Test getting booking without authorization"""
@@ -273,3 +432,165 @@ async def test_get_booking_unauthorized():
 
         # Should return 401 Unauthorized
         assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_gateway_signed_user_headers():
+    """Test user headers signed by the API gateway are accepted and tampered or stale ones rejected"""
+    import hashlib
+    import hmac
+    import time
+
+    from fastapi import HTTPException
+
+    from app.auth import INTERNAL_AUTH_SECRET, get_current_user_id
+
+    timestamp = str(int(time.time()))
+    message = "\n".join(["42", "fan@example.com", "user", timestamp]).encode()
+    signature = hmac.new(INTERNAL_AUTH_SECRET.encode(), message, hashlib.sha256).hexdigest()
+
+    assert await get_current_user_id("42", "fan@example.com", "user", timestamp, signature) == "42"
+
+    for user_id, role, signed_at in [("43", "user", timestamp), ("42", "admin", timestamp), ("42", "user", "0")]:
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_id(user_id, "fan@example.com", role, signed_at, signature)
+        assert exc_info.value.status_code == 401
+
+
+async def test_payment_service_confirms_booking(mock_dynamodb_table):
+    """Test the payment webhook's signed service principal confirms a user's booking without owning it"""
+    from app.auth import service_auth_headers
+    from app.dynamodb import DynamoDBRepository
+    from app.expiry import ExpirySweeper
+
+    repo = DynamoDBRepository()
+    repo.table_name = mock_dynamodb_table.name
+    await repo.create_booking(
+        {
+            "booking_id": "book_123",
+            "event_id": "evt_123",
+            "seat_number": "A1",
+            "user_id": "user_123",
+            "status": "pending",
+            "reservation_id": "res_123",
+            "price": 150000.0,
+            "created_at": datetime.utcnow(),
+        }
+    )
+    inventory_client = MagicMock()
+    inventory_client.confirm_booking = AsyncMock(return_value={"success": True})
+    expiry_sweeper = ExpirySweeper(fakeredis.FakeAsyncRedis(), repo, inventory_client)
+
+    with (
+        patch("app.routers.booking.get_dynamodb_repo", return_value=repo),
+        patch("app.routers.booking.get_inventory_client", return_value=inventory_client),
+        patch("app.routers.booking.get_expiry_sweeper", return_value=expiry_sweeper),
+    ):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            unsigned = await client.post("/bookings/book_123/confirm", json={"payment_id": "pay_123"})
+            response = await client.post(
+                "/bookings/book_123/confirm", json={"payment_id": "pay_123"}, headers=service_auth_headers("payment")
+            )
+
+    assert unsigned.status_code == 401
+    assert response.status_code == 200
+    assert response.json()["status"] == "confirmed"
+    # Inventory에는 서비스 주체가 아니라 예약한 사용자로 확정
+    inventory_client.confirm_booking.assert_awaited_once_with(
+        reservation_id="res_123", user_id="user_123", payment_id="pay_123"
+    )
+
+
+async def test_cancel_losing_to_confirm_keeps_the_seat(mock_dynamodb_table):
+    """Test a cancel that races a winning confirm returns 409 without releasing the paid seat"""
+    from app.auth import get_current_user_id
+    from app.dynamodb import DynamoDBRepository
+    from app.expiry import ExpirySweeper
+
+    repo = DynamoDBRepository()
+    repo.table_name = mock_dynamodb_table.name
+    await repo.create_booking(
+        {
+            "booking_id": "book_123",
+            "event_id": "evt_123",
+            "seat_number": "A1",
+            "user_id": "user_123",
+            "status": "pending",
+            "reservation_id": "res_123",
+            "price": 150000.0,
+            "created_at": datetime.utcnow(),
+        }
+    )
+    # 취소가 pending을 읽은 직후 결제 확정이 먼저 기록된 상황
+    stale = await repo.get_booking("book_123", consistent=True)
+    await repo.update_booking_status(stale, "confirmed", "pay_123")
+
+    inventory_client = MagicMock()
+    inventory_client.release_seat = AsyncMock(return_value={"success": True})
+    expiry_sweeper = ExpirySweeper(fakeredis.FakeAsyncRedis(), repo, inventory_client)
+
+    app.dependency_overrides[get_current_user_id] = lambda: "user_123"
+    try:
+        with (
+            patch.object(repo, "get_booking", AsyncMock(return_value=stale)),
+            patch("app.routers.booking.get_dynamodb_repo", return_value=repo),
+            patch("app.routers.booking.get_inventory_client", return_value=inventory_client),
+            patch("app.routers.booking.get_expiry_sweeper", return_value=expiry_sweeper),
+        ):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.delete("/bookings/book_123")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 409
+    inventory_client.release_seat.assert_not_awaited()
+    assert (await repo.get_booking("book_123", consistent=True))["status"] == "confirmed"
+
+
+async def test_event_check_fails_open_when_events_service_is_down(mock_dynamodb_table):
+    """Test bookings still reach inventory when the event cannot be checked, while unknown events 404 early"""
+    from app.auth import get_current_user_id
+    from app.dynamodb import DynamoDBRepository
+    from app.event_metadata import EventMetadataCache
+    from app.expiry import ExpirySweeper
+
+    events_up = True
+
+    def events_service(request: httpx.Request) -> httpx.Response:
+        if not events_up:
+            return httpx.Response(503)
+        return httpx.Response(404, json={"detail": "Event not found"})
+
+    event_cache = EventMetadataCache(
+        httpx.AsyncClient(transport=httpx.MockTransport(events_service), base_url="http://events")
+    )
+    repo = DynamoDBRepository()
+    repo.table_name = mock_dynamodb_table.name
+    inventory_client = MagicMock()
+    inventory_client.reserve_seat = AsyncMock(
+        return_value={"success": True, "reservation_id": "res_1", "price": 150000.0}
+    )
+    expiry_sweeper = ExpirySweeper(fakeredis.FakeAsyncRedis(), repo, inventory_client)
+
+    app.dependency_overrides[get_current_user_id] = lambda: "user_123"
+    try:
+        with (
+            patch("app.routers.booking.get_dynamodb_repo", return_value=repo),
+            patch("app.routers.booking.get_inventory_client", return_value=inventory_client),
+            patch("app.routers.booking.get_expiry_sweeper", return_value=expiry_sweeper),
+            patch("app.routers.booking.get_event_metadata_cache", return_value=event_cache),
+        ):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                body = {"event_id": "404", "seat_number": "A1", "user_id": "user_123"}
+                unknown = await client.post("/bookings", json=body)
+                assert inventory_client.reserve_seat.await_count == 0
+
+                events_up = False
+                body = {"event_id": "7", "seat_number": "A1", "user_id": "user_123"}
+                created = await client.post("/bookings", json=body)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert unknown.status_code == 404
+    assert created.status_code == 201
+    inventory_client.reserve_seat.assert_awaited_once_with(event_id="7", seat_number="A1", user_id="user_123")
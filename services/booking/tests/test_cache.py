@@ -0,0 +1,180 @@
+from datetime import datetime
+
+import boto3
+import fakeredis
+import pytest
+import redis.asyncio as redis
+from moto import mock_dynamodb
+
+from app.cache import BOOKING_CACHE_REQUESTS, BookingCache
+from app.dynamodb import BookingStatusConflictError, DynamoDBRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class BrokenRedis:
+    """Redis client whose every command fails"""
+
+    async def get(self, *args, **kwargs):
+        raise redis.ConnectionError("connection refused")
+
+    set = delete = get
+
+
+def hits(tier: str, result: str) -> float:
+    return BOOKING_CACHE_REQUESTS.labels(tier=tier, result=result)._value.get()
+
+
+@pytest.fixture
+def bookings_table():
+    """Mock bookings table"""
+    with mock_dynamodb():
+        boto3.client("dynamodb", region_name="us-east-1").create_table(
+            TableName="ticketing-bookings",
+            KeySchema=[{"AttributeName": "booking_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "booking_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield "ticketing-bookings"
+
+
+async def make_repo(table_name: str, cache: BookingCache) -> DynamoDBRepository:
+    repo = DynamoDBRepository(max_concurrency=2, cache=cache)
+    repo.table_name = table_name
+    await repo.create_booking(
+        {
+            "booking_id": "book_1",
+            "event_id": "evt_1",
+            "seat_number": "A1",
+            "user_id": "user_1",
+            "status": "pending",
+            "price": 100.0,
+            "reservation_id": "res_1",
+            "created_at": datetime.utcnow(),
+        }
+    )
+    return repo
+
+
+async def test_read_through_local_then_redis(bookings_table):
+    """Test a miss loads from DynamoDB, then local and redis tiers serve repeat reads"""
+    clock = FakeClock()
+    client = fakeredis.FakeAsyncRedis()
+    cache = BookingCache(client, local_ttl=2.0, clock=clock)
+    repo = await make_repo(bookings_table, cache)
+
+    first = await repo.get_booking("book_1")
+    assert first["status"] == "pending"
+    assert await client.ttl("booking:book_1") > 0
+
+    local_hits, redis_hits = hits("local", "hit"), hits("redis", "hit")
+    repo.client = None  # 이후 조회가 DynamoDB에 가면 실패한다
+    assert await repo.get_booking("book_1") == first
+    assert hits("local", "hit") == local_hits + 1
+
+    # 로컬 TTL이 지나면 Redis에서 읽어 다시 로컬에 채운다
+    clock.now += 3
+    assert await repo.get_booking("book_1") == first
+    assert hits("redis", "hit") == redis_hits + 1
+    assert await repo.get_booking("book_1") == first
+    assert hits("local", "hit") == local_hits + 2
+    repo.close()
+
+
+async def test_status_change_writes_through_both_tiers(bookings_table):
+    """Test update_booking_status returns the stored booking and overwrites the cached copy with it"""
+    client = fakeredis.FakeAsyncRedis()
+    cache = BookingCache(client)
+    repo = await make_repo(bookings_table, cache)
+
+    booking = await repo.get_booking("book_1")
+    assert booking["status"] == "pending"
+
+    updated = await repo.update_booking_status(booking, "confirmed", "pay_1")
+    assert updated["status"] == "confirmed"
+    assert updated["payment_id"] == "pay_1"
+    assert updated["reservation_id"] == "res_1"
+    assert cache.entries["book_1"][0]["status"] == {"S": "confirmed"}
+    assert await client.get("booking:book_1") is not None
+
+    assert await repo.get_booking("book_1") == updated
+    assert await repo.get_booking("book_1", consistent=True) == updated
+    repo.close()
+
+
+async def test_stale_read_does_not_overwrite_status_change(bookings_table):
+    """Test a read that raced a status change (and saw the old item) cannot put the old status back"""
+    client = fakeredis.FakeAsyncRedis()
+    cache = BookingCache(client, local_ttl=0)
+    repo = await make_repo(bookings_table, cache)
+
+    booking = await repo.get_booking("book_1")
+    stale = cache.entries["book_1"][0]
+    updated = await repo.update_booking_status(booking, "cancelled")
+
+    # 최종 일관성 읽기가 상태 변경 전 아이템을 돌려받아 채우는 경우
+    await cache.fill("book_1", stale)
+    assert await repo.get_booking("book_1") == updated
+    repo.close()
+
+
+async def test_conflicting_status_change_invalidates(bookings_table):
+    """Test a rejected status change drops the cached copy instead of writing it"""
+    client = fakeredis.FakeAsyncRedis()
+    cache = BookingCache(client)
+    repo = await make_repo(bookings_table, cache)
+
+    booking = await repo.get_booking("book_1")
+    await repo.update_booking_status(booking, "confirmed", "pay_1")
+    with pytest.raises(BookingStatusConflictError):
+        await repo.update_booking_status(booking, "cancelled")
+
+    assert "book_1" not in cache.entries
+    assert await client.get("booking:book_1") is None
+    assert (await repo.get_booking("book_1"))["status"] == "confirmed"
+    repo.close()
+
+
+async def test_consistent_read_bypasses_cache(bookings_table):
+    """Test consistent reads go to DynamoDB even when a (stale) cached copy exists"""
+    cache = BookingCache(fakeredis.FakeAsyncRedis())
+    repo = await make_repo(bookings_table, cache)
+
+    cached = await repo.get_booking("book_1")
+    cache.entries["book_1"] = ({**cache.entries["book_1"][0], "status": {"S": "cancelled"}}, float("inf"))
+
+    assert (await repo.get_booking("book_1"))["status"] == "cancelled"
+    assert await repo.get_booking("book_1", consistent=True) == cached
+    repo.close()
+
+
+async def test_redis_errors_fall_back_to_dynamodb(bookings_table):
+    """Test a Redis outage degrades to direct DynamoDB reads instead of failing requests"""
+    cache = BookingCache(BrokenRedis(), local_ttl=0)
+    repo = await make_repo(bookings_table, cache)
+
+    errors = hits("redis", "error")
+    booking = await repo.get_booking("book_1")
+    assert booking["status"] == "pending"
+    assert (await repo.update_booking_status(booking, "cancelled"))["status"] == "cancelled"
+    assert (await repo.get_booking("book_1"))["status"] == "cancelled"
+    assert hits("redis", "error") == errors + 2
+    repo.close()
+
+
+async def test_local_tier_evicts_least_recently_used():
+    """Test the in-process tier keeps at most local_max_entries items"""
+    cache = BookingCache(fakeredis.FakeAsyncRedis(), local_max_entries=2)
+
+    await cache.set("a", {"booking_id": {"S": "a"}})
+    await cache.set("b", {"booking_id": {"S": "b"}})
+    await cache.get("a")
+    await cache.set("c", {"booking_id": {"S": "c"}})
+
+    assert list(cache.entries) == ["a", "c"]
@@ -0,0 +1,209 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_dynamodb
+
+from app.dynamodb import DYNAMODB_RETRIES, DynamoDBRepository
+
+
+class SlowClient:
+    """Blocking boto3 stand-in that records how many calls overlap"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def get_item(self, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self.lock:
+            self.in_flight -= 1
+        return {}
+
+
+async def test_calls_do_not_block_event_loop():
+    """Test blocking boto3 calls run on worker threads so concurrent requests overlap"""
+    repo = DynamoDBRepository(max_concurrency=8)
+    repo.client = SlowClient(latency=0.05)
+
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    beating = asyncio.create_task(heartbeat())
+    start_time = time.perf_counter()
+    results = await asyncio.gather(*(repo.get_booking(f"book_{index}") for index in range(8)))
+    elapsed = time.perf_counter() - start_time
+    beating.cancel()
+    repo.close()
+
+    assert results == [None] * 8
+    assert elapsed < 0.05 * 4
+    assert repo.client.max_in_flight == 8
+    assert ticks >= 5
+
+
+async def test_concurrency_is_bounded():
+    """Test calls past max_concurrency wait for a free worker instead of opening more connections"""
+    repo = DynamoDBRepository(max_concurrency=2)
+    repo.client = SlowClient(latency=0.02)
+
+    await asyncio.gather(*(repo.get_booking(f"book_{index}") for index in range(6)))
+    repo.close()
+
+    assert repo.client.max_in_flight == 2
+
+
+class ThrottledClient:
+    """boto3 stand-in that fails with the given errors before succeeding"""
+
+    def __init__(self, errors: list[ClientError]):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def get_item(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {}
+
+
+def client_error(code: str, reasons: list[str] = ()) -> ClientError:
+    response = {"Error": {"Code": code, "Message": code}}
+    if reasons:
+        response["CancellationReasons"] = [{"Code": reason} for reason in reasons]
+    return ClientError(response, "GetItem")
+
+
+def retries(error: str) -> float:
+    return DYNAMODB_RETRIES.labels(operation="get_item", error=error)._value.get()
+
+
+async def test_throttled_calls_are_retried_with_backoff():
+    """Test throttling and transactions cancelled only by throttling are retried until they succeed"""
+    repo = DynamoDBRepository(max_attempts=4, backoff_base=0.001)
+    repo.client = ThrottledClient(
+        [
+            client_error("ProvisionedThroughputExceededException"),
+            client_error("TransactionCanceledException", ["None", "ThrottlingError"]),
+        ]
+    )
+    throttled, cancelled = retries("ProvisionedThroughputExceededException"), retries("ThrottlingError")
+
+    assert await repo.get_booking("book_1") is None
+    repo.close()
+
+    assert repo.client.calls == 3
+    assert retries("ProvisionedThroughputExceededException") == throttled + 1
+    assert retries("ThrottlingError") == cancelled + 1
+
+
+async def test_non_retryable_and_exhausted_errors_are_raised():
+    """Test condition failures are raised at once and throttling is raised after max_attempts"""
+    repo = DynamoDBRepository(max_attempts=3, backoff_base=0.001)
+
+    repo.client = ThrottledClient([client_error("TransactionCanceledException", ["ConditionalCheckFailed"])])
+    with pytest.raises(ClientError):
+        await repo.get_booking("book_1")
+    assert repo.client.calls == 1
+
+    repo.client = ThrottledClient([client_error("ThrottlingException")] * 5)
+    with pytest.raises(ClientError):
+        await repo.get_booking("book_1")
+    assert repo.client.calls == 3
+    repo.close()
+
+
+async def test_cancelled_update_without_reasons_is_raised_as_is():
+    """Test a cancelled transaction that carries no CancellationReasons is re-raised, not an IndexError"""
+
+    class CancellingClient:
+        def update_item(self, **kwargs):
+            raise client_error("TransactionCanceledException")
+
+    repo = DynamoDBRepository()
+    repo.client = CancellingClient()
+    booking = {"booking_id": "book_1", "event_id": "evt_1", "status": "pending", "price": 100.0}
+
+    with pytest.raises(ClientError):
+        await repo.update_booking_status(booking, "confirmed", "pay_1")
+    repo.close()
+
+
+def test_backoff_is_jittered_and_capped():
+    """Test backoff delays are spread over [0, min(cap, base * 2^attempt)]"""
+    repo = DynamoDBRepository(backoff_base=0.01, backoff_cap=0.5)
+    repo.close()
+
+    first = [repo._backoff(0) for _ in range(200)]
+    late = [repo._backoff(10) for _ in range(200)]
+
+    assert all(0 <= delay <= 0.01 for delay in first)
+    assert all(0 <= delay <= 0.5 for delay in late)
+    assert len(set(late)) > 100
+
+
+async def test_event_bookings_are_sharded_and_gathered():
+    """Test one event's bookings spread over event_shard keys and a scatter-gather read returns all of them"""
+    with mock_dynamodb():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="ticketing-bookings",
+            KeySchema=[{"AttributeName": "booking_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "booking_id", "AttributeType": "S"},
+                {"AttributeName": "event_shard", "AttributeType": "S"},
+                {"AttributeName": "created_at", "AttributeType": "N"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "event-shard-index",
+                    "KeySchema": [
+                        {"AttributeName": "event_shard", "KeyType": "HASH"},
+                        {"AttributeName": "created_at", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        repo = DynamoDBRepository(max_concurrency=8)
+        repo.table_name = "ticketing-bookings"
+        repo.event_shards = 4
+
+        for index in range(40):
+            await repo.create_booking(
+                {
+                    "booking_id": f"book_{index}",
+                    "event_id": "evt_hot" if index < 36 else "evt_other",
+                    "seat_number": f"A{index}",
+                    "user_id": f"user_{index}",
+                    "status": "confirmed" if index % 3 == 0 else "pending",
+                    "price": 100.0,
+                    "created_at": datetime.utcnow(),
+                }
+            )
+
+        items = client.scan(TableName="ticketing-bookings")["Items"]
+        shards = {item["event_shard"]["S"] for item in items if item["event_id"]["S"] == "evt_hot"}
+        assert shards == {f"evt_hot#{shard}" for shard in range(4)}
+
+        bookings = await repo.list_event_bookings("evt_hot")
+        confirmed = await repo.list_event_bookings("evt_hot", status="confirmed")
+        repo.close()
+
+    assert sorted(booking["booking_id"] for booking in bookings) == sorted(f"book_{index}" for index in range(36))
+    assert {booking["booking_id"] for booking in confirmed} == {f"book_{index}" for index in range(0, 36, 3)}
@@ -0,0 +1,116 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.event_metadata import EventLookupError, EventMetadataCache
+
+
+class EventsService:
+    """Events Service stand-in served through httpx.MockTransport"""
+
+    def __init__(self, events: dict[int, float]):
+        self.events = events
+        self.requests = []
+        self.latency = 0.0
+        self.fail = False
+        self.during_list = None
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.url.path, dict(request.url.params)))
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            return httpx.Response(503)
+        if request.url.path == "/events":
+            if self.during_list:
+                self.during_list()
+            skip, limit = int(request.url.params["skip"]), int(request.url.params["limit"])
+            ids = sorted(self.events)[skip : skip + limit]
+            events = [self.event(event_id) for event_id in ids]
+            return httpx.Response(200, json={"events": events, "total": len(self.events)})
+
+        event_id = request.url.path.rsplit("/", 1)[-1]
+        if not event_id.isdigit():
+            return httpx.Response(422)
+        if int(event_id) not in self.events:
+            return httpx.Response(404, json={"detail": "Event not found"})
+        return httpx.Response(200, json=self.event(int(event_id)))
+
+    def event(self, event_id: int) -> dict:
+        # Events Service는 Decimal 가격을 문자열로 직렬화한다
+        return {"id": event_id, "price": f"{self.events[event_id]:.2f}", "status": "published"}
+
+
+@pytest.fixture
+def events_service():
+    return EventsService({event_id: 10000.0 * event_id for event_id in range(1, 6)})
+
+
+def published(price: float) -> dict:
+    return {"price": price, "status": "published"}
+
+
+@pytest.fixture
+def cache(events_service):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(events_service.handle), base_url="http://events")
+    return EventMetadataCache(client, page_size=2)
+
+
+async def test_warm_loads_every_page(cache, events_service):
+    """Test warming pages through the events list and later reads need no requests"""
+    await cache.warm()
+
+    assert cache.events == {str(event_id): published(10000.0 * event_id) for event_id in range(1, 6)}
+    assert [params["skip"] for _, params in events_service.requests] == ["0", "2", "4"]
+
+    events_service.requests.clear()
+    assert await cache.lookup("3") == published(30000.0)
+    assert events_service.requests == []
+
+
+async def test_updates_and_deletes_are_applied(cache):
+    """Test event.updated messages change metadata and event.deleted drops the event"""
+    await cache.warm()
+
+    cache.apply({"event_type": "event.updated", "event_id": "2", "price": 25000.0, "status": "cancelled"})
+    cache.apply({"event_type": "event.updated", "event_id": "9", "price": 90000.0, "status": "published"})
+    cache.apply({"event_type": "event.deleted", "event_id": "5"})
+
+    assert cache.get("2") == {"price": 25000.0, "status": "cancelled"}
+    assert cache.get("9") == published(90000.0)
+    assert cache.get("5") is None
+
+
+async def test_warm_keeps_updates_received_while_loading(cache, events_service):
+    """Test a stream update that lands during a warm is not overwritten by the older snapshot"""
+    events_service.during_list = lambda: cache.apply(
+        {"event_type": "event.updated", "event_id": "1", "price": 1.0, "status": "published"}
+    )
+
+    await cache.warm()
+
+    assert cache.get("1") == published(1.0)
+    assert cache.get("2") == published(20000.0)
+
+
+async def test_concurrent_misses_share_one_fetch(cache, events_service):
+    """Test an uncached event is fetched once for simultaneous lookups and unknown events return None"""
+    events_service.latency = 0.01
+
+    results = await asyncio.gather(*(cache.lookup("4") for _ in range(10)))
+
+    assert results == [published(40000.0)] * 10
+    assert events_service.requests == [("/events/4", {})]
+    assert await cache.lookup("404") is None
+    assert await cache.lookup("evt_1") is None
+    assert "404" not in cache.events
+
+
+async def test_events_service_outage_raises(cache, events_service):
+    """Test a miss during an events service outage surfaces as EventLookupError"""
+    events_service.fail = True
+
+    with pytest.raises(EventLookupError):
+        await cache.lookup("1")
+    with pytest.raises(httpx.HTTPStatusError):
+        await cache.warm()
@@ -0,0 +1,210 @@
+import asyncio
+from datetime import datetime
+
+import boto3
+import fakeredis
+import grpc
+import pytest
+import redis.asyncio as redis
+from botocore.exceptions import EndpointConnectionError
+from moto import mock_dynamodb
+
+from app.dynamodb import DynamoDBRepository
+from app.expiry import EXPIRY_BACKLOG, EXPIRY_LAG, ExpirySweeper
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeInventory:
+    """Inventory client stand-in that records releases and can fail or stall them"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.released = []
+        self.unavailable = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def release_seat(self, event_id: str, seat_number: str, user_id: str) -> dict:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.unavailable:
+                raise grpc.aio.AioRpcError(grpc.StatusCode.UNAVAILABLE, grpc.aio.Metadata(), grpc.aio.Metadata())
+            self.released.append((event_id, seat_number, user_id))
+            return {"success": True, "message": "Seat released successfully"}
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def repo():
+    """Repository over a mock bookings table"""
+    with mock_dynamodb():
+        boto3.client("dynamodb", region_name="us-east-1").create_table(
+            TableName="ticketing-bookings",
+            KeySchema=[{"AttributeName": "booking_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "booking_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        repository = DynamoDBRepository(max_concurrency=8)
+        repository.table_name = "ticketing-bookings"
+        yield repository
+        repository.close()
+
+
+async def create_bookings(repo: DynamoDBRepository, sweeper: ExpirySweeper, count: int) -> list[str]:
+    booking_ids = [f"book_{index}" for index in range(count)]
+    for index, booking_id in enumerate(booking_ids):
+        await repo.create_booking(
+            {
+                "booking_id": booking_id,
+                "event_id": "evt_1",
+                "seat_number": f"A{index}",
+                "user_id": "user_1",
+                "status": "pending",
+                "price": 100.0,
+                "created_at": datetime.utcnow(),
+            }
+        )
+    await sweeper.schedule(booking_ids)
+    return booking_ids
+
+
+def make_sweeper(repo, inventory, client=None, clock=None, **kwargs) -> ExpirySweeper:
+    return ExpirySweeper(
+        client or fakeredis.FakeAsyncRedis(), repo, inventory, hold_seconds=600, clock=clock or FakeClock(), **kwargs
+    )
+
+
+async def test_holds_expire_after_hold_time(repo):
+    """Test nothing is touched before the hold ends and every due hold is expired and its seat released after"""
+    clock = FakeClock()
+    inventory = FakeInventory()
+    sweeper = make_sweeper(repo, inventory, clock=clock)
+    booking_ids = await create_bookings(repo, sweeper, 3)
+
+    clock.now += 599
+    assert await sweeper.tick() == 0
+    assert inventory.released == []
+
+    lag_before = EXPIRY_LAG._sum.get()
+    clock.now += 6
+    assert await sweeper.tick() == 3
+    assert EXPIRY_LAG._sum.get() - lag_before == pytest.approx(3 * 5)
+
+    assert sorted(seat for _, seat, _ in inventory.released) == ["A0", "A1", "A2"]
+    for booking_id in booking_ids:
+        assert (await repo.get_booking(booking_id))["status"] == "expired"
+    assert await sweeper.client.zcard(sweeper.key) == 0
+    assert EXPIRY_BACKLOG._value.get() == 0
+
+
+async def test_confirmed_and_cancelled_bookings_are_skipped(repo):
+    """Test bookings that left pending before their hold ended keep their status and seat"""
+    clock = FakeClock()
+    inventory = FakeInventory()
+    sweeper = make_sweeper(repo, inventory, clock=clock)
+    await create_bookings(repo, sweeper, 3)
+
+    await repo.update_booking_status(await repo.get_booking("book_0"), "confirmed", "pay_1")
+    await sweeper.unschedule("book_0")
+    # 인덱스에서 빠지지 못한 경우에도 상태를 보고 건너뛴다
+    await repo.update_booking_status(await repo.get_booking("book_1"), "cancelled")
+
+    clock.now += 601
+    assert await sweeper.tick() == 2
+
+    assert [seat for _, seat, _ in inventory.released] == ["A2"]
+    assert (await repo.get_booking("book_0"))["status"] == "confirmed"
+    assert (await repo.get_booking("book_1"))["status"] == "cancelled"
+
+
+async def test_failed_release_is_retried_after_lease(repo):
+    """Test a release that fails on an inventory outage stays indexed and is retried once the lease runs out"""
+    clock = FakeClock()
+    inventory = FakeInventory()
+    inventory.unavailable = True
+    sweeper = make_sweeper(repo, inventory, clock=clock, lease_seconds=30)
+    await create_bookings(repo, sweeper, 1)
+
+    clock.now += 601
+    assert await sweeper.tick() == 1
+    assert (await repo.get_booking("book_0"))["status"] == "expired"
+    assert inventory.released == []
+
+    inventory.unavailable = False
+    clock.now += 10
+    assert await sweeper.tick() == 0
+
+    clock.now += 25
+    assert await sweeper.tick() == 1
+    assert inventory.released == [("evt_1", "A0", "user_1")]
+    assert await sweeper.client.zcard(sweeper.key) == 0
+
+
+async def test_batches_run_with_bounded_concurrency(repo):
+    """Test one tick claims at most batch_size holds and releases at most concurrency seats at a time"""
+    clock = FakeClock()
+    inventory = FakeInventory(latency=0.01)
+    sweeper = make_sweeper(repo, inventory, clock=clock, batch_size=8, concurrency=3)
+    await create_bookings(repo, sweeper, 10)
+
+    clock.now += 601
+    assert await sweeper.tick() == 8
+    assert EXPIRY_BACKLOG._value.get() == 2
+    assert inventory.max_in_flight == 3
+
+    assert await sweeper.tick() == 2
+    assert len(inventory.released) == 10
+
+
+async def test_replicas_do_not_claim_the_same_holds(repo):
+    """Test two sweepers sharing the index split due holds between them"""
+    clock = FakeClock()
+    client = fakeredis.FakeAsyncRedis()
+    inventory = FakeInventory(latency=0.01)
+    sweepers = [make_sweeper(repo, inventory, client=client, clock=clock, batch_size=4) for _ in range(2)]
+    await create_bookings(repo, sweepers[0], 6)
+
+    clock.now += 601
+    claimed = await asyncio.gather(*(sweeper.tick() for sweeper in sweepers))
+
+    assert sorted(claimed) == [2, 4]
+    assert len(inventory.released) == 6
+
+
+async def test_unexpected_errors_leave_the_hold_for_retry(repo, monkeypatch):
+    """Test a BotoCoreError for one hold and a failed index removal for another do not abort the batch"""
+    clock = FakeClock()
+    inventory = FakeInventory()
+    sweeper = make_sweeper(repo, inventory, clock=clock, lease_seconds=30)
+    await create_bookings(repo, sweeper, 3)
+    expire = sweeper.expire
+    zrem = sweeper.client.zrem
+
+    async def flaky_expire(booking_id):
+        if booking_id == "book_0":
+            raise EndpointConnectionError(endpoint_url="http://dynamodb")
+        return await expire(booking_id)
+
+    async def flaky_zrem(key, booking_id):
+        if booking_id == "book_1":
+            raise redis.ConnectionError("down")
+        return await zrem(key, booking_id)
+
+    monkeypatch.setattr(sweeper, "expire", flaky_expire)
+    monkeypatch.setattr(sweeper.client, "zrem", flaky_zrem)
+
+    clock.now += 601
+    assert await sweeper.tick() == 3
+    assert (await repo.get_booking("book_0"))["status"] == "pending"
+    assert sorted(seat for _, seat, _ in inventory.released) == ["A1", "A2"]
+    assert await sweeper.client.zrange(sweeper.key, 0, -1) == [b"book_0", b"book_1"]
@@ -0,0 +1,166 @@
+import asyncio
+
+import grpc
+import pytest
+from prometheus_client import REGISTRY
+
+from app.grpc_client import InventoryServiceClient
+from app.proto import inventory_pb2, inventory_pb2_grpc
+
+
+class FakeInventoryService(inventory_pb2_grpc.InventoryServiceServicer):
+    """In-process Inventory Service with the same success/message semantics as the Go server"""
+
+    def __init__(self):
+        self.reserved: dict[tuple[str, str], str] = {}
+        self.peers: set[str] = set()
+        self.unavailable = 0  # 다음 호출 N번을 UNAVAILABLE로 실패
+        self.delay = 0.0
+
+    async def _before(self, context):
+        self.peers.add(context.peer())
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.unavailable:
+            self.unavailable -= 1
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "restarting")
+
+    async def ReserveSeat(self, request, context):
+        await self._before(context)
+        key = (request.event_id, request.seat_number)
+        if key in self.reserved:
+            return inventory_pb2.ReserveSeatResponse(success=False, message="seat is not available")
+        self.reserved[key] = request.user_id
+        return inventory_pb2.ReserveSeatResponse(
+            success=True,
+            message="Seat reserved successfully",
+            seat=inventory_pb2.Seat(event_id=request.event_id, seat_number=request.seat_number, price=150000.0),
+            reservation_id=f"res_{request.event_id}_{request.seat_number}",
+        )
+
+    async def ReserveSeats(self, request, context):
+        await self._before(context)
+        keys = [(request.event_id, seat_number) for seat_number in request.seat_numbers]
+        taken = [key[1] for key in keys if key in self.reserved]
+        if taken:
+            return inventory_pb2.ReserveSeatsResponse(
+                success=False, message="seats not available", unavailable_seats=taken
+            )
+        for key in keys:
+            self.reserved[key] = request.user_id
+        return inventory_pb2.ReserveSeatsResponse(
+            success=True,
+            message="Seats reserved successfully",
+            reservations=[
+                inventory_pb2.SeatReservation(seat_number=seat_number, reservation_id=f"res_{event_id}_{seat_number}")
+                for event_id, seat_number in keys
+            ],
+        )
+
+    async def ReleaseSeat(self, request, context):
+        await self._before(context)
+        if self.reserved.get((request.event_id, request.seat_number)) != request.user_id:
+            return inventory_pb2.ReleaseSeatResponse(success=False, message="seat is not reserved by user")
+        del self.reserved[(request.event_id, request.seat_number)]
+        return inventory_pb2.ReleaseSeatResponse(success=True, message="Seat released successfully")
+
+    async def ConfirmBooking(self, request, context):
+        await self._before(context)
+        return inventory_pb2.ConfirmBookingResponse(
+            success=True, message="Booking confirmed successfully", booking_id=f"booking_{request.reservation_id}"
+        )
+
+
+@pytest.fixture
+async def inventory():
+    service = FakeInventoryService()
+    server = grpc.aio.server()
+    inventory_pb2_grpc.add_InventoryServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    service.endpoint = f"127.0.0.1:{port}"
+    yield service
+    await server.stop(None)
+
+
+@pytest.fixture
+async def client(inventory):
+    client = InventoryServiceClient(inventory.endpoint, channels=3, timeout=1.0)
+    await client.connect()
+    yield client
+    await client.close()
+
+
+def observed(method: str, code: str, sample: str = "count") -> float:
+    """Current value of an inventory RPC histogram sample"""
+    value = REGISTRY.get_sample_value(
+        f"inventory_grpc_client_duration_seconds_{sample}", {"method": method, "code": code}
+    )
+    return value or 0.0
+
+
+async def test_reserve_confirm_release(client, inventory):
+    """Test RPC responses are mapped to the dicts the booking router uses"""
+    reserved = await client.reserve_seat("evt-1", "A1", "42")
+    assert reserved == {
+        "success": True,
+        "reservation_id": "res_evt-1_A1",
+        "price": 150000.0,
+        "message": "Seat reserved successfully",
+    }
+
+    taken = await client.reserve_seat("evt-1", "A1", "43")
+    assert taken["success"] is False
+    assert taken["message"] == "seat is not available"
+
+    confirmed = await client.confirm_booking("res_evt-1_A1", "42", "pi_1")
+    assert confirmed["booking_id"] == "booking_res_evt-1_A1"
+
+    assert (await client.release_seat("evt-1", "A1", "42"))["success"] is True
+    assert inventory.reserved == {}
+
+
+async def test_reserve_seats_is_all_or_nothing(client, inventory):
+    """Test a batch reservation either holds every seat or reports the seats that blocked it"""
+    reserved = await client.reserve_seats("evt-1", ["A1", "A2", "A3"], "42")
+    assert reserved["success"] is True
+    assert [r["reservation_id"] for r in reserved["reservations"]] == ["res_evt-1_A1", "res_evt-1_A2", "res_evt-1_A3"]
+
+    blocked = await client.reserve_seats("evt-1", ["A3", "A4"], "43")
+    assert blocked["success"] is False
+    assert blocked["reservations"] == []
+    assert blocked["unavailable_seats"] == ["A3"]
+    assert ("evt-1", "A4") not in inventory.reserved
+
+
+async def test_calls_round_robin_over_channels(client, inventory):
+    """Test consecutive calls use every pooled channel, each with its own connection"""
+    for index in range(6):
+        await client.reserve_seat("evt-1", f"A{index}", "42")
+
+    assert len(inventory.peers) == 3
+
+
+async def test_unavailable_is_retried(client, inventory):
+    """Test the service config retries UNAVAILABLE transparently"""
+    inventory.unavailable = 2
+
+    result = await client.reserve_seat("evt-1", "A1", "42")
+
+    assert result["success"] is True
+    assert inventory.unavailable == 0
+
+
+async def test_deadline_exceeded_is_recorded(client, inventory):
+    """Test slow calls fail at the per-call deadline and are recorded by status code"""
+    inventory.delay = 0.5
+    before = observed("ReleaseSeat", "DEADLINE_EXCEEDED")
+
+    with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+        await client._call(
+            "ReleaseSeat", inventory_pb2.ReleaseSeatRequest(event_id="evt-1", seat_number="A1", user_id="42"), 0.05
+        )
+
+    assert exc_info.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+    assert observed("ReleaseSeat", "DEADLINE_EXCEEDED") == before + 1
+    assert observed("ReleaseSeat", "DEADLINE_EXCEEDED", "sum") >= 0.05
@@ -0,0 +1,313 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import boto3
+import fakeredis
+import httpx
+import pytest
+import redis.asyncio as redis
+from fastapi import FastAPI, HTTPException, Request
+from httpx import ASGITransport, AsyncClient
+from moto import mock_dynamodb
+from pydantic import BaseModel
+
+from app.auth import get_current_user_id, service_auth_headers
+from app.dynamodb import DynamoDBRepository
+from app.event_metadata import EventMetadataCache
+from app.expiry import ExpirySweeper
+from app.idempotency import IdempotencyStore, run_idempotent
+from app.main import app
+
+
+class Echo(BaseModel):
+    value: str
+    calls: int
+
+
+@pytest.fixture
+def store():
+    idempotency_store = IdempotencyStore(fakeredis.FakeAsyncRedis(), wait_timeout=1, poll_interval=0.005)
+    with patch("app.idempotency.get_idempotency_store", return_value=idempotency_store):
+        yield idempotency_store
+
+
+def make_app(handler) -> FastAPI:
+    """One-route app whose handler counts executions"""
+    echo_app = FastAPI()
+    echo_app.state.calls = 0
+
+    @echo_app.post("/echo")
+    async def echo(request: Request):
+        body = await request.json()
+        user_id = request.headers.get("X-User-Id", "user_1")
+
+        async def execute():
+            echo_app.state.calls += 1
+            return await handler(body, echo_app.state.calls)
+
+        return await run_idempotent(request, user_id, request.headers.get("Idempotency-Key"), execute, 201)
+
+    return echo_app
+
+
+async def echo_handler(body: dict, calls: int) -> Echo:
+    await asyncio.sleep(0.05)
+    return Echo(value=body["value"], calls=calls)
+
+
+async def post(echo_app: FastAPI, value: str, key: str = None, user_id: str = "user_1"):
+    headers = {"X-User-Id": user_id}
+    if key:
+        headers["Idempotency-Key"] = key
+    async with AsyncClient(transport=ASGITransport(app=echo_app), base_url="http://test") as client:
+        return await client.post("/echo", json={"value": value}, headers=headers)
+
+
+async def test_retry_replays_first_response(store):
+    """Test a retry with the same key gets the stored response without running the handler again"""
+    echo_app = make_app(echo_handler)
+
+    first = await post(echo_app, "a", key="k1")
+    retry = await post(echo_app, "a", key="k1")
+
+    assert first.status_code == retry.status_code == 201
+    assert first.json() == retry.json() == {"value": "a", "calls": 1}
+    assert "Idempotent-Replayed" not in first.headers
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert echo_app.state.calls == 1
+
+
+async def test_concurrent_duplicates_wait_for_first(store):
+    """Test duplicates arriving while the first request runs wait for its result instead of executing"""
+    echo_app = make_app(echo_handler)
+
+    responses = await asyncio.gather(*(post(echo_app, "a", key="k1") for _ in range(5)))
+
+    assert echo_app.state.calls == 1
+    assert {response.status_code for response in responses} == {201}
+    assert all(response.json() == {"value": "a", "calls": 1} for response in responses)
+
+
+async def test_key_reused_with_different_body_is_rejected(store):
+    """Test a key reused for a different request body returns 422 and does not execute"""
+    echo_app = make_app(echo_handler)
+
+    await post(echo_app, "a", key="k1")
+    reused = await post(echo_app, "b", key="k1")
+
+    assert reused.status_code == 422
+    assert echo_app.state.calls == 1
+
+
+async def test_keys_are_scoped_per_user_and_optional(store):
+    """Test the same key from another user executes separately and requests without a key always execute"""
+    echo_app = make_app(echo_handler)
+
+    await post(echo_app, "a", key="k1", user_id="user_1")
+    other_user = await post(echo_app, "a", key="k1", user_id="user_2")
+    await post(echo_app, "a")
+    await post(echo_app, "a")
+
+    assert other_user.json()["calls"] == 2
+    assert echo_app.state.calls == 4
+
+
+async def test_client_errors_are_stored_and_server_errors_released(store):
+    """Test a 4xx outcome is replayed while a 5xx outcome frees the key for a real retry"""
+
+    async def failing_handler(body: dict, calls: int) -> Echo:
+        if body["value"] == "taken":
+            raise HTTPException(status_code=409, detail="Seat taken")
+        if calls < 3:
+            raise HTTPException(status_code=503, detail="Inventory service error: UNAVAILABLE")
+        return Echo(value=body["value"], calls=calls)
+
+    echo_app = make_app(failing_handler)
+
+    conflict = await post(echo_app, "taken", key="k1")
+    conflict_retry = await post(echo_app, "taken", key="k1")
+    assert conflict.status_code == conflict_retry.status_code == 409
+    assert conflict_retry.json() == {"detail": "Seat taken"}
+    assert echo_app.state.calls == 1
+
+    unavailable = await post(echo_app, "a", key="k2")
+    recovered = await post(echo_app, "a", key="k2")
+    replayed = await post(echo_app, "a", key="k2")
+    assert unavailable.status_code == 503
+    assert recovered.status_code == replayed.status_code == 201
+    assert replayed.json() == {"value": "a", "calls": 3}
+
+
+async def test_stuck_first_request_returns_conflict(store):
+    """Test a duplicate gives up with 409 when the first request does not finish within the wait timeout"""
+    store.wait_timeout = 0.05
+
+    async def slow_handler(body: dict, calls: int) -> Echo:
+        await asyncio.sleep(0.3)
+        return Echo(value=body["value"], calls=calls)
+
+    echo_app = make_app(slow_handler)
+    first, duplicate = await asyncio.gather(post(echo_app, "a", key="k1"), post(echo_app, "a", key="k1"))
+
+    assert first.status_code == 201
+    assert duplicate.status_code == 409
+    assert echo_app.state.calls == 1
+
+
+async def test_redis_failure_while_waiting_returns_503(store, monkeypatch):
+    """Test a duplicate that loses Redis while waiting gets 503 instead of executing the request again"""
+
+    async def broken_wait(key):
+        raise redis.ConnectionError("down")
+
+    monkeypatch.setattr(store, "wait", broken_wait)
+    echo_app = make_app(echo_handler)
+    first, duplicate = await asyncio.gather(post(echo_app, "a", key="k1"), post(echo_app, "a", key="k1"))
+
+    assert first.status_code == 201
+    assert duplicate.status_code == 503
+    assert echo_app.state.calls == 1
+
+
+async def test_handler_error_survives_redis_failure_on_release(store, monkeypatch):
+    """Test the handler's own exception is raised even when releasing the key fails"""
+
+    async def broken_finish(key, token, record):
+        raise redis.ConnectionError("down")
+
+    async def crashing_handler(body: dict, calls: int) -> Echo:
+        raise RuntimeError("handler bug")
+
+    monkeypatch.setattr(store, "finish", broken_finish)
+    with pytest.raises(RuntimeError, match="handler bug"):
+        await post(make_app(crashing_handler), "a", key="k1")
+
+
+async def test_create_booking_retry_reserves_seat_once(store):
+    """Test retrying POST /bookings with the same Idempotency-Key returns the same booking and reserves once"""
+    inventory_client = MagicMock()
+    reserved = {"success": True, "reservation_id": "res_1", "price": 150000.0}
+    inventory_client.reserve_seat = AsyncMock(return_value=reserved)
+
+    with mock_dynamodb():
+        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
+        dynamodb.create_table(
+            TableName="ticketing-bookings",
+            KeySchema=[{"AttributeName": "booking_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "booking_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        dynamodb.create_table(
+            TableName="ticketing-booking-outbox",
+            KeySchema=[
+                {"AttributeName": "shard", "KeyType": "HASH"},
+                {"AttributeName": "outbox_id", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "shard", "AttributeType": "N"},
+                {"AttributeName": "outbox_id", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        repo = DynamoDBRepository()
+        repo.table_name = "ticketing-bookings"
+        expiry_sweeper = ExpirySweeper(fakeredis.FakeAsyncRedis(), repo, inventory_client)
+        event_cache = EventMetadataCache(httpx.AsyncClient(base_url="http://events"))
+        event_cache.apply({"event_type": "event.updated", "event_id": "evt_1", "price": 120000.0})
+
+        app.dependency_overrides[get_current_user_id] = lambda: "user_1"
+        try:
+            with (
+                patch("app.routers.booking.get_dynamodb_repo", return_value=repo),
+                patch("app.routers.booking.get_inventory_client", return_value=inventory_client),
+                patch("app.routers.booking.get_expiry_sweeper", return_value=expiry_sweeper),
+                patch("app.routers.booking.get_event_metadata_cache", return_value=event_cache),
+            ):
+                async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                    responses = await asyncio.gather(
+                        *(
+                            client.post(
+                                "/bookings",
+                                json={"event_id": "evt_1", "seat_number": "A1", "user_id": "user_1"},
+                                headers={"Idempotency-Key": "cart-1"},
+                            )
+                            for _ in range(3)
+                        )
+                    )
+        finally:
+            app.dependency_overrides.clear()
+
+        assert [response.status_code for response in responses] == [201, 201, 201]
+        assert len({response.json()["booking_id"] for response in responses}) == 1
+        # 공연 캐시는 존재 확인에만 쓰고 금액은 Inventory의 좌석 가격
+        assert responses[0].json()["price"] == 150000.0
+        inventory_client.reserve_seat.assert_awaited_once()
+        assert dynamodb.scan(TableName="ticketing-bookings")["Count"] == 1
+
+
+async def test_redelivered_payment_webhook_replays_confirmation(store):
+    """Test a redelivered payment webhook replays the stored confirm response instead of confirming again"""
+    inventory_client = MagicMock()
+    inventory_client.confirm_booking = AsyncMock(return_value={"success": True})
+
+    with mock_dynamodb():
+        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
+        dynamodb.create_table(
+            TableName="ticketing-bookings",
+            KeySchema=[{"AttributeName": "booking_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "booking_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        dynamodb.create_table(
+            TableName="ticketing-booking-outbox",
+            KeySchema=[
+                {"AttributeName": "shard", "KeyType": "HASH"},
+                {"AttributeName": "outbox_id", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "shard", "AttributeType": "N"},
+                {"AttributeName": "outbox_id", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        repo = DynamoDBRepository()
+        repo.table_name = "ticketing-bookings"
+        await repo.create_booking(
+            {
+                "booking_id": "book_1",
+                "event_id": "evt_1",
+                "seat_number": "A1",
+                "user_id": "user_1",
+                "status": "pending",
+                "reservation_id": "res_1",
+                "price": 150000.0,
+                "created_at": datetime.utcnow(),
+            }
+        )
+        expiry_sweeper = ExpirySweeper(fakeredis.FakeAsyncRedis(), repo, inventory_client)
+
+        # Payment Service의 notify_booking_service와 같은 요청 (서비스 주체 + 결제별 키)
+        async def deliver_webhook(client: AsyncClient) -> httpx.Response:
+            return await client.post(
+                "/bookings/book_1/confirm",
+                json={"payment_id": "pay_1"},
+                headers={**service_auth_headers("payment"), "Idempotency-Key": "confirm:pay_1"},
+            )
+
+        with (
+            patch("app.routers.booking.get_dynamodb_repo", return_value=repo),
+            patch("app.routers.booking.get_inventory_client", return_value=inventory_client),
+            patch("app.routers.booking.get_expiry_sweeper", return_value=expiry_sweeper),
+        ):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                first = await deliver_webhook(client)
+                redelivered = await deliver_webhook(client)
+
+        assert first.status_code == redelivered.status_code == 200
+        assert redelivered.headers["Idempotent-Replayed"] == "true"
+        assert redelivered.json() == first.json()
+        assert first.json()["status"] == "confirmed"
+        # 다시 실행했다면 이미 확정된 예약이라 400이고 Inventory 확정도 두 번 불렸을 것
+        inventory_client.confirm_booking.assert_awaited_once()
+        assert await store.client.keys("booking:idempotency:service:payment:*")
@@ -0,0 +1,109 @@
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiokafka.errors import KafkaTimeoutError
+
+from app.events import booking_created
+from app.kafka_producer import KAFKA_MESSAGES, KafkaProducer, kafka_bootstrap_servers, make_serializer
+
+
+class PendingAIOKafkaProducer:
+    """aiokafka producer stand-in whose deliveries stay pending until the test resolves them"""
+
+    def __init__(self):
+        self.records = []
+        self.deliveries = []
+
+    async def send(self, topic, value, key=None, headers=None):
+        self.records.append((topic, value, key, headers))
+        self.deliveries.append(asyncio.get_running_loop().create_future())
+        return self.deliveries[-1]
+
+
+def booking(booking_id: str) -> dict:
+    return {
+        "booking_id": booking_id,
+        "event_id": "evt_1",
+        "seat_number": "A1",
+        "user_id": "user_1",
+        "status": "pending",
+        "price": 100.0,
+        "reservation_id": f"res_{booking_id}",
+        "created_at": datetime.utcnow(),
+    }
+
+
+def delivered(topic: str, result: str) -> float:
+    return KAFKA_MESSAGES.labels(topic=topic, result=result)._value.get()
+
+
+def test_serializers_produce_equivalent_payloads():
+    """Test the orjson switch emits the same JSON as the stdlib encoder and unknown names are rejected"""
+    event = {"event_type": "booking.created", "seat_numbers": ["A1", "A2"], "total_price": 300000.0, "name": "공연"}
+
+    assert json.loads(make_serializer("orjson")(event)) == json.loads(make_serializer("json")(event)) == event
+    with pytest.raises(ValueError):
+        make_serializer("pickle")
+
+
+def test_msgpack_serializer_round_trips():
+    """Test the msgpack switch when the optional package is installed"""
+    msgpack = pytest.importorskip("msgpack")
+    event = {"event_type": "booking.created", "total_price": 300000.0}
+
+    assert msgpack.unpackb(make_serializer("msgpack")(event)) == event
+
+
+async def test_start_configures_batching_and_compression():
+    """Test linger, batch size, compression and the serializer are passed to aiokafka"""
+    producer = KafkaProducer(linger_ms=20, max_batch_size=128 * 1024, compression="zstd", serializer="json")
+
+    with patch("app.kafka_producer.AIOKafkaProducer") as aiokafka_producer:
+        aiokafka_producer.return_value.start = AsyncMock()
+        await producer.start()
+
+    kwargs = aiokafka_producer.call_args.kwargs
+    assert kwargs["linger_ms"] == 20
+    assert kwargs["max_batch_size"] == 128 * 1024
+    assert kwargs["compression_type"] == "zstd"
+    assert kwargs["value_serializer"]({"a": 1}) == b'{"a":1}'
+    assert KafkaProducer(compression="none").compression is None
+
+
+async def test_publish_messages_buffers_the_batch_before_waiting_for_acks():
+    """Test every record is handed to the batching producer before any ack arrives and results are counted"""
+    producer = KafkaProducer()
+    producer.producer = PendingAIOKafkaProducer()
+    messages = [booking_created(booking(f"book_{index}")) for index in range(3)]
+    success, failure = delivered("booking.created", "success"), delivered("booking.created", "failure")
+
+    publish = asyncio.create_task(producer.publish_messages(messages))
+    await asyncio.sleep(0)
+    assert len(producer.producer.records) == 3
+    assert not publish.done()
+
+    first, second, third = producer.producer.deliveries
+    first.set_result(None)
+    second.set_exception(KafkaTimeoutError())
+    third.set_result(None)
+
+    assert [error is None for error in await publish] == [True, False, True]
+    assert delivered("booking.created", "success") == success + 2
+    assert delivered("booking.created", "failure") == failure + 1
+
+
+def test_bootstrap_servers_follow_the_deployment(monkeypatch):
+    """Test MSK_BOOTSTRAP_SERVERS (AWS) wins, KAFKA_BOOTSTRAP_SERVERS (compose, k8s/local) is the fallback"""
+    monkeypatch.delenv("MSK_BOOTSTRAP_SERVERS", raising=False)
+    monkeypatch.setenv("KAFKA_BOOTSTRAP_SERVERS", "kafka:9092")
+    assert kafka_bootstrap_servers() == "kafka:9092"
+    assert KafkaProducer().bootstrap_servers == "kafka:9092"
+
+    # k8s/base는 MSK_BOOTSTRAP_SERVERS를 빈 값으로 둔다
+    monkeypatch.setenv("MSK_BOOTSTRAP_SERVERS", "")
+    assert kafka_bootstrap_servers() == "kafka:9092"
+    monkeypatch.setenv("MSK_BOOTSTRAP_SERVERS", "b-1.msk:9092,b-2.msk:9092")
+    assert kafka_bootstrap_servers() == "b-1.msk:9092,b-2.msk:9092"
@@ -0,0 +1,271 @@
+import asyncio
+from datetime import datetime
+
+import boto3
+import fakeredis
+import pytest
+from aiokafka.errors import KafkaTimeoutError, MessageSizeTooLargeError
+from botocore.exceptions import ClientError, EndpointConnectionError
+from moto import mock_dynamodb
+
+from app.dynamodb import OUTBOX_DEAD_LETTER_SHARD, BookingStatusConflictError, DynamoDBRepository
+from app.events import booking_confirmed, booking_created
+from app.kafka_producer import KafkaProducer, is_rejected
+from app.outbox import OUTBOX_DEAD_LETTERED, OutboxRelay
+
+
+class FakeProducer:
+    """KafkaProducer stand-in that records deliveries and fails chosen message ids with the given errors"""
+
+    def __init__(self):
+        self.sent = []
+        self.failing = {}
+
+    async def publish_messages(self, messages):
+        self.sent.extend(messages)
+        return [self.failing.get(message.message_id) for message in messages]
+
+
+class FakeAIOKafkaProducer:
+    """aiokafka producer stand-in whose send() returns delivery futures"""
+
+    def __init__(self, fail_enqueue_at=None, serializer=None):
+        self.records = []
+        self.fail_enqueue_at = fail_enqueue_at
+        self.serializer = serializer
+
+    async def send(self, topic, value, key=None, headers=None):
+        if len(self.records) == self.fail_enqueue_at:
+            raise KafkaTimeoutError()
+        if self.serializer:
+            self.serializer(value)
+        self.records.append((topic, value, key, headers))
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+
+def booking(booking_id: str, event_id: str = "evt_1") -> dict:
+    return {
+        "booking_id": booking_id,
+        "event_id": event_id,
+        "seat_number": "A1",
+        "user_id": "user_1",
+        "status": "pending",
+        "price": 100.0,
+        "reservation_id": f"res_{booking_id}",
+        "created_at": datetime.utcnow(),
+    }
+
+
+@pytest.fixture
+def repo():
+    """Repository over mock bookings and outbox tables"""
+    with mock_dynamodb():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="ticketing-bookings",
+            KeySchema=[{"AttributeName": "booking_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "booking_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        client.create_table(
+            TableName="ticketing-booking-outbox",
+            KeySchema=[
+                {"AttributeName": "shard", "KeyType": "HASH"},
+                {"AttributeName": "outbox_id", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "shard", "AttributeType": "N"},
+                {"AttributeName": "outbox_id", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        repository = DynamoDBRepository(max_concurrency=2)
+        repository.table_name = "ticketing-bookings"
+        repository.outbox_shards = 1
+        yield repository
+        repository.close()
+
+
+async def test_booking_and_event_are_written_atomically(repo):
+    """Test the outbox row commits with the booking, and neither is written when the transaction fails"""
+    message = booking_created(booking("book_1"))
+    await repo.create_booking(booking("book_1"), events=[message])
+
+    assert await repo.get_booking("book_1") is not None
+    [stored] = await repo.fetch_outbox(0, 10)
+    assert stored == message
+    assert stored.payload["message_id"] == message.message_id
+
+    # 같은 outbox 아이템을 다시 쓰면 조건 검사에 실패해 예약도 저장되지 않는다
+    with pytest.raises(ClientError):
+        await repo.create_booking(booking("book_2"), events=[message])
+    assert await repo.get_booking("book_2") is None
+
+
+async def test_stale_status_change_is_rejected_without_event(repo):
+    """Test a status change based on an outdated read fails and leaves no outbox event behind"""
+    await repo.create_booking(booking("book_1"))
+    current = await repo.get_booking("book_1")
+
+    confirmed = await repo.update_booking_status(
+        current, "confirmed", "pay_1", events=[booking_confirmed(current, "pay_1")]
+    )
+    assert confirmed == await repo.get_booking("book_1")
+
+    with pytest.raises(BookingStatusConflictError):
+        await repo.update_booking_status(current, "cancelled")
+    with pytest.raises(BookingStatusConflictError):
+        await repo.update_booking_status(current, "confirmed", "pay_2", events=[booking_confirmed(current, "pay_2")])
+
+    assert (await repo.get_booking("book_1"))["payment_id"] == "pay_1"
+    assert len(await repo.fetch_outbox(0, 10)) == 1
+
+
+async def test_relay_deletes_only_the_acked_prefix(repo):
+    """Test messages from the first failed delivery on stay in the outbox and are re-sent in order"""
+    messages = [booking_created(booking(f"book_{index}")) for index in range(3)]
+    for index, message in enumerate(messages):
+        await repo.create_booking(booking(f"book_{index}"), events=[message])
+    messages.sort(key=lambda message: message.outbox_id)
+
+    producer = FakeProducer()
+    producer.failing[messages[1].message_id] = KafkaTimeoutError()
+    relay = OutboxRelay(repo, producer, batch_size=10)
+
+    assert await relay.relay_shard(0) == 1
+    assert [message.message_id for message in producer.sent] == [message.message_id for message in messages]
+    # messages[2]는 ack를 받았지만 messages[1]보다 먼저 지우지 않는다
+    assert await repo.fetch_outbox(0, 10) == messages[1:]
+
+    producer.failing.clear()
+    assert await relay.relay_shard(0) == 2
+    assert [message.message_id for message in producer.sent[3:]] == [message.message_id for message in messages[1:]]
+    assert await repo.fetch_outbox(0, 10) == []
+
+
+async def test_rejected_message_is_dead_lettered_after_max_attempts(repo):
+    """Test a message the broker keeps rejecting moves to the dead-letter partition and unblocks its shard"""
+    messages = [booking_created(booking(f"book_{index}")) for index in range(3)]
+    for index, message in enumerate(messages):
+        await repo.create_booking(booking(f"book_{index}"), events=[message])
+    messages.sort(key=lambda message: message.outbox_id)
+    dead_lettered = OUTBOX_DEAD_LETTERED.labels(topic="booking.created")._value.get()
+
+    producer = FakeProducer()
+    producer.failing[messages[0].message_id] = MessageSizeTooLargeError()
+    relay = OutboxRelay(repo, producer, batch_size=10, max_attempts=3)
+
+    # 한도 전까지는 시도 횟수만 기록하고 뒤 메시지도 남겨 둔다
+    assert await relay.relay_shard(0) == 0
+    assert await relay.relay_shard(0) == 0
+    assert [message.attempts for message in await repo.fetch_outbox(0, 10)] == [2, 0, 0]
+
+    assert await relay.relay_shard(0) == 3
+    assert await repo.fetch_outbox(0, 10) == []
+    assert OUTBOX_DEAD_LETTERED.labels(topic="booking.created")._value.get() == dead_lettered + 1
+
+    [dead] = await repo.fetch_outbox(OUTBOX_DEAD_LETTER_SHARD, 10)
+    assert dead.message_id == messages[0].message_id
+    assert dead.attempts == 3
+    [item] = repo.client.query(
+        TableName=repo.outbox_table,
+        KeyConditionExpression="#shard = :shard",
+        ExpressionAttributeNames={"#shard": "shard"},
+        ExpressionAttributeValues={":shard": {"N": str(OUTBOX_DEAD_LETTER_SHARD)}},
+    )["Items"]
+    assert item["source_shard"] == {"N": "0"}
+    assert "MessageSizeTooLargeError" in item["error"]["S"]
+
+
+async def test_broker_outage_never_dead_letters(repo):
+    """Test timeouts while the broker is down are not counted as attempts, so messages wait instead of moving"""
+    message = booking_created(booking("book_1"))
+    await repo.create_booking(booking("book_1"), events=[message])
+
+    producer = FakeProducer()
+    producer.failing[message.message_id] = KafkaTimeoutError()
+    relay = OutboxRelay(repo, producer, batch_size=10, max_attempts=2)
+
+    for _ in range(3):
+        assert await relay.relay_shard(0) == 0
+    assert await repo.fetch_outbox(0, 10) == [message]
+    assert await repo.fetch_outbox(OUTBOX_DEAD_LETTER_SHARD, 10) == []
+
+
+async def test_publish_messages_reports_serialization_errors_as_rejected():
+    """Test a payload the serializer cannot encode is reported per message as a rejection, not raised"""
+    messages = [booking_created(booking(f"book_{index}")) for index in range(2)]
+    producer = KafkaProducer(serializer="json")
+    producer.producer = FakeAIOKafkaProducer(serializer=producer.serializer)
+    messages[0].payload["unserializable"] = object()
+
+    errors = await producer.publish_messages(messages)
+    assert is_rejected(errors[0])
+    assert not is_rejected(errors[1])
+    assert producer.producer.records == []
+
+
+async def test_relay_survives_unexpected_errors(repo, monkeypatch):
+    """Test a non-ClientError from a tick is logged and the loop keeps going with backoff"""
+    calls = []
+    sleeps = []
+
+    async def tick():
+        calls.append(None)
+        if len(calls) == 1:
+            raise EndpointConnectionError(endpoint_url="http://dynamodb")
+        if len(calls) == 2:
+            raise KafkaTimeoutError()
+        raise asyncio.CancelledError()
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    relay = OutboxRelay(repo, FakeProducer(), interval=0.2, max_backoff=0.5)
+    monkeypatch.setattr(relay, "tick", tick)
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        await relay.run()
+    assert len(calls) == 3
+    assert sleeps == [0.4, 0.5]
+
+
+async def test_relay_reports_backlog_and_skips_locked_shards(repo):
+    """Test a full batch triggers an immediate next tick and a shard locked by another replica is skipped"""
+    for index in range(3):
+        await repo.create_booking(booking(f"book_{index}"), events=[booking_created(booking(f"book_{index}"))])
+
+    client = fakeredis.FakeAsyncRedis()
+    producer = FakeProducer()
+    relay = OutboxRelay(repo, producer, client, batch_size=2)
+    other = OutboxRelay(repo, producer, client, batch_size=2)
+
+    await client.set("booking:outbox:lock:0", other.owner)
+    assert await relay.tick() is False
+    assert producer.sent == []
+
+    await client.delete("booking:outbox:lock:0")
+    assert await relay.tick() is True
+    assert await relay.tick() is False
+    assert len(producer.sent) == 3
+    assert await client.get("booking:outbox:lock:0") is None
+
+
+async def test_publish_messages_keys_by_event_and_stops_at_first_failure():
+    """Test records carry the partition key and idempotency header, and nothing is sent after a failed enqueue"""
+    messages = [booking_created(booking(f"book_{index}", "evt_9")) for index in range(3)]
+    producer = KafkaProducer()
+    producer.producer = FakeAIOKafkaProducer(fail_enqueue_at=1)
+
+    assert [error is None for error in await producer.publish_messages(messages)] == [True, False, False]
+    [(topic, value, key, headers)] = producer.producer.records
+    assert topic == "booking.created"
+    assert key == b"evt_9"
+    assert headers == [
+        ("content-type", b"application/json"),
+        ("idempotency-key", messages[0].message_id.encode()),
+    ]
+    assert value["booking_id"] == "book_0"
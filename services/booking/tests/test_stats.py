@@ -0,0 +1,171 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import boto3
+import fakeredis
+import httpx
+import pytest
+import redis.asyncio as redis
+from fastapi import Header
+from httpx import ASGITransport, AsyncClient
+from moto import mock_dynamodb
+
+from app.auth import get_current_user_id
+from app.dynamodb import BookingStatusConflictError, DynamoDBRepository
+from app.event_metadata import EventMetadataCache
+from app.main import app
+from app.stats import BOOKING_STATS_UPDATE_FAILURES, BookingStats
+
+
+@pytest.fixture
+def repo():
+    """Repository over a mock bookings table with the sharded event index and fakeredis stats"""
+    with mock_dynamodb():
+        boto3.client("dynamodb", region_name="us-east-1").create_table(
+            TableName="ticketing-bookings",
+            KeySchema=[{"AttributeName": "booking_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "booking_id", "AttributeType": "S"},
+                {"AttributeName": "event_shard", "AttributeType": "S"},
+                {"AttributeName": "created_at", "AttributeType": "N"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "event-shard-index",
+                    "KeySchema": [
+                        {"AttributeName": "event_shard", "KeyType": "HASH"},
+                        {"AttributeName": "created_at", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        repository = DynamoDBRepository(max_concurrency=8, stats=BookingStats(fakeredis.FakeAsyncRedis()))
+        repository.table_name = "ticketing-bookings"
+        yield repository
+        repository.close()
+
+
+def booking(booking_id: str, event_id: str = "evt_1", price: float = 100.0) -> dict:
+    return {
+        "booking_id": booking_id,
+        "event_id": event_id,
+        "seat_number": booking_id.upper(),
+        "user_id": "user_1",
+        "status": "pending",
+        "price": price,
+        "created_at": datetime.utcnow(),
+    }
+
+
+async def create_and_transition(repo: DynamoDBRepository):
+    """evt_1: 1 pending, 2 confirmed (150 + 250), 1 cancelled, 1 expired; evt_2: 1 pending"""
+    await repo.create_booking(booking("b1"))
+    await repo.create_bookings([booking("b2", price=150.0), booking("b3", price=250.0), booking("b4"), booking("b5")])
+    await repo.create_booking(booking("b6", event_id="evt_2"))
+
+    await repo.update_booking_status(await repo.get_booking("b2"), "confirmed", "pay_2")
+    await repo.update_booking_status(await repo.get_booking("b3"), "confirmed", "pay_3")
+    await repo.update_booking_status(await repo.get_booking("b4"), "cancelled")
+    await repo.update_booking_status(await repo.get_booking("b5"), "expired")
+
+
+async def test_transitions_update_counters(repo):
+    """Test creates and status changes move per-status counts and confirmed revenue for the right event"""
+    await create_and_transition(repo)
+
+    stats = await repo.stats.get("evt_1")
+    assert (stats.pending, stats.confirmed, stats.cancelled, stats.expired) == (1, 2, 1, 1)
+    assert stats.total == 5
+    assert stats.revenue == 400.0
+    assert (await repo.stats.get("evt_2")).pending == 1
+    assert (await repo.stats.get("evt_unknown")).total == 0
+
+
+async def test_rejected_transition_is_not_counted(repo):
+    """Test a transition that loses the status condition leaves the counters alone"""
+    await repo.create_booking(booking("b1"))
+    stale = await repo.get_booking("b1")
+    await repo.update_booking_status(stale, "confirmed", "pay_1")
+
+    with pytest.raises(BookingStatusConflictError):
+        await repo.update_booking_status(stale, "cancelled")
+
+    stats = await repo.stats.get("evt_1")
+    assert (stats.pending, stats.confirmed, stats.cancelled) == (0, 1, 0)
+    assert stats.revenue == 100.0
+
+
+async def test_rebuild_matches_incremental_counters(repo):
+    """Test rebuilding from a scatter-gather read of the table reproduces the incremental aggregate"""
+    await create_and_transition(repo)
+    incremental = await repo.stats.get("evt_1")
+
+    await repo.stats.client.flushall()
+    rebuilt = await repo.stats.rebuild("evt_1", await repo.list_event_bookings("evt_1"))
+
+    assert rebuilt == incremental == await repo.stats.get("evt_1")
+
+
+async def test_stats_outage_does_not_fail_writes(repo):
+    """Test bookings are still written when Redis is down and the missed update is counted"""
+    failures = BOOKING_STATS_UPDATE_FAILURES._value.get()
+
+    with patch.object(repo.stats.client, "pipeline", side_effect=redis.ConnectionError("down")):
+        await repo.create_booking(booking("b1"))
+
+    assert (await repo.get_booking("b1"))["status"] == "pending"
+    assert BOOKING_STATS_UPDATE_FAILURES._value.get() == failures + 1
+
+
+async def test_stats_endpoint_is_for_organizer_and_admin(repo):
+    """Test the dashboard endpoint serves the event's organizer and admins, and 403s other users"""
+    await create_and_transition(repo)
+    requested = []
+
+    def events_service(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path == "/events/evt_1":
+            return httpx.Response(200, json={"id": 1, "organizer_id": 7, "price": "100.00"})
+        return httpx.Response(404, json={"detail": "Event not found"})
+
+    event_cache = EventMetadataCache(
+        httpx.AsyncClient(transport=httpx.MockTransport(events_service), base_url="http://events")
+    )
+
+    def current_user(x_user_id: str = Header()) -> str:
+        return x_user_id
+
+    async def get_stats(event_id: str, user_id: str, role: str = "user") -> httpx.Response:
+        headers = {"X-User-Id": user_id, "X-User-Role": role}
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            return await client.get(f"/bookings/events/{event_id}/stats", headers=headers)
+
+    app.dependency_overrides[get_current_user_id] = current_user
+    try:
+        with (
+            patch("app.routers.booking.get_booking_stats", return_value=repo.stats),
+            patch("app.routers.booking.get_event_metadata_cache", return_value=event_cache),
+        ):
+            admin = await get_stats("evt_1", "1", role="admin")
+            assert requested == []
+            organizer = await get_stats("evt_1", "7")
+            other = await get_stats("evt_1", "8")
+            missing = await get_stats("evt_missing", "7")
+    finally:
+        app.dependency_overrides.clear()
+
+    expected = {
+        "event_id": "evt_1",
+        "pending": 1,
+        "confirmed": 2,
+        "cancelled": 1,
+        "expired": 1,
+        "total": 5,
+        "revenue": 400.0,
+    }
+    assert admin.status_code == organizer.status_code == 200
+    assert admin.json() == organizer.json() == expected
+    assert other.status_code == 403
+    assert missing.status_code == 404
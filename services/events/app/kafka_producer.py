@@ -0,0 +1,95 @@
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Optional
+
+from aiokafka import AIOKafkaProducer
+
+from app.models import Event
+
+logger = logging.getLogger(__name__)
+
+EVENT_UPDATED_TOPIC = "event.updated"
+
+
+class KafkaProducer:
+    """Kafka producer for publishing event changes (booking 서비스 공연 메타데이터 캐시가 구독)"""
+
+    def __init__(self):
+        # AWS 배포는 MSK_BOOTSTRAP_SERVERS, docker compose와 k8s/local은 KAFKA_BOOTSTRAP_SERVERS
+        self.bootstrap_servers = (
+            os.getenv("MSK_BOOTSTRAP_SERVERS") or os.getenv("KAFKA_BOOTSTRAP_SERVERS") or "localhost:9092"
+        )
+        self.producer: Optional[AIOKafkaProducer] = None
+
+    async def start(self):
+        """Start Kafka producer"""
+        try:
+            self.producer = AIOKafkaProducer(
+                bootstrap_servers=self.bootstrap_servers.split(","),
+                value_serializer=lambda v: json.dumps(v, default=str).encode("utf-8"),
+                enable_idempotence=True,
+            )
+            await self.producer.start()
+            logger.info(f"Kafka producer started: {self.bootstrap_servers}")
+        except Exception as e:
+            logger.error(f"Failed to start Kafka producer: {e}")
+            self.producer = None
+
+    async def stop(self):
+        """Stop Kafka producer"""
+        if self.producer:
+            await self.producer.stop()
+
+    async def publish_event(self, topic: str, key: str, event: dict):
+        """Publish event to Kafka (실패해도 요청은 성공, 구독자는 주기적 재적재로 따라잡는다)"""
+        if not self.producer:
+            logger.warning("Kafka producer not available, skipping event publish")
+            return
+
+        try:
+            await self.producer.send_and_wait(topic, event, key=key.encode())
+        except Exception as e:
+            logger.error(f"Failed to publish event: {e}")
+
+    async def publish_event_updated(self, event: Event):
+        """이벤트 생성/수정/게시 알림 (가격, 통화, 상태 전체 스냅샷)"""
+        await self.publish_event(
+            EVENT_UPDATED_TOPIC,
+            str(event.id),
+            {
+                "event_type": "event.updated",
+                "event_id": str(event.id),
+                "price": float(event.price),
+                "currency": event.currency,
+                "status": event.status.value,
+                "updated_at": event.updated_at.isoformat(),
+            },
+        )
+
+    async def publish_event_deleted(self, event_id: int):
+        """이벤트 삭제 알림"""
+        await self.publish_event(
+            EVENT_UPDATED_TOPIC,
+            str(event_id),
+            {
+                "event_type": "event.deleted",
+                "event_id": str(event_id),
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+
+
+# Global instance
+_kafka_producer: Optional[KafkaProducer] = None
+
+
+def get_kafka_producer() -> KafkaProducer:
+    """Get Kafka producer instance"""
+    global _kafka_producer
+
+    if _kafka_producer is None:
+        _kafka_producer = KafkaProducer()
+
+    return _kafka_producer
@@ -10,6 +10,7 @@ from fastapi.responses import JSONResponse, Response
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
 
 from app.db import init_db
+from app.kafka_producer import get_kafka_producer
 from app.routers import events
 from app.schemas import HealthResponse
 from app.search import init_opensearch_index
@@ -45,8 +46,13 @@ async def lifespan(app: FastAPI):
     await init_opensearch_index()
     logger.info("OpenSearch index initialized")
 
+    # 이벤트 변경 알림 (booking 서비스 공연 메타데이터 캐시 갱신용)
+    kafka_producer = get_kafka_producer()
+    await kafka_producer.start()
+
     yield
     logger.info("Shutting down Events Service...")
+    await kafka_producer.stop()
 
 
 # FastAPI app
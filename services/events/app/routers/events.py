@@ -5,7 +5,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth import get_current_user_id
 from app.db import get_db
+from app.kafka_producer import get_kafka_producer
 from app.models import Event, EventStatus
 from app.schemas import EventCreate, EventListResponse, EventResponse, EventUpdate
 from app.search import delete_event_from_index, index_event, search_events, update_event_in_index
@@ -13,17 +15,22 @@ from app.search import delete_event_from_index, index_event, search_events, upda
 router = APIRouter(prefix="/events", tags=["events"])
 
 
-# 임시: 인증 시뮬레이션 (실제로는 Auth Service와 통합)
-async def get_current_user_id() -> int:
-    """임시 사용자 ID (실제로는 JWT 토큰에서 추출)"""
-    return 1  # 임시 하드코딩
+async def get_organizer_id(user_id: str = Depends(get_current_user_id)) -> int:
+    """organizer_id와 비교할 사용자 ID (Auth Service users.id, 숫자가 아니면 401)"""
+    if not user_id.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return int(user_id)
 
 
 @router.post("", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
 async def create_event(
     event_data: EventCreate,
     db: AsyncSession = Depends(get_db),
-    user_id: int = Depends(get_current_user_id),
+    user_id: int = Depends(get_organizer_id),
 ):
     """이벤트 생성"""
     # 시간 검증
@@ -78,6 +85,7 @@ async def create_event(
         "created_at": new_event.created_at,
     }
     await index_event(event_dict)
+    await get_kafka_producer().publish_event_updated(new_event)
 
     return new_event
 
@@ -177,7 +185,7 @@ async def update_event(
     event_id: int,
     event_update: EventUpdate,
     db: AsyncSession = Depends(get_db),
-    user_id: int = Depends(get_current_user_id),
+    user_id: int = Depends(get_organizer_id),
 ):
     """이벤트 수정"""
     result = await db.execute(select(Event).where(Event.id == event_id))
@@ -219,6 +227,7 @@ async def update_event(
     if "status" in event_dict:
         event_dict["status"] = event_dict["status"].value
     await update_event_in_index(event_id, event_dict)
+    await get_kafka_producer().publish_event_updated(event)
 
     return event
 
@@ -227,7 +236,7 @@ async def update_event(
 async def delete_event(
     event_id: int,
     db: AsyncSession = Depends(get_db),
-    user_id: int = Depends(get_current_user_id),
+    user_id: int = Depends(get_organizer_id),
 ):
     """이벤트 삭제"""
     result = await db.execute(select(Event).where(Event.id == event_id))
@@ -251,13 +260,14 @@ async def delete_event(
 
     # OpenSearch에서 삭제
     await delete_event_from_index(event_id)
+    await get_kafka_producer().publish_event_deleted(event_id)
 
 
 @router.post("/{event_id}/publish", response_model=EventResponse)
 async def publish_event(
     event_id: int,
     db: AsyncSession = Depends(get_db),
-    user_id: int = Depends(get_current_user_id),
+    user_id: int = Depends(get_organizer_id),
 ):
     """이벤트 게시"""
     result = await db.execute(select(Event).where(Event.id == event_id))
@@ -281,5 +291,6 @@ async def publish_event(
 
     # OpenSearch 업데이트
     await update_event_in_index(event_id, {"status": "published"})
+    await get_kafka_producer().publish_event_updated(event)
 
     return event
@@ -2,16 +2,20 @@ package grpc
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"log"
 	"net"
+	"time"
 
 	"google.golang.org/grpc"
 	"google.golang.org/grpc/codes"
+	"google.golang.org/grpc/keepalive"
 	"google.golang.org/grpc/status"
 
 	"github.com/ticketing/inventory/internal/config"
 	"github.com/ticketing/inventory/internal/models"
+	"github.com/ticketing/inventory/internal/repository"
 	"github.com/ticketing/inventory/internal/service"
 	pb "github.com/ticketing/inventory/proto"
 )
@@ -35,7 +39,14 @@ func (s *Server) Start() error {
 		return fmt.Errorf("failed to listen: %w", err)
 	}
 
-	grpcServer := grpc.NewServer()
+	// booking 서비스 클라이언트는 유휴 연결에도 30초마다 keepalive ping을 보낸다.
+	// 기본 정책(5분)이면 서버가 too_many_pings로 연결을 끊으므로 허용 간격을 낮춘다.
+	grpcServer := grpc.NewServer(
+		grpc.KeepaliveEnforcementPolicy(keepalive.EnforcementPolicy{
+			MinTime:             10 * time.Second,
+			PermitWithoutStream: true,
+		}),
+	)
 	pb.RegisterInventoryServiceServer(grpcServer, s)
 
 	log.Printf("Starting gRPC server on port %s", s.cfg.GRPCPort)
@@ -103,6 +114,37 @@ func (s *Server) ReserveSeat(ctx context.Context, req *pb.ReserveSeatRequest) (*
 	}, nil
 }
 
+// ReserveSeats implements the ReserveSeats RPC
+func (s *Server) ReserveSeats(ctx context.Context, req *pb.ReserveSeatsRequest) (*pb.ReserveSeatsResponse, error) {
+	reservations, err := s.service.ReserveSeats(ctx, req.EventId, req.SeatNumbers, req.UserId)
+	if err != nil {
+		response := &pb.ReserveSeatsResponse{
+			Success: false,
+			Message: err.Error(),
+		}
+		var unavailable *repository.SeatsUnavailableError
+		if errors.As(err, &unavailable) {
+			response.UnavailableSeats = unavailable.SeatNumbers
+		}
+		return response, nil
+	}
+
+	pbReservations := make([]*pb.SeatReservation, len(reservations))
+	for i, reservation := range reservations {
+		pbReservations[i] = &pb.SeatReservation{
+			SeatNumber:    reservation.SeatNumber,
+			ReservationId: reservation.ReservationID,
+			Price:         reservation.Price,
+		}
+	}
+
+	return &pb.ReserveSeatsResponse{
+		Success:      true,
+		Message:      "Seats reserved successfully",
+		Reservations: pbReservations,
+	}, nil
+}
+
 // ReleaseSeat implements the ReleaseSeat RPC
 func (s *Server) ReleaseSeat(ctx context.Context, req *pb.ReleaseSeatRequest) (*pb.ReleaseSeatResponse, error) {
 	err := s.service.ReleaseSeat(ctx, req.EventId, req.SeatNumber, req.UserId)
@@ -4,6 +4,7 @@ import (
 	"context"
 	"errors"
 	"fmt"
+	"strings"
 	"time"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
@@ -22,6 +23,23 @@ var (
 	ErrReservationNotFound = errors.New("reservation not found")
 )
 
+// MaxBatchSeats is the number of seats one ReserveSeats call can hold.
+// TransactWriteItems takes at most 100 actions and every seat needs two (seat update + reservation put).
+const MaxBatchSeats = 50
+
+// SeatsUnavailableError lists the seats that made a batch reservation fail
+type SeatsUnavailableError struct {
+	SeatNumbers []string
+}
+
+func (e *SeatsUnavailableError) Error() string {
+	return fmt.Sprintf("seats not available: %s", strings.Join(e.SeatNumbers, ", "))
+}
+
+func (e *SeatsUnavailableError) Unwrap() error {
+	return ErrSeatAlreadyReserved
+}
+
 type DynamoDBRepository struct {
 	client *dynamodb.Client
 	cfg    *config.Config
@@ -136,6 +154,110 @@ func (r *DynamoDBRepository) ReserveSeat(ctx context.Context, eventID, seatNumbe
 	return nil
 }
 
+// BatchGetSeats retrieves seats by number in a single BatchGetItem round trip (missing seats are omitted)
+func (r *DynamoDBRepository) BatchGetSeats(ctx context.Context, eventID string, seatNumbers []string) (map[string]*models.Seat, error) {
+	keys := make([]map[string]types.AttributeValue, len(seatNumbers))
+	for i, seatNumber := range seatNumbers {
+		keys[i] = map[string]types.AttributeValue{
+			"event_id":    &types.AttributeValueMemberS{Value: eventID},
+			"seat_number": &types.AttributeValueMemberS{Value: seatNumber},
+		}
+	}
+
+	seats := make(map[string]*models.Seat, len(seatNumbers))
+	// 좌석 상태는 바로 조건부 쓰기로 검증하므로 strongly consistent read가 필요하다
+	requestItems := map[string]types.KeysAndAttributes{
+		r.cfg.SeatsTable: {Keys: keys, ConsistentRead: aws.Bool(true)},
+	}
+
+	// 처리되지 않은 키(throttling)는 남은 것만 다시 요청
+	for len(requestItems) > 0 {
+		result, err := r.client.BatchGetItem(ctx, &dynamodb.BatchGetItemInput{RequestItems: requestItems})
+		if err != nil {
+			return nil, fmt.Errorf("failed to batch get seats: %w", err)
+		}
+
+		for _, item := range result.Responses[r.cfg.SeatsTable] {
+			var seat models.Seat
+			if err := attributevalue.UnmarshalMap(item, &seat); err != nil {
+				return nil, fmt.Errorf("failed to unmarshal seat: %w", err)
+			}
+			seats[seat.SeatNumber] = &seat
+		}
+
+		requestItems = result.UnprocessedKeys
+	}
+
+	return seats, nil
+}
+
+// ReserveSeats reserves seats and creates their reservations in one transaction (all or nothing)
+func (r *DynamoDBRepository) ReserveSeats(ctx context.Context, seats []*models.Seat, reservations []*models.Reservation) error {
+	now := time.Now().Unix()
+	items := make([]types.TransactWriteItem, 0, len(seats)*2)
+
+	for i, seat := range seats {
+		item, err := attributevalue.MarshalMap(reservations[i])
+		if err != nil {
+			return fmt.Errorf("failed to marshal reservation: %w", err)
+		}
+
+		items = append(items,
+			types.TransactWriteItem{
+				Update: &types.Update{
+					TableName: aws.String(r.cfg.SeatsTable),
+					Key: map[string]types.AttributeValue{
+						"event_id":    &types.AttributeValueMemberS{Value: seat.EventID},
+						"seat_number": &types.AttributeValueMemberS{Value: seat.SeatNumber},
+					},
+					// 조건: ReserveSeat와 동일 (status가 AVAILABLE이고 version이 일치해야 함)
+					ConditionExpression: aws.String("#status = :available AND #version = :current_version"),
+					UpdateExpression:    aws.String("SET #status = :reserved, user_id = :user_id, reserved_at = :reserved_at, #version = :new_version, updated_at = :updated_at"),
+					ExpressionAttributeNames: map[string]string{
+						"#status":  "status",
+						"#version": "version",
+					},
+					ExpressionAttributeValues: map[string]types.AttributeValue{
+						":available":       &types.AttributeValueMemberS{Value: string(models.SeatStatusAvailable)},
+						":reserved":        &types.AttributeValueMemberS{Value: string(models.SeatStatusReserved)},
+						":current_version": &types.AttributeValueMemberN{Value: fmt.Sprintf("%d", seat.Version)},
+						":new_version":     &types.AttributeValueMemberN{Value: fmt.Sprintf("%d", seat.Version+1)},
+						":user_id":         &types.AttributeValueMemberS{Value: reservations[i].UserID},
+						":reserved_at":     &types.AttributeValueMemberN{Value: fmt.Sprintf("%d", now)},
+						":updated_at":      &types.AttributeValueMemberN{Value: fmt.Sprintf("%d", now)},
+					},
+				},
+			},
+			types.TransactWriteItem{
+				Put: &types.Put{
+					TableName: aws.String(r.cfg.ReservationsTable),
+					Item:      item,
+				},
+			},
+		)
+	}
+
+	_, err := r.client.TransactWriteItems(ctx, &dynamodb.TransactWriteItemsInput{TransactItems: items})
+	if err != nil {
+		var canceled *types.TransactionCanceledException
+		if errors.As(err, &canceled) {
+			// CancellationReasons는 TransactItems와 같은 순서 (좌석 i의 업데이트는 2*i번째)
+			var unavailable []string
+			for i, reason := range canceled.CancellationReasons {
+				if i%2 == 0 && aws.ToString(reason.Code) == "ConditionalCheckFailed" {
+					unavailable = append(unavailable, seats[i/2].SeatNumber)
+				}
+			}
+			if len(unavailable) > 0 {
+				return &SeatsUnavailableError{SeatNumbers: unavailable}
+			}
+		}
+		return fmt.Errorf("failed to reserve seats: %w", err)
+	}
+
+	return nil
+}
+
 // ReleaseSeat releases a reserved seat
 func (r *DynamoDBRepository) ReleaseSeat(ctx context.Context, eventID, seatNumber, userID string) error {
 	now := time.Now().Unix()
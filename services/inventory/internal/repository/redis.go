@@ -73,6 +73,67 @@ func (r *RedisRepository) ReleaseLock(ctx context.Context, eventID, seatNumber,
 	return nil
 }
 
+// AcquireLocks acquires the locks for several seats in one pipelined round trip.
+// Either every lock is acquired (sharing one token) or none is; the seats whose
+// locks are held by another client are returned with ErrLockAlreadyHeld.
+func (r *RedisRepository) AcquireLocks(ctx context.Context, eventID string, seatNumbers []string) (string, []string, error) {
+	lockToken := uuid.New().String()
+	ttl := time.Duration(r.cfg.RedisLockTTL) * time.Second
+
+	pipe := r.client.Pipeline()
+	cmds := make([]*redis.BoolCmd, len(seatNumbers))
+	for i, seatNumber := range seatNumbers {
+		cmds[i] = pipe.SetNX(ctx, r.getLockKey(eventID, seatNumber), lockToken, ttl)
+	}
+	if _, err := pipe.Exec(ctx); err != nil && !errors.Is(err, redis.Nil) {
+		// 일부만 잡혔을 수 있으므로 토큰이 일치하는 락은 모두 해제
+		r.ReleaseLocks(context.Background(), eventID, seatNumbers, lockToken)
+		return "", nil, fmt.Errorf("failed to acquire locks: %w", err)
+	}
+
+	var held, acquired []string
+	for i, cmd := range cmds {
+		if cmd.Val() {
+			acquired = append(acquired, seatNumbers[i])
+		} else {
+			held = append(held, seatNumbers[i])
+		}
+	}
+
+	if len(held) > 0 {
+		r.ReleaseLocks(context.Background(), eventID, acquired, lockToken)
+		return "", held, ErrLockAlreadyHeld
+	}
+
+	return lockToken, nil, nil
+}
+
+// ReleaseLocks releases locks acquired by AcquireLocks in one pipelined round trip
+func (r *RedisRepository) ReleaseLocks(ctx context.Context, eventID string, seatNumbers []string, lockToken string) error {
+	if len(seatNumbers) == 0 {
+		return nil
+	}
+
+	// Lua script for atomic get-and-delete (same as ReleaseLock)
+	script := redis.NewScript(`
+		if redis.call("GET", KEYS[1]) == ARGV[1] then
+			return redis.call("DEL", KEYS[1])
+		else
+			return 0
+		end
+	`)
+
+	pipe := r.client.Pipeline()
+	for _, seatNumber := range seatNumbers {
+		script.Eval(ctx, pipe, []string{r.getLockKey(eventID, seatNumber)}, lockToken)
+	}
+	if _, err := pipe.Exec(ctx); err != nil {
+		return fmt.Errorf("failed to release locks: %w", err)
+	}
+
+	return nil
+}
+
 // ExtendLock extends the TTL of an existing lock
 func (r *RedisRepository) ExtendLock(ctx context.Context, eventID, seatNumber, lockToken string) error {
 	lockKey := r.getLockKey(eventID, seatNumber)
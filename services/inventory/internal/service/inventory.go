@@ -2,8 +2,10 @@ package service
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"log"
+	"sort"
 	"time"
 
 	"github.com/google/uuid"
@@ -90,6 +92,90 @@ func (s *InventoryService) ReserveSeat(ctx context.Context, eventID, seatNumber,
 	return reservationID, nil
 }
 
+// ReserveSeats reserves several seats of one event all-or-nothing.
+// Locks are taken in one pipelined Redis call, seats are read with one BatchGetItem and
+// all seat updates and reservation records are written in one DynamoDB transaction,
+// so the cost no longer grows with round trips per seat.
+// On failure the returned *repository.SeatsUnavailableError lists the seats at fault.
+func (s *InventoryService) ReserveSeats(ctx context.Context, eventID string, seatNumbers []string, userID string) ([]*models.Reservation, error) {
+	if len(seatNumbers) == 0 {
+		return nil, fmt.Errorf("no seats requested")
+	}
+	if len(seatNumbers) > repository.MaxBatchSeats {
+		return nil, fmt.Errorf("too many seats: at most %d per request", repository.MaxBatchSeats)
+	}
+
+	// 락/트랜잭션 항목 순서를 고정해 같은 좌석을 겹쳐 요청하는 장바구니끼리 결과가 일관되게 한다
+	ordered := append([]string(nil), seatNumbers...)
+	sort.Strings(ordered)
+	for i := 1; i < len(ordered); i++ {
+		if ordered[i] == ordered[i-1] {
+			return nil, fmt.Errorf("duplicate seat: %s", ordered[i])
+		}
+	}
+
+	// Step 1: Acquire distributed locks (Redis, one round trip)
+	lockToken, held, err := s.redis.AcquireLocks(ctx, eventID, ordered)
+	if err != nil {
+		if errors.Is(err, repository.ErrLockAlreadyHeld) {
+			return nil, &repository.SeatsUnavailableError{SeatNumbers: held}
+		}
+		return nil, fmt.Errorf("failed to acquire locks: %w", err)
+	}
+
+	defer func() {
+		if releaseErr := s.redis.ReleaseLocks(context.Background(), eventID, ordered, lockToken); releaseErr != nil {
+			log.Printf("Warning: failed to release locks for %s: %v", eventID, releaseErr)
+		}
+	}()
+
+	// Step 2: Get seats to check current state and version
+	seats, err := s.dynamoDB.BatchGetSeats(ctx, eventID, ordered)
+	if err != nil {
+		return nil, fmt.Errorf("failed to get seats: %w", err)
+	}
+
+	var unavailable []string
+	for _, seatNumber := range ordered {
+		if seat, ok := seats[seatNumber]; !ok || seat.Status != models.SeatStatusAvailable {
+			unavailable = append(unavailable, seatNumber)
+		}
+	}
+	if len(unavailable) > 0 {
+		return nil, &repository.SeatsUnavailableError{SeatNumbers: unavailable}
+	}
+
+	// Step 3: Reserve seats and create reservation records in one transaction
+	orderedSeats := make([]*models.Seat, len(ordered))
+	byNumber := make(map[string]*models.Reservation, len(ordered))
+	reservations := make([]*models.Reservation, len(ordered))
+	for i, seatNumber := range ordered {
+		seat := seats[seatNumber]
+		orderedSeats[i] = seat
+		reservations[i] = models.NewReservation(
+			uuid.New().String(),
+			eventID,
+			seatNumber,
+			userID,
+			seat.Price,
+			s.cfg.ReservationTTLMinutes,
+		)
+		byNumber[seatNumber] = reservations[i]
+	}
+
+	if err := s.dynamoDB.ReserveSeats(ctx, orderedSeats, reservations); err != nil {
+		return nil, err
+	}
+
+	// 요청한 좌석 순서대로 반환
+	result := make([]*models.Reservation, len(seatNumbers))
+	for i, seatNumber := range seatNumbers {
+		result[i] = byNumber[seatNumber]
+	}
+
+	return result, nil
+}
+
 // ReleaseSeat releases a reserved seat
 func (s *InventoryService) ReleaseSeat(ctx context.Context, eventID, seatNumber, userID string) error {
 	// Acquire lock
@@ -415,6 +415,195 @@ func (x *ReserveSeatResponse) GetReservationId() string {
 	return ""
 }
 
+// ReserveSeats
+type ReserveSeatsRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	EventId       string                 `protobuf:"bytes,1,opt,name=event_id,json=eventId,proto3" json:"event_id,omitempty"`
+	SeatNumbers   []string               `protobuf:"bytes,2,rep,name=seat_numbers,json=seatNumbers,proto3" json:"seat_numbers,omitempty"`
+	UserId        string                 `protobuf:"bytes,3,opt,name=user_id,json=userId,proto3" json:"user_id,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ReserveSeatsRequest) Reset() {
+	*x = ReserveSeatsRequest{}
+	mi := &file_proto_inventory_proto_msgTypes[5]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ReserveSeatsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ReserveSeatsRequest) ProtoMessage() {}
+
+func (x *ReserveSeatsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_inventory_proto_msgTypes[5]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ReserveSeatsRequest.ProtoReflect.Descriptor instead.
+func (*ReserveSeatsRequest) Descriptor() ([]byte, []int) {
+	return file_proto_inventory_proto_rawDescGZIP(), []int{5}
+}
+
+func (x *ReserveSeatsRequest) GetEventId() string {
+	if x != nil {
+		return x.EventId
+	}
+	return ""
+}
+
+func (x *ReserveSeatsRequest) GetSeatNumbers() []string {
+	if x != nil {
+		return x.SeatNumbers
+	}
+	return nil
+}
+
+func (x *ReserveSeatsRequest) GetUserId() string {
+	if x != nil {
+		return x.UserId
+	}
+	return ""
+}
+
+type SeatReservation struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	SeatNumber    string                 `protobuf:"bytes,1,opt,name=seat_number,json=seatNumber,proto3" json:"seat_number,omitempty"`
+	ReservationId string                 `protobuf:"bytes,2,opt,name=reservation_id,json=reservationId,proto3" json:"reservation_id,omitempty"`
+	Price         float64                `protobuf:"fixed64,3,opt,name=price,proto3" json:"price,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *SeatReservation) Reset() {
+	*x = SeatReservation{}
+	mi := &file_proto_inventory_proto_msgTypes[6]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *SeatReservation) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SeatReservation) ProtoMessage() {}
+
+func (x *SeatReservation) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_inventory_proto_msgTypes[6]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SeatReservation.ProtoReflect.Descriptor instead.
+func (*SeatReservation) Descriptor() ([]byte, []int) {
+	return file_proto_inventory_proto_rawDescGZIP(), []int{6}
+}
+
+func (x *SeatReservation) GetSeatNumber() string {
+	if x != nil {
+		return x.SeatNumber
+	}
+	return ""
+}
+
+func (x *SeatReservation) GetReservationId() string {
+	if x != nil {
+		return x.ReservationId
+	}
+	return ""
+}
+
+func (x *SeatReservation) GetPrice() float64 {
+	if x != nil {
+		return x.Price
+	}
+	return 0
+}
+
+type ReserveSeatsResponse struct {
+	state            protoimpl.MessageState `protogen:"open.v1"`
+	Success          bool                   `protobuf:"varint,1,opt,name=success,proto3" json:"success,omitempty"`
+	Message          string                 `protobuf:"bytes,2,opt,name=message,proto3" json:"message,omitempty"`
+	Reservations     []*SeatReservation     `protobuf:"bytes,3,rep,name=reservations,proto3" json:"reservations,omitempty"`                                 // Same order as seat_numbers
+	UnavailableSeats []string               `protobuf:"bytes,4,rep,name=unavailable_seats,json=unavailableSeats,proto3" json:"unavailable_seats,omitempty"` // Seats that caused the batch to fail
+	unknownFields    protoimpl.UnknownFields
+	sizeCache        protoimpl.SizeCache
+}
+
+func (x *ReserveSeatsResponse) Reset() {
+	*x = ReserveSeatsResponse{}
+	mi := &file_proto_inventory_proto_msgTypes[7]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ReserveSeatsResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ReserveSeatsResponse) ProtoMessage() {}
+
+func (x *ReserveSeatsResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_inventory_proto_msgTypes[7]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ReserveSeatsResponse.ProtoReflect.Descriptor instead.
+func (*ReserveSeatsResponse) Descriptor() ([]byte, []int) {
+	return file_proto_inventory_proto_rawDescGZIP(), []int{7}
+}
+
+func (x *ReserveSeatsResponse) GetSuccess() bool {
+	if x != nil {
+		return x.Success
+	}
+	return false
+}
+
+func (x *ReserveSeatsResponse) GetMessage() string {
+	if x != nil {
+		return x.Message
+	}
+	return ""
+}
+
+func (x *ReserveSeatsResponse) GetReservations() []*SeatReservation {
+	if x != nil {
+		return x.Reservations
+	}
+	return nil
+}
+
+func (x *ReserveSeatsResponse) GetUnavailableSeats() []string {
+	if x != nil {
+		return x.UnavailableSeats
+	}
+	return nil
+}
+
 // ReleaseSeat
 type ReleaseSeatRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
@@ -427,7 +616,7 @@ type ReleaseSeatRequest struct {
 
 func (x *ReleaseSeatRequest) Reset() {
 	*x = ReleaseSeatRequest{}
-	mi := &file_proto_inventory_proto_msgTypes[5]
+	mi := &file_proto_inventory_proto_msgTypes[8]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -439,7 +628,7 @@ func (x *ReleaseSeatRequest) String() string {
 func (*ReleaseSeatRequest) ProtoMessage() {}
 
 func (x *ReleaseSeatRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_inventory_proto_msgTypes[5]
+	mi := &file_proto_inventory_proto_msgTypes[8]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -452,7 +641,7 @@ func (x *ReleaseSeatRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReleaseSeatRequest.ProtoReflect.Descriptor instead.
 func (*ReleaseSeatRequest) Descriptor() ([]byte, []int) {
-	return file_proto_inventory_proto_rawDescGZIP(), []int{5}
+	return file_proto_inventory_proto_rawDescGZIP(), []int{8}
 }
 
 func (x *ReleaseSeatRequest) GetEventId() string {
@@ -486,7 +675,7 @@ type ReleaseSeatResponse struct {
 
 func (x *ReleaseSeatResponse) Reset() {
 	*x = ReleaseSeatResponse{}
-	mi := &file_proto_inventory_proto_msgTypes[6]
+	mi := &file_proto_inventory_proto_msgTypes[9]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -498,7 +687,7 @@ func (x *ReleaseSeatResponse) String() string {
 func (*ReleaseSeatResponse) ProtoMessage() {}
 
 func (x *ReleaseSeatResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_inventory_proto_msgTypes[6]
+	mi := &file_proto_inventory_proto_msgTypes[9]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -511,7 +700,7 @@ func (x *ReleaseSeatResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReleaseSeatResponse.ProtoReflect.Descriptor instead.
 func (*ReleaseSeatResponse) Descriptor() ([]byte, []int) {
-	return file_proto_inventory_proto_rawDescGZIP(), []int{6}
+	return file_proto_inventory_proto_rawDescGZIP(), []int{9}
 }
 
 func (x *ReleaseSeatResponse) GetSuccess() bool {
@@ -540,7 +729,7 @@ type ConfirmBookingRequest struct {
 
 func (x *ConfirmBookingRequest) Reset() {
 	*x = ConfirmBookingRequest{}
-	mi := &file_proto_inventory_proto_msgTypes[7]
+	mi := &file_proto_inventory_proto_msgTypes[10]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -552,7 +741,7 @@ func (x *ConfirmBookingRequest) String() string {
 func (*ConfirmBookingRequest) ProtoMessage() {}
 
 func (x *ConfirmBookingRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_inventory_proto_msgTypes[7]
+	mi := &file_proto_inventory_proto_msgTypes[10]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -565,7 +754,7 @@ func (x *ConfirmBookingRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ConfirmBookingRequest.ProtoReflect.Descriptor instead.
 func (*ConfirmBookingRequest) Descriptor() ([]byte, []int) {
-	return file_proto_inventory_proto_rawDescGZIP(), []int{7}
+	return file_proto_inventory_proto_rawDescGZIP(), []int{10}
 }
 
 func (x *ConfirmBookingRequest) GetReservationId() string {
@@ -600,7 +789,7 @@ type ConfirmBookingResponse struct {
 
 func (x *ConfirmBookingResponse) Reset() {
 	*x = ConfirmBookingResponse{}
-	mi := &file_proto_inventory_proto_msgTypes[8]
+	mi := &file_proto_inventory_proto_msgTypes[11]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -612,7 +801,7 @@ func (x *ConfirmBookingResponse) String() string {
 func (*ConfirmBookingResponse) ProtoMessage() {}
 
 func (x *ConfirmBookingResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_inventory_proto_msgTypes[8]
+	mi := &file_proto_inventory_proto_msgTypes[11]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -625,7 +814,7 @@ func (x *ConfirmBookingResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ConfirmBookingResponse.ProtoReflect.Descriptor instead.
 func (*ConfirmBookingResponse) Descriptor() ([]byte, []int) {
-	return file_proto_inventory_proto_rawDescGZIP(), []int{8}
+	return file_proto_inventory_proto_rawDescGZIP(), []int{11}
 }
 
 func (x *ConfirmBookingResponse) GetSuccess() bool {
@@ -660,7 +849,7 @@ type CancelBookingRequest struct {
 
 func (x *CancelBookingRequest) Reset() {
 	*x = CancelBookingRequest{}
-	mi := &file_proto_inventory_proto_msgTypes[9]
+	mi := &file_proto_inventory_proto_msgTypes[12]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -672,7 +861,7 @@ func (x *CancelBookingRequest) String() string {
 func (*CancelBookingRequest) ProtoMessage() {}
 
 func (x *CancelBookingRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_inventory_proto_msgTypes[9]
+	mi := &file_proto_inventory_proto_msgTypes[12]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -685,7 +874,7 @@ func (x *CancelBookingRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CancelBookingRequest.ProtoReflect.Descriptor instead.
 func (*CancelBookingRequest) Descriptor() ([]byte, []int) {
-	return file_proto_inventory_proto_rawDescGZIP(), []int{9}
+	return file_proto_inventory_proto_rawDescGZIP(), []int{12}
 }
 
 func (x *CancelBookingRequest) GetBookingId() string {
@@ -712,7 +901,7 @@ type CancelBookingResponse struct {
 
 func (x *CancelBookingResponse) Reset() {
 	*x = CancelBookingResponse{}
-	mi := &file_proto_inventory_proto_msgTypes[10]
+	mi := &file_proto_inventory_proto_msgTypes[13]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -724,7 +913,7 @@ func (x *CancelBookingResponse) String() string {
 func (*CancelBookingResponse) ProtoMessage() {}
 
 func (x *CancelBookingResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_inventory_proto_msgTypes[10]
+	mi := &file_proto_inventory_proto_msgTypes[13]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -737,7 +926,7 @@ func (x *CancelBookingResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CancelBookingResponse.ProtoReflect.Descriptor instead.
 func (*CancelBookingResponse) Descriptor() ([]byte, []int) {
-	return file_proto_inventory_proto_rawDescGZIP(), []int{10}
+	return file_proto_inventory_proto_rawDescGZIP(), []int{13}
 }
 
 func (x *CancelBookingResponse) GetSuccess() bool {
@@ -766,7 +955,7 @@ type InitializeSeatsRequest struct {
 
 func (x *InitializeSeatsRequest) Reset() {
 	*x = InitializeSeatsRequest{}
-	mi := &file_proto_inventory_proto_msgTypes[11]
+	mi := &file_proto_inventory_proto_msgTypes[14]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -778,7 +967,7 @@ func (x *InitializeSeatsRequest) String() string {
 func (*InitializeSeatsRequest) ProtoMessage() {}
 
 func (x *InitializeSeatsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_inventory_proto_msgTypes[11]
+	mi := &file_proto_inventory_proto_msgTypes[14]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -791,7 +980,7 @@ func (x *InitializeSeatsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use InitializeSeatsRequest.ProtoReflect.Descriptor instead.
 func (*InitializeSeatsRequest) Descriptor() ([]byte, []int) {
-	return file_proto_inventory_proto_rawDescGZIP(), []int{11}
+	return file_proto_inventory_proto_rawDescGZIP(), []int{14}
 }
 
 func (x *InitializeSeatsRequest) GetEventId() string {
@@ -826,7 +1015,7 @@ type InitializeSeatsResponse struct {
 
 func (x *InitializeSeatsResponse) Reset() {
 	*x = InitializeSeatsResponse{}
-	mi := &file_proto_inventory_proto_msgTypes[12]
+	mi := &file_proto_inventory_proto_msgTypes[15]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -838,7 +1027,7 @@ func (x *InitializeSeatsResponse) String() string {
 func (*InitializeSeatsResponse) ProtoMessage() {}
 
 func (x *InitializeSeatsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_inventory_proto_msgTypes[12]
+	mi := &file_proto_inventory_proto_msgTypes[15]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -851,7 +1040,7 @@ func (x *InitializeSeatsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use InitializeSeatsResponse.ProtoReflect.Descriptor instead.
 func (*InitializeSeatsResponse) Descriptor() ([]byte, []int) {
-	return file_proto_inventory_proto_rawDescGZIP(), []int{12}
+	return file_proto_inventory_proto_rawDescGZIP(), []int{15}
 }
 
 func (x *InitializeSeatsResponse) GetSuccess() bool {
@@ -907,7 +1096,21 @@ const file_proto_inventory_proto_rawDesc = "" +
 	"\asuccess\x18\x01 \x01(\bR\asuccess\x12\x18\n" +
 	"\amessage\x18\x02 \x01(\tR\amessage\x12#\n" +
 	"\x04seat\x18\x03 \x01(\v2\x0f.inventory.SeatR\x04seat\x12%\n" +
-	"\x0ereservation_id\x18\x04 \x01(\tR\rreservationId\"i\n" +
+	"\x0ereservation_id\x18\x04 \x01(\tR\rreservationId\"l\n" +
+	"\x13ReserveSeatsRequest\x12\x19\n" +
+	"\bevent_id\x18\x01 \x01(\tR\aeventId\x12!\n" +
+	"\fseat_numbers\x18\x02 \x03(\tR\vseatNumbers\x12\x17\n" +
+	"\auser_id\x18\x03 \x01(\tR\x06userId\"o\n" +
+	"\x0fSeatReservation\x12\x1f\n" +
+	"\vseat_number\x18\x01 \x01(\tR\n" +
+	"seatNumber\x12%\n" +
+	"\x0ereservation_id\x18\x02 \x01(\tR\rreservationId\x12\x14\n" +
+	"\x05price\x18\x03 \x01(\x01R\x05price\"\xb7\x01\n" +
+	"\x14ReserveSeatsResponse\x12\x18\n" +
+	"\asuccess\x18\x01 \x01(\bR\asuccess\x12\x18\n" +
+	"\amessage\x18\x02 \x01(\tR\amessage\x12>\n" +
+	"\freservations\x18\x03 \x03(\v2\x1a.inventory.SeatReservationR\freservations\x12+\n" +
+	"\x11unavailable_seats\x18\x04 \x03(\tR\x10unavailableSeats\"i\n" +
 	"\x12ReleaseSeatRequest\x12\x19\n" +
 	"\bevent_id\x18\x01 \x01(\tR\aeventId\x12\x1f\n" +
 	"\vseat_number\x18\x02 \x01(\tR\n" +
@@ -947,10 +1150,11 @@ const file_proto_inventory_proto_rawDesc = "" +
 	"\tAVAILABLE\x10\x00\x12\f\n" +
 	"\bRESERVED\x10\x01\x12\n" +
 	"\n" +
-	"\x06BOOKED\x10\x022\xf8\x03\n" +
+	"\x06BOOKED\x10\x022\xc9\x04\n" +
 	"\x10InventoryService\x12C\n" +
 	"\bGetSeats\x12\x1a.inventory.GetSeatsRequest\x1a\x1b.inventory.GetSeatsResponse\x12L\n" +
-	"\vReserveSeat\x12\x1d.inventory.ReserveSeatRequest\x1a\x1e.inventory.ReserveSeatResponse\x12L\n" +
+	"\vReserveSeat\x12\x1d.inventory.ReserveSeatRequest\x1a\x1e.inventory.ReserveSeatResponse\x12O\n" +
+	"\fReserveSeats\x12\x1e.inventory.ReserveSeatsRequest\x1a\x1f.inventory.ReserveSeatsResponse\x12L\n" +
 	"\vReleaseSeat\x12\x1d.inventory.ReleaseSeatRequest\x1a\x1e.inventory.ReleaseSeatResponse\x12U\n" +
 	"\x0eConfirmBooking\x12 .inventory.ConfirmBookingRequest\x1a!.inventory.ConfirmBookingResponse\x12R\n" +
 	"\rCancelBooking\x12\x1f.inventory.CancelBookingRequest\x1a .inventory.CancelBookingResponse\x12X\n" +
@@ -969,7 +1173,7 @@ func file_proto_inventory_proto_rawDescGZIP() []byte {
 }
 
 var file_proto_inventory_proto_enumTypes = make([]protoimpl.EnumInfo, 1)
-var file_proto_inventory_proto_msgTypes = make([]protoimpl.MessageInfo, 13)
+var file_proto_inventory_proto_msgTypes = make([]protoimpl.MessageInfo, 16)
 var file_proto_inventory_proto_goTypes = []any{
 	(SeatStatus)(0),                 // 0: inventory.SeatStatus
 	(*Seat)(nil),                    // 1: inventory.Seat
@@ -977,37 +1181,43 @@ var file_proto_inventory_proto_goTypes = []any{
 	(*GetSeatsResponse)(nil),        // 3: inventory.GetSeatsResponse
 	(*ReserveSeatRequest)(nil),      // 4: inventory.ReserveSeatRequest
 	(*ReserveSeatResponse)(nil),     // 5: inventory.ReserveSeatResponse
-	(*ReleaseSeatRequest)(nil),      // 6: inventory.ReleaseSeatRequest
-	(*ReleaseSeatResponse)(nil),     // 7: inventory.ReleaseSeatResponse
-	(*ConfirmBookingRequest)(nil),   // 8: inventory.ConfirmBookingRequest
-	(*ConfirmBookingResponse)(nil),  // 9: inventory.ConfirmBookingResponse
-	(*CancelBookingRequest)(nil),    // 10: inventory.CancelBookingRequest
-	(*CancelBookingResponse)(nil),   // 11: inventory.CancelBookingResponse
-	(*InitializeSeatsRequest)(nil),  // 12: inventory.InitializeSeatsRequest
-	(*InitializeSeatsResponse)(nil), // 13: inventory.InitializeSeatsResponse
+	(*ReserveSeatsRequest)(nil),     // 6: inventory.ReserveSeatsRequest
+	(*SeatReservation)(nil),         // 7: inventory.SeatReservation
+	(*ReserveSeatsResponse)(nil),    // 8: inventory.ReserveSeatsResponse
+	(*ReleaseSeatRequest)(nil),      // 9: inventory.ReleaseSeatRequest
+	(*ReleaseSeatResponse)(nil),     // 10: inventory.ReleaseSeatResponse
+	(*ConfirmBookingRequest)(nil),   // 11: inventory.ConfirmBookingRequest
+	(*ConfirmBookingResponse)(nil),  // 12: inventory.ConfirmBookingResponse
+	(*CancelBookingRequest)(nil),    // 13: inventory.CancelBookingRequest
+	(*CancelBookingResponse)(nil),   // 14: inventory.CancelBookingResponse
+	(*InitializeSeatsRequest)(nil),  // 15: inventory.InitializeSeatsRequest
+	(*InitializeSeatsResponse)(nil), // 16: inventory.InitializeSeatsResponse
 }
 var file_proto_inventory_proto_depIdxs = []int32{
 	0,  // 0: inventory.Seat.status:type_name -> inventory.SeatStatus
 	0,  // 1: inventory.GetSeatsRequest.status_filter:type_name -> inventory.SeatStatus
 	1,  // 2: inventory.GetSeatsResponse.seats:type_name -> inventory.Seat
 	1,  // 3: inventory.ReserveSeatResponse.seat:type_name -> inventory.Seat
-	2,  // 4: inventory.InventoryService.GetSeats:input_type -> inventory.GetSeatsRequest
-	4,  // 5: inventory.InventoryService.ReserveSeat:input_type -> inventory.ReserveSeatRequest
-	6,  // 6: inventory.InventoryService.ReleaseSeat:input_type -> inventory.ReleaseSeatRequest
-	8,  // 7: inventory.InventoryService.ConfirmBooking:input_type -> inventory.ConfirmBookingRequest
-	10, // 8: inventory.InventoryService.CancelBooking:input_type -> inventory.CancelBookingRequest
-	12, // 9: inventory.InventoryService.InitializeSeats:input_type -> inventory.InitializeSeatsRequest
-	3,  // 10: inventory.InventoryService.GetSeats:output_type -> inventory.GetSeatsResponse
-	5,  // 11: inventory.InventoryService.ReserveSeat:output_type -> inventory.ReserveSeatResponse
-	7,  // 12: inventory.InventoryService.ReleaseSeat:output_type -> inventory.ReleaseSeatResponse
-	9,  // 13: inventory.InventoryService.ConfirmBooking:output_type -> inventory.ConfirmBookingResponse
-	11, // 14: inventory.InventoryService.CancelBooking:output_type -> inventory.CancelBookingResponse
-	13, // 15: inventory.InventoryService.InitializeSeats:output_type -> inventory.InitializeSeatsResponse
-	10, // [10:16] is the sub-list for method output_type
-	4,  // [4:10] is the sub-list for method input_type
-	4,  // [4:4] is the sub-list for extension type_name
-	4,  // [4:4] is the sub-list for extension extendee
-	0,  // [0:4] is the sub-list for field type_name
+	7,  // 4: inventory.ReserveSeatsResponse.reservations:type_name -> inventory.SeatReservation
+	2,  // 5: inventory.InventoryService.GetSeats:input_type -> inventory.GetSeatsRequest
+	4,  // 6: inventory.InventoryService.ReserveSeat:input_type -> inventory.ReserveSeatRequest
+	6,  // 7: inventory.InventoryService.ReserveSeats:input_type -> inventory.ReserveSeatsRequest
+	9,  // 8: inventory.InventoryService.ReleaseSeat:input_type -> inventory.ReleaseSeatRequest
+	11, // 9: inventory.InventoryService.ConfirmBooking:input_type -> inventory.ConfirmBookingRequest
+	13, // 10: inventory.InventoryService.CancelBooking:input_type -> inventory.CancelBookingRequest
+	15, // 11: inventory.InventoryService.InitializeSeats:input_type -> inventory.InitializeSeatsRequest
+	3,  // 12: inventory.InventoryService.GetSeats:output_type -> inventory.GetSeatsResponse
+	5,  // 13: inventory.InventoryService.ReserveSeat:output_type -> inventory.ReserveSeatResponse
+	8,  // 14: inventory.InventoryService.ReserveSeats:output_type -> inventory.ReserveSeatsResponse
+	10, // 15: inventory.InventoryService.ReleaseSeat:output_type -> inventory.ReleaseSeatResponse
+	12, // 16: inventory.InventoryService.ConfirmBooking:output_type -> inventory.ConfirmBookingResponse
+	14, // 17: inventory.InventoryService.CancelBooking:output_type -> inventory.CancelBookingResponse
+	16, // 18: inventory.InventoryService.InitializeSeats:output_type -> inventory.InitializeSeatsResponse
+	12, // [12:19] is the sub-list for method output_type
+	5,  // [5:12] is the sub-list for method input_type
+	5,  // [5:5] is the sub-list for extension type_name
+	5,  // [5:5] is the sub-list for extension extendee
+	0,  // [0:5] is the sub-list for field type_name
 }
 
 func init() { file_proto_inventory_proto_init() }
@@ -1021,7 +1231,7 @@ func file_proto_inventory_proto_init() {
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_proto_inventory_proto_rawDesc), len(file_proto_inventory_proto_rawDesc)),
 			NumEnums:      1,
-			NumMessages:   13,
+			NumMessages:   16,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
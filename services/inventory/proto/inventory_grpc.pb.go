@@ -22,6 +22,7 @@ const _ = grpc.SupportPackageIsVersion9
 const (
 	InventoryService_GetSeats_FullMethodName        = "/inventory.InventoryService/GetSeats"
 	InventoryService_ReserveSeat_FullMethodName     = "/inventory.InventoryService/ReserveSeat"
+	InventoryService_ReserveSeats_FullMethodName    = "/inventory.InventoryService/ReserveSeats"
 	InventoryService_ReleaseSeat_FullMethodName     = "/inventory.InventoryService/ReleaseSeat"
 	InventoryService_ConfirmBooking_FullMethodName  = "/inventory.InventoryService/ConfirmBooking"
 	InventoryService_CancelBooking_FullMethodName   = "/inventory.InventoryService/CancelBooking"
@@ -38,6 +39,8 @@ type InventoryServiceClient interface {
 	GetSeats(ctx context.Context, in *GetSeatsRequest, opts ...grpc.CallOption) (*GetSeatsResponse, error)
 	// 좌석 예약 (분산 락 사용)
 	ReserveSeat(ctx context.Context, in *ReserveSeatRequest, opts ...grpc.CallOption) (*ReserveSeatResponse, error)
+	// 여러 좌석 일괄 예약 (모두 예약되거나 하나도 예약되지 않음)
+	ReserveSeats(ctx context.Context, in *ReserveSeatsRequest, opts ...grpc.CallOption) (*ReserveSeatsResponse, error)
 	// 좌석 예약 해제
 	ReleaseSeat(ctx context.Context, in *ReleaseSeatRequest, opts ...grpc.CallOption) (*ReleaseSeatResponse, error)
 	// 예약 확정 (결제 완료 후)
@@ -76,6 +79,16 @@ func (c *inventoryServiceClient) ReserveSeat(ctx context.Context, in *ReserveSea
 	return out, nil
 }
 
+func (c *inventoryServiceClient) ReserveSeats(ctx context.Context, in *ReserveSeatsRequest, opts ...grpc.CallOption) (*ReserveSeatsResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(ReserveSeatsResponse)
+	err := c.cc.Invoke(ctx, InventoryService_ReserveSeats_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *inventoryServiceClient) ReleaseSeat(ctx context.Context, in *ReleaseSeatRequest, opts ...grpc.CallOption) (*ReleaseSeatResponse, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(ReleaseSeatResponse)
@@ -126,6 +139,8 @@ type InventoryServiceServer interface {
 	GetSeats(context.Context, *GetSeatsRequest) (*GetSeatsResponse, error)
 	// 좌석 예약 (분산 락 사용)
 	ReserveSeat(context.Context, *ReserveSeatRequest) (*ReserveSeatResponse, error)
+	// 여러 좌석 일괄 예약 (모두 예약되거나 하나도 예약되지 않음)
+	ReserveSeats(context.Context, *ReserveSeatsRequest) (*ReserveSeatsResponse, error)
 	// 좌석 예약 해제
 	ReleaseSeat(context.Context, *ReleaseSeatRequest) (*ReleaseSeatResponse, error)
 	// 예약 확정 (결제 완료 후)
@@ -150,6 +165,9 @@ func (UnimplementedInventoryServiceServer) GetSeats(context.Context, *GetSeatsRe
 func (UnimplementedInventoryServiceServer) ReserveSeat(context.Context, *ReserveSeatRequest) (*ReserveSeatResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method ReserveSeat not implemented")
 }
+func (UnimplementedInventoryServiceServer) ReserveSeats(context.Context, *ReserveSeatsRequest) (*ReserveSeatsResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method ReserveSeats not implemented")
+}
 func (UnimplementedInventoryServiceServer) ReleaseSeat(context.Context, *ReleaseSeatRequest) (*ReleaseSeatResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method ReleaseSeat not implemented")
 }
@@ -219,6 +237,24 @@ func _InventoryService_ReserveSeat_Handler(srv interface{}, ctx context.Context,
 	return interceptor(ctx, in, info, handler)
 }
 
+func _InventoryService_ReserveSeats_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(ReserveSeatsRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(InventoryServiceServer).ReserveSeats(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: InventoryService_ReserveSeats_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(InventoryServiceServer).ReserveSeats(ctx, req.(*ReserveSeatsRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _InventoryService_ReleaseSeat_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(ReleaseSeatRequest)
 	if err := dec(in); err != nil {
@@ -306,6 +342,10 @@ var InventoryService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "ReserveSeat",
 			Handler:    _InventoryService_ReserveSeat_Handler,
 		},
+		{
+			MethodName: "ReserveSeats",
+			Handler:    _InventoryService_ReserveSeats_Handler,
+		},
 		{
 			MethodName: "ReleaseSeat",
 			Handler:    _InventoryService_ReleaseSeat_Handler,
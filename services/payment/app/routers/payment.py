@@ -1,4 +1,5 @@
 import logging
+import os
 import uuid
 from datetime import datetime
 from typing import Optional
@@ -6,6 +7,7 @@ from typing import Optional
 import httpx
 from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
 
+from app.auth import get_current_user_id, service_auth_headers
 from app.schemas import PaymentCreate, PaymentIntent, PaymentResponse, PaymentStatus, RefundRequest, RefundResponse
 from app.stripe_service import get_stripe_service
 
@@ -16,11 +18,6 @@ logger = logging.getLogger(__name__)
 payments_db = {}
 
 
-async def get_current_user_id() -> str:
-    """임시 사용자 ID"""
-    return "user-123"
-
-
 @router.post("/create-intent", response_model=PaymentIntent)
 async def create_payment_intent(payment_data: PaymentCreate, user_id: str = Depends(get_current_user_id)):
     """결제 Intent 생성 (Stripe)"""
@@ -137,13 +134,16 @@ async def refund_payment(payment_id: str, refund_data: RefundRequest, user_id: s
 
 
 async def notify_booking_service(booking_id: str, payment_id: str):
-    """Booking Service에 결제 완료 알림"""
-    booking_service_url = "http://booking-service:8000"
+    """Booking Service에 결제 완료 알림 (게이트웨이를 거치지 않으므로 서비스 주체로 서명)"""
+    booking_service_url = os.getenv("BOOKING_SERVICE_URL", "http://booking-service:8000")
 
     try:
         async with httpx.AsyncClient() as client:
             response = await client.post(
-                f"{booking_service_url}/bookings/{booking_id}/confirm", json={"payment_id": payment_id}
+                f"{booking_service_url}/bookings/{booking_id}/confirm",
+                json={"payment_id": payment_id},
+                # 웹훅 재전송/재시도에도 확정은 한 번만 실행된다
+                headers={**service_auth_headers("payment"), "Idempotency-Key": f"confirm:{payment_id}"},
             )
             response.raise_for_status()
             logger.info(f"Notified Booking Service for booking {booking_id}")
@@ -216,3 +216,54 @@ async def test_multiple_payment_intents():
             assert response1.status_code == 200
             assert response2.status_code == 200
             assert response1.json()["payment_intent_id"] != response2.json()["payment_intent_id"]
+
+
+@pytest.mark.asyncio
+async def test_webhook_confirms_booking_as_payment_service(mock_stripe):
+    """Test a succeeded webhook confirms the booking with service headers that booking-service's verifier accepts"""
+    import httpx
+
+    from app.auth import SERVICE_ROLE, get_current_user_id
+    from app.routers.payment import payments_db
+    from app.schemas import PaymentStatus
+
+    payments_db["pay_123"] = {
+        "payment_id": "pay_123",
+        "booking_id": "book_123",
+        "status": PaymentStatus.PENDING,
+        "stripe_payment_intent_id": "pi_test123",
+    }
+    confirms = []
+
+    def booking_service(request: httpx.Request) -> httpx.Response:
+        confirms.append(request)
+        return httpx.Response(200, json={"booking_id": "book_123", "status": "confirmed"})
+
+    client_class = httpx.AsyncClient
+
+    def booking_client() -> httpx.AsyncClient:
+        return client_class(transport=httpx.MockTransport(booking_service))
+
+    try:
+        with patch("app.routers.payment.httpx.AsyncClient", booking_client):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post(
+                    "/payments/webhook", headers={"stripe-signature": "test_signature"}, content=b"{}"
+                )
+    finally:
+        payments_db.pop("pay_123")
+
+    assert response.status_code == 200
+    [request] = confirms
+    assert request.url.path == "/bookings/book_123/confirm"
+    assert request.headers["Idempotency-Key"] == "confirm:pay_123"
+    # app/auth.py는 서비스 간 같은 파일이므로 Booking Service와 같은 검증을 통과해야 한다
+    assert request.headers["X-User-Role"] == SERVICE_ROLE
+    caller = await get_current_user_id(
+        request.headers["X-User-Id"],
+        request.headers["X-User-Email"],
+        request.headers["X-User-Role"],
+        request.headers["X-Auth-Timestamp"],
+        request.headers["X-Auth-Signature"],
+    )
+    assert caller == "service:payment"
@@ -0,0 +1 @@
+# Queue Service Application
@@ -0,0 +1,78 @@
+import hashlib
+import hmac
+import os
+import time
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, status
+
+# API Gateway가 JWT를 검증한 뒤 서명해서 전달하는 사용자 헤더 (api-gateway/app/auth.py)
+# services/{booking,events,payment,queue}/app/auth.py는 같은 파일이다: 함께 수정한다 (CI에서 비교)
+INTERNAL_AUTH_SECRET = os.getenv(
+    "INTERNAL_AUTH_SECRET", os.getenv("JWT_SECRET", "your-secret-key-change-in-production")
+)
+# 게이트웨이 서명 시각과 허용하는 최대 차이(초)
+INTERNAL_AUTH_MAX_AGE = int(os.getenv("INTERNAL_AUTH_MAX_AGE_SECONDS", "60"))
+# 서비스 간 호출(예: 결제 웹훅 → 예약 확정)의 역할. 인증 서비스의 사용자 역할(admin/user/organizer)에 없으므로
+# 게이트웨이를 거친 사용자 요청으로는 만들 수 없다.
+SERVICE_ROLE = "service"
+
+
+def sign_internal(user_id: str, email: str, role: str, timestamp: str) -> str:
+    """내부 헤더 서명 (HMAC-SHA256, api-gateway/app/auth.py의 sign_claims와 같은 형식)"""
+    message = "\n".join([user_id, email, role, timestamp]).encode()
+    return hmac.new(INTERNAL_AUTH_SECRET.encode(), message, hashlib.sha256).hexdigest()
+
+
+def verify_internal_signature(user_id: str, email: str, role: str, timestamp: str, signature: str) -> bool:
+    """게이트웨이 서명 검증 (HMAC-SHA256 + 서명 시각)"""
+    try:
+        age = abs(time.time() - int(timestamp))
+    except ValueError:
+        return False
+    if age > INTERNAL_AUTH_MAX_AGE:
+        return False
+
+    return hmac.compare_digest(sign_internal(user_id, email, role, timestamp), signature)
+
+
+def service_auth_headers(service: str) -> dict[str, str]:
+    """다른 서비스를 직접 호출할 때 붙이는 서명된 서비스 주체 헤더 (사용자 ID는 service:<서비스 이름>)"""
+    user_id = f"service:{service}"
+    timestamp = str(int(time.time()))
+    return {
+        "X-User-Id": user_id,
+        "X-User-Email": "",
+        "X-User-Role": SERVICE_ROLE,
+        "X-Auth-Timestamp": timestamp,
+        "X-Auth-Signature": sign_internal(user_id, "", SERVICE_ROLE, timestamp),
+    }
+
+
+async def get_current_user_id(
+    x_user_id: Optional[str] = Header(None),
+    x_user_email: str = Header(""),
+    x_user_role: str = Header(""),
+    x_auth_timestamp: str = Header(""),
+    x_auth_signature: str = Header(""),
+) -> str:
+    """게이트웨이가 검증한 사용자 ID (토큰 디코딩이나 DB 조회 없음)"""
+    if not x_user_id or not verify_internal_signature(
+        x_user_id, x_user_email, x_user_role, x_auth_timestamp, x_auth_signature
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return x_user_id
+
+
+async def require_admin(
+    user_id: str = Depends(get_current_user_id),
+    x_user_role: str = Header(""),
+) -> str:
+    """관리자 전용 API (역할 헤더는 get_current_user_id에서 서명과 함께 검증됨)"""
+    if x_user_role != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin role required")
+    return user_id
@@ -0,0 +1,189 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+import redis.asyncio as redis
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.waiting_room import Progress, WaitingRoom, get_waiting_room
+
+logger = logging.getLogger(__name__)
+
+STREAM_CONNECTIONS = Gauge(
+    "queue_stream_connections",
+    "Open queue position streams (SSE) on this replica",
+)
+
+STREAM_REJECTED = Counter(
+    "queue_stream_rejected_total",
+    "Queue position streams refused because the replica reached its connection limit",
+)
+
+STREAM_UPDATES = Counter(
+    "queue_stream_updates_total",
+    "Position updates handed to stream subscribers (unchanged positions are skipped)",
+)
+
+STREAM_FANOUT_DURATION = Histogram(
+    "queue_stream_fanout_duration_seconds",
+    "Time to fan one progress snapshot out to every subscriber of an event",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+
+class Subscriber:
+    """대기 순번 스트림 연결 하나
+
+    브로드캐스터는 위치가 바뀐 구독자에게만 최신 값을 덮어쓰고 깨운다. 보내지 않은 이전 값은
+    버려지므로 느린 클라이언트도 연결당 메모리는 이 객체 하나로 고정된다.
+    """
+
+    __slots__ = ("seq", "position", "total", "admit_rate", "finished", "wakeup")
+
+    def __init__(self, seq: int, position: int):
+        self.seq = seq
+        self.position = position
+        self.total = 0
+        self.admit_rate = 0
+        self.finished = False  # 입장 차례가 지났거나 대기열이 닫힘 (정확한 상태 확인 필요)
+        self.wakeup = asyncio.Event()
+
+    def notify(self, progress: Optional[Progress]) -> bool:
+        """진행 상황 반영 (위치가 바뀌었거나 끝났으면 깨우고 True)"""
+        if progress is None:
+            self.finished = True
+        else:
+            # 추정값은 앞에서 나간 사용자만큼 클 수 있으므로 더 작은 값만 반영한다 (실제 순번은 줄어들기만 함)
+            position = min(self.position, progress.position_of(self.seq))
+            if position == self.position and position > 0:
+                return False
+            self.position = position
+            self.total = progress.total
+            self.admit_rate = progress.admit_rate
+            self.finished = position <= 0
+        self.wakeup.set()
+        return True
+
+    async def wait(self, timeout: float) -> bool:
+        """갱신을 기다림 (timeout 동안 없으면 False)"""
+        try:
+            await asyncio.wait_for(self.wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self.wakeup.clear()
+        return True
+
+
+class EventBroadcaster:
+    """이벤트 하나의 구독자에게 대기 진행 상황 전달
+
+    구독자가 있는 동안 백그라운드 태스크 하나가 interval마다 진행 상황을 한 번 읽고(구독자 수와 무관한
+    Redis 왕복 1회) 각 구독자의 위치를 로컬에서 계산한다. batch_size명마다 이벤트 루프에 양보해
+    구독자가 많아도 다른 요청 처리가 밀리지 않게 한다.
+    """
+
+    def __init__(self, room: WaitingRoom, event_id: str, interval: float = 1.0, batch_size: int = 1000):
+        self.room = room
+        self.event_id = event_id
+        self.interval = interval
+        self.batch_size = batch_size
+        self.subscribers: set[Subscriber] = set()
+        self.task: Optional[asyncio.Task] = None
+
+    def subscribe(self, seq: int, position: int) -> Subscriber:
+        subscriber = Subscriber(seq, position)
+        self.subscribers.add(subscriber)
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+        if not self.subscribers and self.task is not None:
+            self.task.cancel()
+
+    async def run(self):
+        try:
+            while self.subscribers:
+                try:
+                    progress = await self.room.progress(self.event_id)
+                except redis.RedisError as e:
+                    logger.warning(f"Queue progress read failed for {self.event_id}: {e}")
+                else:
+                    await self.fan_out(progress)
+                await asyncio.sleep(self.interval)
+        finally:
+            self.task = None
+
+    async def fan_out(self, progress: Optional[Progress]) -> int:
+        """모든 구독자에게 진행 상황 반영 (깨운 구독자 수 반환)"""
+        start_time = time.perf_counter()
+        notified = 0
+        for index, subscriber in enumerate(list(self.subscribers), 1):
+            if subscriber.notify(progress):
+                notified += 1
+            if index % self.batch_size == 0:
+                await asyncio.sleep(0)
+
+        STREAM_UPDATES.inc(notified)
+        STREAM_FANOUT_DURATION.observe(time.perf_counter() - start_time)
+        return notified
+
+
+class StreamHub:
+    """레플리카의 이벤트별 브로드캐스터와 연결 수 한도 관리"""
+
+    def __init__(self, room: WaitingRoom, interval: float = 1.0, batch_size: int = 1000, max_connections: int = 20000):
+        self.room = room
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_connections = max_connections
+        self.connections = 0
+        self.broadcasters: dict[str, EventBroadcaster] = {}
+
+    def subscribe(self, event_id: str, seq: int, position: int) -> Optional[Subscriber]:
+        """구독 등록 (연결 수 한도를 넘으면 None, 클라이언트는 폴링으로 대체)"""
+        if self.connections >= self.max_connections:
+            STREAM_REJECTED.inc()
+            return None
+
+        broadcaster = self.broadcasters.get(event_id)
+        if broadcaster is None:
+            broadcaster = self.broadcasters[event_id] = EventBroadcaster(
+                self.room, event_id, self.interval, self.batch_size
+            )
+        self.connections += 1
+        STREAM_CONNECTIONS.set(self.connections)
+        return broadcaster.subscribe(seq, position)
+
+    def unsubscribe(self, event_id: str, subscriber: Subscriber):
+        broadcaster = self.broadcasters.get(event_id)
+        if broadcaster is None or subscriber not in broadcaster.subscribers:
+            return
+
+        broadcaster.unsubscribe(subscriber)
+        self.connections -= 1
+        STREAM_CONNECTIONS.set(self.connections)
+        if not broadcaster.subscribers:
+            del self.broadcasters[event_id]
+
+
+# Global instance
+_stream_hub: Optional[StreamHub] = None
+
+
+def get_stream_hub() -> StreamHub:
+    """Get stream hub instance"""
+    global _stream_hub
+
+    if _stream_hub is None:
+        _stream_hub = StreamHub(
+            get_waiting_room(),
+            interval=float(os.getenv("QUEUE_STREAM_INTERVAL_SECONDS", "1")),
+            batch_size=int(os.getenv("QUEUE_STREAM_FANOUT_BATCH", "1000")),
+            max_connections=int(os.getenv("QUEUE_STREAM_MAX_CONNECTIONS", "20000")),
+        )
+
+    return _stream_hub
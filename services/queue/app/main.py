@@ -0,0 +1,146 @@
+import asyncio
+import contextlib
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+
+from app.routers import queue
+from app.schemas import HealthResponse
+from app.waiting_room import get_waiting_room
+
+logging.basicConfig(
+    level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper()),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+REQUEST_COUNT = Counter(
+    "http_requests_total",
+    "Total HTTP requests",
+    ["method", "endpoint", "status"],
+)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request duration in seconds",
+    ["method", "endpoint"],
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작 및 종료"""
+    logger.info("Starting Queue Service...")
+
+    # 배치 입장 루프 (레플리카마다 실행되지만 이벤트별 tick 잠금으로 한 곳만 입장시킨다)
+    waiting_room = get_waiting_room()
+    admission_task = asyncio.create_task(waiting_room.run(float(os.getenv("QUEUE_ADMIT_INTERVAL_SECONDS", "1"))))
+
+    yield
+
+    admission_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await admission_task
+    await waiting_room.client.aclose()
+    logger.info("Shutting down Queue Service...")
+
+
+app = FastAPI(
+    title="Queue Service",
+    description="가상 대기열 서비스",
+    version="1.0.0",
+    lifespan=lifespan,
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=os.getenv("CORS_ORIGINS", "*").split(","),
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+@app.middleware("http")
+async def log_requests(request: Request, call_next):
+    start_time = time.time()
+    response = await call_next(request)
+    duration = time.time() - start_time
+
+    REQUEST_COUNT.labels(
+        method=request.method,
+        endpoint=request.url.path,
+        status=response.status_code,
+    ).inc()
+
+    REQUEST_DURATION.labels(
+        method=request.method,
+        endpoint=request.url.path,
+    ).observe(duration)
+
+    logger.info(f"{request.method} {request.url.path} - Status: {response.status_code} - Duration: {duration:.3f}s")
+
+    return response
+
+
+@app.exception_handler(Exception)
+async def global_exception_handler(request: Request, exc: Exception):
+    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error"},
+    )
+
+
+app.include_router(queue.router)
+
+
+@app.get("/health", response_model=HealthResponse)
+async def health():
+    return HealthResponse(
+        status="healthy",
+        service="queue-service",
+        timestamp=datetime.utcnow(),
+    )
+
+
+@app.get("/ready", response_model=HealthResponse)
+async def ready():
+    return HealthResponse(
+        status="ready",
+        service="queue-service",
+        timestamp=datetime.utcnow(),
+    )
+
+
+@app.get("/metrics")
+async def metrics():
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/")
+async def root():
+    return {
+        "service": "Queue Service",
+        "version": "1.0.0",
+        "status": "running",
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=os.getenv("ENVIRONMENT") != "production",
+        log_level=os.getenv("LOG_LEVEL", "info").lower(),
+    )
@@ -0,0 +1,161 @@
+import math
+import os
+from datetime import datetime, timezone
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.auth import get_current_user_id, require_admin
+from app.broadcaster import StreamHub, get_stream_hub
+from app.schemas import QueueJoin, QueueOpen, QueueStatsResponse, QueueStatusResponse
+from app.tokens import issue_admission_token, issue_queue_token, verify_queue_token
+from app.waiting_room import NOT_QUEUED, READY, WAITING, Position, WaitingRoom, get_waiting_room
+
+router = APIRouter(prefix="/queue", tags=["queue"])
+
+# 갱신이 없을 때 보내는 SSE 주석 주기(초): 프록시/로드 밸런서의 유휴 타임아웃보다 짧아야 한다
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("QUEUE_STREAM_HEARTBEAT_SECONDS", "15"))
+
+
+def status_response(event_id: str, user_id: str, position: Position, queue_token: bool) -> QueueStatusResponse:
+    """대기열 조회 결과를 응답으로 변환 (입장 허용이면 입장 토큰 발급)"""
+    response = QueueStatusResponse(
+        event_id=event_id,
+        status=position.status,
+        queue_position=position.position,
+        total_in_queue=position.total,
+        estimated_wait_time=position.estimated_wait_seconds,
+        queue_token=issue_queue_token(user_id, event_id) if queue_token else None,
+        can_proceed=position.status != WAITING,
+    )
+    if position.status == READY:
+        response.admission_token = issue_admission_token(user_id, event_id, position.admission_expires_at)
+        response.admission_expires_at = datetime.fromtimestamp(position.admission_expires_at, tz=timezone.utc)
+    return response
+
+
+@router.post("/join", response_model=QueueStatusResponse)
+async def join_queue(data: QueueJoin, user_id: str = Depends(get_current_user_id)):
+    """대기열 참가 (대기열이 없는 이벤트는 바로 진행 가능)"""
+    position = await get_waiting_room().join(data.event_id, user_id)
+    return status_response(data.event_id, user_id, position, queue_token=True)
+
+
+@router.get("/status/{event_id}", response_model=QueueStatusResponse)
+async def get_queue_status(event_id: str, user_id: str = Depends(get_current_user_id)):
+    """대기 순번 조회 (ZRANK, O(log n))"""
+    position = await get_waiting_room().status(event_id, user_id)
+    if position.status == NOT_QUEUED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not in queue")
+    return status_response(event_id, user_id, position, queue_token=False)
+
+
+def sse(event: str, data: str) -> bytes:
+    return f"event: {event}\ndata: {data}\n\n".encode()
+
+
+async def queue_events(
+    room: WaitingRoom,
+    hub: StreamHub,
+    event_id: str,
+    user_id: str,
+    position: Position,
+    heartbeat: float = STREAM_HEARTBEAT_SECONDS,
+) -> AsyncIterator[bytes]:
+    """대기 순번 SSE 이벤트
+
+    처음과 마지막에는 전체 상태(status 이벤트)를, 그 사이에는 위치가 바뀔 때만 작은 position
+    이벤트를 보낸다. 입장 차례가 지나거나 대기열이 닫히면 정확한 상태를 다시 조회해 입장 토큰과 함께
+    보내고 스트림을 끝낸다.
+    """
+    yield b"retry: 5000\n\n"
+    yield sse("status", status_response(event_id, user_id, position, queue_token=False).model_dump_json())
+    if position.status != WAITING:
+        return
+
+    seq = await room.sequence(event_id, user_id)
+    subscriber = hub.subscribe(event_id, seq, position.position) if seq is not None else None
+    if subscriber is None:
+        return
+
+    try:
+        while True:
+            if not await subscriber.wait(heartbeat):
+                yield b": ping\n\n"
+                continue
+
+            if subscriber.finished:
+                position = await room.status(event_id, user_id)
+                if position.status != WAITING:
+                    if position.status != NOT_QUEUED:
+                        response = status_response(event_id, user_id, position, queue_token=False)
+                        yield sse("status", response.model_dump_json())
+                    return
+                subscriber.position, subscriber.finished = position.position, False
+
+            wait_seconds = math.ceil(subscriber.position / subscriber.admit_rate) if subscriber.admit_rate else 0
+            yield sse(
+                "position",
+                f'{{"queue_position":{subscriber.position},"total_in_queue":{subscriber.total},'
+                f'"estimated_wait_time":{wait_seconds}}}',
+            )
+    finally:
+        hub.unsubscribe(event_id, subscriber)
+
+
+@router.get("/stream/{event_id}")
+async def stream_queue_status(event_id: str, token: str = Query(..., min_length=1)):
+    """대기 순번 SSE 스트림 (EventSource는 헤더를 보낼 수 없으므로 join에서 받은 queue_token으로 인증)"""
+    verified = verify_queue_token(token)
+    if verified is None or verified[1] != event_id:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid queue token")
+    user_id = verified[0]
+
+    room = get_waiting_room()
+    position = await room.status(event_id, user_id)
+    if position.status == NOT_QUEUED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not in queue")
+
+    hub = get_stream_hub()
+    if position.status == WAITING and hub.connections >= hub.max_connections:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Too many streams", headers={"Retry-After": "5"}
+        )
+
+    return StreamingResponse(
+        queue_events(room, hub, event_id, user_id, position),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/leave", status_code=status.HTTP_204_NO_CONTENT)
+async def leave_queue(data: QueueJoin, user_id: str = Depends(get_current_user_id)):
+    """대기열 나가기 (이미 받은 입장 허용은 유지)"""
+    await get_waiting_room().leave(data.event_id, user_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/events/{event_id}/open", response_model=QueueStatsResponse)
+async def open_queue(event_id: str, data: QueueOpen, _: str = Depends(require_admin)):
+    """이벤트 대기열 열기 또는 입장 속도 변경 (관리자)"""
+    room = get_waiting_room()
+    await room.open(event_id, data.admit_rate, data.max_active, data.admission_ttl)
+    return await room.stats(event_id)
+
+
+@router.post("/events/{event_id}/close", status_code=status.HTTP_204_NO_CONTENT)
+async def close_queue(event_id: str, _: str = Depends(require_admin)):
+    """이벤트 대기열 닫기 (관리자)"""
+    await get_waiting_room().close(event_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/events/{event_id}", response_model=QueueStatsResponse)
+async def get_queue_stats(event_id: str, _: str = Depends(require_admin)):
+    """대기/입장 인원 조회 (관리자)"""
+    stats = await get_waiting_room().stats(event_id)
+    if stats is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Queue not open")
+    return stats
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+# Queue schemas
+class QueueJoin(BaseModel):
+    event_id: str = Field(..., min_length=1, max_length=128)
+
+
+class QueueStatusResponse(BaseModel):
+    """frontend/src/types QueueStatus와 같은 형태"""
+
+    event_id: str
+    status: Literal["waiting", "ready", "open"]
+    queue_position: int  # 1부터 시작, 입장 허용/대기열 없음이면 0
+    total_in_queue: int
+    estimated_wait_time: int  # 초
+    queue_token: Optional[str] = None
+    admission_token: Optional[str] = None  # 예약 요청의 X-Admission-Token 헤더로 전달
+    admission_expires_at: Optional[datetime] = None
+    can_proceed: bool
+
+
+class QueueOpen(BaseModel):
+    admit_rate: int = Field(100, ge=1, le=100_000, description="초당 입장 인원")
+    max_active: int = Field(0, ge=0, description="동시에 입장 허용 상태인 최대 인원 (0이면 무제한)")
+    admission_ttl: int = Field(600, ge=30, le=86_400, description="입장 허용 유효 시간(초)")
+
+
+class QueueStatsResponse(BaseModel):
+    event_id: str
+    admit_rate: int
+    max_active: int
+    admission_ttl: int
+    waiting: int
+    admitted: int
+
+
+# Health check
+class HealthResponse(BaseModel):
+    status: str
+    service: str
+    timestamp: datetime
@@ -0,0 +1,43 @@
+import os
+import time
+from typing import Optional
+
+from jose import JWTError, jwt
+
+# 입장 토큰 서명 키 (api-gateway의 QUEUE_TOKEN_SECRET과 같은 값)
+QUEUE_TOKEN_SECRET = os.getenv("QUEUE_TOKEN_SECRET", "queue-token-secret-change-this")
+QUEUE_TOKEN_ALGORITHM = "HS256"
+
+# 대기열 토큰 유효 시간(초): 대기 중인 클라이언트가 상태 조회에 사용
+QUEUE_TOKEN_TTL = int(os.getenv("QUEUE_TOKEN_TTL_SECONDS", str(6 * 3600)))
+
+ADMISSION_AUDIENCE = "booking"
+QUEUE_AUDIENCE = "queue"
+
+
+def issue_admission_token(user_id: str, event_id: str, expires_at: float) -> str:
+    """입장 토큰 발급 (게이트웨이가 대기열이 열린 이벤트의 예약 요청에서 검증)"""
+    claims = {"sub": user_id, "event_id": event_id, "aud": ADMISSION_AUDIENCE, "exp": int(expires_at)}
+    return jwt.encode(claims, QUEUE_TOKEN_SECRET, algorithm=QUEUE_TOKEN_ALGORITHM)
+
+
+def issue_queue_token(user_id: str, event_id: str) -> str:
+    """대기열 토큰 발급 (대기 중임을 나타낼 뿐 예약 권한은 없음)"""
+    claims = {
+        "sub": user_id,
+        "event_id": event_id,
+        "aud": QUEUE_AUDIENCE,
+        "exp": int(time.time()) + QUEUE_TOKEN_TTL,
+    }
+    return jwt.encode(claims, QUEUE_TOKEN_SECRET, algorithm=QUEUE_TOKEN_ALGORITHM)
+
+
+def verify_queue_token(token: str) -> Optional[tuple[str, str]]:
+    """대기열 토큰 검증 (user_id, event_id), 실패하면 None"""
+    try:
+        payload = jwt.decode(token, QUEUE_TOKEN_SECRET, algorithms=[QUEUE_TOKEN_ALGORITHM], audience=QUEUE_AUDIENCE)
+    except JWTError:
+        return None
+    if not payload.get("sub") or not payload.get("event_id"):
+        return None
+    return str(payload["sub"]), str(payload["event_id"])
@@ -0,0 +1,340 @@
+import asyncio
+import logging
+import math
+import os
+import time
+from typing import Callable, Optional
+
+import redis.asyncio as redis
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+QUEUE_WAITING = Gauge(
+    "queue_waiting_users",
+    "Users waiting in the queue per event",
+    ["event_id"],
+)
+
+QUEUE_ADMITTED = Counter(
+    "queue_admitted_users_total",
+    "Users moved from the queue to the admitted set per event",
+    ["event_id"],
+)
+
+QUEUE_OPERATION_DURATION = Histogram(
+    "queue_redis_operation_duration_seconds",
+    "Waiting room Redis round trip duration by operation",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+# 대기열이 열린 이벤트 목록 (게이트웨이가 이 집합을 보고 예약 요청에 입장 토큰을 요구한다)
+GATED_EVENTS_KEY = "wr:gated"
+
+# 위치 조회/참가를 한 번의 왕복으로 처리
+# KEYS = config, queue, admitted, seq / ARGV = user_id, now_ms, enqueue(0|1)
+# 반환값 = {rank(-1 입장 허용, -2 대기열 없음, -3 대기열에 없음), 대기 인원, admit_rate, 입장 만료 시각 ms}
+POSITION_SCRIPT = """
+local rate = redis.call('HGET', KEYS[1], 'admit_rate')
+if not rate then
+    return {-2, 0, 0, 0}
+end
+
+local admitted_at = redis.call('ZSCORE', KEYS[3], ARGV[1])
+if admitted_at then
+    local expires_at = tonumber(admitted_at) + tonumber(redis.call('HGET', KEYS[1], 'admission_ttl_ms'))
+    if expires_at > tonumber(ARGV[2]) then
+        return {-1, redis.call('ZCARD', KEYS[2]), rate, expires_at}
+    end
+end
+
+local rank = redis.call('ZRANK', KEYS[2], ARGV[1])
+if not rank then
+    if ARGV[3] ~= '1' then
+        return {-3, redis.call('ZCARD', KEYS[2]), rate, 0}
+    end
+    -- 점수는 단조 증가 시퀀스이므로 새 참가자는 항상 맨 뒤에 선다
+    redis.call('ZADD', KEYS[2], redis.call('INCR', KEYS[4]), ARGV[1])
+    rank = redis.call('ZCARD', KEYS[2]) - 1
+end
+return {rank, redis.call('ZCARD', KEYS[2]), rate, 0}
+"""
+
+# 대기열 앞쪽 batch명을 입장 집합으로 이동 (만료된 입장은 먼저 정리해 max_active 자리를 돌려준다)
+# KEYS = config, queue, admitted / ARGV = now_ms, batch
+# 반환값 = 입장시킨 인원
+ADMIT_SCRIPT = """
+local ttl = tonumber(redis.call('HGET', KEYS[1], 'admission_ttl_ms'))
+if not ttl then
+    return 0
+end
+
+local now = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', now - ttl)
+
+local batch = tonumber(ARGV[2])
+local max_active = tonumber(redis.call('HGET', KEYS[1], 'max_active') or '0')
+if max_active > 0 then
+    batch = math.min(batch, max_active - redis.call('ZCARD', KEYS[3]))
+end
+if batch <= 0 then
+    return 0
+end
+
+local popped = redis.call('ZPOPMIN', KEYS[2], batch)
+for i = 1, #popped, 2 do
+    redis.call('ZADD', KEYS[3], now, popped[i])
+end
+return #popped / 2
+"""
+
+# 대기열 진행 상황 (SSE 브로드캐스터가 구독자 수와 무관하게 주기마다 한 번 읽음)
+# KEYS = config, queue, seq
+# 반환값 = {맨 앞 대기자의 순번(대기열이 비었으면 다음 참가 순번), 대기 인원, admit_rate}, 대기열이 없으면 {-1, 0, 0}
+PROGRESS_SCRIPT = """
+local rate = redis.call('HGET', KEYS[1], 'admit_rate')
+if not rate then
+    return {-1, 0, 0}
+end
+
+local head = redis.call('ZRANGE', KEYS[2], 0, 0, 'WITHSCORES')
+local head_seq
+if head[2] then
+    head_seq = tonumber(head[2])
+else
+    head_seq = tonumber(redis.call('GET', KEYS[3]) or '0') + 1
+end
+return {head_seq, redis.call('ZCARD', KEYS[2]), rate}
+"""
+
+WAITING = "waiting"
+READY = "ready"
+OPEN = "open"  # 대기열이 열려 있지 않은 이벤트 (바로 진행 가능)
+NOT_QUEUED = "not_queued"
+
+
+class Position:
+    """대기열 조회 결과"""
+
+    __slots__ = ("status", "position", "total", "admit_rate", "admission_expires_at")
+
+    def __init__(
+        self,
+        status: str,
+        position: int = 0,
+        total: int = 0,
+        admit_rate: int = 0,
+        admission_expires_at: Optional[float] = None,
+    ):
+        self.status = status
+        self.position = position
+        self.total = total
+        self.admit_rate = admit_rate
+        self.admission_expires_at = admission_expires_at
+
+    @property
+    def estimated_wait_seconds(self) -> int:
+        if self.status != WAITING or not self.admit_rate:
+            return 0
+        return math.ceil(self.position / self.admit_rate)
+
+
+class Progress:
+    """이벤트 대기열 진행 상황 (head_seq보다 작은 순번은 모두 입장했거나 나감)"""
+
+    __slots__ = ("head_seq", "total", "admit_rate")
+
+    def __init__(self, head_seq: int, total: int, admit_rate: int):
+        self.head_seq = head_seq
+        self.total = total
+        self.admit_rate = admit_rate
+
+    def position_of(self, seq: int) -> int:
+        """순번 seq의 대기 위치 (앞에서 나간 사용자만큼 실제보다 클 수 있음, 0 이하면 입장 차례가 지남)"""
+        return seq - self.head_seq + 1
+
+
+class WaitingRoom:
+    """Redis sorted set 기반 가상 대기열
+
+    이벤트마다 다음 키를 사용한다 (해시 태그로 같은 클러스터 슬롯에 모아 Lua 스크립트 하나로 처리).
+    - wr:{event_id}:queue: 대기 중인 사용자 (score = 참가 순번), 위치 조회는 ZRANK로 O(log n)
+    - wr:{event_id}:admitted: 입장 허용된 사용자 (score = 입장 시각 ms), admission_ttl 후 만료
+    - wr:{event_id}:config: admit_rate(초당 입장 인원), max_active(동시 입장 상한, 0이면 무제한), admission_ttl_ms
+    - wr:{event_id}:seq: 참가 순번 카운터, wr:{event_id}:tick: 입장 배치 잠금
+
+    입장은 interval마다 admit_rate × interval명씩 배치로 처리하며, tick 잠금으로 여러 레플리카 중
+    한 곳만 같은 이벤트의 배치를 실행한다.
+    """
+
+    def __init__(self, client: redis.Redis, clock: Callable[[], float] = time.time):
+        self.client = client
+        self.clock = clock
+        self.position_script = client.register_script(POSITION_SCRIPT)
+        self.admit_script = client.register_script(ADMIT_SCRIPT)
+        self.progress_script = client.register_script(PROGRESS_SCRIPT)
+
+    @staticmethod
+    def _keys(event_id: str) -> dict[str, str]:
+        prefix = f"wr:{{{event_id}}}"
+        return {
+            "config": f"{prefix}:config",
+            "queue": f"{prefix}:queue",
+            "admitted": f"{prefix}:admitted",
+            "seq": f"{prefix}:seq",
+            "tick": f"{prefix}:tick",
+        }
+
+    async def open(self, event_id: str, admit_rate: int, max_active: int = 0, admission_ttl: int = 600):
+        """이벤트 대기열 열기 (이미 열려 있으면 설정만 변경)"""
+        keys = self._keys(event_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                keys["config"],
+                mapping={"admit_rate": admit_rate, "max_active": max_active, "admission_ttl_ms": admission_ttl * 1000},
+            )
+            pipe.sadd(GATED_EVENTS_KEY, event_id)
+            await pipe.execute()
+
+    async def close(self, event_id: str):
+        """이벤트 대기열 닫기 (대기/입장 상태 모두 삭제)"""
+        keys = self._keys(event_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.srem(GATED_EVENTS_KEY, event_id)
+            pipe.delete(*keys.values())
+            await pipe.execute()
+        try:
+            QUEUE_WAITING.remove(event_id)
+        except KeyError:
+            pass
+
+    async def gated_events(self) -> list[str]:
+        return sorted(member.decode() for member in await self.client.smembers(GATED_EVENTS_KEY))
+
+    async def join(self, event_id: str, user_id: str) -> Position:
+        """대기열 참가 (이미 참가했거나 입장 허용된 사용자는 현재 상태를 그대로 반환)"""
+        return await self._position(event_id, user_id, enqueue=True)
+
+    async def status(self, event_id: str, user_id: str) -> Position:
+        return await self._position(event_id, user_id, enqueue=False)
+
+    async def _position(self, event_id: str, user_id: str, enqueue: bool) -> Position:
+        keys = self._keys(event_id)
+        start_time = time.perf_counter()
+        rank, total, rate, expires_at_ms = await self.position_script(
+            keys=[keys["config"], keys["queue"], keys["admitted"], keys["seq"]],
+            args=[user_id, int(self.clock() * 1000), "1" if enqueue else "0"],
+        )
+        QUEUE_OPERATION_DURATION.labels(operation="join" if enqueue else "status").observe(
+            time.perf_counter() - start_time
+        )
+
+        rank, total, rate = int(rank), int(total), int(rate)
+        if rank == -2:
+            return Position(OPEN)
+        if rank == -3:
+            return Position(NOT_QUEUED, total=total, admit_rate=rate)
+        if rank == -1:
+            return Position(READY, total=total, admit_rate=rate, admission_expires_at=int(expires_at_ms) / 1000)
+        return Position(WAITING, position=rank + 1, total=total, admit_rate=rate)
+
+    async def sequence(self, event_id: str, user_id: str) -> Optional[int]:
+        """대기 중인 사용자의 참가 순번 (대기열에 없으면 None)"""
+        seq = await self.client.zscore(self._keys(event_id)["queue"], user_id)
+        return int(seq) if seq is not None else None
+
+    async def progress(self, event_id: str) -> Optional[Progress]:
+        """대기열 진행 상황 (열려 있지 않으면 None)"""
+        keys = self._keys(event_id)
+        start_time = time.perf_counter()
+        head_seq, total, rate = await self.progress_script(keys=[keys["config"], keys["queue"], keys["seq"]])
+        QUEUE_OPERATION_DURATION.labels(operation="progress").observe(time.perf_counter() - start_time)
+        if int(head_seq) < 0:
+            return None
+        return Progress(int(head_seq), int(total), int(rate))
+
+    async def leave(self, event_id: str, user_id: str):
+        """대기열에서 나가기 (이미 받은 입장 허용은 유지)"""
+        await self.client.zrem(self._keys(event_id)["queue"], user_id)
+
+    async def admit(self, event_id: str, batch: int) -> int:
+        """대기열 앞쪽 batch명 입장 허용"""
+        keys = self._keys(event_id)
+        start_time = time.perf_counter()
+        admitted = int(
+            await self.admit_script(
+                keys=[keys["config"], keys["queue"], keys["admitted"]],
+                args=[int(self.clock() * 1000), batch],
+            )
+        )
+        QUEUE_OPERATION_DURATION.labels(operation="admit").observe(time.perf_counter() - start_time)
+        if admitted:
+            QUEUE_ADMITTED.labels(event_id=event_id).inc(admitted)
+        return admitted
+
+    async def stats(self, event_id: str) -> Optional[dict]:
+        """대기열 설정과 현재 인원 (열려 있지 않으면 None)"""
+        keys = self._keys(event_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(keys["config"])
+            pipe.zcard(keys["queue"])
+            pipe.zcard(keys["admitted"])
+            config, waiting, admitted = await pipe.execute()
+
+        if not config:
+            return None
+        return {
+            "event_id": event_id,
+            "admit_rate": int(config[b"admit_rate"]),
+            "max_active": int(config[b"max_active"]),
+            "admission_ttl": int(config[b"admission_ttl_ms"]) // 1000,
+            "waiting": waiting,
+            "admitted": admitted,
+        }
+
+    async def tick(self, interval: float) -> int:
+        """열린 모든 이벤트에 대해 배치 입장 1회 실행 (다른 레플리카가 잠근 이벤트는 건너뜀)"""
+        total = 0
+        lock_ms = max(int(interval * 1000 * 0.9), 1)
+        for event_id in await self.gated_events():
+            keys = self._keys(event_id)
+            if not await self.client.set(keys["tick"], 1, nx=True, px=lock_ms):
+                continue
+
+            config = await self.client.hget(keys["config"], "admit_rate")
+            if config is None:
+                continue
+            total += await self.admit(event_id, math.ceil(int(config) * interval))
+            QUEUE_WAITING.labels(event_id=event_id).set(await self.client.zcard(keys["queue"]))
+        return total
+
+    async def run(self, interval: float):
+        """interval마다 배치 입장 실행 (lifespan 백그라운드 태스크)"""
+        while True:
+            started = time.monotonic()
+            try:
+                await self.tick(interval)
+            except redis.RedisError as e:
+                logger.warning(f"Admission tick failed: {e}")
+            await asyncio.sleep(max(interval - (time.monotonic() - started), 0))
+
+
+# Global instance
+_waiting_room: Optional[WaitingRoom] = None
+
+
+def get_waiting_room() -> WaitingRoom:
+    """Get waiting room instance"""
+    global _waiting_room
+
+    if _waiting_room is None:
+        # 연결 수를 제한하고 초과 요청은 연결이 반환될 때까지 기다린다
+        pool = redis.BlockingConnectionPool.from_url(
+            os.getenv("REDIS_URL", "redis://redis:6379/0"),
+            max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "100")),
+            timeout=float(os.getenv("REDIS_POOL_TIMEOUT", "2")),
+        )
+        _waiting_room = WaitingRoom(redis.Redis(connection_pool=pool))
+
+    return _waiting_room
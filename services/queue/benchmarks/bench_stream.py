@@ -0,0 +1,95 @@
+"""대기 순번 스트림(SSE) 팬아웃 벤치마크
+
+Redis 없이 브로드캐스터만 측정한다. 유휴 구독자 하나가 차지하는 메모리(Subscriber와 대기 중인
+SSE 제너레이터)와, 주기마다 전체 구독자에게 진행 상황을 반영하고 position 이벤트를 인코딩하는 CPU
+시간을 재서 코어 하나가 감당할 수 있는 연결 수를 계산한다.
+
+    cd services/queue && python -m benchmarks.bench_stream --subscribers 10000 100000
+
+connections/core = interval / (구독자 1명당 팬아웃 + 인코딩 시간). 실제 소켓 쓰기와 TLS 비용은
+포함하지 않으므로 상한값이다.
+"""
+
+import argparse
+import asyncio
+import gc
+import math
+import time
+import tracemalloc
+
+import fakeredis
+
+from app.broadcaster import EventBroadcaster, StreamHub
+from app.routers.queue import queue_events
+from app.waiting_room import WAITING, Position, Progress, WaitingRoom
+
+
+async def idle_memory(count: int) -> float:
+    """유휴 연결 하나당 바이트 (구독 후 갱신을 기다리는 SSE 제너레이터 count개)"""
+    room = WaitingRoom(fakeredis.aioredis.FakeRedis())
+    hub = StreamHub(room, interval=3600, max_connections=count)
+    room.sequence = lambda event_id, user_id: asyncio.sleep(0, result=int(user_id))
+
+    async def connection(index: int):
+        position = Position(WAITING, index, count, 100)
+        async for _ in queue_events(room, hub, "bench", str(index), position, heartbeat=3600):
+            pass
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks = [asyncio.create_task(connection(index)) for index in range(1, count + 1)]
+    while hub.connections < count:
+        await asyncio.sleep(0.01)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return used / count
+
+
+async def fan_out_cost(count: int, ticks: int, batch_size: int) -> tuple[float, float]:
+    """주기당 팬아웃 시간과 구독자 1명당 팬아웃+인코딩 시간(초)"""
+    broadcaster = EventBroadcaster(WaitingRoom(fakeredis.aioredis.FakeRedis()), "bench", batch_size=batch_size)
+    subscribers = [broadcaster.subscribe(seq, seq) for seq in range(1, count + 1)]
+    broadcaster.task.cancel()
+
+    # 주기마다 admit_rate명씩 입장해 모든 구독자의 위치가 바뀌는 최악의 경우
+    admit_rate = max(1, count // (ticks * 2))
+    start_time = time.perf_counter()
+    for tick in range(1, ticks + 1):
+        await broadcaster.fan_out(Progress(head_seq=1 + tick * admit_rate, total=count, admit_rate=admit_rate))
+        for subscriber in subscribers:
+            if subscriber.wakeup.is_set():
+                subscriber.wakeup.clear()
+                wait_seconds = math.ceil(subscriber.position / subscriber.admit_rate)
+                (
+                    f'event: position\ndata: {{"queue_position":{subscriber.position},'
+                    f'"total_in_queue":{subscriber.total},"estimated_wait_time":{wait_seconds}}}\n\n'
+                ).encode()
+    elapsed = time.perf_counter() - start_time
+    return elapsed / ticks, elapsed / (ticks * count)
+
+
+async def main(args: argparse.Namespace):
+    print(f"interval {args.interval}s, fan-out batch {args.batch_size}")
+    print(f"{'subscribers':>11} {'bytes/conn':>11} {'fan-out/tick':>13} {'µs/conn':>8} {'conns/core':>11}")
+    for count in args.subscribers:
+        per_connection_bytes = await idle_memory(count)
+        per_tick, per_connection = await fan_out_cost(count, args.ticks, args.batch_size)
+        print(
+            f"{count:>11,} {per_connection_bytes:>11,.0f} {per_tick * 1000:>11.1f}ms "
+            f"{per_connection * 1e6:>8.2f} {args.interval / per_connection:>11,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--ticks", type=int, default=10)
+    asyncio.run(main(parser.parse_args()))
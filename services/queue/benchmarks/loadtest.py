@@ -0,0 +1,171 @@
+"""가상 대기열 부하 테스트
+
+이벤트 하나에 --users명(기본 100,000)을 동시에 참가시킨 뒤, 대기열 전체에 퍼진 사용자들의 순번 조회와
+배치 입장을 측정한다. 단계별 처리량과 지연 p50/p95/p99, 대기열 키의 Redis 메모리 사용량을 출력한다.
+
+    # Redis에 직접 (WaitingRoom Lua 스크립트의 한계 측정)
+    cd services/queue && python -m benchmarks.loadtest --redis-url redis://localhost:6379/0
+
+    # 실행 중인 queue 서비스 HTTP API로 (게이트웨이 서명 헤더를 직접 만들어 보냄)
+    cd services/queue && python -m benchmarks.loadtest --base-url http://localhost:8007 --users 20000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import os
+import random
+import statistics
+import time
+import uuid
+from typing import Awaitable, Callable
+
+import httpx
+import redis.asyncio as redis
+
+from app.waiting_room import WaitingRoom
+
+INTERNAL_AUTH_SECRET = os.getenv(
+    "INTERNAL_AUTH_SECRET", os.getenv("JWT_SECRET", "your-secret-key-change-in-production")
+)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1] if len(samples) > 1 else samples[0]
+
+
+def report(phase: str, latencies: list[float], elapsed: float):
+    print(
+        f"{phase:<8} {len(latencies):>9,} ops {len(latencies) / elapsed:>10,.0f} ops/s  "
+        f"p50 {percentile(latencies, 50) * 1000:6.2f}ms  "
+        f"p95 {percentile(latencies, 95) * 1000:6.2f}ms  "
+        f"p99 {percentile(latencies, 99) * 1000:6.2f}ms"
+    )
+
+
+async def run_phase(phase: str, count: int, concurrency: int, operation: Callable[[int], Awaitable]):
+    """count번의 operation을 concurrency개 워커로 실행하고 지연 분포 출력"""
+    latencies: list[float] = []
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index
+        while next_index < count:
+            index = next_index
+            next_index += 1
+            start_time = time.perf_counter()
+            await operation(index)
+            latencies.append(time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    report(phase, latencies, time.perf_counter() - start_time)
+
+
+class DirectTarget:
+    """WaitingRoom을 Redis에 직접 호출"""
+
+    def __init__(self, redis_url: str, concurrency: int):
+        pool = redis.BlockingConnectionPool.from_url(redis_url, max_connections=concurrency)
+        self.client = redis.Redis(connection_pool=pool)
+        self.room = WaitingRoom(self.client)
+
+    async def open(self, event_id: str, admit_rate: int):
+        await self.room.open(event_id, admit_rate)
+
+    async def join(self, event_id: str, user_id: str):
+        await self.room.join(event_id, user_id)
+
+    async def status(self, event_id: str, user_id: str):
+        await self.room.status(event_id, user_id)
+
+    async def close(self, event_id: str):
+        await self.room.close(event_id)
+        await self.client.aclose()
+
+
+class HttpTarget:
+    """queue 서비스 HTTP API 호출 (게이트웨이가 붙이는 서명 헤더를 직접 생성)"""
+
+    def __init__(self, base_url: str, concurrency: int):
+        self.http = httpx.AsyncClient(base_url=base_url, limits=httpx.Limits(max_connections=concurrency), timeout=30.0)
+
+    @staticmethod
+    def headers(user_id: str, role: str = "user") -> dict:
+        timestamp = str(int(time.time()))
+        message = "\n".join([user_id, "", role, timestamp]).encode()
+        return {
+            "X-User-Id": user_id,
+            "X-User-Role": role,
+            "X-Auth-Timestamp": timestamp,
+            "X-Auth-Signature": hmac.new(INTERNAL_AUTH_SECRET.encode(), message, hashlib.sha256).hexdigest(),
+        }
+
+    async def open(self, event_id: str, admit_rate: int):
+        response = await self.http.post(
+            f"/queue/events/{event_id}/open", json={"admit_rate": admit_rate}, headers=self.headers("0", "admin")
+        )
+        response.raise_for_status()
+
+    async def join(self, event_id: str, user_id: str):
+        response = await self.http.post("/queue/join", json={"event_id": event_id}, headers=self.headers(user_id))
+        response.raise_for_status()
+
+    async def status(self, event_id: str, user_id: str):
+        response = await self.http.get(f"/queue/status/{event_id}", headers=self.headers(user_id))
+        if response.status_code != 404:  # 그 사이 입장 처리되어 만료된 사용자
+            response.raise_for_status()
+
+    async def close(self, event_id: str):
+        await self.http.post(f"/queue/events/{event_id}/close", headers=self.headers("0", "admin"))
+        await self.http.aclose()
+
+
+async def main(args: argparse.Namespace):
+    event_id = f"loadtest-{uuid.uuid4().hex[:8]}"
+    if args.base_url:
+        target = HttpTarget(args.base_url, args.concurrency)
+    else:
+        target = DirectTarget(args.redis_url, args.concurrency)
+
+    print(f"event {event_id}: {args.users:,} users, concurrency {args.concurrency}, admit_rate {args.admit_rate}/s")
+    await target.open(event_id, args.admit_rate)
+    try:
+        await run_phase("join", args.users, args.concurrency, lambda i: target.join(event_id, f"user-{i}"))
+        await run_phase(
+            "status",
+            args.status_samples,
+            args.concurrency,
+            lambda i: target.status(event_id, f"user-{random.randrange(args.users)}"),
+        )
+
+        if isinstance(target, DirectTarget):
+            room, keys = target.room, target.room._keys(event_id)
+            memory = await room.client.memory_usage(keys["queue"]) or 0
+            print(f"memory   queue ZSET {memory / 1024 / 1024:.1f} MiB ({memory / args.users:.0f} B/user)")
+
+            # 배치 입장: 1초 주기 배치 하나가 걸리는 시간 (대기열이 길어도 O(batch × log n))
+            batch = args.admit_rate
+            latencies = []
+            start_time = time.perf_counter()
+            for _ in range(args.admit_batches):
+                batch_start = time.perf_counter()
+                await room.admit(event_id, batch)
+                latencies.append(time.perf_counter() - batch_start)
+            report("admit", latencies, time.perf_counter() - start_time)
+            print(f"admitted {batch * args.admit_batches:,} users in {args.admit_batches} batches of {batch}")
+    finally:
+        await target.close(event_id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    parser.add_argument("--base-url", help="queue 서비스 URL (지정하면 HTTP API로 부하를 건다)")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--status-samples", type=int, default=100_000)
+    parser.add_argument("--admit-rate", type=int, default=500)
+    parser.add_argument("--admit-batches", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import fakeredis
+import pytest
+
+from app.broadcaster import EventBroadcaster, StreamHub, Subscriber
+from app.routers.queue import queue_events
+from app.waiting_room import Progress, WaitingRoom
+
+
+@pytest.fixture
+def room():
+    return WaitingRoom(fakeredis.aioredis.FakeRedis())
+
+
+def parse(chunk: bytes) -> tuple[str, dict]:
+    """Split one SSE message into its event name and JSON payload"""
+    lines = dict(line.split(": ", 1) for line in chunk.decode().strip().split("\n"))
+    return lines["event"], json.loads(lines["data"])
+
+
+async def test_progress_tracks_queue_head(room):
+    """Test progress reports the head sequence so positions can be computed locally"""
+    assert await room.progress("evt-1") is None
+
+    await room.open("evt-1", admit_rate=10)
+    for index in range(5):
+        await room.join("evt-1", f"user-{index}")
+    seq = await room.sequence("evt-1", "user-3")
+
+    await room.admit("evt-1", 2)
+    progress = await room.progress("evt-1")
+    assert progress.total == 3
+    assert progress.admit_rate == 10
+    assert progress.position_of(seq) == (await room.status("evt-1", "user-3")).position == 2
+
+
+def test_subscriber_only_wakes_on_change():
+    """Test unchanged positions are skipped and later snapshots overwrite unsent ones"""
+    subscriber = Subscriber(seq=10, position=10)
+
+    assert subscriber.notify(Progress(head_seq=1, total=20, admit_rate=5)) is False
+    assert subscriber.notify(Progress(head_seq=4, total=17, admit_rate=5)) is True
+    assert subscriber.notify(Progress(head_seq=8, total=13, admit_rate=5)) is True
+    assert (subscriber.position, subscriber.total) == (3, 13)
+    assert subscriber.wakeup.is_set()
+
+    # 앞사람이 나가 head가 늦게 움직여도 위치는 되돌아가지 않는다
+    assert subscriber.notify(Progress(head_seq=6, total=13, admit_rate=5)) is False
+    assert subscriber.position == 3
+
+    assert subscriber.notify(Progress(head_seq=11, total=9, admit_rate=5)) is True
+    assert subscriber.finished
+
+
+async def test_fan_out_yields_between_batches(room):
+    """Test fan-out hands control back to the event loop every batch_size subscribers"""
+    broadcaster = EventBroadcaster(room, "evt-1", batch_size=100)
+    subscribers = [Subscriber(seq, seq) for seq in range(1, 251)]
+    broadcaster.subscribers.update(subscribers)
+
+    yields = 0
+
+    async def count_yields():
+        nonlocal yields
+        while True:
+            yields += 1
+            await asyncio.sleep(0)
+
+    counter = asyncio.create_task(count_yields())
+    await asyncio.sleep(0)
+    notified = await broadcaster.fan_out(Progress(head_seq=51, total=200, admit_rate=10))
+    counter.cancel()
+
+    assert notified == 250
+    assert yields >= 3
+    assert sum(subscriber.finished for subscriber in subscribers) == 50
+    assert subscribers[-1].position == 200
+
+
+async def test_hub_limits_connections(room):
+    """Test the hub refuses subscribers past max_connections and frees slots on unsubscribe"""
+    hub = StreamHub(room, interval=60, max_connections=2)
+    first = hub.subscribe("evt-1", 1, 1)
+    second = hub.subscribe("evt-2", 1, 1)
+
+    assert hub.subscribe("evt-1", 2, 2) is None
+
+    hub.unsubscribe("evt-1", first)
+    hub.unsubscribe("evt-1", first)
+    assert hub.connections == 1
+    assert "evt-1" not in hub.broadcasters
+    third = hub.subscribe("evt-1", 2, 2)
+    assert third is not None
+
+    hub.unsubscribe("evt-1", third)
+    hub.unsubscribe("evt-2", second)
+    assert hub.connections == 0
+    assert not hub.broadcasters
+
+
+async def test_stream_pushes_positions_until_admitted(room):
+    """Test the stream sends position deltas and ends with an admission token"""
+    await room.open("evt-1", admit_rate=2)
+    for index in range(4):
+        await room.join("evt-1", f"user-{index}")
+    hub = StreamHub(room, interval=0.01)
+
+    stream = queue_events(room, hub, "evt-1", "user-3", await room.status("evt-1", "user-3"))
+    assert await anext(stream) == b"retry: 5000\n\n"
+    event, data = parse(await anext(stream))
+    assert event == "status"
+    assert (data["status"], data["queue_position"]) == ("waiting", 4)
+
+    await room.admit("evt-1", 2)
+    event, data = parse(await anext(stream))
+    assert event == "position"
+    assert data == {"queue_position": 2, "total_in_queue": 2, "estimated_wait_time": 1}
+
+    await room.admit("evt-1", 2)
+    event, data = parse(await anext(stream))
+    assert event == "status"
+    assert data["status"] == "ready"
+    assert data["admission_token"]
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+    assert hub.connections == 0
+
+
+async def test_stream_sends_heartbeat_when_idle(room):
+    """Test idle streams send SSE comments so proxies keep the connection open"""
+    await room.open("evt-1", admit_rate=2)
+    await room.join("evt-1", "user-0")
+    hub = StreamHub(room, interval=60)
+
+    stream = queue_events(room, hub, "evt-1", "user-0", await room.status("evt-1", "user-0"), heartbeat=0.01)
+    await anext(stream)
+    await anext(stream)
+    assert await anext(stream) == b": ping\n\n"
+    assert hub.connections == 1
+
+    await stream.aclose()
+    assert hub.connections == 0
@@ -0,0 +1,251 @@
+import hashlib
+import hmac
+import time
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+from httpx import ASGITransport, AsyncClient
+from jose import jwt
+
+from app.auth import INTERNAL_AUTH_SECRET
+from app.broadcaster import StreamHub
+from app.main import app
+from app.tokens import QUEUE_TOKEN_ALGORITHM, QUEUE_TOKEN_SECRET, issue_queue_token
+from app.waiting_room import GATED_EVENTS_KEY, NOT_QUEUED, OPEN, READY, WAITING, WaitingRoom
+
+
+class FakeClock:
+    """Starts at the real time because admission tokens are checked against it"""
+
+    def __init__(self):
+        self.now = float(int(time.time()))
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def room(clock):
+    return WaitingRoom(fakeredis.aioredis.FakeRedis(), clock=clock)
+
+
+@pytest.fixture
+async def client(room):
+    with (
+        patch("app.routers.queue.get_waiting_room", return_value=room),
+        patch("app.routers.queue.get_stream_hub", return_value=StreamHub(room, interval=0.01)),
+    ):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            yield ac
+
+
+def user_headers(user_id: str, role: str = "user") -> dict:
+    """Headers the API gateway attaches after verifying the JWT"""
+    timestamp = str(int(time.time()))
+    message = "\n".join([user_id, f"{user_id}@example.com", role, timestamp]).encode()
+    return {
+        "X-User-Id": user_id,
+        "X-User-Email": f"{user_id}@example.com",
+        "X-User-Role": role,
+        "X-Auth-Timestamp": timestamp,
+        "X-Auth-Signature": hmac.new(INTERNAL_AUTH_SECRET.encode(), message, hashlib.sha256).hexdigest(),
+    }
+
+
+async def test_join_assigns_fifo_positions(room):
+    """Test users get positions in join order and rejoining keeps the original position"""
+    await room.open("evt-1", admit_rate=10)
+
+    for index in range(5):
+        position = await room.join("evt-1", f"user-{index}")
+        assert position.status == WAITING
+        assert position.position == index + 1
+        assert position.total == index + 1
+
+    again = await room.join("evt-1", "user-2")
+    assert again.position == 3
+    assert again.total == 5
+
+    status = await room.status("evt-1", "user-4")
+    assert status.position == 5
+    assert status.estimated_wait_seconds == 1
+
+
+async def test_event_without_queue_is_open(room):
+    """Test events without an open waiting room let users proceed immediately"""
+    position = await room.join("evt-1", "user-1")
+    assert position.status == OPEN
+    assert await room.client.zcard("wr:{evt-1}:queue") == 0
+
+
+async def test_status_for_unknown_user(room):
+    """Test status lookups do not enqueue users who never joined"""
+    await room.open("evt-1", admit_rate=10)
+    await room.join("evt-1", "user-1")
+
+    position = await room.status("evt-1", "user-2")
+    assert position.status == NOT_QUEUED
+    assert await room.client.zcard("wr:{evt-1}:queue") == 1
+
+
+async def test_admit_moves_front_of_queue(room, clock):
+    """Test a batch admits the earliest joiners and the rest move up"""
+    await room.open("evt-1", admit_rate=2, admission_ttl=60)
+    for index in range(5):
+        await room.join("evt-1", f"user-{index}")
+
+    assert await room.admit("evt-1", 2) == 2
+
+    for user_id in ("user-0", "user-1"):
+        position = await room.status("evt-1", user_id)
+        assert position.status == READY
+        assert position.admission_expires_at == clock.now + 60
+
+    position = await room.status("evt-1", "user-2")
+    assert position.status == WAITING
+    assert position.position == 1
+    assert position.total == 3
+
+    # 입장 허용된 사용자가 다시 참가해도 대기열 뒤로 가지 않는다
+    assert (await room.join("evt-1", "user-0")).status == READY
+    assert await room.client.zcard("wr:{evt-1}:queue") == 3
+
+
+async def test_admission_expires_and_frees_max_active(room, clock):
+    """Test max_active caps concurrent admissions until earlier admissions expire"""
+    await room.open("evt-1", admit_rate=10, max_active=2, admission_ttl=60)
+    for index in range(4):
+        await room.join("evt-1", f"user-{index}")
+
+    assert await room.admit("evt-1", 10) == 2
+    assert await room.admit("evt-1", 10) == 0
+
+    clock.now += 61
+    assert (await room.status("evt-1", "user-0")).status == NOT_QUEUED
+    assert await room.admit("evt-1", 10) == 2
+    assert (await room.status("evt-1", "user-3")).status == READY
+
+
+async def test_leave_keeps_admission(room):
+    """Test leaving removes a waiting user but keeps an existing admission"""
+    await room.open("evt-1", admit_rate=10)
+    await room.join("evt-1", "user-0")
+    await room.join("evt-1", "user-1")
+    await room.admit("evt-1", 1)
+
+    await room.leave("evt-1", "user-0")
+    await room.leave("evt-1", "user-1")
+
+    assert (await room.status("evt-1", "user-0")).status == READY
+    assert (await room.status("evt-1", "user-1")).status == NOT_QUEUED
+
+
+async def test_tick_admits_at_rate_on_one_replica(room, clock):
+    """Test each tick admits admit_rate x interval users and the tick lock stops a second replica"""
+    await room.open("evt-1", admit_rate=3)
+    for index in range(10):
+        await room.join("evt-1", f"user-{index}")
+
+    other_replica = WaitingRoom(room.client, clock=clock)
+    assert await room.tick(interval=1.0) == 3
+    assert await other_replica.tick(interval=1.0) == 0
+
+    await room.client.delete("wr:{evt-1}:tick")
+    assert await other_replica.tick(interval=1.0) == 3
+    assert (await room.status("evt-1", "user-6")).position == 1
+
+
+async def test_close_removes_queue(room):
+    """Test closing a waiting room removes it from the gated set and drops its state"""
+    await room.open("evt-1", admit_rate=10)
+    await room.join("evt-1", "user-0")
+
+    await room.close("evt-1")
+
+    assert not await room.client.sismember(GATED_EVENTS_KEY, "evt-1")
+    assert await room.stats("evt-1") is None
+    assert (await room.join("evt-1", "user-0")).status == OPEN
+
+
+async def test_join_and_status_api(client, room):
+    """Test the endpoints used by frontend queueService"""
+    await room.open("evt-1", admit_rate=10, admission_ttl=300)
+    await room.join("evt-1", "7")
+
+    response = await client.post("/queue/join", json={"event_id": "evt-1"}, headers=user_headers("42"))
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "waiting"
+    assert data["queue_position"] == 2
+    assert data["total_in_queue"] == 2
+    assert data["can_proceed"] is False
+    assert data["queue_token"]
+    assert data["admission_token"] is None
+
+    await room.admit("evt-1", 2)
+
+    response = await client.get("/queue/status/evt-1", headers=user_headers("42"))
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["can_proceed"] is True
+
+    claims = jwt.decode(
+        data["admission_token"], QUEUE_TOKEN_SECRET, algorithms=[QUEUE_TOKEN_ALGORITHM], audience="booking"
+    )
+    assert claims["sub"] == "42"
+    assert claims["event_id"] == "evt-1"
+    assert claims["exp"] == int(room.clock() + 300)
+
+    response = await client.post("/queue/leave", json={"event_id": "evt-1"}, headers=user_headers("42"))
+    assert response.status_code == 204
+
+
+async def test_status_api_not_in_queue(client, room):
+    """Test status for a user who has not joined returns 404"""
+    await room.open("evt-1", admit_rate=10)
+
+    response = await client.get("/queue/status/evt-1", headers=user_headers("42"))
+    assert response.status_code == 404
+
+
+async def test_api_requires_signed_headers(client):
+    """Test requests without gateway-signed user headers are rejected"""
+    response = await client.post("/queue/join", json={"event_id": "evt-1"}, headers={"X-User-Id": "42"})
+    assert response.status_code == 401
+
+
+async def test_open_requires_admin(client, room):
+    """Test only admins can open a waiting room"""
+    response = await client.post("/queue/events/evt-1/open", json={"admit_rate": 50}, headers=user_headers("42"))
+    assert response.status_code == 403
+
+    response = await client.post(
+        "/queue/events/evt-1/open", json={"admit_rate": 50}, headers=user_headers("1", role="admin")
+    )
+    assert response.status_code == 200
+    assert response.json()["admit_rate"] == 50
+    assert await room.client.sismember(GATED_EVENTS_KEY, "evt-1")
+
+
+async def test_stream_api(client, room):
+    """Test the SSE stream authenticates with the queue token and ends once the user is admitted"""
+    await room.open("evt-1", admit_rate=10)
+    await room.join("evt-1", "42")
+
+    response = await client.get("/queue/stream/evt-1", params={"token": issue_queue_token("42", "evt-2")})
+    assert response.status_code == 401
+
+    await room.admit("evt-1", 1)
+
+    response = await client.get("/queue/stream/evt-1", params={"token": issue_queue_token("42", "evt-1")})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "event: status" in response.text
+    assert '"status":"ready"' in response.text
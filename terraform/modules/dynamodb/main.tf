@@ -129,6 +129,12 @@ resource "aws_dynamodb_table" "bookings" {
     type = "N"
   }
 
+  # 공연 ID#샤드 (인기 공연의 GSI 쓰기를 여러 파티션으로 분산)
+  attribute {
+    name = "event_shard"
+    type = "S"
+  }
+
   global_secondary_index {
     name            = "user-bookings-index"
     hash_key        = "user_id"
@@ -136,6 +142,13 @@ resource "aws_dynamodb_table" "bookings" {
     projection_type = "ALL"
   }
 
+  global_secondary_index {
+    name            = "event-shard-index"
+    hash_key        = "event_shard"
+    range_key       = "created_at"
+    projection_type = "ALL"
+  }
+
   global_secondary_index {
     name            = "reference-index"
     hash_key        = "booking_reference"
@@ -159,3 +172,30 @@ resource "aws_dynamodb_table" "bookings" {
     Environment = var.environment
   }
 }
+
+# Booking Outbox Table (Kafka events written in the same transaction as bookings)
+resource "aws_dynamodb_table" "booking_outbox" {
+  name         = "${var.project_name}-booking-outbox-${var.environment}"
+  billing_mode = var.billing_mode
+  hash_key     = "shard"
+  range_key    = "outbox_id"
+
+  attribute {
+    name = "shard"
+    type = "N"
+  }
+
+  attribute {
+    name = "outbox_id"
+    type = "S"
+  }
+
+  point_in_time_recovery {
+    enabled = var.environment == "prod" ? true : false
+  }
+
+  tags = {
+    Name        = "${var.project_name}-booking-outbox-${var.environment}"
+    Environment = var.environment
+  }
+}
@@ -42,3 +42,8 @@ output "bookings_stream_arn" {
   description = "Bookings table stream ARN"
   value       = aws_dynamodb_table.bookings.stream_arn
 }
+
+output "booking_outbox_table_name" {
+  description = "Booking outbox table name"
+  value       = aws_dynamodb_table.booking_outbox.name
+}